@@ -0,0 +1,146 @@
+import numpy
+from ..environments.parallel_evaluation import forked_state, map_in_forked_processes, split_in_chunks
+from ..utils.helpers import round_value
+from ..config import Config
+
+class BidsCache:
+    """
+    Stores the bids of the programs per point, so a program shared by many teams runs only once
+    per point. It is only valid when the registers are reset before each execution (ie. for
+    classification), since then the bid depends only on the program and on the point.
+    """
+
+    def __init__(self):
+        self.bids_per_program_ = {}
+        self.hits_ = 0
+        self.misses_ = 0
+        self.new_bids_ = None # (program_id, point_id, bid), only recorded by the worker processes
+
+    def bid(self, program, point_id, inputs):
+        bids = self._bids_for_program(program)
+        if point_id in bids:
+            self.hits_ += 1
+            return bids[point_id]
+        self.misses_ += 1
+        bid = program.execute(inputs)
+        bids[point_id] = bid
+        if self.new_bids_ is not None:
+            self.new_bids_.append((program.program_id_, point_id, bid))
+        return bid
+
+    def bids_for_arrays(self, program, point_ids, inputs_matrix):
+        """
+        Get the bids of the program for each point, where the rows of inputs_matrix are the inputs
+        of the points. The missing bids are calculated at once with program.execute_for_arrays().
+        """
+        bids = self._bids_for_program(program)
+        missing_rows = [index for index, point_id in enumerate(point_ids) if point_id not in bids]
+        self.hits_ += len(point_ids)-len(missing_rows)
+        self.misses_ += len(missing_rows)
+        if len(missing_rows) > 0:
+            if len(missing_rows) < len(point_ids):
+                inputs_matrix = numpy.asfortranarray(inputs_matrix[missing_rows])
+            for index, bid in zip(missing_rows, program.execute_for_arrays(inputs_matrix)):
+                bids[point_ids[index]] = bid
+                if self.new_bids_ is not None:
+                    self.new_bids_.append((program.program_id_, point_ids[index], bid))
+        return numpy.array([bids[point_id] for point_id in point_ids])
+
+    def calculate_bids_for_teams(self, teams, point_ids, inputs_matrix):
+        """
+        Calculate the missing bids of all the teams before they are evaluated, so each unique program runs 
+        once over all the points that its teams will execute, and the teams only select the programs from 
+        the bids in the cache. The programs are split between the number of processes defined by 'processes' 
+        in the config, and the bids are added to the cache in the main process, so the worker processes that 
+        evaluate the teams also find them. The calculated bids are counted as misses, and the teams get them as hits.
+        """
+        use_memmory = Config.RESTRICTIONS['use_memmory_for_actions']
+        programs = []
+        point_ids_per_program = {}
+        for team in teams:
+            if use_memmory:
+                team_point_ids = set([p for p in point_ids if p not in team.memory_actions_per_points_])
+            else:
+                team_point_ids = set(point_ids)
+            if len(team_point_ids) == 0:
+                continue
+            for program in team.programs:
+                if program not in point_ids_per_program:
+                    point_ids_per_program[program] = set()
+                    programs.append(program) # not a set, so the order is reproducible
+                point_ids_per_program[program].update(team_point_ids)
+
+        row_per_point_id = dict([(point_id, index) for index, point_id in enumerate(point_ids)])
+        tasks = []
+        for program in programs:
+            bids = self._bids_for_program(program)
+            missing_point_ids = sorted([p for p in point_ids_per_program[program] if p not in bids])
+            if len(missing_point_ids) > 0:
+                tasks.append((program, missing_point_ids, [row_per_point_id[p] for p in missing_point_ids]))
+        if len(tasks) == 0:
+            return
+
+        bids_per_task = sum(map_in_forked_processes(_calculate_bids_for_tasks, split_in_chunks(len(tasks)),
+            {'tasks': tasks, 'inputs_matrix': inputs_matrix}), [])
+        for (program, missing_point_ids, _), task_bids in zip(tasks, bids_per_task):
+            bids = self._bids_for_program(program)
+            for point_id, bid in zip(missing_point_ids, task_bids):
+                bids[point_id] = bid
+            self.misses_ += len(missing_point_ids)
+
+    def _bids_for_program(self, program):
+        if program not in self.bids_per_program_:
+            self.bids_per_program_[program] = {}
+        return self.bids_per_program_[program]
+
+    def start_recording(self):
+        """
+        Record the bids calculated from now on, so they can be sent from a worker process to the 
+        cache in the main process with add_recorded_bids().
+        """
+        self.new_bids_ = []
+        self.hits_ = 0
+        self.misses_ = 0
+
+    def stop_recording(self):
+        recorded = {'bids': self.new_bids_, 'hits': self.hits_, 'misses': self.misses_}
+        self.new_bids_ = None
+        return recorded
+
+    def add_recorded_bids(self, recorded, programs):
+        programs_by_id = dict([(program.program_id_, program) for program in programs])
+        for program_id, point_id, bid in recorded['bids']:
+            self._bids_for_program(programs_by_id[program_id])[point_id] = bid
+        self.hits_ += recorded['hits']
+        self.misses_ += recorded['misses']
+
+    def remove_points(self, point_ids):
+        for bids in self.bids_per_program_.values():
+            for point_id in point_ids:
+                if point_id in bids:
+                    bids.pop(point_id)
+
+    def remove_programs(self, programs):
+        for program in programs:
+            if program in self.bids_per_program_:
+                self.bids_per_program_.pop(program)
+
+    def metrics(self):
+        total = self.hits_+self.misses_
+        if total == 0:
+            hit_rate = 0.0
+        else:
+            hit_rate = self.hits_/float(total)
+        return {'hits': self.hits_, 'misses': self.misses_, 'hit_rate': round_value(hit_rate)}
+
+def _calculate_bids_for_tasks(indices):
+    tasks = forked_state['tasks']
+    inputs_matrix = forked_state['inputs_matrix']
+    bids_per_task = []
+    for index in indices:
+        program, _, rows = tasks[index]
+        if Config.RESTRICTIONS['use_arrays_for_classification']:
+            bids_per_task.append(list(program.execute_for_arrays(numpy.asfortranarray(inputs_matrix[rows]))))
+        else:
+            bids_per_task.append([program.execute(inputs_matrix[row]) for row in rows])
+    return bids_per_task
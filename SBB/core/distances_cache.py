@@ -0,0 +1,42 @@
+import numpy
+
+class DistancesCache:
+    """
+    Stores the distances matrix of the last population for each distance, with a row per team key.
+    A key is the team and the values used by the distance (ie. its encoding), so when the values
+    of a team change, its distances are calculated again. Only the rows of the new keys are
+    calculated, and since the distances are symmetric, they are also used as the columns.
+    """
+
+    def __init__(self):
+        self.keys_per_distance_ = {}
+        self.matrix_per_distance_ = {}
+        self.hits_ = 0
+        self.misses_ = 0
+
+    def matrix(self, distance, keys, calculate_rows):
+        """
+        Get the distances between each pair of keys. calculate_rows(rows) must return the distances
+        of the keys in rows to all the keys, but for the columns that are also in rows, only the ones
+        at or above the diagonal are used.
+        """
+        previous_keys = self.keys_per_distance_.get(distance, [])
+        previous_row_per_key = dict([(key, row) for row, key in enumerate(previous_keys)])
+        cached_rows = [row for row, key in enumerate(keys) if key in previous_row_per_key]
+        new_rows = [row for row, key in enumerate(keys) if key not in previous_row_per_key]
+        matrix = numpy.zeros((len(keys), len(keys)))
+        if len(cached_rows) > 0:
+            previous_rows = [previous_row_per_key[keys[row]] for row in cached_rows]
+            matrix[numpy.ix_(cached_rows, cached_rows)] = (
+                self.matrix_per_distance_[distance][numpy.ix_(previous_rows, previous_rows)])
+        if len(new_rows) > 0:
+            distances = calculate_rows(new_rows)
+            matrix[new_rows, :] = distances
+            matrix[numpy.ix_(cached_rows, new_rows)] = distances[:, cached_rows].T
+            new_distances = distances[:, new_rows]
+            matrix[numpy.ix_(new_rows, new_rows)] = numpy.triu(new_distances) + numpy.triu(new_distances, 1).T
+        self.hits_ += len(cached_rows)**2
+        self.misses_ += len(keys)**2 - len(cached_rows)**2
+        self.keys_per_distance_[distance] = list(keys)
+        self.matrix_per_distance_[distance] = matrix
+        return matrix
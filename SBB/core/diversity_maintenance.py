@@ -1,243 +1,443 @@
-import bz2
-import math
-import numpy
-from scipy import stats
-from scipy.spatial.distance import hamming, euclidean
-from collections import defaultdict
-from ..utils.helpers import round_value
-from ..config import Config
-
-class DiversityMaintenance():
-    """
-    This class contains all the diversity maintenance methods for teams.
-    """
-
-    @staticmethod
-    def define_bin_for_actions(actions):
-        if len(actions) == 0:
-            return 0.0
-        weights_per_action = Config.USER['reinforcement_parameters']['environment_parameters']['weights_per_action']
-        points = 0.0
-        for action in actions:
-            points += weights_per_action[action]
-        points = points/float(len(actions))
-        return DiversityMaintenance.define_bin_for_value(points)
-
-    @staticmethod
-    def define_bin_for_value(value, is_normalized = False):
-        if is_normalized:
-            normalization_parameter = Config.RESTRICTIONS['multiply_normalization_by']
-        else:
-            normalization_parameter = 1.0
-
-        interval_amount = 1/float(Config.RESTRICTIONS['diversity']['total_bins'])
-        previous_interval = 0.0
-        for bin_number in range(Config.RESTRICTIONS['diversity']['total_bins']):
-            min_value = previous_interval*normalization_parameter
-            max_value = (bin_number+1)*interval_amount*normalization_parameter
-            if value >= min_value and value < max_value:
-                return bin_number
-            previous_interval += interval_amount
-        return Config.RESTRICTIONS['diversity']['total_bins']-1
-
-    @staticmethod
-    def calculate_diversities(teams_population, point_population):
-        diversities_to_calculate = list(Config.USER['advanced_training_parameters']['diversity']['metrics'])
-
-        if "fitness_sharing" in diversities_to_calculate:
-            DiversityMaintenance._fitness_sharing(teams_population, point_population)
-            diversities_to_calculate.remove("fitness_sharing")
-        if len(diversities_to_calculate) > 0:
-            DiversityMaintenance.calculate_diversities_based_on_distances(teams_population, 
-                Config.USER['advanced_training_parameters']['diversity']['k'], diversities_to_calculate)
-
-    @staticmethod
-    def _fitness_sharing(population, point_population):
-        """
-        Uses the fitness sharing algorithm, so that individuals obtains more fitness by being able to solve
-        points that other individuals can't. It assumes that all dimension have the same weight (if it is not
-        true, normalize the dimensions before applying fitness sharing).
-        """
-        # calculate denominators in each dimension
-        denominators = [1.0] * len(point_population) # initialized to 1 so we don't divide by zero
-        for index, point in enumerate(point_population):
-            for team in population:
-                denominators[index] += float(team.results_per_points_[point.point_id_])
-
-        # calculate fitness
-        for team in population:
-            score = 0.0
-            for index, point in enumerate(point_population):
-                score += float(team.results_per_points_[point.point_id_]) / denominators[index]
-            diversity = score/float(len(point_population))
-            team.diversity_['fitness_sharing'] = round_value(diversity)
-
-    @staticmethod
-    def calculate_diversities_based_on_distances(population, k, distances):
-        """
-        The kNN algorithm is applied to the list of 
-        distances, to get the k most similar teams. The diversity is average distance of the k teams.
-        In the end, teams with more uncommon program sets will obtain higher diversity scores.
-        """
-        for team in population:
-            # create array of distances to other teams
-            results = defaultdict(list)
-            for other_team in population:
-                if team != other_team:
-                    for distance in distances:
-                        result = getattr(DiversityMaintenance, "_"+distance)(team, other_team)
-                        results[distance].append(result)
-            # get mean of the k nearest neighbours
-            for distance in distances:
-                sorted_list = sorted(results[distance])
-                min_values = sorted_list[:k]
-                diversity = numpy.mean(min_values)
-                team.diversity_[distance] = round_value(diversity)
-
-    @staticmethod
-    def _genotype(team, other_team):
-        """
-        Calculate the distance between pairs of teams, where the distance is the intersection of active 
-        programs divided by the union of active programs. Active programs are the ones who the output 
-        was selected at least once during the run.
-
-        More details in: 
-            "Kelly, Stephen, and Malcolm I. Heywood. "Genotypic versus Behavioural Diversity for Teams 
-            of Programs Under the 4-v-3 Keepaway Soccer Task." Twenty-Eighth AAAI Conference on 
-            Artificial Intelligence. 2014."
-
-        Examples:
-        1) 1 2 e 2 3 (mid ground) => 1 - 1/3 = 0.66
-        2) 1 2 e 1 2 (least distant) => 1 - 2/2 = 0.0
-        3) 1 2 e 3 4 (most distant) => 1 - 0/4 = 1.0
-        """
-        num_programs_intersection = len(set(team.active_programs_).intersection(other_team.active_programs_))
-        num_programs_union = len(set(team.active_programs_).union(other_team.active_programs_))
-        if num_programs_union > 0:
-            distance = 1.0 - (float(num_programs_intersection)/float(num_programs_union))
-        else:
-            print "Error: No union between teams' active programs! Look for bugs."
-            raise SystemExit
-        return distance
-
-    @staticmethod
-    def _entropy(team, other_team):
-        if not team.encodings_['encoding_custom_info_per_match']:
-            raise ValueError("No 'encoding_for_actions_per_match' for 'entropy'")
-        action_sequence = team.encodings_['encoding_for_actions_per_match']
-        other_action_sequence = other_team.encodings_['encoding_for_actions_per_match']
-        options = Config.RESTRICTIONS['total_raw_actions']
-        distance = DiversityMaintenance._general_relative_entropy_distance(action_sequence, 
-            other_action_sequence, options)
-        return distance
-
-    @staticmethod
-    def _ncd(team, other_team):
-        if not team.encodings_['encoding_custom_info_per_match']:
-            raise ValueError("No 'encoding_for_actions_per_match' for 'ncd'")
-        action_sequence = team.encodings_['encoding_for_actions_per_match']
-        other_action_sequence = other_team.encodings_['encoding_for_actions_per_match']
-        distance = DiversityMaintenance._general_normalized_compression_distance(action_sequence, 
-            other_action_sequence)
-        return distance
-
-    @staticmethod
-    def _ncd_custom(team, other_team):
-        if not team.encodings_['encoding_custom_info_per_match']:
-            raise ValueError("No custom encoding was defined for 'ncd_custom'")
-        action_sequence = team.encodings_['encoding_custom_info_per_match']
-        other_action_sequence = other_team.encodings_['encoding_custom_info_per_match']
-        distance = DiversityMaintenance._general_normalized_compression_distance(action_sequence, 
-            other_action_sequence)
-        return distance
-
-    @staticmethod
-    def _hamming(team, other_team):
-        if not team.encodings_['encoding_for_pattern_of_actions_per_match']:
-            raise ValueError("No 'encoding_for_pattern_of_actions_per_match' for 'hamming'")
-        return hamming(team.encodings_['encoding_for_pattern_of_actions_per_match'], 
-            other_team.encodings_['encoding_for_pattern_of_actions_per_match'])
-
-    @staticmethod
-    def _euclidean(team, other_team):
-        if not team.encodings_['encoding_for_pattern_of_actions_per_match']:
-            raise ValueError("No 'encoding_for_pattern_of_actions_per_match' for 'euclidean'")
-        value = euclidean(team.encodings_['encoding_for_pattern_of_actions_per_match'], 
-            other_team.encodings_['encoding_for_pattern_of_actions_per_match'])
-        max_value = DiversityMaintenance._get_max_euclidean(Config.RESTRICTIONS['diversity']['total_bins'])
-        result = value/float(max_value)
-        return result
-
-    @staticmethod
-    def _get_max_euclidean(options):
-        if 'max_euclidean' not in Config.RESTRICTIONS['diversity']:
-            max_value = math.sqrt(((options-1)**2)*Config.USER['training_parameters']['populations']['points'])
-            Config.RESTRICTIONS['diversity']['max_euclidean'] = max_value
-        return Config.RESTRICTIONS['diversity']['max_euclidean']
-
-    @staticmethod
-    def _general_normalized_compression_distance(action_sequence, other_action_sequence):
-        """
-        More details in: 
-            Gomez, Faustino J. "Sustaining diversity using behavioral information distance." Proceedings of the 
-            11th Annual conference on Genetic and evolutionary computation. ACM, 2009.
-        """
-        if len(action_sequence) == len(other_action_sequence):
-            if action_sequence == other_action_sequence:
-                return 0.0
-        x_len = len(bz2.compress("".join(action_sequence)))
-        y_len = len(bz2.compress("".join(other_action_sequence)))
-        xy_len = len(bz2.compress("".join(action_sequence+other_action_sequence)))
-        distance = (xy_len - min(x_len, y_len))/float(max(x_len, y_len))
-        distance = distance/Config.RESTRICTIONS['diversity']['max_ncd']
-        if distance < 0.0:
-            print ("Warning! Value lower than 0.0 for NCD! "
-                "Value: "+str(distance)+" ("+str(x_len)+","+str(y_len)+","+str(xy_len)+")")
-            distance = 0.0
-        if distance > 1.0:
-            print ("Warning! Value higher than 1.0 for NCD! "
-                "Value: "+str(distance)+" ("+str(x_len)+","+str(y_len)+","+str(xy_len)+")")
-            distance = 1.0
-        return distance
-
-    @staticmethod
-    def _general_relative_entropy_distance(action_sequence, other_action_sequence, options):
-        """
-
-        """
-        if len(action_sequence) == len(other_action_sequence):
-            if action_sequence == other_action_sequence:
-                return 0.0
-        max_entropy = DiversityMaintenance._get_max_entropy(options)
-        pdf = DiversityMaintenance._pdf(action_sequence, options)
-        other_pdf = DiversityMaintenance._pdf(other_action_sequence, options)
-        e1 = stats.entropy(pdf, other_pdf)
-        e2 = stats.entropy(other_pdf, pdf)
-        total = e1+e2
-        result = total/max_entropy
-        return result
-
-    @staticmethod
-    def _get_max_entropy(options):
-        if 'max_entropy' not in Config.RESTRICTIONS['diversity']:
-            pdf = DiversityMaintenance._pdf([0], options)
-            other_pdf = DiversityMaintenance._pdf([2], options)
-            e1 = stats.entropy(pdf, other_pdf)
-            e2 = stats.entropy(other_pdf, pdf)
-            total = e1+e2
-            Config.RESTRICTIONS['diversity']['max_entropy'] = total
-        return Config.RESTRICTIONS['diversity']['max_entropy']
-
-    @staticmethod
-    def _pdf(array, options):
-        probs = [0.0] * options
-        for value in array:
-            probs[int(value)] += 1.0
-        for index, value in enumerate(probs):
-            probs[index] = value/float(len(array))
-            if probs[index] == 0.0:
-                probs[index] = 0.000000000001 # to avoid values being divided by 0
-        total = sum(probs)
-        for index, value in enumerate(probs):
-            probs[index] = value/float(total)
+import math
+import numpy
+from scipy import stats
+from scipy.spatial.distance import hamming, euclidean
+from distances_cache import DistancesCache
+from ncd_compression import NCDCompression
+from ..utils.helpers import round_value
+from ..config import Config
+
+class DiversityMaintenance():
+    """
+    This class contains all the diversity maintenance methods for teams.
+    """
+
+    ncd_compression_ = None # initialized by reset_ncd_compression()
+
+    @staticmethod
+    def define_bin_for_actions(actions):
+        if len(actions) == 0:
+            return 0.0
+        weights_per_action = Config.USER['reinforcement_parameters']['environment_parameters']['weights_per_action']
+        points = 0.0
+        for action in actions:
+            points += weights_per_action[action]
+        points = points/float(len(actions))
+        return DiversityMaintenance.define_bin_for_value(points)
+
+    @staticmethod
+    def define_bin_for_value(value, is_normalized = False):
+        if is_normalized:
+            normalization_parameter = Config.RESTRICTIONS['multiply_normalization_by']
+        else:
+            normalization_parameter = 1.0
+
+        interval_amount = 1/float(Config.RESTRICTIONS['diversity']['total_bins'])
+        previous_interval = 0.0
+        for bin_number in range(Config.RESTRICTIONS['diversity']['total_bins']):
+            min_value = previous_interval*normalization_parameter
+            max_value = (bin_number+1)*interval_amount*normalization_parameter
+            if value >= min_value and value < max_value:
+                return bin_number
+            previous_interval += interval_amount
+        return Config.RESTRICTIONS['diversity']['total_bins']-1
+
+    @staticmethod
+    def calculate_diversities(teams_population, environment):
+        diversities_to_calculate = list(Config.USER['advanced_training_parameters']['diversity']['metrics'])
+
+        if "fitness_sharing" in diversities_to_calculate:
+            results = environment.results_for_points(teams_population, environment.point_population())
+            DiversityMaintenance._fitness_sharing(teams_population, results)
+            diversities_to_calculate.remove("fitness_sharing")
+        if len(diversities_to_calculate) > 0:
+            DiversityMaintenance.calculate_diversities_based_on_distances(teams_population, 
+                Config.USER['advanced_training_parameters']['diversity']['k'], diversities_to_calculate, 
+                environment.distances_cache_)
+
+    @staticmethod
+    def _fitness_sharing(population, results):
+        """
+        Uses the fitness sharing algorithm, so that individuals obtains more fitness by being able to solve
+        points that other individuals can't. It assumes that all dimension have the same weight (if it is not
+        true, normalize the dimensions before applying fitness sharing).
+
+        The results are a matrix with a row per point and a column per team. The sums use cumsum(), since
+        it adds the values in order, so the result is the same as adding them one by one in a loop.
+        """
+        for team, diversity in zip(population, DiversityMaintenance._shared_fitness(results)):
+            team.diversity_['fitness_sharing'] = round_value(diversity)
+
+    @staticmethod
+    def _shared_fitness(results):
+        # calculate denominators in each dimension, initialized to 1 so we don't divide by zero
+        denominators = numpy.cumsum(numpy.hstack([numpy.ones((len(results), 1)), results]), axis = 1)[:, -1]
+
+        # calculate fitness
+        scores = numpy.cumsum(results / denominators[:, None], axis = 0)[-1]
+        return scores/float(len(results))
+
+    @staticmethod
+    def calculate_diversities_based_on_distances(population, k, distances, distances_cache = None):
+        """
+        The kNN algorithm is applied to the list of 
+        distances, to get the k most similar teams. The diversity is average distance of the k teams.
+        In the end, teams with more uncommon program sets will obtain higher diversity scores.
+        The distances_cache keeps the distances between the calls, so the pairs of teams that didn't 
+        change aren't calculated again.
+        """
+        if distances_cache is None:
+            distances_cache = DistancesCache()
+        # a team can be twice in the population (ie. in the novelty archive), but it isn't its own neighbour
+        team_ids = numpy.array([id(team) for team in population])
+        same_team = team_ids[:, None] == team_ids[None, :]
+        for distance in distances:
+            distances_matrix = DiversityMaintenance._distances_matrix(population, distance, same_team, 
+                distances_cache)
+            distances_matrix[same_team] = numpy.inf
+            # get mean of the k nearest neighbours, sorted so they are added in the same order as before
+            if k < len(population):
+                nearest = numpy.partition(distances_matrix, k-1, axis = 1)[:, :k]
+            else:
+                nearest = distances_matrix
+            nearest = numpy.sort(nearest, axis = 1)
+            for team, values in zip(population, nearest):
+                min_values = values[values < numpy.inf][:k]
+                diversity = numpy.mean(min_values)
+                team.diversity_[distance] = round_value(diversity)
+
+    @staticmethod
+    def _distances_matrix(population, distance, same_team, distances_cache):
+        """
+        Get the matrix with the distances between each pair of teams. The symmetric distances (the ones
+        with a _<distance>_key) are stored in the distances_cache, with a row per team, and each pair 
+        is calculated only once. The rows with a vectorized version (_<distance>_rows) are calculated at 
+        once, and the others pair by pair. NCD isn't symmetric, so it uses the matrix from _<distance>_matrix.
+        """
+        if not hasattr(DiversityMaintenance, "_"+distance+"_key"):
+            return getattr(DiversityMaintenance, "_"+distance+"_matrix")(population, same_team)
+        key_function = getattr(DiversityMaintenance, "_"+distance+"_key")
+        keys = []
+        row_per_key = {}
+        rows = []
+        teams = []
+        for team in population:
+            key = (id(team), key_function(team))
+            if key not in row_per_key:
+                row_per_key[key] = len(keys)
+                keys.append(key)
+                teams.append(team)
+            rows.append(row_per_key[key])
+        if hasattr(DiversityMaintenance, "_"+distance+"_rows"):
+            rows_function = getattr(DiversityMaintenance, "_"+distance+"_rows")
+        else:
+            rows_function = lambda teams, rows: DiversityMaintenance._pairwise_distances_rows(teams, rows, distance)
+        distances_matrix = distances_cache.matrix(distance, keys, lambda new_rows: rows_function(teams, new_rows))
+        return distances_matrix[numpy.ix_(rows, rows)]
+
+    @staticmethod
+    def _pairwise_distances_rows(population, rows, distance):
+        """
+        Calculate the distances of the teams in rows with _<distance>(), pair by pair. For the pairs 
+        where both teams are in rows, only the ones above the diagonal are calculated.
+        """
+        distance_function = getattr(DiversityMaintenance, "_"+distance)
+        rows_to_skip = set()
+        distances = numpy.zeros((len(rows), len(population)))
+        for index, row in enumerate(rows):
+            rows_to_skip.add(row)
+            for column, other_team in enumerate(population):
+                if column not in rows_to_skip:
+                    distances[index, column] = distance_function(population[row], other_team)
+        return distances
+
+    @staticmethod
+    def _pairwise_rows(function, rows_encodings, encodings):
+        """
+        Apply function(rows, encodings) to chunks of rows, so the intermediate arrays with a value 
+        per pair of teams and per point fit in memory.
+        """
+        chunk_size = max(1, 2**20/max(1, encodings.size))
+        return numpy.vstack([function(rows_encodings[start:start+chunk_size], encodings) 
+            for start in range(0, len(rows_encodings), chunk_size)])
+
+    @staticmethod
+    def _encodings_matrix(population, encoding, distance):
+        sequences = [team.encodings_[encoding] for team in population]
+        if len(population) > 1 and not all(sequences):
+            raise ValueError("No '"+encoding+"' for '"+distance+"'")
+        if len(set([len(sequence) for sequence in sequences])) > 1:
+            raise ValueError('The 1d arrays must have equal lengths.')
+        return numpy.array(sequences, dtype = float)
+
+    @staticmethod
+    def _genotype(team, other_team):
+        """
+        Calculate the distance between pairs of teams, where the distance is the intersection of active 
+        programs divided by the union of active programs. Active programs are the ones who the output 
+        was selected at least once during the run.
+
+        More details in: 
+            "Kelly, Stephen, and Malcolm I. Heywood. "Genotypic versus Behavioural Diversity for Teams 
+            of Programs Under the 4-v-3 Keepaway Soccer Task." Twenty-Eighth AAAI Conference on 
+            Artificial Intelligence. 2014."
+
+        Examples:
+        1) 1 2 e 2 3 (mid ground) => 1 - 1/3 = 0.66
+        2) 1 2 e 1 2 (least distant) => 1 - 2/2 = 0.0
+        3) 1 2 e 3 4 (most distant) => 1 - 0/4 = 1.0
+        """
+        num_programs_intersection = len(set(team.active_programs_).intersection(other_team.active_programs_))
+        num_programs_union = len(set(team.active_programs_).union(other_team.active_programs_))
+        if num_programs_union > 0:
+            distance = 1.0 - (float(num_programs_intersection)/float(num_programs_union))
+        else:
+            print "Error: No union between teams' active programs! Look for bugs."
+            raise SystemExit
+        return distance
+
+    @staticmethod
+    def _genotype_key(team):
+        return frozenset(team.active_programs_)
+
+    @staticmethod
+    def _genotype_rows(population, rows):
+        """
+        Vectorized version of _genotype(), using a matrix with a row per team and a column per program,
+        where the intersections are the products of the rows.
+        """
+        active_programs = [set(team.active_programs_) for team in population]
+        column_per_program = {}
+        for programs in active_programs:
+            for program in programs:
+                if program not in column_per_program:
+                    column_per_program[program] = len(column_per_program)
+        incidence = numpy.zeros((len(population), len(column_per_program)), dtype = numpy.int64)
+        for row, programs in enumerate(active_programs):
+            incidence[row, [column_per_program[program] for program in programs]] = 1
+        num_programs_intersection = numpy.dot(incidence[rows], incidence.T)
+        num_programs = incidence.sum(axis = 1)
+        num_programs_union = num_programs[rows, None] + num_programs[None, :] - num_programs_intersection
+        num_programs_union[range(len(rows)), rows] = 1 # the distance of a team to itself isn't used
+        if (num_programs_union == 0).any():
+            print "Error: No union between teams' active programs! Look for bugs."
+            raise SystemExit
+        return 1.0 - num_programs_intersection.astype(float)/num_programs_union.astype(float)
+
+    @staticmethod
+    def _entropy(team, other_team):
+        if not team.encodings_['encoding_custom_info_per_match']:
+            raise ValueError("No 'encoding_for_actions_per_match' for 'entropy'")
+        action_sequence = team.encodings_['encoding_for_actions_per_match']
+        other_action_sequence = other_team.encodings_['encoding_for_actions_per_match']
+        options = Config.RESTRICTIONS['total_raw_actions']
+        distance = DiversityMaintenance._general_relative_entropy_distance(action_sequence, 
+            other_action_sequence, options)
+        return distance
+
+    @staticmethod
+    def _entropy_key(team):
+        return tuple(team.encodings_['encoding_for_actions_per_match'])
+
+    @staticmethod
+    def _ncd(team, other_team):
+        if not team.encodings_['encoding_custom_info_per_match']:
+            raise ValueError("No 'encoding_for_actions_per_match' for 'ncd'")
+        action_sequence = team.encodings_['encoding_for_actions_per_match']
+        other_action_sequence = other_team.encodings_['encoding_for_actions_per_match']
+        distance = DiversityMaintenance._general_normalized_compression_distance(action_sequence, 
+            other_action_sequence)
+        return distance
+
+    @staticmethod
+    def _ncd_matrix(population, same_team):
+        """
+        Vectorized version of _ncd(), that compresses each encoding alone only once.
+        """
+        if len(population) > 1 and not all([team.encodings_['encoding_custom_info_per_match'] for team in population]):
+            raise ValueError("No 'encoding_for_actions_per_match' for 'ncd'")
+        return DiversityMaintenance._normalized_compression_distances_matrix(population, same_team, 
+            'encoding_for_actions_per_match')
+
+    @staticmethod
+    def _ncd_custom_matrix(population, same_team):
+        """
+        Vectorized version of _ncd_custom(), that compresses each encoding alone only once.
+        """
+        if len(population) > 1 and not all([team.encodings_['encoding_custom_info_per_match'] for team in population]):
+            raise ValueError("No custom encoding was defined for 'ncd_custom'")
+        return DiversityMaintenance._normalized_compression_distances_matrix(population, same_team, 
+            'encoding_custom_info_per_match')
+
+    @staticmethod
+    def _ncd_custom(team, other_team):
+        if not team.encodings_['encoding_custom_info_per_match']:
+            raise ValueError("No custom encoding was defined for 'ncd_custom'")
+        action_sequence = team.encodings_['encoding_custom_info_per_match']
+        other_action_sequence = other_team.encodings_['encoding_custom_info_per_match']
+        distance = DiversityMaintenance._general_normalized_compression_distance(action_sequence, 
+            other_action_sequence)
+        return distance
+
+    @staticmethod
+    def _hamming(team, other_team):
+        if not team.encodings_['encoding_for_pattern_of_actions_per_match']:
+            raise ValueError("No 'encoding_for_pattern_of_actions_per_match' for 'hamming'")
+        return hamming(team.encodings_['encoding_for_pattern_of_actions_per_match'], 
+            other_team.encodings_['encoding_for_pattern_of_actions_per_match'])
+
+    @staticmethod
+    def _hamming_key(team):
+        return tuple(team.encodings_['encoding_for_pattern_of_actions_per_match'])
+
+    @staticmethod
+    def _hamming_rows(population, rows):
+        """
+        Vectorized version of _hamming(), the number of different values over the number of values.
+        """
+        encodings = DiversityMaintenance._encodings_matrix(population, 
+            'encoding_for_pattern_of_actions_per_match', 'hamming')
+        differences = DiversityMaintenance._pairwise_rows(
+            lambda rows, encodings: (rows[:, None, :] != encodings[None, :, :]).sum(axis = 2), 
+            encodings[rows], encodings)
+        return differences/float(encodings.shape[1])
+
+    @staticmethod
+    def _euclidean(team, other_team):
+        if not team.encodings_['encoding_for_pattern_of_actions_per_match']:
+            raise ValueError("No 'encoding_for_pattern_of_actions_per_match' for 'euclidean'")
+        value = euclidean(team.encodings_['encoding_for_pattern_of_actions_per_match'], 
+            other_team.encodings_['encoding_for_pattern_of_actions_per_match'])
+        max_value = DiversityMaintenance._get_max_euclidean(Config.RESTRICTIONS['diversity']['total_bins'])
+        result = value/float(max_value)
+        return result
+
+    @staticmethod
+    def _euclidean_key(team):
+        return tuple(team.encodings_['encoding_for_pattern_of_actions_per_match'])
+
+    @staticmethod
+    def _euclidean_rows(population, rows):
+        """
+        Vectorized version of _euclidean(). The encodings are bins (integers), so the sums of the
+        squares are exact and the distances are the same as the ones from scipy.
+        """
+        encodings = DiversityMaintenance._encodings_matrix(population, 
+            'encoding_for_pattern_of_actions_per_match', 'euclidean')
+        squares = DiversityMaintenance._pairwise_rows(
+            lambda rows, encodings: ((rows[:, None, :] - encodings[None, :, :])**2).sum(axis = 2), 
+            encodings[rows], encodings)
+        max_value = DiversityMaintenance._get_max_euclidean(Config.RESTRICTIONS['diversity']['total_bins'])
+        return numpy.sqrt(squares)/float(max_value)
+
+    @staticmethod
+    def _get_max_euclidean(options):
+        if 'max_euclidean' not in Config.RESTRICTIONS['diversity']:
+            max_value = math.sqrt(((options-1)**2)*Config.USER['training_parameters']['populations']['points'])
+            Config.RESTRICTIONS['diversity']['max_euclidean'] = max_value
+        return Config.RESTRICTIONS['diversity']['max_euclidean']
+
+    @staticmethod
+    def reset_ncd_compression():
+        DiversityMaintenance.ncd_compression_ = NCDCompression()
+
+    @staticmethod
+    def _get_ncd_compression():
+        if DiversityMaintenance.ncd_compression_ is None:
+            DiversityMaintenance.reset_ncd_compression()
+        return DiversityMaintenance.ncd_compression_
+
+    @staticmethod
+    def _normalized_compression_distances_matrix(population, same_team, encoding):
+        """
+        Get the NCD for each pair of teams, where the compressed length of each encoding alone is 
+        calculated only once, and reused by all pairs of teams.
+        """
+        ncd_compression = DiversityMaintenance._get_ncd_compression()
+        sequences = [team.encodings_[encoding] for team in population]
+        joined_sequences = ["".join(sequence) for sequence in sequences]
+        lengths = ncd_compression.lengths(joined_sequences)
+        skip = numpy.array(same_team)
+        for index, sequence in enumerate(sequences):
+            for other_index in range(index+1, len(sequences)):
+                if len(sequence) == len(sequences[other_index]):
+                    if sequence == sequences[other_index]:
+                        skip[index, other_index] = skip[other_index, index] = True
+        pair_lengths = ncd_compression.pair_lengths(joined_sequences, skip)
+        distances_matrix = numpy.zeros((len(population), len(population)))
+        for index, other_index in zip(*numpy.nonzero(~skip)):
+            distances_matrix[index, other_index] = DiversityMaintenance._ncd_from_lengths(lengths[index], 
+                lengths[other_index], int(pair_lengths[index, other_index]))
+        return distances_matrix
+
+    @staticmethod
+    def _general_normalized_compression_distance(action_sequence, other_action_sequence):
+        """
+        More details in: 
+            Gomez, Faustino J. "Sustaining diversity using behavioral information distance." Proceedings of the 
+            11th Annual conference on Genetic and evolutionary computation. ACM, 2009.
+        """
+        if len(action_sequence) == len(other_action_sequence):
+            if action_sequence == other_action_sequence:
+                return 0.0
+        compress = DiversityMaintenance._get_ncd_compression().compress_
+        x_len = len(compress("".join(action_sequence)))
+        y_len = len(compress("".join(other_action_sequence)))
+        xy_len = len(compress("".join(action_sequence+other_action_sequence)))
+        return DiversityMaintenance._ncd_from_lengths(x_len, y_len, xy_len)
+
+    @staticmethod
+    def _ncd_from_lengths(x_len, y_len, xy_len):
+        distance = (xy_len - min(x_len, y_len))/float(max(x_len, y_len))
+        distance = distance/Config.RESTRICTIONS['diversity']['max_ncd']
+        if distance < 0.0:
+            print ("Warning! Value lower than 0.0 for NCD! "
+                "Value: "+str(distance)+" ("+str(x_len)+","+str(y_len)+","+str(xy_len)+")")
+            distance = 0.0
+        if distance > 1.0:
+            print ("Warning! Value higher than 1.0 for NCD! "
+                "Value: "+str(distance)+" ("+str(x_len)+","+str(y_len)+","+str(xy_len)+")")
+            distance = 1.0
+        return distance
+
+    @staticmethod
+    def _general_relative_entropy_distance(action_sequence, other_action_sequence, options):
+        """
+
+        """
+        if len(action_sequence) == len(other_action_sequence):
+            if action_sequence == other_action_sequence:
+                return 0.0
+        max_entropy = DiversityMaintenance._get_max_entropy(options)
+        pdf = DiversityMaintenance._pdf(action_sequence, options)
+        other_pdf = DiversityMaintenance._pdf(other_action_sequence, options)
+        e1 = stats.entropy(pdf, other_pdf)
+        e2 = stats.entropy(other_pdf, pdf)
+        total = e1+e2
+        result = total/max_entropy
+        return result
+
+    @staticmethod
+    def _get_max_entropy(options):
+        if 'max_entropy' not in Config.RESTRICTIONS['diversity']:
+            pdf = DiversityMaintenance._pdf([0], options)
+            other_pdf = DiversityMaintenance._pdf([2], options)
+            e1 = stats.entropy(pdf, other_pdf)
+            e2 = stats.entropy(other_pdf, pdf)
+            total = e1+e2
+            Config.RESTRICTIONS['diversity']['max_entropy'] = total
+        return Config.RESTRICTIONS['diversity']['max_entropy']
+
+    @staticmethod
+    def _pdf(array, options):
+        probs = [0.0] * options
+        for value in array:
+            probs[int(value)] += 1.0
+        for index, value in enumerate(probs):
+            probs[index] = value/float(len(array))
+            if probs[index] == 0.0:
+                probs[index] = 0.000000000001 # to avoid values being divided by 0
+        total = sum(probs)
+        for index, value in enumerate(probs):
+            probs[index] = value/float(total)
         return probs
\ No newline at end of file
@@ -1,9 +1,19 @@
 import random
+import numpy
+from operations import Operation
 from ..config import Config
 
+# the programs store their instructions packed in an array, with a row per instruction
+MODE, TARGET, OP, SOURCE = range(4)
+INSTRUCTION_DTYPE = numpy.int16
+MODES = Config.RESTRICTIONS['genotype_options']['modes']
+
 class Instruction:
     """
     The class that represents an instruction of a program, eg.: r[1] = r[1] / r[0]
+
+    The programs don't keep Instruction objects, they keep the rows of the packed array (mode, 
+    target, op code, source), so this class is only used to create, mutate and print the rows.
     """
 
     def __init__(self, mode = None, target = None, op = None, source = None):
@@ -17,6 +27,7 @@ class Instruction:
             self.target = random.randrange(Config.RESTRICTIONS['genotype_options']['total_registers'])
         if op is None:
             self.op = random.choice(Config.USER['advanced_training_parameters']['use_operations'])
+        self.opcode = Operation.opcode(self.op)
         if source is None:
             if self.mode == 'read-register':
                 self.source = random.randrange(Config.RESTRICTIONS['genotype_options']['total_registers'])
@@ -24,21 +35,45 @@ class Instruction:
                 self.source = random.randrange(Config.RESTRICTIONS['total_inputs'])
 
     def mutate(self):
+        row = Instruction.pack([self])[0]
+        Instruction.mutate_row(row)
+        self.mode, self.target, self.op, self.source = Instruction.values(row)
+        self.opcode = Operation.opcode(self.op)
+
+    @staticmethod
+    def mutate_row(row):
+        """
+        Mutate a row of the packed instructions in place.
+        """
         instruction_parameter = random.randrange(Config.RESTRICTIONS['genotype_options']['instruction_size'])
         if instruction_parameter == 0:
-            if self.mode == Config.RESTRICTIONS['genotype_options']['modes'][0]:
-                self.mode = Config.RESTRICTIONS['genotype_options']['modes'][1]
-            else:
-                self.mode = Config.RESTRICTIONS['genotype_options']['modes'][0]
+            row[MODE] = 1 - row[MODE]
         if instruction_parameter == 1:
-            self.target = random.randrange(Config.RESTRICTIONS['genotype_options']['total_registers'])
+            row[TARGET] = random.randrange(Config.RESTRICTIONS['genotype_options']['total_registers'])
         if instruction_parameter == 2:
-            self.op = random.choice(Config.USER['advanced_training_parameters']['use_operations'])
+            row[OP] = Operation.opcode(random.choice(Config.USER['advanced_training_parameters']['use_operations']))
         if instruction_parameter == 0 or instruction_parameter == 3:
-            if self.mode == 'read-register':
-                self.source = random.randrange(Config.RESTRICTIONS['genotype_options']['total_registers'])
+            if MODES[row[MODE]] == 'read-register':
+                row[SOURCE] = random.randrange(Config.RESTRICTIONS['genotype_options']['total_registers'])
             else:
-                self.source = random.randrange(Config.RESTRICTIONS['total_inputs'])
+                row[SOURCE] = random.randrange(Config.RESTRICTIONS['total_inputs'])
+
+    @staticmethod
+    def pack(instructions):
+        rows = [(MODES.index(i.mode), i.target, i.opcode, i.source) for i in instructions]
+        return numpy.array(rows, dtype = INSTRUCTION_DTYPE).reshape((len(rows), 4))
+
+    @staticmethod
+    def values(row):
+        """
+        Get the (mode, target, op, source) of a row of the packed instructions.
+        """
+        return MODES[row[MODE]], int(row[TARGET]), Operation.OPERATORS[row[OP]], int(row[SOURCE])
+
+    @staticmethod
+    def unpack(row):
+        mode, target, op, source = Instruction.values(row)
+        return Instruction(mode = mode, target = target, op = op, source = source)
 
     def dict(self):
         return {'mode': self.mode, 'target': self.target, 'op': self.op, 'source': self.source}
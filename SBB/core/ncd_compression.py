@@ -0,0 +1,104 @@
+import bz2
+import zlib
+import time
+import numpy
+from ..environments.parallel_evaluation import forked_state, map_in_forked_processes
+from ..utils.helpers import round_value
+from ..config import Config
+
+class NCDCompression:
+    """
+    Compresses the encodings of the teams for the normalized compression distance (NCD), using the
+    compressor and the level defined by 'ncd_compressor' and 'ncd_compression_level' in the config.
+    The distances matrix compresses each encoding alone once per generation, and only the
+    concatenations are compressed per pair of teams.
+    The metrics estimate the time saved, compared to compressing the encodings again for each pair.
+    The concatenations are compressed in tiles of the team x team matrix, using the number of processes
+    defined by 'processes' in the config.
+    """
+
+    def __init__(self):
+        diversity = Config.USER['advanced_training_parameters']['diversity']
+        self.compress_ = NCDCompression.compressor(diversity['ncd_compressor'], diversity['ncd_compression_level'])
+        self.single_compressions_ = 0
+        self.pair_compressions_ = 0
+        self.avoided_compressions_ = 0
+        self.single_time_ = 0.0
+        self.pair_time_ = 0.0
+
+    @staticmethod
+    def compressor(name, level):
+        if name == 'bz2':
+            return lambda data: bz2.compress(data, level)
+        if name == 'zlib':
+            return lambda data: zlib.compress(data, level)
+        if name == 'lzma':
+            try:
+                import lzma
+            except ImportError:
+                from backports import lzma # python 2
+            return lambda data: lzma.compress(data, preset = level)
+        raise ValueError("Invalid compressor for NCD: "+str(name))
+
+    def lengths(self, data_list):
+        start_time = time.time()
+        lengths = [len(self.compress_(data)) for data in data_list]
+        self.single_time_ += time.time() - start_time
+        self.single_compressions_ += len(data_list)
+        return lengths
+
+    def pair_lengths(self, data_list, skip):
+        """
+        Get a matrix with the compressed length of data_list[row]+data_list[column], for each pair that
+        is not in skip. Only the tiles in the upper triangle are sent to the workers, and each one also
+        compresses the transposed pairs, since the compressed length of y+x may differ from x+y.
+        """
+        processes = Config.USER['advanced_training_parameters']['processes']
+        if processes <= 1 or len(data_list) < 2:
+            tiles = [(0, len(data_list), 0, len(data_list))]
+        else:
+            tile_size = max(1, len(data_list)/(processes*2)) # smaller tiles to balance the load between processes
+            starts = range(0, len(data_list), tile_size)
+            tiles = [(row, min(row+tile_size, len(data_list)), column, min(column+tile_size, len(data_list))) 
+                for row in starts for column in starts if row <= column]
+        results_per_tile = map_in_forked_processes(_pair_lengths_for_tile, tiles,
+            {'data_list': data_list, 'skip': skip, 'compress': self.compress_})
+
+        lengths = numpy.zeros(skip.shape, dtype = int)
+        for rows, columns, tile_lengths, elapsed_time in results_per_tile:
+            lengths[rows, columns] = tile_lengths
+            self.pair_time_ += elapsed_time
+            self.pair_compressions_ += len(tile_lengths)
+            self.avoided_compressions_ += 2*len(tile_lengths) # without the cache, each pair would compress both encodings again
+        return lengths
+
+    def metrics(self):
+        avoided = self.avoided_compressions_ - self.single_compressions_
+        if self.single_compressions_ > 0:
+            time_saved = avoided*self.single_time_/float(self.single_compressions_)
+        else:
+            time_saved = 0.0
+        return {
+            'compressions': self.single_compressions_+self.pair_compressions_,
+            'avoided_compressions': avoided,
+            'compression_time': round_value(self.single_time_+self.pair_time_),
+            'estimated_time_saved': round_value(time_saved),
+        }
+
+def _pair_lengths_for_tile(tile):
+    row_start, row_end, column_start, column_end = tile
+    data_list = forked_state['data_list']
+    skip = forked_state['skip']
+    compress = forked_state['compress']
+    start_time = time.time()
+    rows, columns, lengths = [], [], []
+    for row in range(row_start, row_end):
+        for column in range(max(row, column_start), column_end):
+            for x, y in [(row, column), (column, row)]:
+                if not skip[x, y]:
+                    rows.append(x)
+                    columns.append(y)
+                    lengths.append(len(compress(data_list[x]+data_list[y])))
+                if x == y:
+                    break
+    return rows, columns, lengths, time.time() - start_time
@@ -1,62 +1,148 @@
-import math
-import numpy
-import warnings
-
-class Operation():
-    """
-    Class that provides protected execution of operations.
-    If an operation results in an ArithmeticEroor, NaN, or Infinity, it returns the
-    value of the 'target' register (ie. ignores the instruction)
-    """
-
-    @staticmethod
-    def execute(operator, target, source=float('NaN')):
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore") # all errors are handled by this method, so there is no need for warnings here
-            error = False
-            try:
-                if operator == '+':
-                    result = target + source
-                elif operator == '-':
-                    result = target - source
-                elif operator == '*':
-                    result = target * source
-                elif operator == '/':
-                    result = target / source
-                elif operator == 'ln':
-                    result = numpy.log(target)
-                elif operator == 'exp':
-                    result = math.exp(target)
-                elif operator == 'cos':
-                    result = numpy.cos(target)
-                elif operator == 'sin':
-                    result = numpy.sin(target)
-                elif operator == 'if_lesser_than_for_signal':
-                    if (target < source):
-                        return -target
-                    else:
-                        return target
-                elif operator == 'if_equal_or_higher_than_for_signal':
-                    if (target >= source):
-                        return -target
-                    else:
-                        return target
-            except ArithmeticError:
-                error = True
-            if error or math.isnan(result) or math.isinf(result):
-                return target
-            return result
-
-    @staticmethod
-    def execute_if(operator, target, source):
-        if operator == 'if_lesser_than':
-            if (target < source):
-                return True
-            else:
-                return False
-        if operator == 'if_equal_or_higher_than':
-            if (target >= source):
-                return True
-            else:
-                return False
-        raise ValueError(str(operator)+" is not a valid 'if' operator.")
\ No newline at end of file
+import re
+import math
+import numpy
+import warnings
+from ..config import Config
+
+# all errors are handled by the protected operations, so their numpy warnings are ignored once here,
+# instead of in each call
+warnings.filterwarnings('ignore', category = RuntimeWarning, module = re.escape(__name__)+'$')
+
+def _protected(operation):
+    """
+    Wraps an operation so it has the same protected behavior as Operation.execute().
+    """
+    def protected_operation(target, source=float('NaN')):
+        try:
+            result = operation(target, source)
+        except ArithmeticError:
+            return target
+        if math.isnan(result) or math.isinf(result):
+            return target
+        return result
+    return protected_operation
+
+def _protected_for_arrays(operation):
+    """
+    Wraps an operation over arrays so it applies the same protected behavior as Operation.execute() 
+    for each element.
+    """
+    def protected_operation(target, source=None):
+        result = operation(target, source)
+        invalid = ~numpy.isfinite(result)
+        if invalid.any():
+            result[invalid] = target[invalid]
+        return result
+    return protected_operation
+
+def _if_lesser_than_for_signal(target, source):
+    if (target < source):
+        return -target
+    else:
+        return target
+
+def _if_equal_or_higher_than_for_signal(target, source):
+    if (target >= source):
+        return -target
+    else:
+        return target
+
+class Operation():
+    """
+    Class that provides protected execution of operations.
+    If an operation results in an ArithmeticEroor, NaN, or Infinity, it returns the
+    value of the 'target' register (ie. ignores the instruction)
+
+    The operators are registered with an integer opcode, that indexes the lists of functions, 
+    so the instructions resolve their operator only once.
+    """
+
+    OPERATORS = [] # the operator of each opcode
+    OPCODES = {} # the opcode of each operator
+    FUNCTIONS = [] # used by execute() and by compiled programs
+    ARRAY_FUNCTIONS = [] # used by programs executed over arrays of inputs, the caller must ignore the numpy warnings
+    CONDITIONS = [] # used by execute_if(), only for the 'if' operators
+
+    @staticmethod
+    def register(operator, function = None, array_function = None, condition = None, one_operand = False):
+        """
+        Register an operator, with the next opcode. The 'if' operators only have a condition, and the 
+        other ones a function and an array_function of (target, source), with the same semantics. 
+        The operator is added to the genotype options in the config, so it can be used in 'use_operations'.
+        """
+        if operator in Operation.OPCODES:
+            raise ValueError(str(operator)+" is already registered.")
+        Operation.OPCODES[operator] = len(Operation.OPERATORS)
+        Operation.OPERATORS.append(operator)
+        Operation.FUNCTIONS.append(function)
+        Operation.ARRAY_FUNCTIONS.append(array_function)
+        Operation.CONDITIONS.append(condition)
+        options = Config.RESTRICTIONS['genotype_options']
+        if operator not in options['simple_operations'] and operator not in options['complex_operations']:
+            options['complex_operations'].append(operator)
+        if one_operand and operator not in options['one-operand-instructions']:
+            options['one-operand-instructions'].append(operator)
+        if condition is not None and operator not in options['if-instructions']:
+            options['if-instructions'].append(operator)
+        return Operation.OPCODES[operator]
+
+    @staticmethod
+    def opcode(operator):
+        if operator not in Operation.OPCODES:
+            raise ValueError(str(operator)+" is not a valid operator.")
+        return Operation.OPCODES[operator]
+
+    @staticmethod
+    def execute(opcode, target, source=float('NaN')):
+        return Operation.FUNCTIONS[opcode](target, source)
+
+    @staticmethod
+    def function(operator):
+        """
+        Returns a function with the same semantics as execute() for the operator.
+        """
+        function = Operation.FUNCTIONS[Operation.opcode(operator)]
+        if function is None:
+            raise ValueError(str(operator)+" is not a valid operator.")
+        return function
+
+    @staticmethod
+    def array_function(operator):
+        """
+        Returns a function with the same semantics as execute() for the operator, applied to each 
+        element of the target and source arrays.
+        """
+        function = Operation.ARRAY_FUNCTIONS[Operation.opcode(operator)]
+        if function is None:
+            raise ValueError(str(operator)+" is not a valid operator.")
+        return function
+
+    @staticmethod
+    def execute_if(opcode, target, source):
+        condition = Operation.CONDITIONS[opcode]
+        if condition is None:
+            raise ValueError(str(Operation.OPERATORS[opcode])+" is not a valid 'if' operator.")
+        return condition(target, source)
+
+Operation.register('+', _protected(lambda target, source: target + source), 
+    _protected_for_arrays(lambda target, source: target + source))
+Operation.register('-', _protected(lambda target, source: target - source), 
+    _protected_for_arrays(lambda target, source: target - source))
+Operation.register('*', _protected(lambda target, source: target * source), 
+    _protected_for_arrays(lambda target, source: target * source))
+Operation.register('/', _protected(lambda target, source: target / source), 
+    _protected_for_arrays(lambda target, source: target / source))
+Operation.register('ln', _protected(lambda target, source: numpy.log(target)), 
+    _protected_for_arrays(lambda target, source: numpy.log(target)), one_operand = True)
+Operation.register('exp', _protected(lambda target, source: math.exp(target)), 
+    _protected_for_arrays(lambda target, source: numpy.exp(target)), one_operand = True)
+Operation.register('cos', _protected(lambda target, source: numpy.cos(target)), 
+    _protected_for_arrays(lambda target, source: numpy.cos(target)), one_operand = True)
+Operation.register('sin', _protected(lambda target, source: numpy.sin(target)), 
+    _protected_for_arrays(lambda target, source: numpy.sin(target)), one_operand = True)
+Operation.register('if_lesser_than', condition = lambda target, source: target < source)
+Operation.register('if_equal_or_higher_than', condition = lambda target, source: target >= source)
+Operation.register('if_lesser_than_for_signal', _if_lesser_than_for_signal, 
+    lambda target, source: numpy.where(target < source, -target, target))
+Operation.register('if_equal_or_higher_than_for_signal', _if_equal_or_higher_than_for_signal, 
+    lambda target, source: numpy.where(target >= source, -target, target))
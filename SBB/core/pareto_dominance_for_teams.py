@@ -1,91 +1,182 @@
-from diversity_maintenance import DiversityMaintenance
-from ..utils.helpers import is_nearly_equal_to
-from ..config import Config 
-
-class ParetoDominanceForTeams():
-    """
-    Pareto dominance: Given a set of objectives, a solution is said to Pareto dominate another if the 
-    first is not inferior to the second in all objectives, and, additionally, there is at least one 
-    objective where it is better.
-
-    This code is based on Stephen's version of the C++ SBB, that was focused in using pareto for 
-    multi-objective between fitness and novelty for the teams.
-    """
-
-    @staticmethod
-    def run(teams_population, novelty, teams_to_keep):
-        front, dominateds = ParetoDominanceForTeams._pareto_front(teams_population, novelty)
-        pareto_front = list(front)
-        keep_solutions = list(front)
-        remove_solutions = list(dominateds)
-        if len(keep_solutions) < teams_to_keep: # must include some teams from dominateds
-            keep_solutions, remove_solutions = ParetoDominanceForTeams._balance_pareto_front_to_up(dominateds, keep_solutions, remove_solutions, teams_to_keep)
-        if len(keep_solutions) > teams_to_keep: # must discard some teams from front
-            keep_solutions, remove_solutions = ParetoDominanceForTeams._balance_pareto_front_to_down(front, keep_solutions, remove_solutions, teams_to_keep)
-        return keep_solutions, remove_solutions, pareto_front
-
-    @staticmethod
-    def _pareto_front(teams_population, novelty):
-        """
-        Finds the pareto front, i.e. the pareto dominant solutions.
-        """
-        for team in teams_population:
-            team.dom_by_ = 0
-            team.dom_of_ = 0
-
-        front = []
-        dominateds = []
-        for teamA in teams_population:
-            for teamB in teams_population:
-                # check if there are teams that have a better or equal [fitness, novelty] and that are better in at least 
-                # one of the dimensions. If yes, then teamA is dominated by these teams.
-                if ParetoDominanceForTeams._is_dominated(teamA, teamB, novelty):
-                    teamA.dom_by_ += 1
-                    teamB.dom_of_ += 1
-                    if teamA not in dominateds:
-                        dominateds.append(teamA)
-            if teamA.dom_by_ == 0:
-                front.append(teamA)
-
-        # use this score to balance the teams between remove and keep
-        for team in teams_population:
-            team.submission_score_ = team.dom_by_/float(len(teams_population)) # use it to add teams to the front (the lower, the better)
-            team.dominance_score_ = team.dom_of_/float(len(teams_population)) # use it to remove teams from the front (the higher, the better)
-        return front, dominateds
-
-    @staticmethod
-    def _is_dominated(teamA, teamB, novelty):
-        """
-        Check if a solution is domninated or equal to another, assuming that higher results are better than lower ones.
-        """  
-        if (teamB.fitness_ >= teamA.fitness_ and teamB.diversity_[novelty] >= teamA.diversity_[novelty] and 
-                ((teamB.fitness_ > teamA.fitness_ and not is_nearly_equal_to(teamA.fitness_, teamB.fitness_)) or
-                (teamB.diversity_[novelty] > teamA.diversity_[novelty] and 
-                not is_nearly_equal_to(teamA.diversity_[novelty], teamB.diversity_[novelty])))):
-            return True
-        return False
-
-    @staticmethod
-    def _balance_pareto_front_to_up(dominateds, keep_solutions, remove_solutions, teams_to_keep):
-        available = [team for team in dominateds if team.fitness_ > 0.0]
-        if len(available) < teams_to_keep:
-            not_available = [team for team in dominateds if team.fitness_ == 0.0]
-            available += not_available[:teams_to_keep-len(available)]
-        sorted_solutions = sorted(available, key=lambda solution: solution.submission_score_, reverse = False) # worse ones first
-        for solution in sorted_solutions:
-            if solution not in keep_solutions:
-                keep_solutions.append(solution)
-                remove_solutions.remove(solution)
-            if len(keep_solutions) == teams_to_keep:
-                break
-        return keep_solutions, remove_solutions
-
-    @staticmethod
-    def _balance_pareto_front_to_down(front, keep_solutions, remove_solutions, teams_to_keep):
-        sorted_solutions = sorted(front, key=lambda solution: solution.dominance_score_, reverse = True) # better ones first
-        for solution in sorted_solutions:
-            keep_solutions.remove(solution)
-            remove_solutions.append(solution)
-            if len(keep_solutions) == teams_to_keep:
-                break
+import bisect
+import math
+from diversity_maintenance import DiversityMaintenance
+from ..utils.helpers import is_nearly_equal_to
+from ..config import Config 
+
+class ParetoDominanceForTeams():
+    """
+    Pareto dominance: Given a set of objectives, a solution is said to Pareto dominate another if the 
+    first is not inferior to the second in all objectives, and, additionally, there is at least one 
+    objective where it is better.
+
+    This code is based on Stephen's version of the C++ SBB, that was focused in using pareto for 
+    multi-objective between fitness and novelty for the teams.
+    """
+
+    @staticmethod
+    def run(teams_population, novelty, teams_to_keep):
+        front, dominateds = ParetoDominanceForTeams._pareto_front(teams_population, novelty)
+        pareto_front = list(front)
+        keep_solutions = list(front)
+        remove_solutions = list(dominateds)
+        if len(keep_solutions) < teams_to_keep: # must include some teams from dominateds
+            keep_solutions, remove_solutions = ParetoDominanceForTeams._balance_pareto_front_to_up(dominateds, keep_solutions, remove_solutions, teams_to_keep)
+        if len(keep_solutions) > teams_to_keep: # must discard some teams from front
+            keep_solutions, remove_solutions = ParetoDominanceForTeams._balance_pareto_front_to_down(front, keep_solutions, remove_solutions, teams_to_keep)
+        return keep_solutions, remove_solutions, pareto_front
+
+    @staticmethod
+    def _pareto_front(teams_population, novelty):
+        """
+        Finds the pareto front, i.e. the pareto dominant solutions.
+
+        Instead of comparing each pair of teams, it counts the teams inside rectangles of the 
+        [fitness, novelty] plane, in O(N log N). A teamB dominates a teamA if it is better or equal in 
+        both dimensions (the rectangle above teamA), except if it is nearly equal in both dimensions
+        (the small rectangle just above teamA), so the counts are the same as with _is_dominated().
+        """
+        for team in teams_population:
+            team.dom_by_ = 0
+            team.dom_of_ = 0
+
+        # a nan value can't dominate or be dominated
+        teams = [team for team in teams_population 
+            if not math.isnan(team.fitness_) and not math.isnan(team.diversity_[novelty])]
+        if len(teams) > 0:
+            fitness_positions, fitness_bounds = ParetoDominanceForTeams._positions_and_bounds(
+                [team.fitness_ for team in teams])
+            novelty_positions, novelty_bounds = ParetoDominanceForTeams._positions_and_bounds(
+                [team.diversity_[novelty] for team in teams])
+            total = len(teams)
+            rectangles = []
+            for (below_f, start_f, end_f, above_f), (below_n, start_n, end_n, above_n) in zip(fitness_bounds, novelty_bounds):
+                rectangles.append((start_f, total, start_n, total)) # teams better or equal
+                rectangles.append((start_f, above_f, start_n, above_n)) # teams better or equal, but nearly equal
+                rectangles.append((0, end_f, 0, end_n)) # teams worse or equal
+                rectangles.append((below_f, end_f, below_n, end_n)) # teams worse or equal, but nearly equal
+            counts = ParetoDominanceForTeams._count_points_in_rectangles(fitness_positions, novelty_positions, 
+                rectangles)
+            for index, team in enumerate(teams):
+                team.dom_by_ = counts[4*index] - counts[4*index+1]
+                team.dom_of_ = counts[4*index+2] - counts[4*index+3]
+
+        front = [team for team in teams_population if team.dom_by_ == 0]
+        dominateds = [team for team in teams_population if team.dom_by_ > 0]
+
+        # use this score to balance the teams between remove and keep
+        for team in teams_population:
+            team.submission_score_ = team.dom_by_/float(len(teams_population)) # use it to add teams to the front (the lower, the better)
+            team.dominance_score_ = team.dom_of_/float(len(teams_population)) # use it to remove teams from the front (the higher, the better)
+        return front, dominateds
+
+    @staticmethod
+    def _is_dominated(teamA, teamB, novelty):
+        """
+        Check if a solution is domninated or equal to another, assuming that higher results are better than lower ones.
+        """  
+        if (teamB.fitness_ >= teamA.fitness_ and teamB.diversity_[novelty] >= teamA.diversity_[novelty] and 
+                ((teamB.fitness_ > teamA.fitness_ and not is_nearly_equal_to(teamA.fitness_, teamB.fitness_)) or
+                (teamB.diversity_[novelty] > teamA.diversity_[novelty] and 
+                not is_nearly_equal_to(teamA.diversity_[novelty], teamB.diversity_[novelty])))):
+            return True
+        return False
+
+    @staticmethod
+    def _positions_and_bounds(values):
+        """
+        Get the position of each value in the sorted values, and the bounds of the ranges of positions 
+        with the values that are: nearly equal and lower (start), equal (start and end), and nearly 
+        equal and higher (end).
+        """
+        order = sorted(range(len(values)), key = lambda index: values[index])
+        positions = [0]*len(values)
+        for position, index in enumerate(order):
+            positions[index] = position
+        sorted_values = [values[index] for index in order]
+        bounds = []
+        for value in values:
+            bounds.append((
+                ParetoDominanceForTeams._first_position(sorted_values, 
+                    lambda other: other >= value or is_nearly_equal_to(value, other)),
+                bisect.bisect_left(sorted_values, value),
+                bisect.bisect_right(sorted_values, value),
+                ParetoDominanceForTeams._first_position(sorted_values, 
+                    lambda other: other > value and not is_nearly_equal_to(value, other)),
+            ))
+        return positions, bounds
+
+    @staticmethod
+    def _first_position(sorted_values, condition):
+        """
+        Binary search for the first value that meets the condition, which must be False for the lower
+        values and True for the higher ones.
+        """
+        low, high = 0, len(sorted_values)
+        while low < high:
+            middle = (low+high)/2
+            if condition(sorted_values[middle]):
+                high = middle
+            else:
+                low = middle+1
+        return low
+
+    @staticmethod
+    def _count_points_in_rectangles(x_positions, y_positions, rectangles):
+        """
+        Count the points inside each rectangle [x_start, x_end) x [y_start, y_end), where the points 
+        are given by their positions in each axis. It sweeps the x axis, adding the points to a 
+        Fenwick tree over the y axis, and each rectangle is the combination of four counts of points 
+        below and to the left of a corner.
+        """
+        total = len(x_positions)
+        point_per_x_position = [0]*total
+        for point, x_position in enumerate(x_positions):
+            point_per_x_position[x_position] = point
+        corners_per_x_position = [[] for _ in range(total+1)]
+        for index, (x_start, x_end, y_start, y_end) in enumerate(rectangles):
+            corners_per_x_position[x_end].append((index, y_end, 1))
+            corners_per_x_position[x_start].append((index, y_end, -1))
+            corners_per_x_position[x_end].append((index, y_start, -1))
+            corners_per_x_position[x_start].append((index, y_start, 1))
+
+        counts = [0]*len(rectangles)
+        tree = [0]*(total+1)
+        for x_position in range(total+1):
+            for index, y_position, sign in corners_per_x_position[x_position]:
+                count = 0
+                while y_position > 0:
+                    count += tree[y_position]
+                    y_position -= y_position & -y_position
+                counts[index] += sign*count
+            if x_position < total:
+                y_position = y_positions[point_per_x_position[x_position]]+1
+                while y_position <= total:
+                    tree[y_position] += 1
+                    y_position += y_position & -y_position
+        return counts
+
+    @staticmethod
+    def _balance_pareto_front_to_up(dominateds, keep_solutions, remove_solutions, teams_to_keep):
+        available = [team for team in dominateds if team.fitness_ > 0.0]
+        if len(available) < teams_to_keep:
+            not_available = [team for team in dominateds if team.fitness_ == 0.0]
+            available += not_available[:teams_to_keep-len(available)]
+        sorted_solutions = sorted(available, key=lambda solution: solution.submission_score_, reverse = False) # worse ones first
+        for solution in sorted_solutions:
+            if solution not in keep_solutions:
+                keep_solutions.append(solution)
+                remove_solutions.remove(solution)
+            if len(keep_solutions) == teams_to_keep:
+                break
+        return keep_solutions, remove_solutions
+
+    @staticmethod
+    def _balance_pareto_front_to_down(front, keep_solutions, remove_solutions, teams_to_keep):
+        sorted_solutions = sorted(front, key=lambda solution: solution.dominance_score_, reverse = True) # better ones first
+        for solution in sorted_solutions:
+            keep_solutions.remove(solution)
+            remove_solutions.append(solution)
+            if len(keep_solutions) == teams_to_keep:
+                break
         return keep_solutions, remove_solutions
\ No newline at end of file
@@ -1,217 +1,379 @@
-import random
-from instruction import Instruction
-from operations import Operation
-from ..config import Config
-
-def reset_programs_ids():
-    global next_program_id
-    next_program_id = 0
-
-def get_program_id():
-    global next_program_id
-    next_program_id += 1
-    return next_program_id
- 
-class Program:
-    def __init__(self, generation, instructions, action, program_id = None):
-        self.generation = generation
-        self.instructions = instructions
-        self.action = action
-        if program_id is None:
-            self.program_id_ = get_program_id()
-        else:
-            self.program_id_ = program_id
-        self.teams_ = []
-        self.instructions_without_introns_ = []
-        self.inputs_list_ = []
-        self.general_registers_ = [0] * Config.RESTRICTIONS['genotype_options']['total_registers']
-
-    def reset_registers(self):
-        self.general_registers_ = [0] * Config.RESTRICTIONS['genotype_options']['total_registers']
-
-    def execute(self, input_registers, force_reset = False):
-        """
-        Execute code for each input
-        """
-        if len(self.instructions_without_introns_) == 0:
-            self.instructions_without_introns_ = Program.remove_introns(self.instructions)
-            self.inputs_list_ = self._inputs_list()
-        instructions = self.instructions_without_introns_
-        if Config.USER['task'] == 'classification' or force_reset:
-            self.reset_registers()
-        
-        if_instruction = None
-        skip_next = False
-        for instruction in instructions:
-            if if_instruction and not Operation.execute_if(if_instruction.op, if_instruction.target, 
-                    if_instruction.source):
-                if_instruction = None
-                if instruction.op in Config.RESTRICTIONS['genotype_options']['if-instructions']:
-                    skip_next = True
-            elif skip_next:
-                if instruction.op in Config.RESTRICTIONS['genotype_options']['if-instructions']:
-                    skip_next = True
-                else:
-                    skip_next = False
-            elif instruction.op in Config.RESTRICTIONS['genotype_options']['if-instructions']:
-                if_instruction = instruction
-            elif instruction.op in Config.RESTRICTIONS['genotype_options']['one-operand-instructions']:
-                self.general_registers_[instruction.target] = Operation.execute(instruction.op, 
-                    self.general_registers_[instruction.target])
-            else:
-                if instruction.mode == 'read-register':
-                    source =  self.general_registers_[instruction.source]
-                else:
-                    source =  input_registers[instruction.source]
-                self.general_registers_[instruction.target] = Operation.execute(instruction.op, 
-                    self.general_registers_[instruction.target], source)
-
-        return self.general_registers_[0] # get bid output
-
-    def _inputs_list(self):
-        inputs = []
-        for instruction in self.instructions_without_introns_:
-            if (instruction.mode == 'read-input' 
-                and instruction.op not in Config.RESTRICTIONS['genotype_options']['one-operand-instructions']
-                and instruction.source not in inputs):
-                inputs.append(instruction.source)
-        return inputs
-
-    def get_action_result(self, point_id, inputs, valid_actions, is_training):
-        if self.is_atomic_action():
-            return self.action
-        else:
-            team = Config.RESTRICTIONS['second_layer']['action_mapping'][self.action]
-            return team.execute(point_id, inputs, valid_actions, is_training, update_profile = False)
-
-    def is_atomic_action(self):
-        if not Config.USER['advanced_training_parameters']['second_layer']['enabled']:
-            return True
-        else:
-            if self.generation == -1:
-                return True # WARNING: Incompatible for more than 2 layers
-            else:
-                return False
-
-    def get_raw_actions(self):
-        if self.is_atomic_action():
-            return [self.action]
-        else:
-            meta_action = self.action
-            team = Config.RESTRICTIONS['second_layer']['action_mapping'][meta_action]
-            actions = [p.action for p in team.programs]
-            return actions
-
-    def mutate(self):
-        mutation_chance = random.random()
-        if (mutation_chance <= Config.USER['training_parameters']['mutation']['program']['remove_instruction'] 
-                and len(self.instructions) > Config.USER['training_parameters']['program_size']['min']):
-            self.instructions.remove(random.choice(self.instructions))
-
-        mutation_chance = random.random()
-        if mutation_chance <= Config.USER['training_parameters']['mutation']['program']['change_instruction']:
-            instruction = random.choice(self.instructions)
-            instruction.mutate()
- 
-        mutation_chance = random.random()
-        if (mutation_chance <= Config.USER['training_parameters']['mutation']['program']['add_instruction'] 
-                and len(self.instructions) < Config.USER['training_parameters']['program_size']['max']):
-            index = random.randrange(len(self.instructions))
-            self.instructions.insert(index, Instruction())
-        
-        mutation_chance = random.random()
-        if (mutation_chance <= Config.USER['training_parameters']['mutation']['program']['swap_instructions'] 
-                and len(self.instructions) > Config.USER['training_parameters']['program_size']['min']):
-            available_indeces = range(len(self.instructions))
-            index1 = random.choice(available_indeces)
-            available_indeces.remove(index1)
-            index2 = random.choice(available_indeces)
-            temp = self.instructions[index1]
-            self.instructions[index1] = self.instructions[index2]
-            self.instructions[index2] = temp
-
-        mutation_chance = random.random()
-        if mutation_chance <= Config.USER['training_parameters']['mutation']['program']['change_action']:
-            self.action = random.randrange(Config.RESTRICTIONS['total_actions'])
-
-    def add_team(self, team):
-        self.teams_.append(team)
-
-    def remove_team(self, team):
-        self.teams_.remove(team)
-
-    def dict(self):
-        save = {}
-        save['program_id'] = self.program_id_
-        save['action'] = self.action
-        if self.is_atomic_action():
-            save['action_type'] = 'atomic'
-        else:
-            save['action_type'] = 'meta'
-        save['instructions'] = []
-        for instruction in self.instructions:
-            save['instructions'].append(instruction.dict())
-        return save
-
-    def __repr__(self):
-        return "("+str(self.program_id_)+":"+str(self.generation)+", "+str(self.action)+")"
-
-    def __str__(self):
-        text = "\n#### Program "+self.__repr__()
-        teams_ids = [t.__repr__() for t in self.teams_]
-        text += "\nParticipate in the teams ("+str(len(teams_ids))+"): "+str(teams_ids)
-        if self.is_atomic_action():
-            text += "\nAction Type: atomic"
-        else:
-            text += "\nAction Type: meta"
-        text += "\n================\n"
-        text += "\nTotal instructions (without introns): "+str(len(self.instructions_without_introns_))
-        text += "\nInputs used: "+str(self.inputs_list_)
-        text += "\n----------------\n"
-        text += "\n"+Program.print_indented_instructions(self.instructions_without_introns_)
-        text += "\n================\n"
-        text += "\nTotal instructions: "+str(len(self.instructions))
-        text += "\n----------------\n"
-        text += "\n"+Program.print_indented_instructions(self.instructions)
-        text += "\n################"
-        return text
-
-    @staticmethod
-    def print_indented_instructions(instructions):
-        text = ""
-        indentation = 0
-        spaces = 4
-        for instruction in instructions:
-            text += (" ")*spaces*indentation+str(instruction)+"\n"
-            if instruction.op in Config.RESTRICTIONS['genotype_options']['if-instructions']:
-                indentation += 1
-            else:
-                indentation = 0
-        return text
-
-    @staticmethod
-    def remove_introns(instructions):
-        """
-        Remove introns (ie. instructions that don't affect the final output)
-        """
-        instructions_without_introns = []
-        relevant_registers = [0]
-        ignore_previous_if = True
-        for instruction in reversed(instructions):
-            if (instruction.target in relevant_registers 
-                or instruction.op in Config.RESTRICTIONS['genotype_options']['if-instructions']):
-                if ignore_previous_if and instruction.op in Config.RESTRICTIONS['genotype_options']['if-instructions']:
-                    continue
-                else:
-                    ignore_previous_if = False
-                    instructions_without_introns.insert(0, instruction)
-                    if not instruction.op in Config.RESTRICTIONS['genotype_options']['one-operand-instructions']:
-                        if instruction.mode == 'read-register' and instruction.source not in relevant_registers:
-                            relevant_registers.append(instruction.source)
-                    if (instruction.op in Config.RESTRICTIONS['genotype_options']['if-instructions'] 
-                        or instruction.op in Config.RESTRICTIONS['genotype_options']['if-instructions-for-signal']):
-                        if instruction.target not in relevant_registers:
-                            relevant_registers.append(instruction.target)
-            else:
-                ignore_previous_if = True
-        return instructions_without_introns
\ No newline at end of file
+import random
+import numpy
+from instruction import Instruction, MODES, OP
+from operations import Operation
+from ..utils.helpers import actions_mask
+from ..config import Config
+
+def reset_programs_ids():
+    global next_program_id
+    next_program_id = 0
+
+def get_program_id():
+    global next_program_id
+    next_program_id += 1
+    return next_program_id
+ 
+class Program:
+    def __init__(self, generation, instructions, action, program_id = None):
+        """
+        The instructions are packed in an array with a row per instruction (see instruction.py), 
+        and a list of Instruction objects is packed when the program is created.
+        """
+        self.generation = generation
+        if not isinstance(instructions, numpy.ndarray):
+            instructions = Instruction.pack(instructions)
+        self.instructions = instructions
+        self.action = action
+        if program_id is None:
+            self.program_id_ = get_program_id()
+        else:
+            self.program_id_ = program_id
+        self.teams_ = []
+        self.compiled_program_ = None
+        self.compiled_program_for_arrays_ = None
+        self.raw_actions_mask_ = None
+        self.general_registers_ = [0] * Config.RESTRICTIONS['genotype_options']['total_registers']
+        self._analyze_effective_program()
+
+    def reset_registers(self):
+        self.general_registers_ = [0] * Config.RESTRICTIONS['genotype_options']['total_registers']
+
+    def execute(self, input_registers, force_reset = False):
+        """
+        Execute code for each input
+        """
+        if Config.USER['task'] == 'classification' or force_reset:
+            self.reset_registers()
+
+        if Config.RESTRICTIONS['use_compiled_programs']:
+            if self.compiled_program_ is None:
+                self.compiled_program_ = Program.compile(self.instructions_without_introns_)
+            return self.compiled_program_(self.general_registers_, input_registers)
+        
+        if_step = None
+        skip_next = False
+        for step in self.effective_steps_:
+            step_type, opcode, target, source = step
+            if if_step and not Operation.execute_if(if_step[1], if_step[2], if_step[3]):
+                if_step = None
+                if step_type == 'if':
+                    skip_next = True
+            elif skip_next:
+                if step_type == 'if':
+                    skip_next = True
+                else:
+                    skip_next = False
+            elif step_type == 'if':
+                if_step = step
+            elif step_type == 'one-operand':
+                self.general_registers_[target] = Operation.execute(opcode, self.general_registers_[target])
+            else:
+                if step_type == 'read-register':
+                    source =  self.general_registers_[source]
+                else:
+                    source =  input_registers[source]
+                self.general_registers_[target] = Operation.execute(opcode, self.general_registers_[target], source)
+
+        return self.general_registers_[0] # get bid output
+
+    def execute_for_arrays(self, inputs_matrix):
+        """
+        Execute code for each row of a (points x inputs) matrix at once, with one array of registers 
+        per register. It is equivalent to execute() only when the registers are reset before each 
+        execution (ie. for classification). Returns the array of bids.
+        """
+        if self.compiled_program_for_arrays_ is None:
+            self.compiled_program_for_arrays_ = Program.compile_for_arrays(self.instructions_without_introns_)
+        return self.compiled_program_for_arrays_(inputs_matrix)
+
+    def _analyze_effective_program(self):
+        """
+        Remove the introns, and store the effective instructions, the inputs and the registers they use,
+        and the steps executed by the interpreter. It runs when the program is created or mutated, so
+        the execution and the metrics only read the results.
+        """
+        self.instructions_without_introns_ = self.instructions[Program.effective_rows(self.instructions)]
+        self.instructions_without_introns_.flags.writeable = False # the compiled programs and the steps use it
+        values = [Instruction.values(row) for row in self.instructions_without_introns_]
+        steps = [Program._step(mode, target, op, source, row[OP]) 
+            for (mode, target, op, source), row in zip(values, self.instructions_without_introns_)]
+        inputs = []
+        registers = []
+        for mode, target, op, source in values:
+            if target not in registers:
+                registers.append(target)
+            if op not in Config.RESTRICTIONS['genotype_options']['one-operand-instructions']:
+                if mode == 'read-input' and source not in inputs:
+                    inputs.append(source)
+                if mode == 'read-register' and source not in registers:
+                    registers.append(source)
+        self.effective_steps_ = tuple(steps)
+        self.inputs_list_ = tuple(inputs)
+        self.registers_list_ = tuple(registers)
+
+    @staticmethod
+    def _step(mode, target, op, source, opcode):
+        if op in Config.RESTRICTIONS['genotype_options']['if-instructions']:
+            step_type = 'if'
+        elif op in Config.RESTRICTIONS['genotype_options']['one-operand-instructions']:
+            step_type = 'one-operand'
+        else:
+            step_type = mode
+        return (step_type, int(opcode), target, source)
+
+    def get_action_result(self, point_id, inputs, valid_actions, is_training):
+        if self.is_atomic_action():
+            return self.action
+        else:
+            team = Config.RESTRICTIONS['second_layer']['action_mapping'][self.action]
+            return team.execute(point_id, inputs, valid_actions, is_training, update_profile = False)
+
+    def is_atomic_action(self):
+        if not Config.USER['advanced_training_parameters']['second_layer']['enabled']:
+            return True
+        else:
+            if self.generation == -1:
+                return True # WARNING: Incompatible for more than 2 layers
+            else:
+                return False
+
+    def get_raw_actions(self):
+        if self.is_atomic_action():
+            return [self.action]
+        else:
+            meta_action = self.action
+            team = Config.RESTRICTIONS['second_layer']['action_mapping'][meta_action]
+            actions = [p.action for p in team.programs]
+            return actions
+
+    def get_raw_actions_mask(self):
+        """
+        The raw actions as a bitset, with the bit 1 << action set for each action. It is calculated 
+        when first used, since the raw actions of meta actions depend on the second layer.
+        """
+        if self.raw_actions_mask_ is None:
+            self.raw_actions_mask_ = actions_mask(self.get_raw_actions())
+        return self.raw_actions_mask_
+
+    def mutate(self):
+        """
+        Mutate the packed instructions. The indices are chosen with the same calls to random as 
+        choosing from a list of instructions.
+        """
+        self.compiled_program_ = None
+        self.compiled_program_for_arrays_ = None
+
+        mutation_chance = random.random()
+        if (mutation_chance <= Config.USER['training_parameters']['mutation']['program']['remove_instruction'] 
+                and len(self.instructions) > Config.USER['training_parameters']['program_size']['min']):
+            index = random.randrange(len(self.instructions))
+            self.instructions = numpy.delete(self.instructions, index, axis = 0)
+
+        mutation_chance = random.random()
+        if mutation_chance <= Config.USER['training_parameters']['mutation']['program']['change_instruction']:
+            index = random.randrange(len(self.instructions))
+            Instruction.mutate_row(self.instructions[index])
+ 
+        mutation_chance = random.random()
+        if (mutation_chance <= Config.USER['training_parameters']['mutation']['program']['add_instruction'] 
+                and len(self.instructions) < Config.USER['training_parameters']['program_size']['max']):
+            index = random.randrange(len(self.instructions))
+            self.instructions = numpy.insert(self.instructions, index, Instruction.pack([Instruction()]), axis = 0)
+        
+        mutation_chance = random.random()
+        if (mutation_chance <= Config.USER['training_parameters']['mutation']['program']['swap_instructions'] 
+                and len(self.instructions) > Config.USER['training_parameters']['program_size']['min']):
+            available_indeces = range(len(self.instructions))
+            index1 = random.choice(available_indeces)
+            available_indeces.remove(index1)
+            index2 = random.choice(available_indeces)
+            self.instructions[[index1, index2]] = self.instructions[[index2, index1]]
+
+        mutation_chance = random.random()
+        if mutation_chance <= Config.USER['training_parameters']['mutation']['program']['change_action']:
+            self.action = random.randrange(Config.RESTRICTIONS['total_actions'])
+            self.raw_actions_mask_ = None
+            for team in self.teams_:
+                team.actions_mask_ = None
+
+        self._analyze_effective_program()
+
+    def add_team(self, team):
+        self.teams_.append(team)
+
+    def remove_team(self, team):
+        self.teams_.remove(team)
+
+    def dict(self):
+        save = {}
+        save['program_id'] = self.program_id_
+        save['action'] = self.action
+        if self.is_atomic_action():
+            save['action_type'] = 'atomic'
+        else:
+            save['action_type'] = 'meta'
+        save['instructions'] = [Instruction.unpack(row).dict() for row in self.instructions]
+        return save
+
+    def __repr__(self):
+        return "("+str(self.program_id_)+":"+str(self.generation)+", "+str(self.action)+")"
+
+    def __str__(self):
+        text = "\n#### Program "+self.__repr__()
+        teams_ids = [t.__repr__() for t in self.teams_]
+        text += "\nParticipate in the teams ("+str(len(teams_ids))+"): "+str(teams_ids)
+        if self.is_atomic_action():
+            text += "\nAction Type: atomic"
+        else:
+            text += "\nAction Type: meta"
+        text += "\n================\n"
+        text += "\nTotal instructions (without introns): "+str(len(self.instructions_without_introns_))
+        text += "\nInputs used: "+str(self.inputs_list_)
+        text += "\n----------------\n"
+        text += "\n"+Program.print_indented_instructions(self.instructions_without_introns_)
+        text += "\n================\n"
+        text += "\nTotal instructions: "+str(len(self.instructions))
+        text += "\n----------------\n"
+        text += "\n"+Program.print_indented_instructions(self.instructions)
+        text += "\n################"
+        return text
+
+    @staticmethod
+    def print_indented_instructions(instructions):
+        text = ""
+        indentation = 0
+        spaces = 4
+        for row in instructions:
+            instruction = Instruction.unpack(row)
+            text += (" ")*spaces*indentation+str(instruction)+"\n"
+            if instruction.op in Config.RESTRICTIONS['genotype_options']['if-instructions']:
+                indentation += 1
+            else:
+                indentation = 0
+        return text
+
+    @staticmethod
+    def compile(instructions):
+        """
+        Generates a function equivalent to execute() for the instructions (that should be 
+        already without introns). The 'if' instructions are compared using the indeces in 
+        the instruction (the same way execute() does it), so the instructions that will run 
+        are known beforehand and only them are compiled.
+        """
+        namespace = {}
+        lines = []
+        for index, (mode, target, op, source) in enumerate(Program.reachable_instructions(instructions)):
+            operation = "operation"+str(index)
+            namespace[operation] = Operation.function(op)
+            target = "registers["+str(target)+"]"
+            if op in Config.RESTRICTIONS['genotype_options']['one-operand-instructions']:
+                lines.append(target+" = "+operation+"("+target+")")
+            elif mode == 'read-register':
+                lines.append(target+" = "+operation+"("+target+", registers["+str(source)+"])")
+            else:
+                lines.append(target+" = "+operation+"("+target+", inputs["+str(source)+"])")
+        code = "def compiled_program(registers, inputs):\n"
+        if len(lines) > 0:
+            code += "".join(["    "+line+"\n" for line in lines])
+        code += "    return registers[0]\n"
+        exec code in namespace
+        return namespace['compiled_program']
+
+    @staticmethod
+    def compile_for_arrays(instructions):
+        """
+        Generates a function equivalent to execute_for_arrays() for the instructions. Since the 
+        'if' instructions are resolved beforehand (see compile()), their mask is the same for 
+        all rows, so only the reachable instructions are kept.
+        """
+        steps = []
+        for mode, target, op, source in Program.reachable_instructions(instructions):
+            if op in Config.RESTRICTIONS['genotype_options']['one-operand-instructions']:
+                source_type = 'none'
+            elif mode == 'read-register':
+                source_type = 'register'
+            else:
+                source_type = 'input'
+            steps.append((Operation.array_function(op), target, source_type, source))
+
+        def compiled_program_for_arrays(inputs_matrix):
+            registers = numpy.zeros((Config.RESTRICTIONS['genotype_options']['total_registers'], 
+                len(inputs_matrix)))
+            with numpy.errstate(all = 'ignore'):
+                for operation, target, source_type, source in steps:
+                    if source_type == 'none':
+                        registers[target] = operation(registers[target])
+                    elif source_type == 'register':
+                        registers[target] = operation(registers[target], registers[source])
+                    else:
+                        registers[target] = operation(registers[target], inputs_matrix[:, source])
+            return registers[0]
+        return compiled_program_for_arrays
+
+    @staticmethod
+    def reachable_instructions(instructions):
+        """
+        Returns the (mode, target, op, source) of the non-'if' packed instructions that execute() 
+        runs, following the same rules it uses to skip instructions.
+        """
+        reachable = []
+        if_instruction = None
+        skip_next = False
+        for instruction in [Instruction.values(row) for row in instructions]:
+            mode, target, op, source = instruction
+            if if_instruction and not Operation.execute_if(Operation.opcode(if_instruction[2]), 
+                    if_instruction[1], if_instruction[3]):
+                if_instruction = None
+                if op in Config.RESTRICTIONS['genotype_options']['if-instructions']:
+                    skip_next = True
+            elif skip_next:
+                if op in Config.RESTRICTIONS['genotype_options']['if-instructions']:
+                    skip_next = True
+                else:
+                    skip_next = False
+            elif op in Config.RESTRICTIONS['genotype_options']['if-instructions']:
+                if_instruction = instruction
+            else:
+                reachable.append(instruction)
+        return reachable
+
+    @staticmethod
+    def remove_introns(instructions):
+        """
+        Remove introns (ie. instructions that don't affect the final output) from a list of Instruction
+        """
+        return [instructions[row] for row in Program.effective_rows(Instruction.pack(instructions))]
+
+    @staticmethod
+    def effective_rows(instructions):
+        """
+        Get the indices of the packed instructions that aren't introns, in order.
+        """
+        if_codes = set([Operation.opcode(op) for op in Config.RESTRICTIONS['genotype_options']['if-instructions']])
+        one_operand_codes = set([Operation.opcode(op) 
+            for op in Config.RESTRICTIONS['genotype_options']['one-operand-instructions']])
+        signal_codes = set([Operation.opcode(op) 
+            for op in Config.RESTRICTIONS['genotype_options']['if-instructions-for-signal']])
+        read_register = MODES.index('read-register')
+        rows = []
+        relevant_registers = [0]
+        ignore_previous_if = True
+        for row in range(len(instructions)-1, -1, -1):
+            mode, target, op, source = instructions[row].tolist()
+            if target in relevant_registers or op in if_codes:
+                if ignore_previous_if and op in if_codes:
+                    continue
+                else:
+                    ignore_previous_if = False
+                    rows.append(row)
+                    if not op in one_operand_codes:
+                        if mode == read_register and source not in relevant_registers:
+                            relevant_registers.append(source)
+                    if op in if_codes or op in signal_codes:
+                        if target not in relevant_registers:
+                            relevant_registers.append(target)
+            else:
+                ignore_previous_if = True
+        rows.reverse()
+        return rows
\ No newline at end of file
@@ -0,0 +1,75 @@
+import numpy
+
+class ResultsMatrix:
+    """
+    Stores the results of the teams in the point population in a matrix, with a row per point and
+    a column per team, so the diversity maintenance can use them without looking up each result.
+    The environment sets the results during the evaluation. When points or teams are removed, their
+    rows or columns are reused by the new ones, so the matrix only grows if the populations grow.
+    """
+
+    def __init__(self):
+        self.matrix_ = numpy.zeros((0, 0))
+        self.row_per_point_ = {}
+        self.column_per_team_ = {}
+        self.free_rows_ = []
+        self.free_columns_ = []
+
+    def set_results(self, team, point_ids, results):
+        column = self._column_for_team(team)
+        rows = [self._row_for_point(point_id) for point_id in point_ids]
+        self.matrix_[rows, column] = results
+
+    def results(self, teams, point_ids):
+        """
+        Get a matrix with the results of the teams (columns) in the points (rows). Like the
+        dict team.results_per_points_, it raises a KeyError if a team has no result for a point.
+        """
+        rows = [self.row_per_point_[point_id] for point_id in point_ids]
+        columns = [self.column_per_team_[team] for team in teams]
+        results = self.matrix_[numpy.ix_(rows, columns)]
+        if numpy.isnan(results).any():
+            raise KeyError("Missing results for some teams in the point population")
+        return results
+
+    def remove_points(self, point_ids):
+        for point_id in point_ids:
+            if point_id in self.row_per_point_:
+                row = self.row_per_point_.pop(point_id)
+                self.matrix_[row, :] = numpy.nan
+                self.free_rows_.append(row)
+
+    def remove_teams(self, teams):
+        for team in teams:
+            if team in self.column_per_team_:
+                column = self.column_per_team_.pop(team)
+                self.matrix_[:, column] = numpy.nan
+                self.free_columns_.append(column)
+
+    def _row_for_point(self, point_id):
+        if point_id not in self.row_per_point_:
+            if len(self.free_rows_) == 0:
+                self._grow(rows = True)
+            self.row_per_point_[point_id] = self.free_rows_.pop()
+        return self.row_per_point_[point_id]
+
+    def _column_for_team(self, team):
+        if team not in self.column_per_team_:
+            if len(self.free_columns_) == 0:
+                self._grow(rows = False)
+            self.column_per_team_[team] = self.free_columns_.pop()
+        return self.column_per_team_[team]
+
+    def _grow(self, rows):
+        """
+        Double the number of rows or of columns, with empty (nan) results.
+        """
+        total_rows, total_columns = self.matrix_.shape
+        if rows:
+            new_rows = max(1, total_rows)
+            self.matrix_ = numpy.vstack([self.matrix_, numpy.full((new_rows, total_columns), numpy.nan)])
+            self.free_rows_ = range(total_rows+new_rows-1, total_rows-1, -1) + self.free_rows_
+        else:
+            new_columns = max(1, total_columns)
+            self.matrix_ = numpy.hstack([self.matrix_, numpy.full((total_rows, new_columns), numpy.nan)])
+            self.free_columns_ = range(total_columns+new_columns-1, total_columns-1, -1) + self.free_columns_
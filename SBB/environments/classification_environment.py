@@ -1,282 +1,376 @@
-import random
-from collections import Counter
-import numpy
-from sklearn.metrics import confusion_matrix, accuracy_score, recall_score
-from default_environment import DefaultEnvironment, DefaultPoint, reset_points_ids
-from ..utils.helpers import round_array, flatten, round_value
-from ..config import Config
-
-class ClassificationPoint(DefaultPoint):
-    """
-    Encapsulates a dataset value as a point.
-    """
-
-    def __init__(self, inputs, output):
-        super(ClassificationPoint, self).__init__()
-        self.inputs = inputs
-        self.output = output
-
-class ClassificationEnvironment(DefaultEnvironment):
-    """
-    This environment encapsulates all methods to deal with a classification task.
-    """
-
-    def __init__(self):
-        reset_points_ids()
-        self.point_population_ = None
-        train, test = self._initialize_datasets()
-        self.train_population_ = self._dataset_to_points(train)
-        self.test_population_ = self._dataset_to_points(test)
-        self.trainset_class_distribution_ = Counter([p.output for p in self.train_population_])
-        self.testset_class_distribution_ = Counter([p.output for p in self.test_population_])
-        self.total_actions_ = len(self.testset_class_distribution_)
-        self.total_inputs_ = len(self.train_population_[0].inputs)
-        self.trainset_per_action_ = self._get_data_per_action(self.train_population_)
-        Config.RESTRICTIONS['total_actions'] = self.total_actions_
-        Config.RESTRICTIONS['total_raw_actions'] = self.total_actions_
-        Config.RESTRICTIONS['total_inputs'] = self.total_inputs_
-        Config.RESTRICTIONS['use_memmory_for_actions'] = True # since for the same input, the output label is always the same
-        # ensures that the point population will be balanced:
-        total_samples_per_criteria = Config.USER['training_parameters']['populations']['points']/self.total_actions_
-        Config.USER['training_parameters']['populations']['points'] = total_samples_per_criteria*self.total_actions_
-
-    def _initialize_datasets(self):
-        """
-        Read from file and normalize the train and tests sets.
-        """
-        dataset_filename = Config.USER['classification_parameters']['dataset']
-        print("\nReading inputs from data: "+dataset_filename)
-        train = self._read_space_separated_file(Config.USER['classification_parameters']['working_path']+dataset_filename+".train")
-        test = self._read_space_separated_file(Config.USER['classification_parameters']['working_path']+dataset_filename+".test")
-        normalization_params = self._get_normalization_params(train, test)
-        train = self._normalize(normalization_params, train)
-        test = self._normalize(normalization_params, test)
-        return train, test
-
-    def _read_space_separated_file(self, file_path):
-        """
-        Read files separated by space (example: 0.015 0.12 0.082 0.146 3)
-        """
-        with open(file_path) as f:
-            content = f.readlines()
-            content = [x.strip('\n').strip() for x in content]
-            content = [x.split(' ') for x in content]
-            X = [x[:-1] for x in content]
-            Y = [x[-1:] for x in content]
-            self.action_mapping_ = self._create_action_mapping(Y)
-            Y = self._apply_action_mapping(Y)
-            content = numpy.append(X, Y, axis = 1)
-            content = [[float(y) for y in x]for x in content]
-        return content
-
-    def _create_action_mapping(self, Y):
-        action_mapping_ = {}
-        labels = sorted(set(flatten(Y)))
-        for i, label in enumerate(labels):
-            action_mapping_[label] = i
-        return action_mapping_
-
-    def _apply_action_mapping(self, Y):
-        return [[self.action_mapping_[y] for y in x]for x in Y]
-
-    def _get_normalization_params(self, train, test):
-        """
-        Get the mean and range for each column from the total dataset (train+test), excluding the labels column.
-        """
-        normalization_params = []
-        data = numpy.append(train, test, axis = 0)
-        attributes_len = len(data[0])
-        for index in range(attributes_len-1): # dont get normalization parameters for the labels column
-            column = data[:,index]
-            normalization_params.append({'min':min(column), 'range':max(column)-min(column)})
-        return normalization_params
-
-    def _normalize(self, normalization_params, data):
-        """
-        Normalize all columns, except the labels, using the normalization parameters.
-        """
-        normalized_data = []
-        for line in data:
-            new_line = []
-            for i, cell in enumerate(line):
-                if not i == len(line)-1:  # dont normalize the labels column
-                    if normalization_params[i]['range'] == 0.0:
-                        cell = 0.0
-                    else:
-                        cell = (cell-normalization_params[i]['min'])/float(normalization_params[i]['range'])*Config.RESTRICTIONS['multiply_normalization_by']
-                new_line.append(cell)
-            normalized_data.append(new_line)
-        return normalized_data
-
-    def _dataset_to_points(self, data):
-        """
-        Use dataset to create point population.
-        """
-        population = []
-        for index, item in enumerate(data):
-            population.append(ClassificationPoint(numpy.array(item[:-1]), item[-1]))
-        return population
-
-    def _get_data_per_action(self, point_population):
-        subsets_per_class = []
-        for class_index in range(self.total_actions_):
-            values = [point for point in point_population if point.output == class_index]
-            subsets_per_class.append(values)
-        return subsets_per_class
-
-    def point_population(self):
-        return self.point_population_
-
-    def reset(self):
-        self.point_population_ = None
-
-    def setup(self, teams_population):
-        """
-        Get a sample of the training dataset to create the point population. If it is the first generation 
-        of the run, just gets random samples for each action of the dataset. For the next generations, it 
-        replaces some of the points in the sample for new points.
-        """
-        total_samples_per_class = Config.USER['training_parameters']['populations']['points']/self.total_actions_
-
-        if not self.point_population_: # first sampling of the run
-            # get random samples per class
-            samples_per_class = []
-            for subset in self.trainset_per_action_:
-                samples_per_class.append(self._sample_subset(subset, total_samples_per_class))
-        else: # uses attributes defined in evaluate_point_population()
-            self._remove_points(flatten(self.samples_per_class_to_remove_), teams_population)
-            samples_per_class = self.samples_per_class_to_keep_
-        
-        # ensure that the sampling is balanced for all classes, using oversampling for the ones with less than the minimum samples
-        for sample in samples_per_class:
-            while len(sample) < total_samples_per_class:
-                sample += self._sample_subset(sample, total_samples_per_class-len(sample))
-
-        sample = flatten(samples_per_class) # join samples per class
-        random.shuffle(sample)
-        self.point_population_ = sample
-        self._check_for_bugs()
-
-    def _sample_subset(self, subset, sample_size):
-        if len(subset) <= sample_size:
-            sample = subset
-        else:
-            sample = random.sample(subset, sample_size)
-        return sample
-
-    def _remove_points(self, points_to_remove, teams_population):
-        """
-        Remove the points to remove from the teams, in order to save memory.
-        """
-        for team in teams_population:
-            for point in points_to_remove:
-                if point.point_id_ in team.results_per_points_:
-                    team.results_per_points_.pop(point.point_id_)
-                if point.point_id_ in team.memory_actions_per_points_:
-                    team.memory_actions_per_points_.pop(point.point_id_)
-
-    def _check_for_bugs(self):
-        if len(self.point_population_) != Config.USER['training_parameters']['populations']['points']:
-            raise ValueError("The size of the points population changed during selection! You got a bug! (it is: "+str(len(self.point_population_))+", should be: "+str(Config.USER['training_parameters']['populations']['points'])+")")
-
-    def evaluate_point_population(self, teams_population):
-        current_subsets_per_class = self._get_data_per_action(self.point_population_)
-        total_samples_per_class = Config.USER['training_parameters']['populations']['points']/self.total_actions_
-        samples_per_class_to_keep = int(round(total_samples_per_class*(1.0-Config.USER['training_parameters']['replacement_rate']['points'])))
-
-        kept_subsets_per_class = []
-        removed_subsets_per_class = []
-
-        # obtain the data points that will be kept and that will be removed for each subset using uniform probability
-        total_samples_per_class_to_add = total_samples_per_class - samples_per_class_to_keep
-        for i, subset in enumerate(current_subsets_per_class):
-            kept_subsets = random.sample(subset, samples_per_class_to_keep) # get points that will be kept
-            kept_subsets += self._sample_subset(self.trainset_per_action_[i], total_samples_per_class_to_add) # add new points
-            kept_subsets_per_class.append(kept_subsets)
-            removed_subsets_per_class.append(list(set(subset) - set(kept_subsets))) # find the remvoed points
-
-        self.samples_per_class_to_keep_ = kept_subsets_per_class
-        self.samples_per_class_to_remove_ = removed_subsets_per_class
-
-    def evaluate_teams_population_for_training(self, teams_population):
-        for team in teams_population:
-            self.evaluate_team(team, Config.RESTRICTIONS['mode']['training'])
-
-    def evaluate_team(self, team, mode):
-        """
-        Evaluate the team using the environment inputs.
-        """
-        if mode == Config.RESTRICTIONS['mode']['training']:
-            population = self.point_population_
-            is_training = True
-        else:
-            population = self.test_population_
-            is_training = False
-
-        outputs = []
-        for point in population:
-            output = team.execute(point.point_id_, point.inputs, range(Config.RESTRICTIONS['total_raw_actions']), is_training)
-            outputs.append(output)
-            if is_training:
-                if output == point.output:
-                    result = 1 # correct
-                else:
-                    result = 0 # incorrect
-                team.results_per_points_[point.point_id_] = result
-
-        Y = [p.output for p in population]
-        score, extra_metrics = self._calculate_team_metrics(outputs, Y, is_training)
-        
-        if is_training:
-            team.fitness_ = score
-        else:
-            team.score_testset_ = score
-            team.extra_metrics_ = extra_metrics
-
-    def _calculate_team_metrics(self, predicted_outputs, desired_outputs, is_training = False):
-        recall = recall_score(desired_outputs, predicted_outputs, average = None)
-        macro_recall = numpy.mean(recall)
-        extra_metrics = {}
-        if not is_training: # to avoid wasting time processing metrics when they are not necessary
-            extra_metrics['recall_per_action'] = round_array(recall)
-            extra_metrics['accuracy'] = accuracy_score(desired_outputs, predicted_outputs)
-            extra_metrics['confusion_matrix'] = confusion_matrix(desired_outputs, predicted_outputs)
-        return macro_recall, extra_metrics
-
-    def validate(self, current_generation, teams_population):
-        fitness = [p.fitness_ for p in teams_population]
-        best_team = teams_population[fitness.index(max(fitness))]
-        self.evaluate_team(best_team, Config.RESTRICTIONS['mode']['validation'])
-        return best_team
-
-    def metrics_for_team(self, team):
-        msg = ""
-        if team.extra_metrics_:
-            msg += "\n\n### Classification-specific metrics for the best team:"
-            msg += "\nrecall per action: "+str(team.extra_metrics_['recall_per_action'])
-            msg += "\n\naccuracy: "+str(round_value(team.extra_metrics_['accuracy']))
-            msg += "\n\nconfusion matrix:\n"+str(team.extra_metrics_['confusion_matrix'])
-            if team.diversity_:
-                msg += "\n\ndiversities:"
-                for key, value in team.diversity_.iteritems():
-                    msg += "\n - "+str(key)+": "+str(value)
-        return msg
-
-    def initialize_attributes_for_run_info(self, run_info):
-        run_info.recall_per_validation_ = []
-
-    def generate_output_for_attributes_for_run_info(self, run_info):
-        msg = ""
-        msg += "\n\n\n\n#################### Classification-specific Metrics:"
-        msg += "\n\nBest Team Recall per Action per Validation: "+str(run_info.recall_per_validation_)
-        return msg
-
-    def metrics(self):
-        msg = ""
-        msg += "\n### Dataset Info:"
-        msg += "\ntotal inputs: "+str(self.total_inputs_)
-        msg += "\ntotal actions: "+str(self.total_actions_)
-        msg += "\nactions mapping: "+str(self.action_mapping_)
-        msg += "\nclass distribution (train set, "+str(len(self.train_population_))+" samples): "+str(self.trainset_class_distribution_)
-        msg += "\nclass distribution (test set, "+str(len(self.test_population_))+" samples): "+str(self.testset_class_distribution_)
+import os
+import sys
+import json
+import random
+from collections import Counter
+import numpy
+from sklearn.metrics import confusion_matrix, accuracy_score, recall_score
+from default_environment import DefaultEnvironment, DefaultPoint, reset_points_ids
+from parallel_evaluation import evaluate_teams
+from ..core.bids_cache import BidsCache
+from ..core.results_matrix import ResultsMatrix
+from ..core.distances_cache import DistancesCache
+from ..utils.helpers import round_array, flatten, round_value
+from ..config import Config
+
+class ClassificationPoint(DefaultPoint):
+    """
+    Encapsulates a dataset value as a point.
+    """
+
+    def __init__(self, inputs, output):
+        super(ClassificationPoint, self).__init__()
+        self.inputs = inputs
+        self.output = output
+
+class ClassificationEnvironment(DefaultEnvironment):
+    """
+    This environment encapsulates all methods to deal with a classification task.
+    """
+
+    def __init__(self):
+        reset_points_ids()
+        self.point_population_ = None
+        self.point_population_inputs_ = None
+        self.bids_cache_ = BidsCache()
+        self.results_matrix_ = ResultsMatrix()
+        self.distances_cache_ = DistancesCache()
+        train, test = self._initialize_datasets()
+        self.train_population_ = self._dataset_to_points(train)
+        self.test_population_ = self._dataset_to_points(test)
+        self.test_population_inputs_ = self._inputs_matrix(self.test_population_)
+        self.trainset_class_distribution_ = Counter([p.output for p in self.train_population_])
+        self.testset_class_distribution_ = Counter([p.output for p in self.test_population_])
+        self.total_actions_ = len(self.testset_class_distribution_)
+        self.total_inputs_ = len(self.train_population_[0].inputs)
+        self.trainset_per_action_ = self._get_data_per_action(self.train_population_)
+        Config.RESTRICTIONS['total_actions'] = self.total_actions_
+        Config.RESTRICTIONS['total_raw_actions'] = self.total_actions_
+        Config.RESTRICTIONS['total_inputs'] = self.total_inputs_
+        Config.RESTRICTIONS['use_memmory_for_actions'] = True # since for the same input, the output label is always the same
+        # ensures that the point population will be balanced:
+        total_samples_per_criteria = Config.USER['training_parameters']['populations']['points']/self.total_actions_
+        Config.USER['training_parameters']['populations']['points'] = total_samples_per_criteria*self.total_actions_
+
+    def _initialize_datasets(self):
+        """
+        Read from file and normalize the train and tests sets. The normalized sets are cached as .npy 
+        files next to the dataset, and the cache is used while it is newer than the dataset files.
+        """
+        dataset_filename = Config.USER['classification_parameters']['dataset']
+        print("\nReading inputs from data: "+dataset_filename)
+        dataset_path = Config.USER['classification_parameters']['working_path']+dataset_filename
+        if self._cache_is_updated(dataset_path):
+            return self._load_cache(dataset_path)
+        train = self._read_space_separated_file(dataset_path+".train")
+        test = self._read_space_separated_file(dataset_path+".test")
+        normalization_params = self._get_normalization_params(train, test)
+        train = self._normalize(normalization_params, train)
+        test = self._normalize(normalization_params, test)
+        self._save_cache(dataset_path, train, test)
+        return train, test
+
+    def _cache_is_updated(self, dataset_path):
+        cache_files = [dataset_path+".train.npy", dataset_path+".test.npy", dataset_path+".cache.json"]
+        if not all([os.path.exists(f) for f in cache_files]):
+            return False
+        cache_time = min([os.path.getmtime(f) for f in cache_files])
+        if cache_time < max(os.path.getmtime(dataset_path+".train"), os.path.getmtime(dataset_path+".test")):
+            return False
+        with open(dataset_path+".cache.json", 'r') as f:
+            info = json.load(f)
+        return info['multiply_normalization_by'] == Config.RESTRICTIONS['multiply_normalization_by']
+
+    def _load_cache(self, dataset_path):
+        with open(dataset_path+".cache.json", 'r') as f:
+            info = json.load(f)
+        self.action_mapping_ = dict([(str(label), action) for label, action in info['action_mapping'].iteritems()])
+        train = numpy.load(dataset_path+".train.npy", mmap_mode = 'r')
+        test = numpy.load(dataset_path+".test.npy", mmap_mode = 'r')
+        return train, test
+
+    def _save_cache(self, dataset_path, train, test):
+        """
+        Each file is written with a temporary name and then renamed, so other runs never load a partially
+        written file. The .cache.json is the last one, since the cache is only used when all files exist.
+        If the cache can't be written (ie. the folder is read-only or full), the run only warns about it,
+        since the sets are already in memory.
+        """
+        info = {
+            'action_mapping': self.action_mapping_, 
+            'multiply_normalization_by': Config.RESTRICTIONS['multiply_normalization_by'],
+        }
+        try:
+            self._write_cache_file(dataset_path+".train.npy", lambda f: numpy.save(f, train))
+            self._write_cache_file(dataset_path+".test.npy", lambda f: numpy.save(f, test))
+            self._write_cache_file(dataset_path+".cache.json", lambda f: json.dump(info, f))
+        except (IOError, OSError) as e:
+            sys.stderr.write("Warning: Couldn't save the cache for the dataset: "+str(e)+"\n")
+
+    def _write_cache_file(self, file_path, write):
+        temp_file = file_path+"."+str(os.getpid())+".tmp" # per process, since many runs may start at once
+        try:
+            with open(temp_file, 'wb') as f:
+                write(f)
+            os.rename(temp_file, file_path)
+        except (IOError, OSError):
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+            raise
+
+    def _read_space_separated_file(self, file_path):
+        """
+        Read files separated by space (example: 0.015 0.12 0.082 0.146 3)
+        """
+        content = numpy.loadtxt(file_path, dtype = str, ndmin = 2)
+        X = content[:,:-1].astype(float)
+        Y = content[:,-1].tolist()
+        self.action_mapping_ = self._create_action_mapping(Y)
+        Y = self._apply_action_mapping(Y)
+        return numpy.column_stack((X, Y))
+
+    def _create_action_mapping(self, Y):
+        action_mapping_ = {}
+        labels = sorted(set(Y))
+        for i, label in enumerate(labels):
+            action_mapping_[label] = i
+        return action_mapping_
+
+    def _apply_action_mapping(self, Y):
+        return numpy.array([self.action_mapping_[y] for y in Y], dtype = float)
+
+    def _get_normalization_params(self, train, test):
+        """
+        Get the min and range for each column from the total dataset (train+test), excluding the labels column.
+        """
+        data = numpy.append(train, test, axis = 0)[:,:-1] # dont get normalization parameters for the labels column
+        minimum = data.min(axis = 0)
+        return {'min': minimum, 'range': data.max(axis = 0)-minimum}
+
+    def _normalize(self, normalization_params, data):
+        """
+        Normalize all columns, except the labels, using the normalization parameters.
+        """
+        normalized_data = numpy.zeros(data.shape)
+        columns = numpy.flatnonzero(normalization_params['range'] != 0.0)
+        normalized_data[:,columns] = ((data[:,columns]-normalization_params['min'][columns])
+            /normalization_params['range'][columns]*Config.RESTRICTIONS['multiply_normalization_by'])
+        normalized_data[:,-1] = data[:,-1] # dont normalize the labels column
+        return normalized_data
+
+    def _dataset_to_points(self, data):
+        """
+        Use dataset to create point population.
+        """
+        population = []
+        for index, item in enumerate(data):
+            population.append(ClassificationPoint(numpy.array(item[:-1]), float(item[-1])))
+        return population
+
+    def _inputs_matrix(self, population):
+        """
+        Join the inputs of the points in a (points x inputs) matrix, used to execute the teams over 
+        all points at once. It is stored column by column, since the programs read one input at a time.
+        """
+        return numpy.array([point.inputs for point in population], order = 'F')
+
+    def _get_data_per_action(self, point_population):
+        subsets_per_class = []
+        for class_index in range(self.total_actions_):
+            values = [point for point in point_population if point.output == class_index]
+            subsets_per_class.append(values)
+        return subsets_per_class
+
+    def point_population(self):
+        return self.point_population_
+
+    def reset(self):
+        self.point_population_ = None
+        self.point_population_inputs_ = None
+        self.bids_cache_ = BidsCache()
+        self.results_matrix_ = ResultsMatrix()
+        self.distances_cache_ = DistancesCache()
+
+    def setup(self, teams_population):
+        """
+        Get a sample of the training dataset to create the point population. If it is the first generation 
+        of the run, just gets random samples for each action of the dataset. For the next generations, it 
+        replaces some of the points in the sample for new points.
+        """
+        total_samples_per_class = Config.USER['training_parameters']['populations']['points']/self.total_actions_
+
+        if not self.point_population_: # first sampling of the run
+            # get random samples per class
+            samples_per_class = []
+            for subset in self.trainset_per_action_:
+                samples_per_class.append(self._sample_subset(subset, total_samples_per_class))
+        else: # uses attributes defined in evaluate_point_population()
+            self._remove_points(flatten(self.samples_per_class_to_remove_), teams_population)
+            samples_per_class = self.samples_per_class_to_keep_
+        
+        # ensure that the sampling is balanced for all classes, using oversampling for the ones with less than the minimum samples
+        for sample in samples_per_class:
+            while len(sample) < total_samples_per_class:
+                sample += self._sample_subset(sample, total_samples_per_class-len(sample))
+
+        sample = flatten(samples_per_class) # join samples per class
+        random.shuffle(sample)
+        self.point_population_ = sample
+        self.point_population_inputs_ = self._inputs_matrix(self.point_population_)
+        self._check_for_bugs()
+
+    def _sample_subset(self, subset, sample_size):
+        if len(subset) <= sample_size:
+            sample = subset
+        else:
+            sample = random.sample(subset, sample_size)
+        return sample
+
+    def _remove_points(self, points_to_remove, teams_population):
+        """
+        Remove the points to remove from the teams, in order to save memory.
+        """
+        for team in teams_population:
+            for point in points_to_remove:
+                if point.point_id_ in team.results_per_points_:
+                    team.results_per_points_.pop(point.point_id_)
+                if point.point_id_ in team.memory_actions_per_points_:
+                    team.memory_actions_per_points_.pop(point.point_id_)
+        self.bids_cache_.remove_points([point.point_id_ for point in points_to_remove])
+        self.results_matrix_.remove_points([point.point_id_ for point in points_to_remove])
+
+    def remove_programs(self, programs):
+        self.bids_cache_.remove_programs(programs)
+
+    def _check_for_bugs(self):
+        if len(self.point_population_) != Config.USER['training_parameters']['populations']['points']:
+            raise ValueError("The size of the points population changed during selection! You got a bug! (it is: "+str(len(self.point_population_))+", should be: "+str(Config.USER['training_parameters']['populations']['points'])+")")
+
+    def evaluate_point_population(self, teams_population):
+        current_subsets_per_class = self._get_data_per_action(self.point_population_)
+        total_samples_per_class = Config.USER['training_parameters']['populations']['points']/self.total_actions_
+        samples_per_class_to_keep = int(round(total_samples_per_class*(1.0-Config.USER['training_parameters']['replacement_rate']['points'])))
+
+        kept_subsets_per_class = []
+        removed_subsets_per_class = []
+
+        # obtain the data points that will be kept and that will be removed for each subset using uniform probability
+        total_samples_per_class_to_add = total_samples_per_class - samples_per_class_to_keep
+        for i, subset in enumerate(current_subsets_per_class):
+            kept_subsets = random.sample(subset, samples_per_class_to_keep) # get points that will be kept
+            kept_subsets += self._sample_subset(self.trainset_per_action_[i], total_samples_per_class_to_add) # add new points
+            kept_subsets_per_class.append(kept_subsets)
+            removed_subsets_per_class.append(list(set(subset) - set(kept_subsets))) # find the remvoed points
+
+        self.samples_per_class_to_keep_ = kept_subsets_per_class
+        self.samples_per_class_to_remove_ = removed_subsets_per_class
+
+    def evaluate_teams_population_for_training(self, teams_population):
+        self.bids_cache_.calculate_bids_for_teams(teams_population, 
+            [point.point_id_ for point in self.point_population_], self.point_population_inputs_)
+        evaluate_teams(self, teams_population, Config.RESTRICTIONS['mode']['training'])
+
+    def evaluate_team_in_worker(self, team, mode):
+        self.bids_cache_.start_recording()
+        results = super(ClassificationEnvironment, self).evaluate_team_in_worker(team, mode)
+        results['bids_cache'] = self.bids_cache_.stop_recording()
+        return results
+
+    def apply_parallel_evaluation_results(self, team, mode, results):
+        super(ClassificationEnvironment, self).apply_parallel_evaluation_results(team, mode, results)
+        self.bids_cache_.add_recorded_bids(results['bids_cache'], team.programs)
+
+    def evaluate_team(self, team, mode):
+        """
+        Evaluate the team using the environment inputs.
+        """
+        if mode == Config.RESTRICTIONS['mode']['training']:
+            population = self.point_population_
+            inputs_matrix = self.point_population_inputs_
+            is_training = True
+            bids_cache = self.bids_cache_
+        else:
+            population = self.test_population_
+            inputs_matrix = self.test_population_inputs_
+            is_training = False
+            bids_cache = None # the test set is too big to keep the bids in memory
+
+        valid_actions = range(Config.RESTRICTIONS['total_raw_actions'])
+        if Config.RESTRICTIONS['use_arrays_for_classification']:
+            outputs = team.execute_for_arrays([point.point_id_ for point in population], inputs_matrix, 
+                valid_actions, is_training, bids_cache)
+        else:
+            outputs = []
+            for point in population:
+                outputs.append(team.execute(point.point_id_, point.inputs, valid_actions, is_training, 
+                    bids_cache = bids_cache))
+
+        if is_training:
+            results = []
+            for point, output in zip(population, outputs):
+                if output == point.output:
+                    result = 1 # correct
+                else:
+                    result = 0 # incorrect
+                team.results_per_points_[point.point_id_] = result
+                results.append(result)
+            self.results_matrix_.set_results(team, [point.point_id_ for point in population], results)
+
+        Y = [p.output for p in population]
+        score, extra_metrics = self._calculate_team_metrics(outputs, Y, is_training)
+        
+        if is_training:
+            team.fitness_ = score
+        else:
+            team.score_testset_ = score
+            team.extra_metrics_ = extra_metrics
+
+    def _calculate_team_metrics(self, predicted_outputs, desired_outputs, is_training = False):
+        recall = recall_score(desired_outputs, predicted_outputs, average = None)
+        macro_recall = numpy.mean(recall)
+        extra_metrics = {}
+        if not is_training: # to avoid wasting time processing metrics when they are not necessary
+            extra_metrics['recall_per_action'] = round_array(recall)
+            extra_metrics['accuracy'] = accuracy_score(desired_outputs, predicted_outputs)
+            extra_metrics['confusion_matrix'] = confusion_matrix(desired_outputs, predicted_outputs)
+        return macro_recall, extra_metrics
+
+    def validate(self, current_generation, teams_population):
+        fitness = [p.fitness_ for p in teams_population]
+        best_team = teams_population[fitness.index(max(fitness))]
+        self.evaluate_team(best_team, Config.RESTRICTIONS['mode']['validation'])
+        return best_team
+
+    def metrics_for_team(self, team):
+        msg = ""
+        if team.extra_metrics_:
+            msg += "\n\n### Classification-specific metrics for the best team:"
+            msg += "\nrecall per action: "+str(team.extra_metrics_['recall_per_action'])
+            msg += "\n\naccuracy: "+str(round_value(team.extra_metrics_['accuracy']))
+            msg += "\n\nconfusion matrix:\n"+str(team.extra_metrics_['confusion_matrix'])
+            if team.diversity_:
+                msg += "\n\ndiversities:"
+                for key, value in team.diversity_.iteritems():
+                    msg += "\n - "+str(key)+": "+str(value)
+        return msg
+
+    def initialize_attributes_for_run_info(self, run_info):
+        run_info.recall_per_validation_ = []
+        run_info.bids_cache_per_validation_ = []
+
+    def generate_output_for_attributes_for_run_info(self, run_info):
+        msg = ""
+        msg += "\n\n\n\n#################### Classification-specific Metrics:"
+        msg += "\n\nBest Team Recall per Action per Validation: "+str(run_info.recall_per_validation_)
+        msg += "\n\nBids Cache per Validation: "+str(run_info.bids_cache_per_validation_)
+        return msg
+
+    def metrics(self):
+        msg = ""
+        msg += "\n### Dataset Info:"
+        msg += "\ntotal inputs: "+str(self.total_inputs_)
+        msg += "\ntotal actions: "+str(self.total_actions_)
+        msg += "\nactions mapping: "+str(self.action_mapping_)
+        msg += "\nclass distribution (train set, "+str(len(self.train_population_))+" samples): "+str(self.trainset_class_distribution_)
+        msg += "\nclass distribution (test set, "+str(len(self.test_population_))+" samples): "+str(self.testset_class_distribution_)
         return msg
\ No newline at end of file
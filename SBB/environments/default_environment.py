@@ -1,120 +1,185 @@
-import abc
-from ..config import Config
-
-def reset_points_ids():
-    global next_point_id
-    next_point_id = 0
-
-def get_point_id():
-    global next_point_id
-    next_point_id += 1
-    return next_point_id
-
-class DefaultPoint(object):
-    """
-    Encapsulates a value from the environment as a point.
-    """
-    __metaclass__  = abc.ABCMeta
-
-    def __init__(self):
-        self.point_id_ = get_point_id()
-        self.age_ = 0
-
-    def __repr__(self): 
-        return "("+str(self.point_id_)+")"
-
-    def __str__(self): 
-        return "("+str(self.point_id_)+")"
-
-class DefaultEnvironment(object):
-    """
-    Abstract class for environments. All environments must implement these 
-    methods to be able to work with SBB.
-    """
-    __metaclass__  = abc.ABCMeta
-
-    @abc.abstractmethod
-    def __init__(self):
-        """
-        Initialize the environment variables.
-        """
-
-    @abc.abstractmethod
-    def point_population(self):
-         """
-         Return the point_population. If the Hall of Fame is being used, it will return 
-         the point_population plus the hall_of_fame, since both were used during training.
-         """
-
-    @abc.abstractmethod
-    def reset(self):
-         """
-         Method that is called at the beginning of each run by SBB, to reset the 
-         variables that will be used by the generations.
-         """
-
-    @abc.abstractmethod
-    def setup(self, teams_population):
-         """
-         Method that is called at the beginning of each generation by SBB, to set the 
-         variables that will be used by the generationand remove the ones that are no 
-         longer being used.
-         """
-
-    @abc.abstractmethod
-    def evaluate_point_population(self, teams_population):
-        """
-        Evaluate the fitness of the point population, to define which points will be removed 
-        or added in the next generation, when setup_point_population() is executed.
-        """
-
-    @abc.abstractmethod
-    def evaluate_teams_population_for_training(self, teams_population):
-        """
-        Evaluate all the teams using the evaluate_team() method, and sets metrics. Used only 
-        for training.
-        """
-
-    @abc.abstractmethod
-    def evaluate_team(self, team, mode):
-        """
-        Evaluate the team using the environment inputs. May be executed in the training
-        or the test mode.
-        This method must set the attribute results_per_points of the team, if you intend to 
-        use pareto.
-        """
-
-    @abc.abstractmethod
-    def validate(self, current_generation, teams_population):
-        """
-        Return the best team for the teams_population using the validation set. It must 
-        also set the team.score_testset_ and, if necessary, team.extra_metrics_
-        """
-
-    @abc.abstractmethod
-    def metrics_for_team(self, team):
-        """
-        Generate a string with the metrics for the team specific of the environment.
-        """
-
-    @abc.abstractmethod
-    def initialize_attributes_for_run_info(self, run_info):
-        """
-        Initialize the attributes in run_info, that will be the output at the end of the run.
-        """
-
-    @abc.abstractmethod
-    def generate_output_for_attributes_for_run_info(self, run_info):
-        """
-        Generate an output of the attributes in run_info, to append it to the other results of the run.
-        """
-
-    @abc.abstractmethod
-    def metrics(self):
-        """
-        Generate a string with the metrics for the environment. It is printed at the 
-        start and at the end of the execution, and it is also saved in the output file.
-        """
-
-    def hall_of_fame(self):
-        return []
\ No newline at end of file
+import abc
+from ..config import Config
+
+def reset_points_ids():
+    global next_point_id
+    next_point_id = 0
+
+def get_point_id():
+    global next_point_id
+    next_point_id += 1
+    return next_point_id
+
+class DefaultPoint(object):
+    """
+    Encapsulates a value from the environment as a point.
+    """
+    __metaclass__  = abc.ABCMeta
+
+    def __init__(self):
+        self.point_id_ = get_point_id()
+        self.age_ = 0
+
+    def __repr__(self): 
+        return "("+str(self.point_id_)+")"
+
+    def __str__(self): 
+        return "("+str(self.point_id_)+")"
+
+class DefaultEnvironment(object):
+    """
+    Abstract class for environments. All environments must implement these 
+    methods to be able to work with SBB.
+    """
+    __metaclass__  = abc.ABCMeta
+
+    @abc.abstractmethod
+    def __init__(self):
+        """
+        Initialize the environment variables.
+        """
+
+    @abc.abstractmethod
+    def point_population(self):
+         """
+         Return the point_population. If the Hall of Fame is being used, it will return 
+         the point_population plus the hall_of_fame, since both were used during training.
+         """
+
+    @abc.abstractmethod
+    def reset(self):
+         """
+         Method that is called at the beginning of each run by SBB, to reset the 
+         variables that will be used by the generations.
+         """
+
+    @abc.abstractmethod
+    def setup(self, teams_population):
+         """
+         Method that is called at the beginning of each generation by SBB, to set the 
+         variables that will be used by the generationand remove the ones that are no 
+         longer being used.
+         """
+
+    @abc.abstractmethod
+    def evaluate_point_population(self, teams_population):
+        """
+        Evaluate the fitness of the point population, to define which points will be removed 
+        or added in the next generation, when setup_point_population() is executed.
+        """
+
+    @abc.abstractmethod
+    def evaluate_teams_population_for_training(self, teams_population):
+        """
+        Evaluate all the teams using the evaluate_team() method, and sets metrics. Used only 
+        for training.
+        """
+
+    @abc.abstractmethod
+    def evaluate_team(self, team, mode):
+        """
+        Evaluate the team using the environment inputs. May be executed in the training
+        or the test mode.
+        This method must set the attribute results_per_points of the team, if you intend to 
+        use pareto.
+        """
+
+    @abc.abstractmethod
+    def validate(self, current_generation, teams_population):
+        """
+        Return the best team for the teams_population using the validation set. It must 
+        also set the team.score_testset_ and, if necessary, team.extra_metrics_
+        """
+
+    @abc.abstractmethod
+    def metrics_for_team(self, team):
+        """
+        Generate a string with the metrics for the team specific of the environment.
+        """
+
+    @abc.abstractmethod
+    def initialize_attributes_for_run_info(self, run_info):
+        """
+        Initialize the attributes in run_info, that will be the output at the end of the run.
+        """
+
+    @abc.abstractmethod
+    def generate_output_for_attributes_for_run_info(self, run_info):
+        """
+        Generate an output of the attributes in run_info, to append it to the other results of the run.
+        """
+
+    @abc.abstractmethod
+    def metrics(self):
+        """
+        Generate a string with the metrics for the environment. It is printed at the 
+        start and at the end of the execution, and it is also saved in the output file.
+        """
+
+    def hall_of_fame(self):
+        return []
+
+    def can_evaluate_teams_in_parallel(self, mode):
+        """
+        If the teams can be evaluated in worker processes, that is, if the evaluation of a team 
+        doesn't depend on the evaluation of the other teams. The teams of the second layer are 
+        shared by all teams, so they are only evaluated in the main process.
+        """
+        return not Config.USER['advanced_training_parameters']['second_layer']['enabled']
+
+    def evaluate_team_in_worker(self, team, mode):
+        """
+        Evaluate the team in a worker process, and return what the evaluation changed in the team,
+        to be applied to the team in the main process by apply_parallel_evaluation_results().
+        """
+        self.evaluate_team(team, mode)
+        results = {}
+        if mode == Config.RESTRICTIONS['mode']['training']:
+            results['fitness'] = team.fitness_
+            results['results_per_points'] = team.results_per_points_
+            results['memory_actions_per_points'] = team.memory_actions_per_points_
+            results['active_programs'] = [p.program_id_ for p in team.active_programs_]
+        else:
+            results['score_testset'] = team.score_testset_
+            results['extra_metrics'] = team.extra_metrics_
+            results['results_per_points_for_validation'] = team.results_per_points_for_validation_
+            results['last_selected_program'] = team.last_selected_program_
+            results['validation_active_programs'] = [p.program_id_ for p in team.validation_active_programs_]
+        return results
+
+    def apply_parallel_evaluation_results(self, team, mode, results):
+        programs_by_id = dict([(p.program_id_, p) for p in team.programs])
+        if mode == Config.RESTRICTIONS['mode']['training']:
+            team.fitness_ = results['fitness']
+            team.results_per_points_ = results['results_per_points']
+            point_ids = team.results_per_points_.keys()
+            self.results_matrix_.set_results(team, point_ids, [team.results_per_points_[i] for i in point_ids])
+            team.memory_actions_per_points_ = results['memory_actions_per_points']
+            team.active_programs_ = [programs_by_id[program_id] for program_id in results['active_programs']]
+        else:
+            team.score_testset_ = results['score_testset']
+            team.extra_metrics_ = results['extra_metrics']
+            team.results_per_points_for_validation_ = results['results_per_points_for_validation']
+            team.last_selected_program_ = results['last_selected_program']
+            team.validation_active_programs_ = [programs_by_id[program_id] 
+                for program_id in results['validation_active_programs']]
+
+    def results_for_points(self, teams, points):
+        """
+        Get a matrix with the results of the teams (columns) in the points (rows) for training. The 
+        environments store the results in self.results_matrix_ during the evaluation of the teams.
+        """
+        return self.results_matrix_.results(teams, [point.point_id_ for point in points])
+
+    def remove_teams(self, teams):
+        """
+        Method that is called by the selection when teams are removed from the teams population.
+        """
+        self.results_matrix_.remove_teams(teams)
+
+    def remove_programs(self, programs):
+        """
+        Method that is called by the selection when programs are removed from the programs 
+        population, so the environment can release what it stores about them.
+        """
+        pass
\ No newline at end of file
@@ -0,0 +1,61 @@
+import multiprocessing
+from ..config import Config
+
+# what the worker processes need, it is set before they are forked so they inherit it without pickling
+forked_state = {}
+
+def evaluate_teams(environment, teams, mode):
+    """
+    Evaluate the teams with environment.evaluate_team(), using the number of processes defined by
+    'processes' in the config. The worker processes are forked, so they start with a copy of the
+    environment and of the teams, and send back only what the evaluation changed in each team.
+    The results are applied to the teams in the same order as a serial evaluation.
+    """
+    processes = Config.USER['advanced_training_parameters']['processes']
+    if processes <= 1 or len(teams) < 2 or not environment.can_evaluate_teams_in_parallel(mode):
+        for team in teams:
+            environment.evaluate_team(team, mode)
+        return
+
+    chunks = split_in_chunks(len(teams))
+    results_per_chunk = map_in_forked_processes(_evaluate_chunk, chunks,
+        {'environment': environment, 'teams': teams, 'mode': mode})
+    for chunk, results in zip(chunks, results_per_chunk):
+        for index, team_results in zip(chunk, results):
+            environment.apply_parallel_evaluation_results(teams[index], mode, team_results)
+
+def split_in_chunks(total):
+    """
+    Split the indices in [0, total) in chunks for the processes defined by 'processes' in the config,
+    smaller than total/processes to balance the load between processes.
+    """
+    processes = Config.USER['advanced_training_parameters']['processes']
+    chunk_size = max(1, total/(max(1, processes)*4))
+    return [range(start, min(start+chunk_size, total)) for start in range(0, total, chunk_size)]
+
+def map_in_forked_processes(function, items, state):
+    """
+    Call function for each item with a pool of the processes defined by 'processes' in the config, and
+    return the results in the order of the items. state is set in forked_state before the processes are
+    forked, so they inherit it without pickling, and it is cleared when they finish. With one process
+    or one item, the items run in the main process.
+    """
+    processes = Config.USER['advanced_training_parameters']['processes']
+    forked_state.update(state)
+    try:
+        if processes <= 1 or len(items) < 2:
+            return [function(item) for item in items]
+        pool = multiprocessing.Pool(processes)
+        try:
+            return pool.map(function, items)
+        finally:
+            pool.terminate()
+            pool.join()
+    finally:
+        forked_state.clear()
+
+def _evaluate_chunk(indices):
+    environment = forked_state['environment']
+    teams = forked_state['teams']
+    mode = forked_state['mode']
+    return [environment.evaluate_team_in_worker(teams[index], mode) for index in indices]
@@ -0,0 +1,167 @@
+import itertools
+import numpy
+from ..poker_config import PokerConfig
+
+TOTAL_RANKS = len(PokerConfig.CONFIG['ranks'])
+TOTAL_SUITS = len(PokerConfig.CONFIG['suits'])
+DECK = [rank+suit for rank in PokerConfig.CONFIG['ranks'] for suit in PokerConfig.CONFIG['suits']]
+CARD_INDEX = dict([(card, index) for index, card in enumerate(DECK)]) # card = rank*TOTAL_SUITS+suit
+CARD_RANKS = numpy.arange(len(DECK)) / TOTAL_SUITS
+CARD_SUITS = numpy.arange(len(DECK)) % TOTAL_SUITS
+CARD_BITS = numpy.array([1 << index for index in range(len(DECK))], dtype = numpy.int64)
+RANK_BITS = numpy.array([1 << rank for rank in range(TOTAL_RANKS)], dtype = numpy.int64)
+
+# the keys of a hand are the sum of the keys of its cards, so they count the cards per rank and per suit
+CARD_RANK_KEYS = numpy.array([1 << (3*rank) for rank in CARD_RANKS], dtype = numpy.int64) # 3 bits per rank
+CARD_SUIT_KEYS = numpy.array([1 << (4*suit) for suit in CARD_SUITS], dtype = numpy.int64) # 4 bits per suit
+
+# hand categories, from the worst to the best
+HIGH_CARD, PAIR, TWO_PAIR, TRIPS, STRAIGHT, FLUSH, FULL_HOUSE, QUADS, STRAIGHT_FLUSH = range(9)
+
+def _value(category, primary, secondary):
+    """
+    The category of the best 5-card hand in the bits above 26, and the ranks that break ties in
+    two 13-bit masks. For masks with the same number of bits, comparing the masks as integers
+    compares their ranks in order.
+    """
+    return (category << (2*TOTAL_RANKS)) | (primary << TOTAL_RANKS) | secondary
+
+def _top_bits_table(total_bits):
+    """
+    For each 13-bit mask of ranks, the mask with only its highest 'total_bits' ranks.
+    """
+    table = numpy.zeros(1 << TOTAL_RANKS, dtype = numpy.int64)
+    for mask in range(1 << TOTAL_RANKS):
+        kept = 0
+        for rank in reversed(range(TOTAL_RANKS)):
+            if kept == total_bits:
+                break
+            if mask & (1 << rank):
+                table[mask] |= 1 << rank
+                kept += 1
+    return table
+
+def _straight_table():
+    """
+    For each 13-bit mask of ranks, 1 + the rank of the highest card of the best straight, or 0.
+    """
+    windows = [(high, sum([1 << rank for rank in range(high-4, high+1)])) for high in reversed(range(4, TOTAL_RANKS))]
+    wheel = (1 << (TOTAL_RANKS-1)) | 0b1111 # A-2-3-4-5
+    table = numpy.zeros(1 << TOTAL_RANKS, dtype = numpy.int64)
+    for mask in range(1 << TOTAL_RANKS):
+        for high, window in windows:
+            if mask & window == window:
+                table[mask] = high+1
+                break
+        else:
+            if mask & wheel == wheel:
+                table[mask] = 4
+    return table
+
+TOP_BITS = dict([(total_bits, _top_bits_table(total_bits)) for total_bits in [1, 2, 3, 5]])
+STRAIGHT_HIGH = _straight_table()
+
+def _flush_values_table():
+    """
+    For each 13-bit mask with the ranks of the cards of the flush suit, the value of the flush or
+    of the straight flush.
+    """
+    masks = numpy.arange(1 << TOTAL_RANKS, dtype = numpy.int64)
+    flushes = _value(FLUSH, TOP_BITS[5][masks], 0)
+    straight_flushes = _value(STRAIGHT_FLUSH, STRAIGHT_HIGH[masks], 0)
+    return numpy.where(STRAIGHT_HIGH[masks] > 0, straight_flushes, flushes)
+
+def _flush_suits_table():
+    """
+    For each suit key, the suit with 5 or more cards, or -1.
+    """
+    keys = numpy.arange(1 << (4*TOTAL_SUITS), dtype = numpy.int64)
+    table = numpy.zeros(len(keys), dtype = numpy.int64)-1
+    for suit in range(TOTAL_SUITS):
+        table[((keys >> (4*suit)) & 0b1111) >= 5] = suit
+    return table
+
+def _rank_values_table():
+    """
+    The values ignoring the suits for all hands with 5 to 7 cards, sorted by the rank keys.
+    """
+    rank_counts = []
+    for total_cards in [5, 6, 7]:
+        for ranks in itertools.combinations_with_replacement(range(TOTAL_RANKS), total_cards):
+            counts = numpy.bincount(ranks, minlength = TOTAL_RANKS)
+            if counts.max() <= TOTAL_SUITS:
+                rank_counts.append(counts)
+    rank_counts = numpy.array(rank_counts, dtype = numpy.int64)
+    keys = (rank_counts << (3*numpy.arange(TOTAL_RANKS))).sum(axis = 1)
+
+    rank_mask = ((rank_counts >= 1) * RANK_BITS).sum(axis = 1)
+    pairs_mask = ((rank_counts >= 2) * RANK_BITS).sum(axis = 1)
+    trips_mask = ((rank_counts >= 3) * RANK_BITS).sum(axis = 1)
+    quads_mask = ((rank_counts == 4) * RANK_BITS).sum(axis = 1)
+    straight_high = STRAIGHT_HIGH[rank_mask]
+    top_trips = TOP_BITS[1][trips_mask]
+    pair_for_full_house = TOP_BITS[1][pairs_mask & ~top_trips]
+    top_pair = TOP_BITS[1][pairs_mask]
+    top_two_pairs = TOP_BITS[2][pairs_mask]
+    conditions = [
+        quads_mask > 0,
+        (top_trips > 0) & (pair_for_full_house > 0),
+        straight_high > 0,
+        top_trips > 0,
+        top_two_pairs != top_pair,
+        top_pair > 0,
+    ]
+    values = [
+        _value(QUADS, quads_mask, TOP_BITS[1][rank_mask & ~quads_mask]),
+        _value(FULL_HOUSE, top_trips, pair_for_full_house),
+        _value(STRAIGHT, straight_high, 0),
+        _value(TRIPS, top_trips, TOP_BITS[2][rank_mask & ~top_trips]),
+        _value(TWO_PAIR, top_two_pairs, TOP_BITS[1][rank_mask & ~top_two_pairs]),
+        _value(PAIR, top_pair, TOP_BITS[3][rank_mask & ~top_pair]),
+    ]
+    values = numpy.select(conditions, values, default = _value(HIGH_CARD, TOP_BITS[5][rank_mask], 0))
+    order = numpy.argsort(keys)
+    return keys[order], values[order]
+
+FLUSH_VALUES = _flush_values_table()
+FLUSH_SUITS = _flush_suits_table()
+RANK_KEYS, RANK_VALUES = _rank_values_table()
+COMBINATIONS = dict([(size, numpy.array(list(itertools.combinations(range(len(DECK)), size)), dtype = numpy.int64))
+    for size in [1, 2]])
+
+class PokerHandEvaluator():
+    """
+    Evaluates many poker hands at once with numpy. The cards are integers (see CARD_INDEX), and
+    each hand is a row with 5 to 7 cards. The value of a hand is an integer that is higher for
+    better hands and equal for hands with the same rank, so it can be compared like the value from
+    pokereval.evaln(). The values come from tables precomputed for all the combinations of ranks
+    and for all the flushes, so evaluating a batch of hands is only a few array lookups.
+    """
+
+    @staticmethod
+    def to_indices(cards):
+        return numpy.array([CARD_INDEX[card] for card in cards], dtype = numpy.int64)
+
+    @staticmethod
+    def available_combinations(dealt_cards, size):
+        """
+        All combinations of 'size' cards from the deck without the dealt cards, in the same order
+        as itertools.combinations() over the deck.
+        """
+        combinations = COMBINATIONS[size]
+        dealt_bits = CARD_BITS[dealt_cards].sum()
+        return combinations[(CARD_BITS[combinations].sum(axis = 1) & dealt_bits) == 0]
+
+    @staticmethod
+    def evaluate(hands):
+        hands = numpy.asarray(hands)
+        values = RANK_VALUES[numpy.searchsorted(RANK_KEYS, CARD_RANK_KEYS[hands].sum(axis = 1))]
+        flush_suits = FLUSH_SUITS[CARD_SUIT_KEYS[hands].sum(axis = 1)]
+        flush_rows = numpy.nonzero(flush_suits >= 0)[0]
+        if len(flush_rows) > 0:
+            flush_hands = hands[flush_rows]
+            in_flush_suit = CARD_SUITS[flush_hands] == flush_suits[flush_rows][:, None]
+            flush_masks = (RANK_BITS[CARD_RANKS[flush_hands]] * in_flush_suit).sum(axis = 1)
+            # the best of the flush (or straight flush) and of the hand without the suits
+            values[flush_rows] = numpy.maximum(values[flush_rows], FLUSH_VALUES[flush_masks])
+        return values
@@ -1,100 +1,172 @@
-import os
-import json
-import random
-from poker_metrics import PokerMetrics
-from ..match_state import MatchState
-from ..poker_config import PokerConfig
-from ....utils.helpers import available_ports, round_value
-from ....config import Config
-
-def set_metrics(point, round_id, full_deck, key):
-    s = PokerMetrics.calculate_hand_strength(point[key]['hc'], point['bc'], full_deck)
-    if round_id == 1 or round_id == 2:
-        p = PokerMetrics.calculate_hand_potential_without_heuristics(point[key]['hc'], point['bc'], round_id, full_deck)
-    else:
-        p = 0
-    e = PokerMetrics.calculate_equity(point[key]['hc'])
-    ep = PokerMetrics.calculate_ep(s, e, p, round_id)
-    point[key]['str'][round_id] = round_value(s*Config.RESTRICTIONS['multiply_normalization_by'], 3)
-    point[key]['ep'][round_id] = round_value(ep*Config.RESTRICTIONS['multiply_normalization_by'], 3)
-    return point
-
-def initialize_metrics(seed, port_pos0, port_pos1, full_deck):
-    seeded_deck = PokerMetrics.initialize_deck()
-    random.seed(seed)
-    random.shuffle(seeded_deck)
-
-    point = {}
-    point['bc'] = []
-    point['pos'] = 0
-    point['p'] = {}
-    point['o'] = {}
-    point['p']['hc'] = [seeded_deck.pop(), seeded_deck.pop()]
-    point['o']['hc'] = [seeded_deck.pop(), seeded_deck.pop()]
-    point['p']['str'] = [-1] * 4
-    point['p']['ep'] = [-1] * 4
-    point['o']['str'] = [-1] * 4
-    point['o']['ep'] = [-1] * 4
-
-    for round_id, poker_round in enumerate(['preflop', 'flop', 'turn', 'river']):
-        if poker_round == 'flop':
-            point['bc'] = [seeded_deck.pop(), seeded_deck.pop(), seeded_deck.pop()]
-        if poker_round == 'turn' or poker_round == 'river':
-            point['bc'].append(seeded_deck.pop())
-        set_metrics(point, round_id, full_deck, 'p')
-        set_metrics(point, round_id, full_deck, 'o')
-    
-    point_pos1 = {}
-    point_pos1['bc'] = point['bc']
-    point_pos1['pos'] = 1
-    point_pos1['p'] = {}
-    point_pos1['o'] = {}
-    point_pos1['p']['hc'] = point['o']['hc']
-    point_pos1['o']['hc'] = point['p']['hc']
-    point_pos1['p']['str'] = point['o']['str']
-    point_pos1['p']['ep'] = point['o']['ep']
-    point_pos1['o']['str'] = point['p']['str']
-    point_pos1['o']['ep'] = point['p']['ep']
-
-    return point, point_pos1
-
-def generate_poker_hands(from_seed, to_seed):
-    path = "hands_generated/hands"+str(to_seed)
-    index = 0
-    indeces = 9
-    mapping = {'00': 0, '01': 1, '02': 2, '10': 3, '11': 4, '12': 5, '20': 6, '21': 7, '22': 8}
-
-    print "starting"
-    full_deck = PokerMetrics.initialize_deck()
-    port0, port1 = available_ports()
-    if not os.path.exists('hands_generated'):
-        os.makedirs('hands_generated')
-    if not os.path.exists(path):
-        os.makedirs(path)
-    files = []
-    for x in range(indeces):
-        files.append(open(path+'/hands_type_'+str(x)+'.json','a'))
-    for seed in range(from_seed, to_seed):
-        point_pos0, point_pos1 = initialize_metrics(seed, port0, port1, full_deck)
-        point_pos0['id'] = seed
-        point_pos1['id'] = seed
-        label0_player = PokerConfig.get_hand_strength_label(point_pos0['p']['str'][index])
-        label0_opp = PokerConfig.get_hand_strength_label(point_pos0['o']['str'][index])
-        label1_player = PokerConfig.get_hand_strength_label(point_pos1['p']['str'][index])
-        label1_opp = PokerConfig.get_hand_strength_label(point_pos1['o']['str'][index])
-        label0 = str(label0_player)+str(label0_opp)
-        label1 = str(label1_player)+str(label1_opp)
-        print str(label0)+","+str(mapping[label0])+": "+str(point_pos0)
-        print str(label1)+","+str(mapping[label1])+": "+str(point_pos1)
-        print "#"
-        files[mapping[label0]].write(json.dumps(point_pos0)+'\n')
-        files[mapping[label1]].write(json.dumps(point_pos1)+'\n')
-        print "#"
-    for f in files:
-        f.close()
-
-if __name__ == "__main__":
-    start_time = time.time()
-    generate_poker_hands(from_seed=20000, to_seed=25000)
-    elapsed_time = round_value((time.time() - start_time)/60.0)
-    print("\nFinished, elapsed time: "+str(elapsed_time)+" mins")
\ No newline at end of file
+import os
+import sys
+import time
+import json
+import random
+import shutil
+import signal
+import multiprocessing
+from optparse import OptionParser
+from poker_metrics import PokerMetrics
+from ..match_state import MatchState
+from ..poker_config import PokerConfig
+from ....utils.helpers import round_value
+from ....config import Config
+
+def set_metrics(point, round_id, key):
+    s = PokerMetrics.calculate_hand_strength(point[key]['hc'], point['bc'])
+    if round_id == 1 or round_id == 2:
+        p = PokerMetrics.calculate_hand_potential_without_heuristics(point[key]['hc'], point['bc'], round_id)
+    else:
+        p = 0
+    e = PokerMetrics.calculate_equity(point[key]['hc'])
+    ep = PokerMetrics.calculate_ep(s, e, p, round_id)
+    point[key]['str'][round_id] = round_value(s*Config.RESTRICTIONS['multiply_normalization_by'], 3)
+    point[key]['ep'][round_id] = round_value(ep*Config.RESTRICTIONS['multiply_normalization_by'], 3)
+    return point
+
+def initialize_metrics(seed):
+    seeded_deck = PokerMetrics.initialize_deck()
+    random.seed(seed)
+    random.shuffle(seeded_deck)
+
+    point = {}
+    point['bc'] = []
+    point['pos'] = 0
+    point['p'] = {}
+    point['o'] = {}
+    point['p']['hc'] = [seeded_deck.pop(), seeded_deck.pop()]
+    point['o']['hc'] = [seeded_deck.pop(), seeded_deck.pop()]
+    point['p']['str'] = [-1] * 4
+    point['p']['ep'] = [-1] * 4
+    point['o']['str'] = [-1] * 4
+    point['o']['ep'] = [-1] * 4
+
+    for round_id, poker_round in enumerate(['preflop', 'flop', 'turn', 'river']):
+        if poker_round == 'flop':
+            point['bc'] = [seeded_deck.pop(), seeded_deck.pop(), seeded_deck.pop()]
+        if poker_round == 'turn' or poker_round == 'river':
+            point['bc'].append(seeded_deck.pop())
+        set_metrics(point, round_id, 'p')
+        set_metrics(point, round_id, 'o')
+    
+    point_pos1 = {}
+    point_pos1['bc'] = point['bc']
+    point_pos1['pos'] = 1
+    point_pos1['p'] = {}
+    point_pos1['o'] = {}
+    point_pos1['p']['hc'] = point['o']['hc']
+    point_pos1['o']['hc'] = point['p']['hc']
+    point_pos1['p']['str'] = point['o']['str']
+    point_pos1['p']['ep'] = point['o']['ep']
+    point_pos1['o']['str'] = point['p']['str']
+    point_pos1['o']['ep'] = point['p']['ep']
+
+    return point, point_pos1
+
+def label_for_point(point):
+    index = 0 # labels by the strength in the pre-flop
+    label_player = PokerConfig.get_hand_strength_label(point['p']['str'][index])
+    label_opp = PokerConfig.get_hand_strength_label(point['o']['str'][index])
+    return PokerConfig.CONFIG['label_mapping'][str(label_player)+str(label_opp)]
+
+def generate_poker_hands(from_seed, to_seed, processes, seeds_per_shard, path):
+    """
+    Generate the hands for the seeds in [from_seed, to_seed), two per seed (one per position). The
+    seeds are split in shards generated by a pool of processes, and each finished shard is saved in
+    its own file. The last seed of the finished shards is saved in a checkpoint, with the parameters
+    that define the shards, so running again with the same parameters resumes the generation. If the
+    parameters changed, the shards can't be reused and the generation restarts. When all the shards
+    are finished, they are merged, in the order of the seeds, into a hands_type_N.json file per label.
+    """
+    shards_path = path+"/shards"
+    checkpoint_file = shards_path+"/checkpoint"
+    parameters = {'from_seed': from_seed, 'to_seed': to_seed, 'seeds_per_shard': seeds_per_shard}
+    first_seed = from_seed
+    if os.path.exists(checkpoint_file):
+        with open(checkpoint_file, 'r') as f:
+            checkpoint = json.load(f)
+        if checkpoint['parameters'] == parameters:
+            first_seed = checkpoint['finished_seed']
+            print "resuming from seed "+str(first_seed)
+        else:
+            print "the checkpoint has other parameters ("+str(checkpoint['parameters'])+"), restarting"
+            shutil.rmtree(shards_path)
+    if not os.path.exists(shards_path):
+        os.makedirs(shards_path)
+    all_shards = [(seed, min(seed+seeds_per_shard, to_seed)) for seed in range(from_seed, to_seed, seeds_per_shard)]
+    shards_to_generate = [(shard_from, shard_to, shards_path) for shard_from, shard_to in all_shards if shard_to > first_seed]
+
+    print "generating "+str(len(shards_to_generate))+" shards with "+str(processes)+" processes"
+    start_time = time.time()
+    total_hands = 0
+    pool = multiprocessing.Pool(processes, _ignore_interruptions)
+    try:
+        results = pool.imap(_generate_shard, shards_to_generate)
+        for _ in shards_to_generate:
+            # with a timeout, since otherwise the main process can't be interrupted with ctrl+c
+            shard_from, shard_to, hands = results.next(timeout = sys.maxint)
+            # imap returns the shards in order, so all seeds before shard_to are finished
+            _save_checkpoint(checkpoint_file, parameters, shard_to)
+            total_hands += hands
+            hands_per_second = round_value(total_hands/(time.time()-start_time))
+            print "finished seeds up to "+str(shard_to)+" ("+str(hands_per_second)+" hands per second)"
+    finally:
+        pool.terminate()
+        pool.join()
+
+    _merge_shards(all_shards, shards_path, path)
+    shutil.rmtree(shards_path)
+    elapsed_time = round_value(time.time()-start_time)
+    print "generated "+str(total_hands)+" hands in "+str(elapsed_time)+" secs"
+
+def _save_checkpoint(checkpoint_file, parameters, finished_seed):
+    with open(checkpoint_file+".tmp", 'w') as f:
+        json.dump({'parameters': parameters, 'finished_seed': finished_seed}, f)
+    os.rename(checkpoint_file+".tmp", checkpoint_file)
+
+def _ignore_interruptions():
+    signal.signal(signal.SIGINT, signal.SIG_IGN) # only the main process handles ctrl+c
+
+def _shard_file(shards_path, shard_from, shard_to):
+    return shards_path+"/shard_"+str(shard_from)+"_"+str(shard_to)+".json"
+
+def _generate_shard(args):
+    shard_from, shard_to, shards_path = args
+    lines = []
+    for seed in range(shard_from, shard_to):
+        for point in initialize_metrics(seed):
+            point['id'] = seed
+            lines.append(str(label_for_point(point))+" "+json.dumps(point)+"\n")
+    temp_file = _shard_file(shards_path, shard_from, shard_to)+".tmp"
+    with open(temp_file, 'w') as f:
+        f.write("".join(lines))
+    os.rename(temp_file, _shard_file(shards_path, shard_from, shard_to)) # so an interrupted shard is never used
+    return shard_from, shard_to, len(lines)
+
+def _merge_shards(shards, shards_path, path):
+    files = [open(path+'/hands_type_'+str(label)+'.json', 'w') for label in PokerConfig.CONFIG['labels_per_subdivision']['sbb_label']]
+    try:
+        for shard_from, shard_to in shards:
+            with open(_shard_file(shards_path, shard_from, shard_to), 'r') as f:
+                for line in f:
+                    label, point = line.split(" ", 1)
+                    files[int(label)].write(point)
+    finally:
+        for f in files:
+            f.close()
+
+if __name__ == "__main__":
+    # ie.: python -m SBB.environments.poker.hand_generator.poker_hand_generator --from_seed 20000 --to_seed 25000
+    parser = OptionParser()
+    parser.add_option("--from_seed", dest="from_seed", type="int", help="first seed", default=20000)
+    parser.add_option("--to_seed", dest="to_seed", type="int", help="last seed (not included)", default=25000)
+    parser.add_option("--processes", dest="processes", type="int", help="number of processes",
+                      default=multiprocessing.cpu_count())
+    parser.add_option("--seeds_per_shard", dest="seeds_per_shard", type="int", help="seeds per shard file", default=100)
+    parser.add_option("--path", dest="path", help="folder for the hands files (default: hands_generated/hands<to_seed>)")
+    (options, args) = parser.parse_args()
+    path = options.path
+    if path is None:
+        path = "hands_generated/hands"+str(options.to_seed)
+    generate_poker_hands(options.from_seed, options.to_seed, options.processes, options.seeds_per_shard, path)
@@ -1,508 +1,508 @@
-"""
-    Pre-flop equity holdem lookup table based on:
-    http://oscar6echo.blogspot.ca/2012/09/poker-4-monte-carlo-analysis.html
-    Hole cards are passed as A 2 3 4 5 6 7 8 9 T J Q K, suited(s) or offsuit(o)
-    
-    The columns are the number of opponents, so EQUITY_TABLE['AAo'][3] returns 
-    the equity for two offsuited Aces for 4 opponents.
-"""
-
-EQUITY_TABLE = {
-    'AAo': [0.84933161,0.732048899,0.63609019,0.556456592,0.489655059,0.433154822,0.385045777,0.343928841,0.308682918],
-    'AKs': [0.662217824,0.49836231,0.405354241,0.34515568,0.301837554,0.268197189,0.240827756,0.217859914,0.198274079],
-    'AQs': [0.653189637,0.484191891,0.388210044,0.32655401,0.282788455,0.249469723,0.222840535,0.200960194,0.182658307],
-    'AJs': [0.643978479,0.470635585,0.372791729,0.310569389,0.267001709,0.234301182,0.208611393,0.187799987,0.170641465],
-    'ATs': [0.63488318,0.45783769,0.358912007,0.29677093,0.253844614,0.22199696,0.197274707,0.17746934,0.161297284],
-    'A9s': [0.615104341,0.431096677,0.330626739,0.269112429,0.227612086,0.197508218,0.174527713,0.156414951,0.141853099],
-    'A8s': [0.605031564,0.418928455,0.318643416,0.257894367,0.217260036,0.188043564,0.165923102,0.148649564,0.134853885],
-    'A7s': [0.593886468,0.406282356,0.306818472,0.247367347,0.208009485,0.17991033,0.158820987,0.142426059,0.129394336],
-    'A6s': [0.581813015,0.393037571,0.294990897,0.23731368,0.199610406,0.172939086,0.153023294,0.137601175,0.125358938],
-    'A5s': [0.580658287,0.394601911,0.298519706,0.241888066,0.204625501,0.17805168,0.158035357,0.142426851,0.129946079],
-    'A4s': [0.571392999,0.385452311,0.290991748,0.235941522,0.199975165,0.174432403,0.155237763,0.140261944,0.128306753],
-    'A3s': [0.563386492,0.377282971,0.284166605,0.230534004,0.195790554,0.171203182,0.152739255,0.138328251,0.12678969],
-    'A2s': [0.555081999,0.368629683,0.276717132,0.224415059,0.190753244,0.166992815,0.149161462,0.135203941,0.12402933],
-    'KAo': [0.644713545,0.472889868,0.376062287,0.313826001,0.269258649,0.234759003,0.206708406,0.183214006,0.16318403],
-    'KKo': [0.821190542,0.68632226,0.580094481,0.495367291,0.427145251,0.371729128,0.326414723,0.289103423,0.258244527],
-    'KQs': [0.62408774,0.460952865,0.372178994,0.315036143,0.273770439,0.241769359,0.21596639,0.194652633,0.176831571],
-    'KJs': [0.614789294,0.447557053,0.357075889,0.299509953,0.258564178,0.227325535,0.20253639,0.182411508,0.165800951],
-    'KTs': [0.605853525,0.435340581,0.343904947,0.286426595,0.246073578,0.215732789,0.191971667,0.172887066,0.157313858],
-    'K9s': [0.586422136,0.409185548,0.316204105,0.259264535,0.220235303,0.191484436,0.169343086,0.151808562,0.137648908],
-    'K8s': [0.56789751,0.386175377,0.293303848,0.237821931,0.200549102,0.173575324,0.153077825,0.137040765,0.124203469],
-    'K7s': [0.558469346,0.375766155,0.283531572,0.22892431,0.192548208,0.166417994,0.146714941,0.131374875,0.119162208],
-    'K6s': [0.54807547,0.364796693,0.273777053,0.220559977,0.185435159,0.160368812,0.141530997,0.126918532,0.115292554],
-    'K5s': [0.538321619,0.355064597,0.265393287,0.213562802,0.179671654,0.155578337,0.137523783,0.123488,0.112319802],
-    'K4s': [0.528917067,0.346415468,0.258489663,0.208229218,0.175587578,0.152467297,0.135161122,0.121741449,0.111044267],
-    'K3s': [0.520746257,0.338665037,0.252322259,0.203554706,0.172127419,0.149961957,0.13338837,0.120501525,0.110210762],
-    'K2s': [0.512391178,0.330889637,0.246235277,0.199038881,0.16886311,0.147632449,0.131751535,0.119389756,0.109496907],
-    'QAo': [0.635092014,0.457673987,0.357586072,0.293631538,0.248399304,0.214007779,0.186583719,0.16406332,0.145245502],
-    'QKo': [0.604341519,0.433583141,0.34151037,0.282644844,0.240264795,0.207500222,0.181061749,0.159295832,0.141105647],
-    'QQo': [0.796323165,0.646643354,0.532429852,0.444379359,0.375861202,0.322160241,0.279736848,0.245979211,0.218934686],
-    'QJs': [0.590691291,0.430395053,0.345545363,0.29088171,0.251368634,0.221026072,0.19695863,0.177498449,0.16153667],
-    'QTs': [0.581681508,0.418468422,0.332842879,0.278331337,0.239504545,0.210120353,0.187123908,0.168760838,0.153856591],
-    'Q9s': [0.562225636,0.392696241,0.305646966,0.251662597,0.214130567,0.186312399,0.16492027,0.148044931,0.134486673],
-    'Q8s': [0.544165232,0.370368429,0.283353762,0.230742967,0.194902307,0.168744363,0.148870611,0.1333447,0.120937944],
-    'Q7s': [0.52520164,0.348330487,0.262280594,0.211467522,0.177487231,0.153060521,0.134714733,0.120481086,0.109183234],
-    'Q6s': [0.516763675,0.339628287,0.254330845,0.204397963,0.171288614,0.147660261,0.129987756,0.116335247,0.105510627],
-    'Q5s': [0.507125342,0.330321439,0.246409845,0.197892584,0.165996016,0.143341168,0.126433129,0.113343479,0.102945046],
-    'Q4s': [0.497589353,0.321952707,0.239808007,0.192812386,0.162143284,0.140458953,0.124290178,0.11179402,0.101837627],
-    'Q3s': [0.489407004,0.314357089,0.233769743,0.188254502,0.15881168,0.138076446,0.12261467,0.110642076,0.101081795],
-    'Q2s': [0.481047641,0.30677764,0.227898377,0.183952112,0.155748984,0.135921109,0.121148687,0.109666845,0.100463511],
-    'JAo': [0.625372686,0.443135782,0.340896566,0.276189449,0.231017729,0.197178102,0.170623412,0.149148099,0.131481518],
-    'JKo': [0.594408269,0.419215383,0.325193607,0.265716966,0.223517027,0.191403861,0.165989769,0.145367238,0.128424013],
-    'JQo': [0.56905233,0.401687927,0.313955214,0.25777239,0.217287657,0.186268472,0.161706465,0.141902531,0.125739026],
-    'JJo': [0.771566329,0.608719205,0.488663522,0.399303802,0.332225854,0.281377268,0.242514802,0.212533399,0.189156082],
-    'JTs': [0.561545188,0.406898271,0.326345604,0.27408498,0.236369066,0.207742769,0.185427089,0.167697244,0.15337269],
-    'J9s': [0.541107174,0.38099004,0.299382861,0.247814981,0.21148903,0.184490716,0.163774119,0.147531524,0.134513267],
-    'J8s': [0.523125072,0.359185792,0.277699175,0.227417835,0.192708261,0.167299346,0.148054287,0.133071185,0.121131845],
-    'J7s': [0.504545433,0.337618096,0.256918986,0.208306914,0.175356152,0.151558967,0.133676683,0.119854657,0.108847663],
-    'J6s': [0.485737405,0.316831548,0.237545538,0.190899555,0.15982034,0.137652565,0.121133488,0.10838803,0.098271518],
-    'J5s': [0.478186221,0.309611974,0.231139885,0.18538736,0.155160574,0.133730607,0.117764709,0.105447974,0.095651475],
-    'J4s': [0.46868197,0.301548997,0.224764013,0.180504538,0.151483862,0.130988597,0.115756482,0.103997868,0.094604604],
-    'J3s': [0.460393597,0.294146802,0.218954202,0.176169476,0.14836795,0.12877164,0.114211851,0.10293467,0.093918657],
-    'J2s': [0.452025373,0.286717271,0.213227089,0.172013063,0.145424482,0.12674832,0.112842874,0.102043109,0.093366709],
-    'TAo': [0.615637267,0.429465168,0.325908287,0.261144162,0.216521386,0.183507927,0.157896604,0.137451716,0.120796565],
-    'TKo': [0.584948514,0.40610897,0.31088959,0.25137845,0.209737376,0.178466894,0.154053931,0.134504079,0.118613069],
-    'TQo': [0.559468173,0.388972383,0.300237166,0.244079142,0.20416202,0.174046257,0.150568435,0.131917624,0.116872125],
-    'TJo': [0.538280755,0.377268019,0.294278613,0.240670624,0.202091208,0.172893743,0.150238063,0.132345274,0.118006858],
-    'TTo': [0.746639807,0.572433294,0.448586779,0.359651897,0.295182195,0.247937132,0.212924551,0.186632505,0.166608373],
-    'T9s': [0.523784303,0.37372004,0.296685615,0.246890957,0.211461185,0.185123313,0.165007954,0.149274901,0.136695089],
-    'T8s': [0.505025812,0.351942023,0.275243826,0.226828921,0.193047039,0.168370637,0.149720756,0.135251554,0.123704647],
-    'T7s': [0.486476148,0.330823543,0.254904337,0.208056954,0.175983687,0.152838304,0.135487214,0.122068871,0.1113897],
-    'T6s': [0.468000789,0.310364428,0.23566365,0.190616327,0.160258963,0.138590413,0.122420908,0.109938967,0.099993234],
-    'T5s': [0.449398677,0.290750131,0.217725053,0.17473803,0.146282337,0.126116208,0.111126505,0.099523624,0.090254855],
-    'T4s': [0.442026931,0.28470794,0.212722357,0.17069799,0.14305329,0.123552987,0.109082921,0.097897937,0.088950647],
-    'T3s': [0.433797153,0.277508395,0.207073881,0.166499974,0.140040198,0.121429898,0.107609436,0.096894205,0.088291756],
-    'T2s': [0.425374835,0.270232505,0.201527789,0.162526066,0.137270244,0.119535676,0.106341842,0.096077554,0.087778627],
-    '9Ao': [0.594487092,0.400666912,0.295288475,0.231018825,0.187847165,0.156601578,0.132853026,0.114230003,0.099318465],
-    '9Ko': [0.564089482,0.377917165,0.280942115,0.221851069,0.181516353,0.151877099,0.129166957,0.111274677,0.096929337],
-    '9Qo': [0.538652036,0.36119198,0.270823617,0.215057855,0.176441723,0.147936683,0.12613527,0.109071472,0.09548934],
-    '9Jo': [0.516406165,0.34937472,0.265060706,0.212044297,0.174846132,0.147320231,0.126358231,0.110065241,0.097175921],
-    '9To': [0.498155219,0.342193758,0.262991734,0.212006713,0.175878429,0.149179515,0.128958017,0.113314914,0.100988647],
-    '99o': [0.71665056,0.532657795,0.408142716,0.322575823,0.262972076,0.220814753,0.190544383,0.168410729,0.151921848],
-    '98s': [0.488559881,0.345321875,0.27171124,0.22418202,0.190923792,0.16674661,0.148613631,0.134592627,0.123435875],
-    '97s': [0.469938822,0.325478399,0.253174083,0.207656825,0.176445297,0.154052478,0.137410152,0.124572373,0.114343492],
-    '96s': [0.451493119,0.305500223,0.234496782,0.190800752,0.161351637,0.140466023,0.125000274,0.113097317,0.103596716],
-    '95s': [0.433143275,0.28598276,0.216520911,0.174758148,0.147053944,0.127526462,0.113085208,0.101932921,0.09299735],
-    '94s': [0.414046261,0.26737541,0.200009093,0.160411079,0.134505284,0.116391891,0.103035066,0.092711017,0.08441667],
-    '93s': [0.408071568,0.262150475,0.19566563,0.156988531,0.131866782,0.114356251,0.101449013,0.091458805,0.083422277],
-    '92s': [0.399702664,0.254980946,0.190195852,0.153070419,0.129134076,0.112487247,0.100148337,0.090574825,0.082837462],
-    '8Ao': [0.58370153,0.387574194,0.282293017,0.218808192,0.17651199,0.146196528,0.123374132,0.105642525,0.091589997],
-    '8Ko': [0.544292702,0.353204872,0.256157696,0.198533858,0.160031776,0.132283762,0.111329409,0.095055667,0.082161495],
-    '8Qo': [0.519293016,0.337105439,0.246669627,0.192283465,0.155408169,0.128656072,0.10849668,0.092886399,0.080591033],
-    '8Jo': [0.497142891,0.325853449,0.241525412,0.189772267,0.15424972,0.128434587,0.109046564,0.094149376,0.08244968],
-    '8To': [0.478209277,0.318837043,0.239823083,0.190188795,0.155772841,0.130802221,0.11214167,0.097851363,0.086670073],
-    '89o': [0.460661044,0.312094786,0.236516026,0.187951941,0.154186875,0.129859178,0.111844561,0.098173294,0.087508822],
-    '88o': [0.687185223,0.496046663,0.372652456,0.29140528,0.236885875,0.199596733,0.173515542,0.15483269,0.141076158],
-    '87s': [0.456850271,0.322843838,0.25314472,0.208455172,0.177811502,0.155918766,0.139652564,0.12711132,0.117070452],
-    '86s': [0.438161019,0.30385295,0.2358407,0.193296247,0.164651518,0.144437353,0.129492337,0.117949654,0.108669611],
-    '85s': [0.41993028,0.284763444,0.21832395,0.177738264,0.150856016,0.131989419,0.118050865,0.10723364,0.09850069],
-    '84s': [0.401033858,0.266127712,0.201557284,0.162973089,0.137733478,0.120134789,0.107134469,0.097031918,0.0888487],
-    '83s': [0.382858237,0.2481033,0.1857573,0.149358964,0.125860931,0.10957168,0.097536835,0.088149426,0.080518241],
-    '82s': [0.376797601,0.242959063,0.181573825,0.146153195,0.123453225,0.107736323,0.096111868,0.08702171,0.07960532],
-    '7Ao': [0.571658507,0.373788491,0.269385161,0.207244013,0.166287251,0.13721569,0.115518848,0.098766017,0.08554805],
-    '7Ko': [0.534175394,0.34193235,0.245519284,0.18877765,0.151193353,0.124366446,0.104277363,0.088787224,0.076593951],
-    '7Qo': [0.499064769,0.313455654,0.223899,0.17135625,0.136465393,0.111566498,0.093057162,0.078894489,0.067826772],
-    '7Jo': [0.477270534,0.302636786,0.219049584,0.169016016,0.135331825,0.111260482,0.093386525,0.079761703,0.069122333],
-    '7To': [0.458260152,0.296074862,0.217738419,0.169732373,0.137095142,0.113765617,0.096529967,0.083434664,0.073236927],
-    '79o': [0.440699247,0.290700686,0.216449136,0.169941683,0.138308501,0.115893066,0.099508073,0.087134072,0.077522657],
-    '78o': [0.426916959,0.288335073,0.216913532,0.171356947,0.140415379,0.118605472,0.102698172,0.090721324,0.081382185],
-    '77o': [0.657264883,0.461114387,0.340562861,0.264478469,0.215274125,0.182603063,0.160256908,0.144470502,0.132891112],
-    '76s': [0.428277227,0.30378379,0.237462548,0.195535611,0.167414584,0.147624542,0.132977128,0.121615548,0.112406564],
-    '75s': [0.409801746,0.285482621,0.221154185,0.181574284,0.155475525,0.137208782,0.123677637,0.113115211,0.10451071],
-    '74s': [0.391113895,0.267238634,0.204841056,0.167218393,0.14274405,0.125730225,0.113115723,0.103260505,0.095196334],
-    '73s': [0.373045844,0.24907964,0.188648696,0.153066673,0.13019537,0.114339231,0.102580881,0.093348142,0.085767376],
-    '72s': [0.354395707,0.231157944,0.1731383,0.139800723,0.118658795,0.104052911,0.093184102,0.084581495,0.077474521],
-    '6Ao': [0.558681997,0.359502948,0.256519275,0.196244063,0.157066865,0.129523271,0.109091456,0.093425366,0.081121096],
-    '6Ko': [0.522964136,0.330069934,0.234879825,0.179577858,0.143321512,0.11761631,0.098516545,0.083851191,0.072334162],
-    '6Qo': [0.489960122,0.304018237,0.215225838,0.163592228,0.12960061,0.105561881,0.087816403,0.074317353,0.063807551],
-    '6Jo': [0.457163518,0.28036601,0.198150515,0.150138904,0.118436182,0.096109373,0.079721957,0.067323234,0.057689439],
-    '6To': [0.438462657,0.274028433,0.196892409,0.150717947,0.119928202,0.098207875,0.08229463,0.070276841,0.060934769],
-    '69o': [0.421029753,0.269313574,0.196289554,0.151669426,0.121916581,0.101131089,0.086068785,0.074744984,0.065978416],
-    '68o': [0.406957244,0.267961396,0.198210861,0.154873885,0.126056013,0.106064096,0.091602254,0.08074266,0.072266944],
-    '67o': [0.396572172,0.268211917,0.200339511,0.157736944,0.129520671,0.110016647,0.095951719,0.085341132,0.077019799],
-    '66o': [0.626976703,0.428132112,0.311892435,0.241641386,0.197728911,0.16932095,0.150163017,0.136648627,0.126663479],
-    '65s': [0.403502271,0.287238805,0.223954194,0.184913716,0.159298148,0.141393904,0.128065489,0.117601931,0.10899834],
-    '64s': [0.384806142,0.269878515,0.208860987,0.172117838,0.148336185,0.131807307,0.119493119,0.109778713,0.101744244],
-    '63s': [0.366841075,0.251942264,0.192983053,0.15825959,0.136063838,0.120690818,0.109233908,0.10015034,0.092599894],
-    '62s': [0.348380541,0.233893897,0.17711837,0.144463693,0.12382265,0.10954803,0.098866082,0.090345435,0.083231957],
-    '5Ao': [0.557448169,0.361120677,0.260213614,0.20105501,0.162342073,0.134905809,0.114414406,0.09857234,0.086036538],
-    '5Ko': [0.512576769,0.31963737,0.225822575,0.171992568,0.137009182,0.112367294,0.094113442,0.080106726,0.069118274],
-    '5Qo': [0.479568736,0.29389463,0.206491944,0.15636024,0.123701403,0.100744439,0.083844036,0.070984254,0.060963271],
-    '5Jo': [0.449015885,0.272467628,0.191063783,0.143994191,0.113224611,0.091691716,0.075920739,0.064022122,0.054783109],
-    '5To': [0.418586144,0.252874621,0.177462237,0.133489719,0.104695528,0.084630412,0.070024851,0.059030898,0.050487987],
-    '59o': [0.401401891,0.24832172,0.176827911,0.134265673,0.106361927,0.087070287,0.07313101,0.06267999,0.054589838],
-    '58o': [0.387406132,0.247387218,0.179243842,0.138001221,0.111052759,0.092532188,0.079206224,0.069195366,0.061385561],
-    '57o': [0.376715759,0.248496429,0.182702481,0.142519663,0.116465053,0.098637901,0.085819772,0.076144555,0.068524907],
-    '56o': [0.370186745,0.25065539,0.185950538,0.146442119,0.120937419,0.103522475,0.090965323,0.081433544,0.073859951],
-    '55o': [0.596427625,0.396494301,0.285363541,0.220998168,0.182033769,0.157307948,0.140743733,0.129014254,0.120206115],
-    '54s': [0.385344148,0.274962112,0.21414963,0.177602825,0.153928161,0.137406148,0.124987815,0.115106881,0.10685998],
-    '53s': [0.367607383,0.258005383,0.199590357,0.165293409,0.143398957,0.128149267,0.116668512,0.107478637,0.099756205],
-    '52s': [0.349329336,0.240124951,0.183891687,0.15167563,0.131332796,0.117202393,0.106515469,0.097919607,0.090664974],
-    '4Ao': [0.547341875,0.351083799,0.251866046,0.194424112,0.157160977,0.130897666,0.111332066,0.09622596,0.084286865],
-    '4Ko': [0.502234779,0.310037013,0.218089218,0.165913165,0.132313485,0.108793082,0.091398221,0.078084419,0.067661096],
-    '4Qo': [0.469213505,0.284677109,0.199113083,0.150576957,0.119252937,0.097374056,0.081316188,0.069133789,0.059642677],
-    '4Jo': [0.438673541,0.263612247,0.183986558,0.138507215,0.10904397,0.0885447,0.073603416,0.062332086,0.053588333],
-    '4To': [0.41054876,0.246255664,0.171886171,0.128910789,0.101007772,0.081685122,0.067682221,0.05715868,0.049007502],
-    '49o': [0.380838129,0.228159719,0.1588437,0.118558459,0.092631211,0.074907436,0.062214165,0.052729409,0.045389162],
-    '48o': [0.367086696,0.22724309,0.161042531,0.12190501,0.096762488,0.079656739,0.067416835,0.058244323,0.051100076],
-    '47o': [0.35661139,0.22872934,0.164875713,0.126860578,0.102601389,0.086190294,0.074444228,0.065589858,0.058615825],
-    '46o': [0.350029898,0.231852581,0.169544458,0.132451663,0.108935723,0.093069373,0.081674528,0.073016716,0.066118402],
-    '45o': [0.35074301,0.237479105,0.175356657,0.138485419,0.115118485,0.09926365,0.087776561,0.078960013,0.071859376],
-    '44o': [0.562626131,0.36348873,0.259784768,0.202937409,0.170004944,0.149613224,0.136036967,0.12630672,0.118836446],
-    '43s': [0.357229934,0.249946314,0.192663855,0.15947202,0.138406894,0.123742871,0.112650409,0.103707683,0.096160198],
-    '42s': [0.339180746,0.23297102,0.178258205,0.14740093,0.128086231,0.11466502,0.104454851,0.096164205,0.089113786],
-    '3Ao': [0.538564204,0.342043143,0.244267742,0.188388818,0.152481762,0.127272934,0.10853968,0.09407869,0.082637043],
-    '3Ko': [0.493342859,0.3014577,0.211206845,0.160641858,0.128406139,0.105958066,0.089387726,0.076709587,0.066761023],
-    '3Qo': [0.460219736,0.276308984,0.192407538,0.145523968,0.11553703,0.094717759,0.079467591,0.067895294,0.058856013],
-    '3Jo': [0.429666105,0.255408122,0.177431541,0.133572063,0.105453234,0.085994056,0.071842759,0.061147257,0.052831264],
-    '3To': [0.401615667,0.23828926,0.165575766,0.12416934,0.097569191,0.079252709,0.066002333,0.056035726,0.048281561],
-    '39o': [0.374236003,0.222282772,0.153853766,0.114581429,0.089539168,0.072516617,0.060362455,0.051300386,0.044275366],
-    '38o': [0.34750001,0.207736789,0.143825865,0.107017175,0.083803145,0.06816995,0.057027637,0.048693706,0.042194109],
-    '37o': [0.337148469,0.209031089,0.147299825,0.111450947,0.088926818,0.073820703,0.063036624,0.054926531,0.048533033],
-    '36o': [0.330669515,0.212399806,0.152225422,0.11732529,0.0955553,0.08098971,0.070564703,0.062659726,0.056351307],
-    '35o': [0.331675259,0.21911026,0.159512475,0.125057132,0.103630284,0.089225327,0.078815785,0.070800614,0.064319528],
-    '34o': [0.320683531,0.210612861,0.152161178,0.118873743,0.098327647,0.084559148,0.074572142,0.066856759,0.060592092],
-    '33o': [0.528401382,0.3321123,0.236914271,0.187823769,0.160544069,0.143984413,0.132888231,0.124735254,0.118257565],
-    '32s': [0.330934762,0.225061861,0.171649535,0.141961498,0.123489089,0.11063735,0.100809865,0.092770347,0.085900885],
-    '2Ao': [0.529457,0.332487485,0.236011462,0.181581248,0.146882752,0.122644891,0.104632894,0.09070468,0.079670277],
-    '2Ko': [0.484196089,0.292883125,0.204393964,0.155585363,0.124754258,0.103356168,0.087585214,0.075500703,0.065996096],
-    '2Qo': [0.451141763,0.267996595,0.185902647,0.140680723,0.112057739,0.092268759,0.077803601,0.066796393,0.058174799],
-    '2Jo': [0.42050763,0.247239531,0.171060921,0.128880215,0.102113861,0.08368265,0.070275947,0.060135884,0.052210835],
-    '2To': [0.392384515,0.230233753,0.159300248,0.119603383,0.094361069,0.077050762,0.064524254,0.055074627,0.047684535],
-    '29o': [0.36513905,0.214436759,0.147821221,0.110196413,0.086459917,0.070397839,0.058923993,0.050336723,0.043656017],
-    '28o': [0.340840585,0.201945571,0.139078693,0.103362703,0.081009221,0.066037677,0.055385789,0.047416158,0.041181551],
-    '27o': [0.317097993,0.189663313,0.130429511,0.096983565,0.076367765,0.062666122,0.052913611,0.045551185,0.039741353],
-    '26o': [0.31082834,0.192878149,0.135000647,0.102323878,0.082282548,0.068970568,0.059459541,0.052217931,0.046423191],
-    '25o': [0.311948254,0.199746653,0.142459478,0.110257251,0.090552092,0.077409713,0.067910852,0.060578244,0.054646508],
-    '24o': [0.301172779,0.192194122,0.136500258,0.105765472,0.087176888,0.07481934,0.065875828,0.058917719,0.053230221],
-    '23o': [0.29240095,0.183699852,0.129341637,0.09982238,0.082133957,0.070393825,0.061849594,0.055182624,0.049697954],
-    '22o': [0.493804224,0.30240269,0.216757158,0.17545235,0.153423789,0.140163722,0.131084607,0.12413666,0.1183773],
-    'KAs': [0.662217824,0.49836231,0.405354241,0.34515568,0.301837554,0.268197189,0.240827756,0.217859914,0.198274079],
-    'QAs': [0.653189637,0.484191891,0.388210044,0.32655401,0.282788455,0.249469723,0.222840535,0.200960194,0.182658307],
-    'JAs': [0.643978479,0.470635585,0.372791729,0.310569389,0.267001709,0.234301182,0.208611393,0.187799987,0.170641465],
-    'TAs': [0.63488318,0.45783769,0.358912007,0.29677093,0.253844614,0.22199696,0.197274707,0.17746934,0.161297284],
-    '9As': [0.615104341,0.431096677,0.330626739,0.269112429,0.227612086,0.197508218,0.174527713,0.156414951,0.141853099],
-    '8As': [0.605031564,0.418928455,0.318643416,0.257894367,0.217260036,0.188043564,0.165923102,0.148649564,0.134853885],
-    '7As': [0.593886468,0.406282356,0.306818472,0.247367347,0.208009485,0.17991033,0.158820987,0.142426059,0.129394336],
-    '6As': [0.581813015,0.393037571,0.294990897,0.23731368,0.199610406,0.172939086,0.153023294,0.137601175,0.125358938],
-    '5As': [0.580658287,0.394601911,0.298519706,0.241888066,0.204625501,0.17805168,0.158035357,0.142426851,0.129946079],
-    '4As': [0.571392999,0.385452311,0.290991748,0.235941522,0.199975165,0.174432403,0.155237763,0.140261944,0.128306753],
-    '3As': [0.563386492,0.377282971,0.284166605,0.230534004,0.195790554,0.171203182,0.152739255,0.138328251,0.12678969],
-    '2As': [0.555081999,0.368629683,0.276717132,0.224415059,0.190753244,0.166992815,0.149161462,0.135203941,0.12402933],
-    'AKo': [0.644713545,0.472889868,0.376062287,0.313826001,0.269258649,0.234759003,0.206708406,0.183214006,0.16318403],
-    'QKs': [0.62408774,0.460952865,0.372178994,0.315036143,0.273770439,0.241769359,0.21596639,0.194652633,0.176831571],
-    'JKs': [0.614789294,0.447557053,0.357075889,0.299509953,0.258564178,0.227325535,0.20253639,0.182411508,0.165800951],
-    'TKs': [0.605853525,0.435340581,0.343904947,0.286426595,0.246073578,0.215732789,0.191971667,0.172887066,0.157313858],
-    '9Ks': [0.586422136,0.409185548,0.316204105,0.259264535,0.220235303,0.191484436,0.169343086,0.151808562,0.137648908],
-    '8Ks': [0.56789751,0.386175377,0.293303848,0.237821931,0.200549102,0.173575324,0.153077825,0.137040765,0.124203469],
-    '7Ks': [0.558469346,0.375766155,0.283531572,0.22892431,0.192548208,0.166417994,0.146714941,0.131374875,0.119162208],
-    '6Ks': [0.54807547,0.364796693,0.273777053,0.220559977,0.185435159,0.160368812,0.141530997,0.126918532,0.115292554],
-    '5Ks': [0.538321619,0.355064597,0.265393287,0.213562802,0.179671654,0.155578337,0.137523783,0.123488,0.112319802],
-    '4Ks': [0.528917067,0.346415468,0.258489663,0.208229218,0.175587578,0.152467297,0.135161122,0.121741449,0.111044267],
-    '3Ks': [0.520746257,0.338665037,0.252322259,0.203554706,0.172127419,0.149961957,0.13338837,0.120501525,0.110210762],
-    '2Ks': [0.512391178,0.330889637,0.246235277,0.199038881,0.16886311,0.147632449,0.131751535,0.119389756,0.109496907],
-    'AQo': [0.635092014,0.457673987,0.357586072,0.293631538,0.248399304,0.214007779,0.186583719,0.16406332,0.145245502],
-    'KQo': [0.604341519,0.433583141,0.34151037,0.282644844,0.240264795,0.207500222,0.181061749,0.159295832,0.141105647],
-    'JQs': [0.590691291,0.430395053,0.345545363,0.29088171,0.251368634,0.221026072,0.19695863,0.177498449,0.16153667],
-    'TQs': [0.581681508,0.418468422,0.332842879,0.278331337,0.239504545,0.210120353,0.187123908,0.168760838,0.153856591],
-    '9Qs': [0.562225636,0.392696241,0.305646966,0.251662597,0.214130567,0.186312399,0.16492027,0.148044931,0.134486673],
-    '8Qs': [0.544165232,0.370368429,0.283353762,0.230742967,0.194902307,0.168744363,0.148870611,0.1333447,0.120937944],
-    '7Qs': [0.52520164,0.348330487,0.262280594,0.211467522,0.177487231,0.153060521,0.134714733,0.120481086,0.109183234],
-    '6Qs': [0.516763675,0.339628287,0.254330845,0.204397963,0.171288614,0.147660261,0.129987756,0.116335247,0.105510627],
-    '5Qs': [0.507125342,0.330321439,0.246409845,0.197892584,0.165996016,0.143341168,0.126433129,0.113343479,0.102945046],
-    '4Qs': [0.497589353,0.321952707,0.239808007,0.192812386,0.162143284,0.140458953,0.124290178,0.11179402,0.101837627],
-    '3Qs': [0.489407004,0.314357089,0.233769743,0.188254502,0.15881168,0.138076446,0.12261467,0.110642076,0.101081795],
-    '2Qs': [0.481047641,0.30677764,0.227898377,0.183952112,0.155748984,0.135921109,0.121148687,0.109666845,0.100463511],
-    'AJo': [0.625372686,0.443135782,0.340896566,0.276189449,0.231017729,0.197178102,0.170623412,0.149148099,0.131481518],
-    'KJo': [0.594408269,0.419215383,0.325193607,0.265716966,0.223517027,0.191403861,0.165989769,0.145367238,0.128424013],
-    'QJo': [0.56905233,0.401687927,0.313955214,0.25777239,0.217287657,0.186268472,0.161706465,0.141902531,0.125739026],
-    'TJs': [0.561545188,0.406898271,0.326345604,0.27408498,0.236369066,0.207742769,0.185427089,0.167697244,0.15337269],
-    '9Js': [0.541107174,0.38099004,0.299382861,0.247814981,0.21148903,0.184490716,0.163774119,0.147531524,0.134513267],
-    '8Js': [0.523125072,0.359185792,0.277699175,0.227417835,0.192708261,0.167299346,0.148054287,0.133071185,0.121131845],
-    '7Js': [0.504545433,0.337618096,0.256918986,0.208306914,0.175356152,0.151558967,0.133676683,0.119854657,0.108847663],
-    '6Js': [0.485737405,0.316831548,0.237545538,0.190899555,0.15982034,0.137652565,0.121133488,0.10838803,0.098271518],
-    '5Js': [0.478186221,0.309611974,0.231139885,0.18538736,0.155160574,0.133730607,0.117764709,0.105447974,0.095651475],
-    '4Js': [0.46868197,0.301548997,0.224764013,0.180504538,0.151483862,0.130988597,0.115756482,0.103997868,0.094604604],
-    '3Js': [0.460393597,0.294146802,0.218954202,0.176169476,0.14836795,0.12877164,0.114211851,0.10293467,0.093918657],
-    '2Js': [0.452025373,0.286717271,0.213227089,0.172013063,0.145424482,0.12674832,0.112842874,0.102043109,0.093366709],
-    'ATo': [0.615637267,0.429465168,0.325908287,0.261144162,0.216521386,0.183507927,0.157896604,0.137451716,0.120796565],
-    'KTo': [0.584948514,0.40610897,0.31088959,0.25137845,0.209737376,0.178466894,0.154053931,0.134504079,0.118613069],
-    'QTo': [0.559468173,0.388972383,0.300237166,0.244079142,0.20416202,0.174046257,0.150568435,0.131917624,0.116872125],
-    'JTo': [0.538280755,0.377268019,0.294278613,0.240670624,0.202091208,0.172893743,0.150238063,0.132345274,0.118006858],
-    '9Ts': [0.523784303,0.37372004,0.296685615,0.246890957,0.211461185,0.185123313,0.165007954,0.149274901,0.136695089],
-    '8Ts': [0.505025812,0.351942023,0.275243826,0.226828921,0.193047039,0.168370637,0.149720756,0.135251554,0.123704647],
-    '7Ts': [0.486476148,0.330823543,0.254904337,0.208056954,0.175983687,0.152838304,0.135487214,0.122068871,0.1113897],
-    '6Ts': [0.468000789,0.310364428,0.23566365,0.190616327,0.160258963,0.138590413,0.122420908,0.109938967,0.099993234],
-    '5Ts': [0.449398677,0.290750131,0.217725053,0.17473803,0.146282337,0.126116208,0.111126505,0.099523624,0.090254855],
-    '4Ts': [0.442026931,0.28470794,0.212722357,0.17069799,0.14305329,0.123552987,0.109082921,0.097897937,0.088950647],
-    '3Ts': [0.433797153,0.277508395,0.207073881,0.166499974,0.140040198,0.121429898,0.107609436,0.096894205,0.088291756],
-    '2Ts': [0.425374835,0.270232505,0.201527789,0.162526066,0.137270244,0.119535676,0.106341842,0.096077554,0.087778627],
-    'A9o': [0.594487092,0.400666912,0.295288475,0.231018825,0.187847165,0.156601578,0.132853026,0.114230003,0.099318465],
-    'K9o': [0.564089482,0.377917165,0.280942115,0.221851069,0.181516353,0.151877099,0.129166957,0.111274677,0.096929337],
-    'Q9o': [0.538652036,0.36119198,0.270823617,0.215057855,0.176441723,0.147936683,0.12613527,0.109071472,0.09548934],
-    'J9o': [0.516406165,0.34937472,0.265060706,0.212044297,0.174846132,0.147320231,0.126358231,0.110065241,0.097175921],
-    'T9o': [0.498155219,0.342193758,0.262991734,0.212006713,0.175878429,0.149179515,0.128958017,0.113314914,0.100988647],
-    '89s': [0.488559881,0.345321875,0.27171124,0.22418202,0.190923792,0.16674661,0.148613631,0.134592627,0.123435875],
-    '79s': [0.469938822,0.325478399,0.253174083,0.207656825,0.176445297,0.154052478,0.137410152,0.124572373,0.114343492],
-    '69s': [0.451493119,0.305500223,0.234496782,0.190800752,0.161351637,0.140466023,0.125000274,0.113097317,0.103596716],
-    '59s': [0.433143275,0.28598276,0.216520911,0.174758148,0.147053944,0.127526462,0.113085208,0.101932921,0.09299735],
-    '49s': [0.414046261,0.26737541,0.200009093,0.160411079,0.134505284,0.116391891,0.103035066,0.092711017,0.08441667],
-    '39s': [0.408071568,0.262150475,0.19566563,0.156988531,0.131866782,0.114356251,0.101449013,0.091458805,0.083422277],
-    '29s': [0.399702664,0.254980946,0.190195852,0.153070419,0.129134076,0.112487247,0.100148337,0.090574825,0.082837462],
-    'A8o': [0.58370153,0.387574194,0.282293017,0.218808192,0.17651199,0.146196528,0.123374132,0.105642525,0.091589997],
-    'K8o': [0.544292702,0.353204872,0.256157696,0.198533858,0.160031776,0.132283762,0.111329409,0.095055667,0.082161495],
-    'Q8o': [0.519293016,0.337105439,0.246669627,0.192283465,0.155408169,0.128656072,0.10849668,0.092886399,0.080591033],
-    'J8o': [0.497142891,0.325853449,0.241525412,0.189772267,0.15424972,0.128434587,0.109046564,0.094149376,0.08244968],
-    'T8o': [0.478209277,0.318837043,0.239823083,0.190188795,0.155772841,0.130802221,0.11214167,0.097851363,0.086670073],
-    '98o': [0.460661044,0.312094786,0.236516026,0.187951941,0.154186875,0.129859178,0.111844561,0.098173294,0.087508822],
-    '78s': [0.456850271,0.322843838,0.25314472,0.208455172,0.177811502,0.155918766,0.139652564,0.12711132,0.117070452],
-    '68s': [0.438161019,0.30385295,0.2358407,0.193296247,0.164651518,0.144437353,0.129492337,0.117949654,0.108669611],
-    '58s': [0.41993028,0.284763444,0.21832395,0.177738264,0.150856016,0.131989419,0.118050865,0.10723364,0.09850069],
-    '48s': [0.401033858,0.266127712,0.201557284,0.162973089,0.137733478,0.120134789,0.107134469,0.097031918,0.0888487],
-    '38s': [0.382858237,0.2481033,0.1857573,0.149358964,0.125860931,0.10957168,0.097536835,0.088149426,0.080518241],
-    '28s': [0.376797601,0.242959063,0.181573825,0.146153195,0.123453225,0.107736323,0.096111868,0.08702171,0.07960532],
-    'A7o': [0.571658507,0.373788491,0.269385161,0.207244013,0.166287251,0.13721569,0.115518848,0.098766017,0.08554805],
-    'K7o': [0.534175394,0.34193235,0.245519284,0.18877765,0.151193353,0.124366446,0.104277363,0.088787224,0.076593951],
-    'Q7o': [0.499064769,0.313455654,0.223899,0.17135625,0.136465393,0.111566498,0.093057162,0.078894489,0.067826772],
-    'J7o': [0.477270534,0.302636786,0.219049584,0.169016016,0.135331825,0.111260482,0.093386525,0.079761703,0.069122333],
-    'T7o': [0.458260152,0.296074862,0.217738419,0.169732373,0.137095142,0.113765617,0.096529967,0.083434664,0.073236927],
-    '97o': [0.440699247,0.290700686,0.216449136,0.169941683,0.138308501,0.115893066,0.099508073,0.087134072,0.077522657],
-    '87o': [0.426916959,0.288335073,0.216913532,0.171356947,0.140415379,0.118605472,0.102698172,0.090721324,0.081382185],
-    '67s': [0.428277227,0.30378379,0.237462548,0.195535611,0.167414584,0.147624542,0.132977128,0.121615548,0.112406564],
-    '57s': [0.409801746,0.285482621,0.221154185,0.181574284,0.155475525,0.137208782,0.123677637,0.113115211,0.10451071],
-    '47s': [0.391113895,0.267238634,0.204841056,0.167218393,0.14274405,0.125730225,0.113115723,0.103260505,0.095196334],
-    '37s': [0.373045844,0.24907964,0.188648696,0.153066673,0.13019537,0.114339231,0.102580881,0.093348142,0.085767376],
-    '27s': [0.354395707,0.231157944,0.1731383,0.139800723,0.118658795,0.104052911,0.093184102,0.084581495,0.077474521],
-    'A6o': [0.558681997,0.359502948,0.256519275,0.196244063,0.157066865,0.129523271,0.109091456,0.093425366,0.081121096],
-    'K6o': [0.522964136,0.330069934,0.234879825,0.179577858,0.143321512,0.11761631,0.098516545,0.083851191,0.072334162],
-    'Q6o': [0.489960122,0.304018237,0.215225838,0.163592228,0.12960061,0.105561881,0.087816403,0.074317353,0.063807551],
-    'J6o': [0.457163518,0.28036601,0.198150515,0.150138904,0.118436182,0.096109373,0.079721957,0.067323234,0.057689439],
-    'T6o': [0.438462657,0.274028433,0.196892409,0.150717947,0.119928202,0.098207875,0.08229463,0.070276841,0.060934769],
-    '96o': [0.421029753,0.269313574,0.196289554,0.151669426,0.121916581,0.101131089,0.086068785,0.074744984,0.065978416],
-    '86o': [0.406957244,0.267961396,0.198210861,0.154873885,0.126056013,0.106064096,0.091602254,0.08074266,0.072266944],
-    '76o': [0.396572172,0.268211917,0.200339511,0.157736944,0.129520671,0.110016647,0.095951719,0.085341132,0.077019799],
-    '56s': [0.403502271,0.287238805,0.223954194,0.184913716,0.159298148,0.141393904,0.128065489,0.117601931,0.10899834],
-    '46s': [0.384806142,0.269878515,0.208860987,0.172117838,0.148336185,0.131807307,0.119493119,0.109778713,0.101744244],
-    '36s': [0.366841075,0.251942264,0.192983053,0.15825959,0.136063838,0.120690818,0.109233908,0.10015034,0.092599894],
-    '26s': [0.348380541,0.233893897,0.17711837,0.144463693,0.12382265,0.10954803,0.098866082,0.090345435,0.083231957],
-    'A5o': [0.557448169,0.361120677,0.260213614,0.20105501,0.162342073,0.134905809,0.114414406,0.09857234,0.086036538],
-    'K5o': [0.512576769,0.31963737,0.225822575,0.171992568,0.137009182,0.112367294,0.094113442,0.080106726,0.069118274],
-    'Q5o': [0.479568736,0.29389463,0.206491944,0.15636024,0.123701403,0.100744439,0.083844036,0.070984254,0.060963271],
-    'J5o': [0.449015885,0.272467628,0.191063783,0.143994191,0.113224611,0.091691716,0.075920739,0.064022122,0.054783109],
-    'T5o': [0.418586144,0.252874621,0.177462237,0.133489719,0.104695528,0.084630412,0.070024851,0.059030898,0.050487987],
-    '95o': [0.401401891,0.24832172,0.176827911,0.134265673,0.106361927,0.087070287,0.07313101,0.06267999,0.054589838],
-    '85o': [0.387406132,0.247387218,0.179243842,0.138001221,0.111052759,0.092532188,0.079206224,0.069195366,0.061385561],
-    '75o': [0.376715759,0.248496429,0.182702481,0.142519663,0.116465053,0.098637901,0.085819772,0.076144555,0.068524907],
-    '65o': [0.370186745,0.25065539,0.185950538,0.146442119,0.120937419,0.103522475,0.090965323,0.081433544,0.073859951],
-    '45s': [0.385344148,0.274962112,0.21414963,0.177602825,0.153928161,0.137406148,0.124987815,0.115106881,0.10685998],
-    '35s': [0.367607383,0.258005383,0.199590357,0.165293409,0.143398957,0.128149267,0.116668512,0.107478637,0.099756205],
-    '25s': [0.349329336,0.240124951,0.183891687,0.15167563,0.131332796,0.117202393,0.106515469,0.097919607,0.090664974],
-    'A4o': [0.547341875,0.351083799,0.251866046,0.194424112,0.157160977,0.130897666,0.111332066,0.09622596,0.084286865],
-    'K4o': [0.502234779,0.310037013,0.218089218,0.165913165,0.132313485,0.108793082,0.091398221,0.078084419,0.067661096],
-    'Q4o': [0.469213505,0.284677109,0.199113083,0.150576957,0.119252937,0.097374056,0.081316188,0.069133789,0.059642677],
-    'J4o': [0.438673541,0.263612247,0.183986558,0.138507215,0.10904397,0.0885447,0.073603416,0.062332086,0.053588333],
-    'T4o': [0.41054876,0.246255664,0.171886171,0.128910789,0.101007772,0.081685122,0.067682221,0.05715868,0.049007502],
-    '94o': [0.380838129,0.228159719,0.1588437,0.118558459,0.092631211,0.074907436,0.062214165,0.052729409,0.045389162],
-    '84o': [0.367086696,0.22724309,0.161042531,0.12190501,0.096762488,0.079656739,0.067416835,0.058244323,0.051100076],
-    '74o': [0.35661139,0.22872934,0.164875713,0.126860578,0.102601389,0.086190294,0.074444228,0.065589858,0.058615825],
-    '64o': [0.350029898,0.231852581,0.169544458,0.132451663,0.108935723,0.093069373,0.081674528,0.073016716,0.066118402],
-    '54o': [0.35074301,0.237479105,0.175356657,0.138485419,0.115118485,0.09926365,0.087776561,0.078960013,0.071859376],
-    '34s': [0.357229934,0.249946314,0.192663855,0.15947202,0.138406894,0.123742871,0.112650409,0.103707683,0.096160198],
-    '24s': [0.339180746,0.23297102,0.178258205,0.14740093,0.128086231,0.11466502,0.104454851,0.096164205,0.089113786],
-    'A3o': [0.538564204,0.342043143,0.244267742,0.188388818,0.152481762,0.127272934,0.10853968,0.09407869,0.082637043],
-    'K3o': [0.493342859,0.3014577,0.211206845,0.160641858,0.128406139,0.105958066,0.089387726,0.076709587,0.066761023],
-    'Q3o': [0.460219736,0.276308984,0.192407538,0.145523968,0.11553703,0.094717759,0.079467591,0.067895294,0.058856013],
-    'J3o': [0.429666105,0.255408122,0.177431541,0.133572063,0.105453234,0.085994056,0.071842759,0.061147257,0.052831264],
-    'T3o': [0.401615667,0.23828926,0.165575766,0.12416934,0.097569191,0.079252709,0.066002333,0.056035726,0.048281561],
-    '93o': [0.374236003,0.222282772,0.153853766,0.114581429,0.089539168,0.072516617,0.060362455,0.051300386,0.044275366],
-    '83o': [0.34750001,0.207736789,0.143825865,0.107017175,0.083803145,0.06816995,0.057027637,0.048693706,0.042194109],
-    '73o': [0.337148469,0.209031089,0.147299825,0.111450947,0.088926818,0.073820703,0.063036624,0.054926531,0.048533033],
-    '63o': [0.330669515,0.212399806,0.152225422,0.11732529,0.0955553,0.08098971,0.070564703,0.062659726,0.056351307],
-    '53o': [0.331675259,0.21911026,0.159512475,0.125057132,0.103630284,0.089225327,0.078815785,0.070800614,0.064319528],
-    '43o': [0.320683531,0.210612861,0.152161178,0.118873743,0.098327647,0.084559148,0.074572142,0.066856759,0.060592092],
-    '23s': [0.330934762,0.225061861,0.171649535,0.141961498,0.123489089,0.11063735,0.100809865,0.092770347,0.085900885],
-    'A2o': [0.529457,0.332487485,0.236011462,0.181581248,0.146882752,0.122644891,0.104632894,0.09070468,0.079670277],
-    'K2o': [0.484196089,0.292883125,0.204393964,0.155585363,0.124754258,0.103356168,0.087585214,0.075500703,0.065996096],
-    'Q2o': [0.451141763,0.267996595,0.185902647,0.140680723,0.112057739,0.092268759,0.077803601,0.066796393,0.058174799],
-    'J2o': [0.42050763,0.247239531,0.171060921,0.128880215,0.102113861,0.08368265,0.070275947,0.060135884,0.052210835],
-    'T2o': [0.392384515,0.230233753,0.159300248,0.119603383,0.094361069,0.077050762,0.064524254,0.055074627,0.047684535],
-    '92o': [0.36513905,0.214436759,0.147821221,0.110196413,0.086459917,0.070397839,0.058923993,0.050336723,0.043656017],
-    '82o': [0.340840585,0.201945571,0.139078693,0.103362703,0.081009221,0.066037677,0.055385789,0.047416158,0.041181551],
-    '72o': [0.317097993,0.189663313,0.130429511,0.096983565,0.076367765,0.062666122,0.052913611,0.045551185,0.039741353],
-    '62o': [0.31082834,0.192878149,0.135000647,0.102323878,0.082282548,0.068970568,0.059459541,0.052217931,0.046423191],
-    '52o': [0.311948254,0.199746653,0.142459478,0.110257251,0.090552092,0.077409713,0.067910852,0.060578244,0.054646508],
-    '42o': [0.301172779,0.192194122,0.136500258,0.105765472,0.087176888,0.07481934,0.065875828,0.058917719,0.053230221],
-    '32o': [0.29240095,0.183699852,0.129341637,0.09982238,0.082133957,0.070393825,0.061849594,0.055182624,0.049697954]
-}
-
-UNIQUE_EQUITY_TABLE = {
-    'AAo': [0.84933161,0.732048899,0.63609019,0.556456592,0.489655059,0.433154822,0.385045777,0.343928841,0.308682918],
-    'AKs': [0.662217824,0.49836231,0.405354241,0.34515568,0.301837554,0.268197189,0.240827756,0.217859914,0.198274079],
-    'AQs': [0.653189637,0.484191891,0.388210044,0.32655401,0.282788455,0.249469723,0.222840535,0.200960194,0.182658307],
-    'AJs': [0.643978479,0.470635585,0.372791729,0.310569389,0.267001709,0.234301182,0.208611393,0.187799987,0.170641465],
-    'ATs': [0.63488318,0.45783769,0.358912007,0.29677093,0.253844614,0.22199696,0.197274707,0.17746934,0.161297284],
-    'A9s': [0.615104341,0.431096677,0.330626739,0.269112429,0.227612086,0.197508218,0.174527713,0.156414951,0.141853099],
-    'A8s': [0.605031564,0.418928455,0.318643416,0.257894367,0.217260036,0.188043564,0.165923102,0.148649564,0.134853885],
-    'A7s': [0.593886468,0.406282356,0.306818472,0.247367347,0.208009485,0.17991033,0.158820987,0.142426059,0.129394336],
-    'A6s': [0.581813015,0.393037571,0.294990897,0.23731368,0.199610406,0.172939086,0.153023294,0.137601175,0.125358938],
-    'A5s': [0.580658287,0.394601911,0.298519706,0.241888066,0.204625501,0.17805168,0.158035357,0.142426851,0.129946079],
-    'A4s': [0.571392999,0.385452311,0.290991748,0.235941522,0.199975165,0.174432403,0.155237763,0.140261944,0.128306753],
-    'A3s': [0.563386492,0.377282971,0.284166605,0.230534004,0.195790554,0.171203182,0.152739255,0.138328251,0.12678969],
-    'A2s': [0.555081999,0.368629683,0.276717132,0.224415059,0.190753244,0.166992815,0.149161462,0.135203941,0.12402933],
-    'KAo': [0.644713545,0.472889868,0.376062287,0.313826001,0.269258649,0.234759003,0.206708406,0.183214006,0.16318403],
-    'KKo': [0.821190542,0.68632226,0.580094481,0.495367291,0.427145251,0.371729128,0.326414723,0.289103423,0.258244527],
-    'KQs': [0.62408774,0.460952865,0.372178994,0.315036143,0.273770439,0.241769359,0.21596639,0.194652633,0.176831571],
-    'KJs': [0.614789294,0.447557053,0.357075889,0.299509953,0.258564178,0.227325535,0.20253639,0.182411508,0.165800951],
-    'KTs': [0.605853525,0.435340581,0.343904947,0.286426595,0.246073578,0.215732789,0.191971667,0.172887066,0.157313858],
-    'K9s': [0.586422136,0.409185548,0.316204105,0.259264535,0.220235303,0.191484436,0.169343086,0.151808562,0.137648908],
-    'K8s': [0.56789751,0.386175377,0.293303848,0.237821931,0.200549102,0.173575324,0.153077825,0.137040765,0.124203469],
-    'K7s': [0.558469346,0.375766155,0.283531572,0.22892431,0.192548208,0.166417994,0.146714941,0.131374875,0.119162208],
-    'K6s': [0.54807547,0.364796693,0.273777053,0.220559977,0.185435159,0.160368812,0.141530997,0.126918532,0.115292554],
-    'K5s': [0.538321619,0.355064597,0.265393287,0.213562802,0.179671654,0.155578337,0.137523783,0.123488,0.112319802],
-    'K4s': [0.528917067,0.346415468,0.258489663,0.208229218,0.175587578,0.152467297,0.135161122,0.121741449,0.111044267],
-    'K3s': [0.520746257,0.338665037,0.252322259,0.203554706,0.172127419,0.149961957,0.13338837,0.120501525,0.110210762],
-    'K2s': [0.512391178,0.330889637,0.246235277,0.199038881,0.16886311,0.147632449,0.131751535,0.119389756,0.109496907],
-    'QAo': [0.635092014,0.457673987,0.357586072,0.293631538,0.248399304,0.214007779,0.186583719,0.16406332,0.145245502],
-    'QKo': [0.604341519,0.433583141,0.34151037,0.282644844,0.240264795,0.207500222,0.181061749,0.159295832,0.141105647],
-    'QQo': [0.796323165,0.646643354,0.532429852,0.444379359,0.375861202,0.322160241,0.279736848,0.245979211,0.218934686],
-    'QJs': [0.590691291,0.430395053,0.345545363,0.29088171,0.251368634,0.221026072,0.19695863,0.177498449,0.16153667],
-    'QTs': [0.581681508,0.418468422,0.332842879,0.278331337,0.239504545,0.210120353,0.187123908,0.168760838,0.153856591],
-    'Q9s': [0.562225636,0.392696241,0.305646966,0.251662597,0.214130567,0.186312399,0.16492027,0.148044931,0.134486673],
-    'Q8s': [0.544165232,0.370368429,0.283353762,0.230742967,0.194902307,0.168744363,0.148870611,0.1333447,0.120937944],
-    'Q7s': [0.52520164,0.348330487,0.262280594,0.211467522,0.177487231,0.153060521,0.134714733,0.120481086,0.109183234],
-    'Q6s': [0.516763675,0.339628287,0.254330845,0.204397963,0.171288614,0.147660261,0.129987756,0.116335247,0.105510627],
-    'Q5s': [0.507125342,0.330321439,0.246409845,0.197892584,0.165996016,0.143341168,0.126433129,0.113343479,0.102945046],
-    'Q4s': [0.497589353,0.321952707,0.239808007,0.192812386,0.162143284,0.140458953,0.124290178,0.11179402,0.101837627],
-    'Q3s': [0.489407004,0.314357089,0.233769743,0.188254502,0.15881168,0.138076446,0.12261467,0.110642076,0.101081795],
-    'Q2s': [0.481047641,0.30677764,0.227898377,0.183952112,0.155748984,0.135921109,0.121148687,0.109666845,0.100463511],
-    'JAo': [0.625372686,0.443135782,0.340896566,0.276189449,0.231017729,0.197178102,0.170623412,0.149148099,0.131481518],
-    'JKo': [0.594408269,0.419215383,0.325193607,0.265716966,0.223517027,0.191403861,0.165989769,0.145367238,0.128424013],
-    'JQo': [0.56905233,0.401687927,0.313955214,0.25777239,0.217287657,0.186268472,0.161706465,0.141902531,0.125739026],
-    'JJo': [0.771566329,0.608719205,0.488663522,0.399303802,0.332225854,0.281377268,0.242514802,0.212533399,0.189156082],
-    'JTs': [0.561545188,0.406898271,0.326345604,0.27408498,0.236369066,0.207742769,0.185427089,0.167697244,0.15337269],
-    'J9s': [0.541107174,0.38099004,0.299382861,0.247814981,0.21148903,0.184490716,0.163774119,0.147531524,0.134513267],
-    'J8s': [0.523125072,0.359185792,0.277699175,0.227417835,0.192708261,0.167299346,0.148054287,0.133071185,0.121131845],
-    'J7s': [0.504545433,0.337618096,0.256918986,0.208306914,0.175356152,0.151558967,0.133676683,0.119854657,0.108847663],
-    'J6s': [0.485737405,0.316831548,0.237545538,0.190899555,0.15982034,0.137652565,0.121133488,0.10838803,0.098271518],
-    'J5s': [0.478186221,0.309611974,0.231139885,0.18538736,0.155160574,0.133730607,0.117764709,0.105447974,0.095651475],
-    'J4s': [0.46868197,0.301548997,0.224764013,0.180504538,0.151483862,0.130988597,0.115756482,0.103997868,0.094604604],
-    'J3s': [0.460393597,0.294146802,0.218954202,0.176169476,0.14836795,0.12877164,0.114211851,0.10293467,0.093918657],
-    'J2s': [0.452025373,0.286717271,0.213227089,0.172013063,0.145424482,0.12674832,0.112842874,0.102043109,0.093366709],
-    'TAo': [0.615637267,0.429465168,0.325908287,0.261144162,0.216521386,0.183507927,0.157896604,0.137451716,0.120796565],
-    'TKo': [0.584948514,0.40610897,0.31088959,0.25137845,0.209737376,0.178466894,0.154053931,0.134504079,0.118613069],
-    'TQo': [0.559468173,0.388972383,0.300237166,0.244079142,0.20416202,0.174046257,0.150568435,0.131917624,0.116872125],
-    'TJo': [0.538280755,0.377268019,0.294278613,0.240670624,0.202091208,0.172893743,0.150238063,0.132345274,0.118006858],
-    'TTo': [0.746639807,0.572433294,0.448586779,0.359651897,0.295182195,0.247937132,0.212924551,0.186632505,0.166608373],
-    'T9s': [0.523784303,0.37372004,0.296685615,0.246890957,0.211461185,0.185123313,0.165007954,0.149274901,0.136695089],
-    'T8s': [0.505025812,0.351942023,0.275243826,0.226828921,0.193047039,0.168370637,0.149720756,0.135251554,0.123704647],
-    'T7s': [0.486476148,0.330823543,0.254904337,0.208056954,0.175983687,0.152838304,0.135487214,0.122068871,0.1113897],
-    'T6s': [0.468000789,0.310364428,0.23566365,0.190616327,0.160258963,0.138590413,0.122420908,0.109938967,0.099993234],
-    'T5s': [0.449398677,0.290750131,0.217725053,0.17473803,0.146282337,0.126116208,0.111126505,0.099523624,0.090254855],
-    'T4s': [0.442026931,0.28470794,0.212722357,0.17069799,0.14305329,0.123552987,0.109082921,0.097897937,0.088950647],
-    'T3s': [0.433797153,0.277508395,0.207073881,0.166499974,0.140040198,0.121429898,0.107609436,0.096894205,0.088291756],
-    'T2s': [0.425374835,0.270232505,0.201527789,0.162526066,0.137270244,0.119535676,0.106341842,0.096077554,0.087778627],
-    '9Ao': [0.594487092,0.400666912,0.295288475,0.231018825,0.187847165,0.156601578,0.132853026,0.114230003,0.099318465],
-    '9Ko': [0.564089482,0.377917165,0.280942115,0.221851069,0.181516353,0.151877099,0.129166957,0.111274677,0.096929337],
-    '9Qo': [0.538652036,0.36119198,0.270823617,0.215057855,0.176441723,0.147936683,0.12613527,0.109071472,0.09548934],
-    '9Jo': [0.516406165,0.34937472,0.265060706,0.212044297,0.174846132,0.147320231,0.126358231,0.110065241,0.097175921],
-    '9To': [0.498155219,0.342193758,0.262991734,0.212006713,0.175878429,0.149179515,0.128958017,0.113314914,0.100988647],
-    '99o': [0.71665056,0.532657795,0.408142716,0.322575823,0.262972076,0.220814753,0.190544383,0.168410729,0.151921848],
-    '98s': [0.488559881,0.345321875,0.27171124,0.22418202,0.190923792,0.16674661,0.148613631,0.134592627,0.123435875],
-    '97s': [0.469938822,0.325478399,0.253174083,0.207656825,0.176445297,0.154052478,0.137410152,0.124572373,0.114343492],
-    '96s': [0.451493119,0.305500223,0.234496782,0.190800752,0.161351637,0.140466023,0.125000274,0.113097317,0.103596716],
-    '95s': [0.433143275,0.28598276,0.216520911,0.174758148,0.147053944,0.127526462,0.113085208,0.101932921,0.09299735],
-    '94s': [0.414046261,0.26737541,0.200009093,0.160411079,0.134505284,0.116391891,0.103035066,0.092711017,0.08441667],
-    '93s': [0.408071568,0.262150475,0.19566563,0.156988531,0.131866782,0.114356251,0.101449013,0.091458805,0.083422277],
-    '92s': [0.399702664,0.254980946,0.190195852,0.153070419,0.129134076,0.112487247,0.100148337,0.090574825,0.082837462],
-    '8Ao': [0.58370153,0.387574194,0.282293017,0.218808192,0.17651199,0.146196528,0.123374132,0.105642525,0.091589997],
-    '8Ko': [0.544292702,0.353204872,0.256157696,0.198533858,0.160031776,0.132283762,0.111329409,0.095055667,0.082161495],
-    '8Qo': [0.519293016,0.337105439,0.246669627,0.192283465,0.155408169,0.128656072,0.10849668,0.092886399,0.080591033],
-    '8Jo': [0.497142891,0.325853449,0.241525412,0.189772267,0.15424972,0.128434587,0.109046564,0.094149376,0.08244968],
-    '8To': [0.478209277,0.318837043,0.239823083,0.190188795,0.155772841,0.130802221,0.11214167,0.097851363,0.086670073],
-    '89o': [0.460661044,0.312094786,0.236516026,0.187951941,0.154186875,0.129859178,0.111844561,0.098173294,0.087508822],
-    '88o': [0.687185223,0.496046663,0.372652456,0.29140528,0.236885875,0.199596733,0.173515542,0.15483269,0.141076158],
-    '87s': [0.456850271,0.322843838,0.25314472,0.208455172,0.177811502,0.155918766,0.139652564,0.12711132,0.117070452],
-    '86s': [0.438161019,0.30385295,0.2358407,0.193296247,0.164651518,0.144437353,0.129492337,0.117949654,0.108669611],
-    '85s': [0.41993028,0.284763444,0.21832395,0.177738264,0.150856016,0.131989419,0.118050865,0.10723364,0.09850069],
-    '84s': [0.401033858,0.266127712,0.201557284,0.162973089,0.137733478,0.120134789,0.107134469,0.097031918,0.0888487],
-    '83s': [0.382858237,0.2481033,0.1857573,0.149358964,0.125860931,0.10957168,0.097536835,0.088149426,0.080518241],
-    '82s': [0.376797601,0.242959063,0.181573825,0.146153195,0.123453225,0.107736323,0.096111868,0.08702171,0.07960532],
-    '7Ao': [0.571658507,0.373788491,0.269385161,0.207244013,0.166287251,0.13721569,0.115518848,0.098766017,0.08554805],
-    '7Ko': [0.534175394,0.34193235,0.245519284,0.18877765,0.151193353,0.124366446,0.104277363,0.088787224,0.076593951],
-    '7Qo': [0.499064769,0.313455654,0.223899,0.17135625,0.136465393,0.111566498,0.093057162,0.078894489,0.067826772],
-    '7Jo': [0.477270534,0.302636786,0.219049584,0.169016016,0.135331825,0.111260482,0.093386525,0.079761703,0.069122333],
-    '7To': [0.458260152,0.296074862,0.217738419,0.169732373,0.137095142,0.113765617,0.096529967,0.083434664,0.073236927],
-    '79o': [0.440699247,0.290700686,0.216449136,0.169941683,0.138308501,0.115893066,0.099508073,0.087134072,0.077522657],
-    '78o': [0.426916959,0.288335073,0.216913532,0.171356947,0.140415379,0.118605472,0.102698172,0.090721324,0.081382185],
-    '77o': [0.657264883,0.461114387,0.340562861,0.264478469,0.215274125,0.182603063,0.160256908,0.144470502,0.132891112],
-    '76s': [0.428277227,0.30378379,0.237462548,0.195535611,0.167414584,0.147624542,0.132977128,0.121615548,0.112406564],
-    '75s': [0.409801746,0.285482621,0.221154185,0.181574284,0.155475525,0.137208782,0.123677637,0.113115211,0.10451071],
-    '74s': [0.391113895,0.267238634,0.204841056,0.167218393,0.14274405,0.125730225,0.113115723,0.103260505,0.095196334],
-    '73s': [0.373045844,0.24907964,0.188648696,0.153066673,0.13019537,0.114339231,0.102580881,0.093348142,0.085767376],
-    '72s': [0.354395707,0.231157944,0.1731383,0.139800723,0.118658795,0.104052911,0.093184102,0.084581495,0.077474521],
-    '6Ao': [0.558681997,0.359502948,0.256519275,0.196244063,0.157066865,0.129523271,0.109091456,0.093425366,0.081121096],
-    '6Ko': [0.522964136,0.330069934,0.234879825,0.179577858,0.143321512,0.11761631,0.098516545,0.083851191,0.072334162],
-    '6Qo': [0.489960122,0.304018237,0.215225838,0.163592228,0.12960061,0.105561881,0.087816403,0.074317353,0.063807551],
-    '6Jo': [0.457163518,0.28036601,0.198150515,0.150138904,0.118436182,0.096109373,0.079721957,0.067323234,0.057689439],
-    '6To': [0.438462657,0.274028433,0.196892409,0.150717947,0.119928202,0.098207875,0.08229463,0.070276841,0.060934769],
-    '69o': [0.421029753,0.269313574,0.196289554,0.151669426,0.121916581,0.101131089,0.086068785,0.074744984,0.065978416],
-    '68o': [0.406957244,0.267961396,0.198210861,0.154873885,0.126056013,0.106064096,0.091602254,0.08074266,0.072266944],
-    '67o': [0.396572172,0.268211917,0.200339511,0.157736944,0.129520671,0.110016647,0.095951719,0.085341132,0.077019799],
-    '66o': [0.626976703,0.428132112,0.311892435,0.241641386,0.197728911,0.16932095,0.150163017,0.136648627,0.126663479],
-    '65s': [0.403502271,0.287238805,0.223954194,0.184913716,0.159298148,0.141393904,0.128065489,0.117601931,0.10899834],
-    '64s': [0.384806142,0.269878515,0.208860987,0.172117838,0.148336185,0.131807307,0.119493119,0.109778713,0.101744244],
-    '63s': [0.366841075,0.251942264,0.192983053,0.15825959,0.136063838,0.120690818,0.109233908,0.10015034,0.092599894],
-    '62s': [0.348380541,0.233893897,0.17711837,0.144463693,0.12382265,0.10954803,0.098866082,0.090345435,0.083231957],
-    '5Ao': [0.557448169,0.361120677,0.260213614,0.20105501,0.162342073,0.134905809,0.114414406,0.09857234,0.086036538],
-    '5Ko': [0.512576769,0.31963737,0.225822575,0.171992568,0.137009182,0.112367294,0.094113442,0.080106726,0.069118274],
-    '5Qo': [0.479568736,0.29389463,0.206491944,0.15636024,0.123701403,0.100744439,0.083844036,0.070984254,0.060963271],
-    '5Jo': [0.449015885,0.272467628,0.191063783,0.143994191,0.113224611,0.091691716,0.075920739,0.064022122,0.054783109],
-    '5To': [0.418586144,0.252874621,0.177462237,0.133489719,0.104695528,0.084630412,0.070024851,0.059030898,0.050487987],
-    '59o': [0.401401891,0.24832172,0.176827911,0.134265673,0.106361927,0.087070287,0.07313101,0.06267999,0.054589838],
-    '58o': [0.387406132,0.247387218,0.179243842,0.138001221,0.111052759,0.092532188,0.079206224,0.069195366,0.061385561],
-    '57o': [0.376715759,0.248496429,0.182702481,0.142519663,0.116465053,0.098637901,0.085819772,0.076144555,0.068524907],
-    '56o': [0.370186745,0.25065539,0.185950538,0.146442119,0.120937419,0.103522475,0.090965323,0.081433544,0.073859951],
-    '55o': [0.596427625,0.396494301,0.285363541,0.220998168,0.182033769,0.157307948,0.140743733,0.129014254,0.120206115],
-    '54s': [0.385344148,0.274962112,0.21414963,0.177602825,0.153928161,0.137406148,0.124987815,0.115106881,0.10685998],
-    '53s': [0.367607383,0.258005383,0.199590357,0.165293409,0.143398957,0.128149267,0.116668512,0.107478637,0.099756205],
-    '52s': [0.349329336,0.240124951,0.183891687,0.15167563,0.131332796,0.117202393,0.106515469,0.097919607,0.090664974],
-    '4Ao': [0.547341875,0.351083799,0.251866046,0.194424112,0.157160977,0.130897666,0.111332066,0.09622596,0.084286865],
-    '4Ko': [0.502234779,0.310037013,0.218089218,0.165913165,0.132313485,0.108793082,0.091398221,0.078084419,0.067661096],
-    '4Qo': [0.469213505,0.284677109,0.199113083,0.150576957,0.119252937,0.097374056,0.081316188,0.069133789,0.059642677],
-    '4Jo': [0.438673541,0.263612247,0.183986558,0.138507215,0.10904397,0.0885447,0.073603416,0.062332086,0.053588333],
-    '4To': [0.41054876,0.246255664,0.171886171,0.128910789,0.101007772,0.081685122,0.067682221,0.05715868,0.049007502],
-    '49o': [0.380838129,0.228159719,0.1588437,0.118558459,0.092631211,0.074907436,0.062214165,0.052729409,0.045389162],
-    '48o': [0.367086696,0.22724309,0.161042531,0.12190501,0.096762488,0.079656739,0.067416835,0.058244323,0.051100076],
-    '47o': [0.35661139,0.22872934,0.164875713,0.126860578,0.102601389,0.086190294,0.074444228,0.065589858,0.058615825],
-    '46o': [0.350029898,0.231852581,0.169544458,0.132451663,0.108935723,0.093069373,0.081674528,0.073016716,0.066118402],
-    '45o': [0.35074301,0.237479105,0.175356657,0.138485419,0.115118485,0.09926365,0.087776561,0.078960013,0.071859376],
-    '44o': [0.562626131,0.36348873,0.259784768,0.202937409,0.170004944,0.149613224,0.136036967,0.12630672,0.118836446],
-    '43s': [0.357229934,0.249946314,0.192663855,0.15947202,0.138406894,0.123742871,0.112650409,0.103707683,0.096160198],
-    '42s': [0.339180746,0.23297102,0.178258205,0.14740093,0.128086231,0.11466502,0.104454851,0.096164205,0.089113786],
-    '3Ao': [0.538564204,0.342043143,0.244267742,0.188388818,0.152481762,0.127272934,0.10853968,0.09407869,0.082637043],
-    '3Ko': [0.493342859,0.3014577,0.211206845,0.160641858,0.128406139,0.105958066,0.089387726,0.076709587,0.066761023],
-    '3Qo': [0.460219736,0.276308984,0.192407538,0.145523968,0.11553703,0.094717759,0.079467591,0.067895294,0.058856013],
-    '3Jo': [0.429666105,0.255408122,0.177431541,0.133572063,0.105453234,0.085994056,0.071842759,0.061147257,0.052831264],
-    '3To': [0.401615667,0.23828926,0.165575766,0.12416934,0.097569191,0.079252709,0.066002333,0.056035726,0.048281561],
-    '39o': [0.374236003,0.222282772,0.153853766,0.114581429,0.089539168,0.072516617,0.060362455,0.051300386,0.044275366],
-    '38o': [0.34750001,0.207736789,0.143825865,0.107017175,0.083803145,0.06816995,0.057027637,0.048693706,0.042194109],
-    '37o': [0.337148469,0.209031089,0.147299825,0.111450947,0.088926818,0.073820703,0.063036624,0.054926531,0.048533033],
-    '36o': [0.330669515,0.212399806,0.152225422,0.11732529,0.0955553,0.08098971,0.070564703,0.062659726,0.056351307],
-    '35o': [0.331675259,0.21911026,0.159512475,0.125057132,0.103630284,0.089225327,0.078815785,0.070800614,0.064319528],
-    '34o': [0.320683531,0.210612861,0.152161178,0.118873743,0.098327647,0.084559148,0.074572142,0.066856759,0.060592092],
-    '33o': [0.528401382,0.3321123,0.236914271,0.187823769,0.160544069,0.143984413,0.132888231,0.124735254,0.118257565],
-    '32s': [0.330934762,0.225061861,0.171649535,0.141961498,0.123489089,0.11063735,0.100809865,0.092770347,0.085900885],
-    '2Ao': [0.529457,0.332487485,0.236011462,0.181581248,0.146882752,0.122644891,0.104632894,0.09070468,0.079670277],
-    '2Ko': [0.484196089,0.292883125,0.204393964,0.155585363,0.124754258,0.103356168,0.087585214,0.075500703,0.065996096],
-    '2Qo': [0.451141763,0.267996595,0.185902647,0.140680723,0.112057739,0.092268759,0.077803601,0.066796393,0.058174799],
-    '2Jo': [0.42050763,0.247239531,0.171060921,0.128880215,0.102113861,0.08368265,0.070275947,0.060135884,0.052210835],
-    '2To': [0.392384515,0.230233753,0.159300248,0.119603383,0.094361069,0.077050762,0.064524254,0.055074627,0.047684535],
-    '29o': [0.36513905,0.214436759,0.147821221,0.110196413,0.086459917,0.070397839,0.058923993,0.050336723,0.043656017],
-    '28o': [0.340840585,0.201945571,0.139078693,0.103362703,0.081009221,0.066037677,0.055385789,0.047416158,0.041181551],
-    '27o': [0.317097993,0.189663313,0.130429511,0.096983565,0.076367765,0.062666122,0.052913611,0.045551185,0.039741353],
-    '26o': [0.31082834,0.192878149,0.135000647,0.102323878,0.082282548,0.068970568,0.059459541,0.052217931,0.046423191],
-    '25o': [0.311948254,0.199746653,0.142459478,0.110257251,0.090552092,0.077409713,0.067910852,0.060578244,0.054646508],
-    '24o': [0.301172779,0.192194122,0.136500258,0.105765472,0.087176888,0.07481934,0.065875828,0.058917719,0.053230221],
-    '23o': [0.29240095,0.183699852,0.129341637,0.09982238,0.082133957,0.070393825,0.061849594,0.055182624,0.049697954],
-    '22o': [0.493804224,0.30240269,0.216757158,0.17545235,0.153423789,0.140163722,0.131084607,0.12413666,0.1183773]
+"""
+    Pre-flop equity holdem lookup table based on:
+    http://oscar6echo.blogspot.ca/2012/09/poker-4-monte-carlo-analysis.html
+    Hole cards are passed as A 2 3 4 5 6 7 8 9 T J Q K, suited(s) or offsuit(o)
+    
+    The columns are the number of opponents, so EQUITY_TABLE['AAo'][3] returns 
+    the equity for two offsuited Aces for 4 opponents.
+"""
+
+EQUITY_TABLE = {
+    'AAo': [0.84933161,0.732048899,0.63609019,0.556456592,0.489655059,0.433154822,0.385045777,0.343928841,0.308682918],
+    'AKs': [0.662217824,0.49836231,0.405354241,0.34515568,0.301837554,0.268197189,0.240827756,0.217859914,0.198274079],
+    'AQs': [0.653189637,0.484191891,0.388210044,0.32655401,0.282788455,0.249469723,0.222840535,0.200960194,0.182658307],
+    'AJs': [0.643978479,0.470635585,0.372791729,0.310569389,0.267001709,0.234301182,0.208611393,0.187799987,0.170641465],
+    'ATs': [0.63488318,0.45783769,0.358912007,0.29677093,0.253844614,0.22199696,0.197274707,0.17746934,0.161297284],
+    'A9s': [0.615104341,0.431096677,0.330626739,0.269112429,0.227612086,0.197508218,0.174527713,0.156414951,0.141853099],
+    'A8s': [0.605031564,0.418928455,0.318643416,0.257894367,0.217260036,0.188043564,0.165923102,0.148649564,0.134853885],
+    'A7s': [0.593886468,0.406282356,0.306818472,0.247367347,0.208009485,0.17991033,0.158820987,0.142426059,0.129394336],
+    'A6s': [0.581813015,0.393037571,0.294990897,0.23731368,0.199610406,0.172939086,0.153023294,0.137601175,0.125358938],
+    'A5s': [0.580658287,0.394601911,0.298519706,0.241888066,0.204625501,0.17805168,0.158035357,0.142426851,0.129946079],
+    'A4s': [0.571392999,0.385452311,0.290991748,0.235941522,0.199975165,0.174432403,0.155237763,0.140261944,0.128306753],
+    'A3s': [0.563386492,0.377282971,0.284166605,0.230534004,0.195790554,0.171203182,0.152739255,0.138328251,0.12678969],
+    'A2s': [0.555081999,0.368629683,0.276717132,0.224415059,0.190753244,0.166992815,0.149161462,0.135203941,0.12402933],
+    'KAo': [0.644713545,0.472889868,0.376062287,0.313826001,0.269258649,0.234759003,0.206708406,0.183214006,0.16318403],
+    'KKo': [0.821190542,0.68632226,0.580094481,0.495367291,0.427145251,0.371729128,0.326414723,0.289103423,0.258244527],
+    'KQs': [0.62408774,0.460952865,0.372178994,0.315036143,0.273770439,0.241769359,0.21596639,0.194652633,0.176831571],
+    'KJs': [0.614789294,0.447557053,0.357075889,0.299509953,0.258564178,0.227325535,0.20253639,0.182411508,0.165800951],
+    'KTs': [0.605853525,0.435340581,0.343904947,0.286426595,0.246073578,0.215732789,0.191971667,0.172887066,0.157313858],
+    'K9s': [0.586422136,0.409185548,0.316204105,0.259264535,0.220235303,0.191484436,0.169343086,0.151808562,0.137648908],
+    'K8s': [0.56789751,0.386175377,0.293303848,0.237821931,0.200549102,0.173575324,0.153077825,0.137040765,0.124203469],
+    'K7s': [0.558469346,0.375766155,0.283531572,0.22892431,0.192548208,0.166417994,0.146714941,0.131374875,0.119162208],
+    'K6s': [0.54807547,0.364796693,0.273777053,0.220559977,0.185435159,0.160368812,0.141530997,0.126918532,0.115292554],
+    'K5s': [0.538321619,0.355064597,0.265393287,0.213562802,0.179671654,0.155578337,0.137523783,0.123488,0.112319802],
+    'K4s': [0.528917067,0.346415468,0.258489663,0.208229218,0.175587578,0.152467297,0.135161122,0.121741449,0.111044267],
+    'K3s': [0.520746257,0.338665037,0.252322259,0.203554706,0.172127419,0.149961957,0.13338837,0.120501525,0.110210762],
+    'K2s': [0.512391178,0.330889637,0.246235277,0.199038881,0.16886311,0.147632449,0.131751535,0.119389756,0.109496907],
+    'QAo': [0.635092014,0.457673987,0.357586072,0.293631538,0.248399304,0.214007779,0.186583719,0.16406332,0.145245502],
+    'QKo': [0.604341519,0.433583141,0.34151037,0.282644844,0.240264795,0.207500222,0.181061749,0.159295832,0.141105647],
+    'QQo': [0.796323165,0.646643354,0.532429852,0.444379359,0.375861202,0.322160241,0.279736848,0.245979211,0.218934686],
+    'QJs': [0.590691291,0.430395053,0.345545363,0.29088171,0.251368634,0.221026072,0.19695863,0.177498449,0.16153667],
+    'QTs': [0.581681508,0.418468422,0.332842879,0.278331337,0.239504545,0.210120353,0.187123908,0.168760838,0.153856591],
+    'Q9s': [0.562225636,0.392696241,0.305646966,0.251662597,0.214130567,0.186312399,0.16492027,0.148044931,0.134486673],
+    'Q8s': [0.544165232,0.370368429,0.283353762,0.230742967,0.194902307,0.168744363,0.148870611,0.1333447,0.120937944],
+    'Q7s': [0.52520164,0.348330487,0.262280594,0.211467522,0.177487231,0.153060521,0.134714733,0.120481086,0.109183234],
+    'Q6s': [0.516763675,0.339628287,0.254330845,0.204397963,0.171288614,0.147660261,0.129987756,0.116335247,0.105510627],
+    'Q5s': [0.507125342,0.330321439,0.246409845,0.197892584,0.165996016,0.143341168,0.126433129,0.113343479,0.102945046],
+    'Q4s': [0.497589353,0.321952707,0.239808007,0.192812386,0.162143284,0.140458953,0.124290178,0.11179402,0.101837627],
+    'Q3s': [0.489407004,0.314357089,0.233769743,0.188254502,0.15881168,0.138076446,0.12261467,0.110642076,0.101081795],
+    'Q2s': [0.481047641,0.30677764,0.227898377,0.183952112,0.155748984,0.135921109,0.121148687,0.109666845,0.100463511],
+    'JAo': [0.625372686,0.443135782,0.340896566,0.276189449,0.231017729,0.197178102,0.170623412,0.149148099,0.131481518],
+    'JKo': [0.594408269,0.419215383,0.325193607,0.265716966,0.223517027,0.191403861,0.165989769,0.145367238,0.128424013],
+    'JQo': [0.56905233,0.401687927,0.313955214,0.25777239,0.217287657,0.186268472,0.161706465,0.141902531,0.125739026],
+    'JJo': [0.771566329,0.608719205,0.488663522,0.399303802,0.332225854,0.281377268,0.242514802,0.212533399,0.189156082],
+    'JTs': [0.561545188,0.406898271,0.326345604,0.27408498,0.236369066,0.207742769,0.185427089,0.167697244,0.15337269],
+    'J9s': [0.541107174,0.38099004,0.299382861,0.247814981,0.21148903,0.184490716,0.163774119,0.147531524,0.134513267],
+    'J8s': [0.523125072,0.359185792,0.277699175,0.227417835,0.192708261,0.167299346,0.148054287,0.133071185,0.121131845],
+    'J7s': [0.504545433,0.337618096,0.256918986,0.208306914,0.175356152,0.151558967,0.133676683,0.119854657,0.108847663],
+    'J6s': [0.485737405,0.316831548,0.237545538,0.190899555,0.15982034,0.137652565,0.121133488,0.10838803,0.098271518],
+    'J5s': [0.478186221,0.309611974,0.231139885,0.18538736,0.155160574,0.133730607,0.117764709,0.105447974,0.095651475],
+    'J4s': [0.46868197,0.301548997,0.224764013,0.180504538,0.151483862,0.130988597,0.115756482,0.103997868,0.094604604],
+    'J3s': [0.460393597,0.294146802,0.218954202,0.176169476,0.14836795,0.12877164,0.114211851,0.10293467,0.093918657],
+    'J2s': [0.452025373,0.286717271,0.213227089,0.172013063,0.145424482,0.12674832,0.112842874,0.102043109,0.093366709],
+    'TAo': [0.615637267,0.429465168,0.325908287,0.261144162,0.216521386,0.183507927,0.157896604,0.137451716,0.120796565],
+    'TKo': [0.584948514,0.40610897,0.31088959,0.25137845,0.209737376,0.178466894,0.154053931,0.134504079,0.118613069],
+    'TQo': [0.559468173,0.388972383,0.300237166,0.244079142,0.20416202,0.174046257,0.150568435,0.131917624,0.116872125],
+    'TJo': [0.538280755,0.377268019,0.294278613,0.240670624,0.202091208,0.172893743,0.150238063,0.132345274,0.118006858],
+    'TTo': [0.746639807,0.572433294,0.448586779,0.359651897,0.295182195,0.247937132,0.212924551,0.186632505,0.166608373],
+    'T9s': [0.523784303,0.37372004,0.296685615,0.246890957,0.211461185,0.185123313,0.165007954,0.149274901,0.136695089],
+    'T8s': [0.505025812,0.351942023,0.275243826,0.226828921,0.193047039,0.168370637,0.149720756,0.135251554,0.123704647],
+    'T7s': [0.486476148,0.330823543,0.254904337,0.208056954,0.175983687,0.152838304,0.135487214,0.122068871,0.1113897],
+    'T6s': [0.468000789,0.310364428,0.23566365,0.190616327,0.160258963,0.138590413,0.122420908,0.109938967,0.099993234],
+    'T5s': [0.449398677,0.290750131,0.217725053,0.17473803,0.146282337,0.126116208,0.111126505,0.099523624,0.090254855],
+    'T4s': [0.442026931,0.28470794,0.212722357,0.17069799,0.14305329,0.123552987,0.109082921,0.097897937,0.088950647],
+    'T3s': [0.433797153,0.277508395,0.207073881,0.166499974,0.140040198,0.121429898,0.107609436,0.096894205,0.088291756],
+    'T2s': [0.425374835,0.270232505,0.201527789,0.162526066,0.137270244,0.119535676,0.106341842,0.096077554,0.087778627],
+    '9Ao': [0.594487092,0.400666912,0.295288475,0.231018825,0.187847165,0.156601578,0.132853026,0.114230003,0.099318465],
+    '9Ko': [0.564089482,0.377917165,0.280942115,0.221851069,0.181516353,0.151877099,0.129166957,0.111274677,0.096929337],
+    '9Qo': [0.538652036,0.36119198,0.270823617,0.215057855,0.176441723,0.147936683,0.12613527,0.109071472,0.09548934],
+    '9Jo': [0.516406165,0.34937472,0.265060706,0.212044297,0.174846132,0.147320231,0.126358231,0.110065241,0.097175921],
+    '9To': [0.498155219,0.342193758,0.262991734,0.212006713,0.175878429,0.149179515,0.128958017,0.113314914,0.100988647],
+    '99o': [0.71665056,0.532657795,0.408142716,0.322575823,0.262972076,0.220814753,0.190544383,0.168410729,0.151921848],
+    '98s': [0.488559881,0.345321875,0.27171124,0.22418202,0.190923792,0.16674661,0.148613631,0.134592627,0.123435875],
+    '97s': [0.469938822,0.325478399,0.253174083,0.207656825,0.176445297,0.154052478,0.137410152,0.124572373,0.114343492],
+    '96s': [0.451493119,0.305500223,0.234496782,0.190800752,0.161351637,0.140466023,0.125000274,0.113097317,0.103596716],
+    '95s': [0.433143275,0.28598276,0.216520911,0.174758148,0.147053944,0.127526462,0.113085208,0.101932921,0.09299735],
+    '94s': [0.414046261,0.26737541,0.200009093,0.160411079,0.134505284,0.116391891,0.103035066,0.092711017,0.08441667],
+    '93s': [0.408071568,0.262150475,0.19566563,0.156988531,0.131866782,0.114356251,0.101449013,0.091458805,0.083422277],
+    '92s': [0.399702664,0.254980946,0.190195852,0.153070419,0.129134076,0.112487247,0.100148337,0.090574825,0.082837462],
+    '8Ao': [0.58370153,0.387574194,0.282293017,0.218808192,0.17651199,0.146196528,0.123374132,0.105642525,0.091589997],
+    '8Ko': [0.544292702,0.353204872,0.256157696,0.198533858,0.160031776,0.132283762,0.111329409,0.095055667,0.082161495],
+    '8Qo': [0.519293016,0.337105439,0.246669627,0.192283465,0.155408169,0.128656072,0.10849668,0.092886399,0.080591033],
+    '8Jo': [0.497142891,0.325853449,0.241525412,0.189772267,0.15424972,0.128434587,0.109046564,0.094149376,0.08244968],
+    '8To': [0.478209277,0.318837043,0.239823083,0.190188795,0.155772841,0.130802221,0.11214167,0.097851363,0.086670073],
+    '89o': [0.460661044,0.312094786,0.236516026,0.187951941,0.154186875,0.129859178,0.111844561,0.098173294,0.087508822],
+    '88o': [0.687185223,0.496046663,0.372652456,0.29140528,0.236885875,0.199596733,0.173515542,0.15483269,0.141076158],
+    '87s': [0.456850271,0.322843838,0.25314472,0.208455172,0.177811502,0.155918766,0.139652564,0.12711132,0.117070452],
+    '86s': [0.438161019,0.30385295,0.2358407,0.193296247,0.164651518,0.144437353,0.129492337,0.117949654,0.108669611],
+    '85s': [0.41993028,0.284763444,0.21832395,0.177738264,0.150856016,0.131989419,0.118050865,0.10723364,0.09850069],
+    '84s': [0.401033858,0.266127712,0.201557284,0.162973089,0.137733478,0.120134789,0.107134469,0.097031918,0.0888487],
+    '83s': [0.382858237,0.2481033,0.1857573,0.149358964,0.125860931,0.10957168,0.097536835,0.088149426,0.080518241],
+    '82s': [0.376797601,0.242959063,0.181573825,0.146153195,0.123453225,0.107736323,0.096111868,0.08702171,0.07960532],
+    '7Ao': [0.571658507,0.373788491,0.269385161,0.207244013,0.166287251,0.13721569,0.115518848,0.098766017,0.08554805],
+    '7Ko': [0.534175394,0.34193235,0.245519284,0.18877765,0.151193353,0.124366446,0.104277363,0.088787224,0.076593951],
+    '7Qo': [0.499064769,0.313455654,0.223899,0.17135625,0.136465393,0.111566498,0.093057162,0.078894489,0.067826772],
+    '7Jo': [0.477270534,0.302636786,0.219049584,0.169016016,0.135331825,0.111260482,0.093386525,0.079761703,0.069122333],
+    '7To': [0.458260152,0.296074862,0.217738419,0.169732373,0.137095142,0.113765617,0.096529967,0.083434664,0.073236927],
+    '79o': [0.440699247,0.290700686,0.216449136,0.169941683,0.138308501,0.115893066,0.099508073,0.087134072,0.077522657],
+    '78o': [0.426916959,0.288335073,0.216913532,0.171356947,0.140415379,0.118605472,0.102698172,0.090721324,0.081382185],
+    '77o': [0.657264883,0.461114387,0.340562861,0.264478469,0.215274125,0.182603063,0.160256908,0.144470502,0.132891112],
+    '76s': [0.428277227,0.30378379,0.237462548,0.195535611,0.167414584,0.147624542,0.132977128,0.121615548,0.112406564],
+    '75s': [0.409801746,0.285482621,0.221154185,0.181574284,0.155475525,0.137208782,0.123677637,0.113115211,0.10451071],
+    '74s': [0.391113895,0.267238634,0.204841056,0.167218393,0.14274405,0.125730225,0.113115723,0.103260505,0.095196334],
+    '73s': [0.373045844,0.24907964,0.188648696,0.153066673,0.13019537,0.114339231,0.102580881,0.093348142,0.085767376],
+    '72s': [0.354395707,0.231157944,0.1731383,0.139800723,0.118658795,0.104052911,0.093184102,0.084581495,0.077474521],
+    '6Ao': [0.558681997,0.359502948,0.256519275,0.196244063,0.157066865,0.129523271,0.109091456,0.093425366,0.081121096],
+    '6Ko': [0.522964136,0.330069934,0.234879825,0.179577858,0.143321512,0.11761631,0.098516545,0.083851191,0.072334162],
+    '6Qo': [0.489960122,0.304018237,0.215225838,0.163592228,0.12960061,0.105561881,0.087816403,0.074317353,0.063807551],
+    '6Jo': [0.457163518,0.28036601,0.198150515,0.150138904,0.118436182,0.096109373,0.079721957,0.067323234,0.057689439],
+    '6To': [0.438462657,0.274028433,0.196892409,0.150717947,0.119928202,0.098207875,0.08229463,0.070276841,0.060934769],
+    '69o': [0.421029753,0.269313574,0.196289554,0.151669426,0.121916581,0.101131089,0.086068785,0.074744984,0.065978416],
+    '68o': [0.406957244,0.267961396,0.198210861,0.154873885,0.126056013,0.106064096,0.091602254,0.08074266,0.072266944],
+    '67o': [0.396572172,0.268211917,0.200339511,0.157736944,0.129520671,0.110016647,0.095951719,0.085341132,0.077019799],
+    '66o': [0.626976703,0.428132112,0.311892435,0.241641386,0.197728911,0.16932095,0.150163017,0.136648627,0.126663479],
+    '65s': [0.403502271,0.287238805,0.223954194,0.184913716,0.159298148,0.141393904,0.128065489,0.117601931,0.10899834],
+    '64s': [0.384806142,0.269878515,0.208860987,0.172117838,0.148336185,0.131807307,0.119493119,0.109778713,0.101744244],
+    '63s': [0.366841075,0.251942264,0.192983053,0.15825959,0.136063838,0.120690818,0.109233908,0.10015034,0.092599894],
+    '62s': [0.348380541,0.233893897,0.17711837,0.144463693,0.12382265,0.10954803,0.098866082,0.090345435,0.083231957],
+    '5Ao': [0.557448169,0.361120677,0.260213614,0.20105501,0.162342073,0.134905809,0.114414406,0.09857234,0.086036538],
+    '5Ko': [0.512576769,0.31963737,0.225822575,0.171992568,0.137009182,0.112367294,0.094113442,0.080106726,0.069118274],
+    '5Qo': [0.479568736,0.29389463,0.206491944,0.15636024,0.123701403,0.100744439,0.083844036,0.070984254,0.060963271],
+    '5Jo': [0.449015885,0.272467628,0.191063783,0.143994191,0.113224611,0.091691716,0.075920739,0.064022122,0.054783109],
+    '5To': [0.418586144,0.252874621,0.177462237,0.133489719,0.104695528,0.084630412,0.070024851,0.059030898,0.050487987],
+    '59o': [0.401401891,0.24832172,0.176827911,0.134265673,0.106361927,0.087070287,0.07313101,0.06267999,0.054589838],
+    '58o': [0.387406132,0.247387218,0.179243842,0.138001221,0.111052759,0.092532188,0.079206224,0.069195366,0.061385561],
+    '57o': [0.376715759,0.248496429,0.182702481,0.142519663,0.116465053,0.098637901,0.085819772,0.076144555,0.068524907],
+    '56o': [0.370186745,0.25065539,0.185950538,0.146442119,0.120937419,0.103522475,0.090965323,0.081433544,0.073859951],
+    '55o': [0.596427625,0.396494301,0.285363541,0.220998168,0.182033769,0.157307948,0.140743733,0.129014254,0.120206115],
+    '54s': [0.385344148,0.274962112,0.21414963,0.177602825,0.153928161,0.137406148,0.124987815,0.115106881,0.10685998],
+    '53s': [0.367607383,0.258005383,0.199590357,0.165293409,0.143398957,0.128149267,0.116668512,0.107478637,0.099756205],
+    '52s': [0.349329336,0.240124951,0.183891687,0.15167563,0.131332796,0.117202393,0.106515469,0.097919607,0.090664974],
+    '4Ao': [0.547341875,0.351083799,0.251866046,0.194424112,0.157160977,0.130897666,0.111332066,0.09622596,0.084286865],
+    '4Ko': [0.502234779,0.310037013,0.218089218,0.165913165,0.132313485,0.108793082,0.091398221,0.078084419,0.067661096],
+    '4Qo': [0.469213505,0.284677109,0.199113083,0.150576957,0.119252937,0.097374056,0.081316188,0.069133789,0.059642677],
+    '4Jo': [0.438673541,0.263612247,0.183986558,0.138507215,0.10904397,0.0885447,0.073603416,0.062332086,0.053588333],
+    '4To': [0.41054876,0.246255664,0.171886171,0.128910789,0.101007772,0.081685122,0.067682221,0.05715868,0.049007502],
+    '49o': [0.380838129,0.228159719,0.1588437,0.118558459,0.092631211,0.074907436,0.062214165,0.052729409,0.045389162],
+    '48o': [0.367086696,0.22724309,0.161042531,0.12190501,0.096762488,0.079656739,0.067416835,0.058244323,0.051100076],
+    '47o': [0.35661139,0.22872934,0.164875713,0.126860578,0.102601389,0.086190294,0.074444228,0.065589858,0.058615825],
+    '46o': [0.350029898,0.231852581,0.169544458,0.132451663,0.108935723,0.093069373,0.081674528,0.073016716,0.066118402],
+    '45o': [0.35074301,0.237479105,0.175356657,0.138485419,0.115118485,0.09926365,0.087776561,0.078960013,0.071859376],
+    '44o': [0.562626131,0.36348873,0.259784768,0.202937409,0.170004944,0.149613224,0.136036967,0.12630672,0.118836446],
+    '43s': [0.357229934,0.249946314,0.192663855,0.15947202,0.138406894,0.123742871,0.112650409,0.103707683,0.096160198],
+    '42s': [0.339180746,0.23297102,0.178258205,0.14740093,0.128086231,0.11466502,0.104454851,0.096164205,0.089113786],
+    '3Ao': [0.538564204,0.342043143,0.244267742,0.188388818,0.152481762,0.127272934,0.10853968,0.09407869,0.082637043],
+    '3Ko': [0.493342859,0.3014577,0.211206845,0.160641858,0.128406139,0.105958066,0.089387726,0.076709587,0.066761023],
+    '3Qo': [0.460219736,0.276308984,0.192407538,0.145523968,0.11553703,0.094717759,0.079467591,0.067895294,0.058856013],
+    '3Jo': [0.429666105,0.255408122,0.177431541,0.133572063,0.105453234,0.085994056,0.071842759,0.061147257,0.052831264],
+    '3To': [0.401615667,0.23828926,0.165575766,0.12416934,0.097569191,0.079252709,0.066002333,0.056035726,0.048281561],
+    '39o': [0.374236003,0.222282772,0.153853766,0.114581429,0.089539168,0.072516617,0.060362455,0.051300386,0.044275366],
+    '38o': [0.34750001,0.207736789,0.143825865,0.107017175,0.083803145,0.06816995,0.057027637,0.048693706,0.042194109],
+    '37o': [0.337148469,0.209031089,0.147299825,0.111450947,0.088926818,0.073820703,0.063036624,0.054926531,0.048533033],
+    '36o': [0.330669515,0.212399806,0.152225422,0.11732529,0.0955553,0.08098971,0.070564703,0.062659726,0.056351307],
+    '35o': [0.331675259,0.21911026,0.159512475,0.125057132,0.103630284,0.089225327,0.078815785,0.070800614,0.064319528],
+    '34o': [0.320683531,0.210612861,0.152161178,0.118873743,0.098327647,0.084559148,0.074572142,0.066856759,0.060592092],
+    '33o': [0.528401382,0.3321123,0.236914271,0.187823769,0.160544069,0.143984413,0.132888231,0.124735254,0.118257565],
+    '32s': [0.330934762,0.225061861,0.171649535,0.141961498,0.123489089,0.11063735,0.100809865,0.092770347,0.085900885],
+    '2Ao': [0.529457,0.332487485,0.236011462,0.181581248,0.146882752,0.122644891,0.104632894,0.09070468,0.079670277],
+    '2Ko': [0.484196089,0.292883125,0.204393964,0.155585363,0.124754258,0.103356168,0.087585214,0.075500703,0.065996096],
+    '2Qo': [0.451141763,0.267996595,0.185902647,0.140680723,0.112057739,0.092268759,0.077803601,0.066796393,0.058174799],
+    '2Jo': [0.42050763,0.247239531,0.171060921,0.128880215,0.102113861,0.08368265,0.070275947,0.060135884,0.052210835],
+    '2To': [0.392384515,0.230233753,0.159300248,0.119603383,0.094361069,0.077050762,0.064524254,0.055074627,0.047684535],
+    '29o': [0.36513905,0.214436759,0.147821221,0.110196413,0.086459917,0.070397839,0.058923993,0.050336723,0.043656017],
+    '28o': [0.340840585,0.201945571,0.139078693,0.103362703,0.081009221,0.066037677,0.055385789,0.047416158,0.041181551],
+    '27o': [0.317097993,0.189663313,0.130429511,0.096983565,0.076367765,0.062666122,0.052913611,0.045551185,0.039741353],
+    '26o': [0.31082834,0.192878149,0.135000647,0.102323878,0.082282548,0.068970568,0.059459541,0.052217931,0.046423191],
+    '25o': [0.311948254,0.199746653,0.142459478,0.110257251,0.090552092,0.077409713,0.067910852,0.060578244,0.054646508],
+    '24o': [0.301172779,0.192194122,0.136500258,0.105765472,0.087176888,0.07481934,0.065875828,0.058917719,0.053230221],
+    '23o': [0.29240095,0.183699852,0.129341637,0.09982238,0.082133957,0.070393825,0.061849594,0.055182624,0.049697954],
+    '22o': [0.493804224,0.30240269,0.216757158,0.17545235,0.153423789,0.140163722,0.131084607,0.12413666,0.1183773],
+    'KAs': [0.662217824,0.49836231,0.405354241,0.34515568,0.301837554,0.268197189,0.240827756,0.217859914,0.198274079],
+    'QAs': [0.653189637,0.484191891,0.388210044,0.32655401,0.282788455,0.249469723,0.222840535,0.200960194,0.182658307],
+    'JAs': [0.643978479,0.470635585,0.372791729,0.310569389,0.267001709,0.234301182,0.208611393,0.187799987,0.170641465],
+    'TAs': [0.63488318,0.45783769,0.358912007,0.29677093,0.253844614,0.22199696,0.197274707,0.17746934,0.161297284],
+    '9As': [0.615104341,0.431096677,0.330626739,0.269112429,0.227612086,0.197508218,0.174527713,0.156414951,0.141853099],
+    '8As': [0.605031564,0.418928455,0.318643416,0.257894367,0.217260036,0.188043564,0.165923102,0.148649564,0.134853885],
+    '7As': [0.593886468,0.406282356,0.306818472,0.247367347,0.208009485,0.17991033,0.158820987,0.142426059,0.129394336],
+    '6As': [0.581813015,0.393037571,0.294990897,0.23731368,0.199610406,0.172939086,0.153023294,0.137601175,0.125358938],
+    '5As': [0.580658287,0.394601911,0.298519706,0.241888066,0.204625501,0.17805168,0.158035357,0.142426851,0.129946079],
+    '4As': [0.571392999,0.385452311,0.290991748,0.235941522,0.199975165,0.174432403,0.155237763,0.140261944,0.128306753],
+    '3As': [0.563386492,0.377282971,0.284166605,0.230534004,0.195790554,0.171203182,0.152739255,0.138328251,0.12678969],
+    '2As': [0.555081999,0.368629683,0.276717132,0.224415059,0.190753244,0.166992815,0.149161462,0.135203941,0.12402933],
+    'AKo': [0.644713545,0.472889868,0.376062287,0.313826001,0.269258649,0.234759003,0.206708406,0.183214006,0.16318403],
+    'QKs': [0.62408774,0.460952865,0.372178994,0.315036143,0.273770439,0.241769359,0.21596639,0.194652633,0.176831571],
+    'JKs': [0.614789294,0.447557053,0.357075889,0.299509953,0.258564178,0.227325535,0.20253639,0.182411508,0.165800951],
+    'TKs': [0.605853525,0.435340581,0.343904947,0.286426595,0.246073578,0.215732789,0.191971667,0.172887066,0.157313858],
+    '9Ks': [0.586422136,0.409185548,0.316204105,0.259264535,0.220235303,0.191484436,0.169343086,0.151808562,0.137648908],
+    '8Ks': [0.56789751,0.386175377,0.293303848,0.237821931,0.200549102,0.173575324,0.153077825,0.137040765,0.124203469],
+    '7Ks': [0.558469346,0.375766155,0.283531572,0.22892431,0.192548208,0.166417994,0.146714941,0.131374875,0.119162208],
+    '6Ks': [0.54807547,0.364796693,0.273777053,0.220559977,0.185435159,0.160368812,0.141530997,0.126918532,0.115292554],
+    '5Ks': [0.538321619,0.355064597,0.265393287,0.213562802,0.179671654,0.155578337,0.137523783,0.123488,0.112319802],
+    '4Ks': [0.528917067,0.346415468,0.258489663,0.208229218,0.175587578,0.152467297,0.135161122,0.121741449,0.111044267],
+    '3Ks': [0.520746257,0.338665037,0.252322259,0.203554706,0.172127419,0.149961957,0.13338837,0.120501525,0.110210762],
+    '2Ks': [0.512391178,0.330889637,0.246235277,0.199038881,0.16886311,0.147632449,0.131751535,0.119389756,0.109496907],
+    'AQo': [0.635092014,0.457673987,0.357586072,0.293631538,0.248399304,0.214007779,0.186583719,0.16406332,0.145245502],
+    'KQo': [0.604341519,0.433583141,0.34151037,0.282644844,0.240264795,0.207500222,0.181061749,0.159295832,0.141105647],
+    'JQs': [0.590691291,0.430395053,0.345545363,0.29088171,0.251368634,0.221026072,0.19695863,0.177498449,0.16153667],
+    'TQs': [0.581681508,0.418468422,0.332842879,0.278331337,0.239504545,0.210120353,0.187123908,0.168760838,0.153856591],
+    '9Qs': [0.562225636,0.392696241,0.305646966,0.251662597,0.214130567,0.186312399,0.16492027,0.148044931,0.134486673],
+    '8Qs': [0.544165232,0.370368429,0.283353762,0.230742967,0.194902307,0.168744363,0.148870611,0.1333447,0.120937944],
+    '7Qs': [0.52520164,0.348330487,0.262280594,0.211467522,0.177487231,0.153060521,0.134714733,0.120481086,0.109183234],
+    '6Qs': [0.516763675,0.339628287,0.254330845,0.204397963,0.171288614,0.147660261,0.129987756,0.116335247,0.105510627],
+    '5Qs': [0.507125342,0.330321439,0.246409845,0.197892584,0.165996016,0.143341168,0.126433129,0.113343479,0.102945046],
+    '4Qs': [0.497589353,0.321952707,0.239808007,0.192812386,0.162143284,0.140458953,0.124290178,0.11179402,0.101837627],
+    '3Qs': [0.489407004,0.314357089,0.233769743,0.188254502,0.15881168,0.138076446,0.12261467,0.110642076,0.101081795],
+    '2Qs': [0.481047641,0.30677764,0.227898377,0.183952112,0.155748984,0.135921109,0.121148687,0.109666845,0.100463511],
+    'AJo': [0.625372686,0.443135782,0.340896566,0.276189449,0.231017729,0.197178102,0.170623412,0.149148099,0.131481518],
+    'KJo': [0.594408269,0.419215383,0.325193607,0.265716966,0.223517027,0.191403861,0.165989769,0.145367238,0.128424013],
+    'QJo': [0.56905233,0.401687927,0.313955214,0.25777239,0.217287657,0.186268472,0.161706465,0.141902531,0.125739026],
+    'TJs': [0.561545188,0.406898271,0.326345604,0.27408498,0.236369066,0.207742769,0.185427089,0.167697244,0.15337269],
+    '9Js': [0.541107174,0.38099004,0.299382861,0.247814981,0.21148903,0.184490716,0.163774119,0.147531524,0.134513267],
+    '8Js': [0.523125072,0.359185792,0.277699175,0.227417835,0.192708261,0.167299346,0.148054287,0.133071185,0.121131845],
+    '7Js': [0.504545433,0.337618096,0.256918986,0.208306914,0.175356152,0.151558967,0.133676683,0.119854657,0.108847663],
+    '6Js': [0.485737405,0.316831548,0.237545538,0.190899555,0.15982034,0.137652565,0.121133488,0.10838803,0.098271518],
+    '5Js': [0.478186221,0.309611974,0.231139885,0.18538736,0.155160574,0.133730607,0.117764709,0.105447974,0.095651475],
+    '4Js': [0.46868197,0.301548997,0.224764013,0.180504538,0.151483862,0.130988597,0.115756482,0.103997868,0.094604604],
+    '3Js': [0.460393597,0.294146802,0.218954202,0.176169476,0.14836795,0.12877164,0.114211851,0.10293467,0.093918657],
+    '2Js': [0.452025373,0.286717271,0.213227089,0.172013063,0.145424482,0.12674832,0.112842874,0.102043109,0.093366709],
+    'ATo': [0.615637267,0.429465168,0.325908287,0.261144162,0.216521386,0.183507927,0.157896604,0.137451716,0.120796565],
+    'KTo': [0.584948514,0.40610897,0.31088959,0.25137845,0.209737376,0.178466894,0.154053931,0.134504079,0.118613069],
+    'QTo': [0.559468173,0.388972383,0.300237166,0.244079142,0.20416202,0.174046257,0.150568435,0.131917624,0.116872125],
+    'JTo': [0.538280755,0.377268019,0.294278613,0.240670624,0.202091208,0.172893743,0.150238063,0.132345274,0.118006858],
+    '9Ts': [0.523784303,0.37372004,0.296685615,0.246890957,0.211461185,0.185123313,0.165007954,0.149274901,0.136695089],
+    '8Ts': [0.505025812,0.351942023,0.275243826,0.226828921,0.193047039,0.168370637,0.149720756,0.135251554,0.123704647],
+    '7Ts': [0.486476148,0.330823543,0.254904337,0.208056954,0.175983687,0.152838304,0.135487214,0.122068871,0.1113897],
+    '6Ts': [0.468000789,0.310364428,0.23566365,0.190616327,0.160258963,0.138590413,0.122420908,0.109938967,0.099993234],
+    '5Ts': [0.449398677,0.290750131,0.217725053,0.17473803,0.146282337,0.126116208,0.111126505,0.099523624,0.090254855],
+    '4Ts': [0.442026931,0.28470794,0.212722357,0.17069799,0.14305329,0.123552987,0.109082921,0.097897937,0.088950647],
+    '3Ts': [0.433797153,0.277508395,0.207073881,0.166499974,0.140040198,0.121429898,0.107609436,0.096894205,0.088291756],
+    '2Ts': [0.425374835,0.270232505,0.201527789,0.162526066,0.137270244,0.119535676,0.106341842,0.096077554,0.087778627],
+    'A9o': [0.594487092,0.400666912,0.295288475,0.231018825,0.187847165,0.156601578,0.132853026,0.114230003,0.099318465],
+    'K9o': [0.564089482,0.377917165,0.280942115,0.221851069,0.181516353,0.151877099,0.129166957,0.111274677,0.096929337],
+    'Q9o': [0.538652036,0.36119198,0.270823617,0.215057855,0.176441723,0.147936683,0.12613527,0.109071472,0.09548934],
+    'J9o': [0.516406165,0.34937472,0.265060706,0.212044297,0.174846132,0.147320231,0.126358231,0.110065241,0.097175921],
+    'T9o': [0.498155219,0.342193758,0.262991734,0.212006713,0.175878429,0.149179515,0.128958017,0.113314914,0.100988647],
+    '89s': [0.488559881,0.345321875,0.27171124,0.22418202,0.190923792,0.16674661,0.148613631,0.134592627,0.123435875],
+    '79s': [0.469938822,0.325478399,0.253174083,0.207656825,0.176445297,0.154052478,0.137410152,0.124572373,0.114343492],
+    '69s': [0.451493119,0.305500223,0.234496782,0.190800752,0.161351637,0.140466023,0.125000274,0.113097317,0.103596716],
+    '59s': [0.433143275,0.28598276,0.216520911,0.174758148,0.147053944,0.127526462,0.113085208,0.101932921,0.09299735],
+    '49s': [0.414046261,0.26737541,0.200009093,0.160411079,0.134505284,0.116391891,0.103035066,0.092711017,0.08441667],
+    '39s': [0.408071568,0.262150475,0.19566563,0.156988531,0.131866782,0.114356251,0.101449013,0.091458805,0.083422277],
+    '29s': [0.399702664,0.254980946,0.190195852,0.153070419,0.129134076,0.112487247,0.100148337,0.090574825,0.082837462],
+    'A8o': [0.58370153,0.387574194,0.282293017,0.218808192,0.17651199,0.146196528,0.123374132,0.105642525,0.091589997],
+    'K8o': [0.544292702,0.353204872,0.256157696,0.198533858,0.160031776,0.132283762,0.111329409,0.095055667,0.082161495],
+    'Q8o': [0.519293016,0.337105439,0.246669627,0.192283465,0.155408169,0.128656072,0.10849668,0.092886399,0.080591033],
+    'J8o': [0.497142891,0.325853449,0.241525412,0.189772267,0.15424972,0.128434587,0.109046564,0.094149376,0.08244968],
+    'T8o': [0.478209277,0.318837043,0.239823083,0.190188795,0.155772841,0.130802221,0.11214167,0.097851363,0.086670073],
+    '98o': [0.460661044,0.312094786,0.236516026,0.187951941,0.154186875,0.129859178,0.111844561,0.098173294,0.087508822],
+    '78s': [0.456850271,0.322843838,0.25314472,0.208455172,0.177811502,0.155918766,0.139652564,0.12711132,0.117070452],
+    '68s': [0.438161019,0.30385295,0.2358407,0.193296247,0.164651518,0.144437353,0.129492337,0.117949654,0.108669611],
+    '58s': [0.41993028,0.284763444,0.21832395,0.177738264,0.150856016,0.131989419,0.118050865,0.10723364,0.09850069],
+    '48s': [0.401033858,0.266127712,0.201557284,0.162973089,0.137733478,0.120134789,0.107134469,0.097031918,0.0888487],
+    '38s': [0.382858237,0.2481033,0.1857573,0.149358964,0.125860931,0.10957168,0.097536835,0.088149426,0.080518241],
+    '28s': [0.376797601,0.242959063,0.181573825,0.146153195,0.123453225,0.107736323,0.096111868,0.08702171,0.07960532],
+    'A7o': [0.571658507,0.373788491,0.269385161,0.207244013,0.166287251,0.13721569,0.115518848,0.098766017,0.08554805],
+    'K7o': [0.534175394,0.34193235,0.245519284,0.18877765,0.151193353,0.124366446,0.104277363,0.088787224,0.076593951],
+    'Q7o': [0.499064769,0.313455654,0.223899,0.17135625,0.136465393,0.111566498,0.093057162,0.078894489,0.067826772],
+    'J7o': [0.477270534,0.302636786,0.219049584,0.169016016,0.135331825,0.111260482,0.093386525,0.079761703,0.069122333],
+    'T7o': [0.458260152,0.296074862,0.217738419,0.169732373,0.137095142,0.113765617,0.096529967,0.083434664,0.073236927],
+    '97o': [0.440699247,0.290700686,0.216449136,0.169941683,0.138308501,0.115893066,0.099508073,0.087134072,0.077522657],
+    '87o': [0.426916959,0.288335073,0.216913532,0.171356947,0.140415379,0.118605472,0.102698172,0.090721324,0.081382185],
+    '67s': [0.428277227,0.30378379,0.237462548,0.195535611,0.167414584,0.147624542,0.132977128,0.121615548,0.112406564],
+    '57s': [0.409801746,0.285482621,0.221154185,0.181574284,0.155475525,0.137208782,0.123677637,0.113115211,0.10451071],
+    '47s': [0.391113895,0.267238634,0.204841056,0.167218393,0.14274405,0.125730225,0.113115723,0.103260505,0.095196334],
+    '37s': [0.373045844,0.24907964,0.188648696,0.153066673,0.13019537,0.114339231,0.102580881,0.093348142,0.085767376],
+    '27s': [0.354395707,0.231157944,0.1731383,0.139800723,0.118658795,0.104052911,0.093184102,0.084581495,0.077474521],
+    'A6o': [0.558681997,0.359502948,0.256519275,0.196244063,0.157066865,0.129523271,0.109091456,0.093425366,0.081121096],
+    'K6o': [0.522964136,0.330069934,0.234879825,0.179577858,0.143321512,0.11761631,0.098516545,0.083851191,0.072334162],
+    'Q6o': [0.489960122,0.304018237,0.215225838,0.163592228,0.12960061,0.105561881,0.087816403,0.074317353,0.063807551],
+    'J6o': [0.457163518,0.28036601,0.198150515,0.150138904,0.118436182,0.096109373,0.079721957,0.067323234,0.057689439],
+    'T6o': [0.438462657,0.274028433,0.196892409,0.150717947,0.119928202,0.098207875,0.08229463,0.070276841,0.060934769],
+    '96o': [0.421029753,0.269313574,0.196289554,0.151669426,0.121916581,0.101131089,0.086068785,0.074744984,0.065978416],
+    '86o': [0.406957244,0.267961396,0.198210861,0.154873885,0.126056013,0.106064096,0.091602254,0.08074266,0.072266944],
+    '76o': [0.396572172,0.268211917,0.200339511,0.157736944,0.129520671,0.110016647,0.095951719,0.085341132,0.077019799],
+    '56s': [0.403502271,0.287238805,0.223954194,0.184913716,0.159298148,0.141393904,0.128065489,0.117601931,0.10899834],
+    '46s': [0.384806142,0.269878515,0.208860987,0.172117838,0.148336185,0.131807307,0.119493119,0.109778713,0.101744244],
+    '36s': [0.366841075,0.251942264,0.192983053,0.15825959,0.136063838,0.120690818,0.109233908,0.10015034,0.092599894],
+    '26s': [0.348380541,0.233893897,0.17711837,0.144463693,0.12382265,0.10954803,0.098866082,0.090345435,0.083231957],
+    'A5o': [0.557448169,0.361120677,0.260213614,0.20105501,0.162342073,0.134905809,0.114414406,0.09857234,0.086036538],
+    'K5o': [0.512576769,0.31963737,0.225822575,0.171992568,0.137009182,0.112367294,0.094113442,0.080106726,0.069118274],
+    'Q5o': [0.479568736,0.29389463,0.206491944,0.15636024,0.123701403,0.100744439,0.083844036,0.070984254,0.060963271],
+    'J5o': [0.449015885,0.272467628,0.191063783,0.143994191,0.113224611,0.091691716,0.075920739,0.064022122,0.054783109],
+    'T5o': [0.418586144,0.252874621,0.177462237,0.133489719,0.104695528,0.084630412,0.070024851,0.059030898,0.050487987],
+    '95o': [0.401401891,0.24832172,0.176827911,0.134265673,0.106361927,0.087070287,0.07313101,0.06267999,0.054589838],
+    '85o': [0.387406132,0.247387218,0.179243842,0.138001221,0.111052759,0.092532188,0.079206224,0.069195366,0.061385561],
+    '75o': [0.376715759,0.248496429,0.182702481,0.142519663,0.116465053,0.098637901,0.085819772,0.076144555,0.068524907],
+    '65o': [0.370186745,0.25065539,0.185950538,0.146442119,0.120937419,0.103522475,0.090965323,0.081433544,0.073859951],
+    '45s': [0.385344148,0.274962112,0.21414963,0.177602825,0.153928161,0.137406148,0.124987815,0.115106881,0.10685998],
+    '35s': [0.367607383,0.258005383,0.199590357,0.165293409,0.143398957,0.128149267,0.116668512,0.107478637,0.099756205],
+    '25s': [0.349329336,0.240124951,0.183891687,0.15167563,0.131332796,0.117202393,0.106515469,0.097919607,0.090664974],
+    'A4o': [0.547341875,0.351083799,0.251866046,0.194424112,0.157160977,0.130897666,0.111332066,0.09622596,0.084286865],
+    'K4o': [0.502234779,0.310037013,0.218089218,0.165913165,0.132313485,0.108793082,0.091398221,0.078084419,0.067661096],
+    'Q4o': [0.469213505,0.284677109,0.199113083,0.150576957,0.119252937,0.097374056,0.081316188,0.069133789,0.059642677],
+    'J4o': [0.438673541,0.263612247,0.183986558,0.138507215,0.10904397,0.0885447,0.073603416,0.062332086,0.053588333],
+    'T4o': [0.41054876,0.246255664,0.171886171,0.128910789,0.101007772,0.081685122,0.067682221,0.05715868,0.049007502],
+    '94o': [0.380838129,0.228159719,0.1588437,0.118558459,0.092631211,0.074907436,0.062214165,0.052729409,0.045389162],
+    '84o': [0.367086696,0.22724309,0.161042531,0.12190501,0.096762488,0.079656739,0.067416835,0.058244323,0.051100076],
+    '74o': [0.35661139,0.22872934,0.164875713,0.126860578,0.102601389,0.086190294,0.074444228,0.065589858,0.058615825],
+    '64o': [0.350029898,0.231852581,0.169544458,0.132451663,0.108935723,0.093069373,0.081674528,0.073016716,0.066118402],
+    '54o': [0.35074301,0.237479105,0.175356657,0.138485419,0.115118485,0.09926365,0.087776561,0.078960013,0.071859376],
+    '34s': [0.357229934,0.249946314,0.192663855,0.15947202,0.138406894,0.123742871,0.112650409,0.103707683,0.096160198],
+    '24s': [0.339180746,0.23297102,0.178258205,0.14740093,0.128086231,0.11466502,0.104454851,0.096164205,0.089113786],
+    'A3o': [0.538564204,0.342043143,0.244267742,0.188388818,0.152481762,0.127272934,0.10853968,0.09407869,0.082637043],
+    'K3o': [0.493342859,0.3014577,0.211206845,0.160641858,0.128406139,0.105958066,0.089387726,0.076709587,0.066761023],
+    'Q3o': [0.460219736,0.276308984,0.192407538,0.145523968,0.11553703,0.094717759,0.079467591,0.067895294,0.058856013],
+    'J3o': [0.429666105,0.255408122,0.177431541,0.133572063,0.105453234,0.085994056,0.071842759,0.061147257,0.052831264],
+    'T3o': [0.401615667,0.23828926,0.165575766,0.12416934,0.097569191,0.079252709,0.066002333,0.056035726,0.048281561],
+    '93o': [0.374236003,0.222282772,0.153853766,0.114581429,0.089539168,0.072516617,0.060362455,0.051300386,0.044275366],
+    '83o': [0.34750001,0.207736789,0.143825865,0.107017175,0.083803145,0.06816995,0.057027637,0.048693706,0.042194109],
+    '73o': [0.337148469,0.209031089,0.147299825,0.111450947,0.088926818,0.073820703,0.063036624,0.054926531,0.048533033],
+    '63o': [0.330669515,0.212399806,0.152225422,0.11732529,0.0955553,0.08098971,0.070564703,0.062659726,0.056351307],
+    '53o': [0.331675259,0.21911026,0.159512475,0.125057132,0.103630284,0.089225327,0.078815785,0.070800614,0.064319528],
+    '43o': [0.320683531,0.210612861,0.152161178,0.118873743,0.098327647,0.084559148,0.074572142,0.066856759,0.060592092],
+    '23s': [0.330934762,0.225061861,0.171649535,0.141961498,0.123489089,0.11063735,0.100809865,0.092770347,0.085900885],
+    'A2o': [0.529457,0.332487485,0.236011462,0.181581248,0.146882752,0.122644891,0.104632894,0.09070468,0.079670277],
+    'K2o': [0.484196089,0.292883125,0.204393964,0.155585363,0.124754258,0.103356168,0.087585214,0.075500703,0.065996096],
+    'Q2o': [0.451141763,0.267996595,0.185902647,0.140680723,0.112057739,0.092268759,0.077803601,0.066796393,0.058174799],
+    'J2o': [0.42050763,0.247239531,0.171060921,0.128880215,0.102113861,0.08368265,0.070275947,0.060135884,0.052210835],
+    'T2o': [0.392384515,0.230233753,0.159300248,0.119603383,0.094361069,0.077050762,0.064524254,0.055074627,0.047684535],
+    '92o': [0.36513905,0.214436759,0.147821221,0.110196413,0.086459917,0.070397839,0.058923993,0.050336723,0.043656017],
+    '82o': [0.340840585,0.201945571,0.139078693,0.103362703,0.081009221,0.066037677,0.055385789,0.047416158,0.041181551],
+    '72o': [0.317097993,0.189663313,0.130429511,0.096983565,0.076367765,0.062666122,0.052913611,0.045551185,0.039741353],
+    '62o': [0.31082834,0.192878149,0.135000647,0.102323878,0.082282548,0.068970568,0.059459541,0.052217931,0.046423191],
+    '52o': [0.311948254,0.199746653,0.142459478,0.110257251,0.090552092,0.077409713,0.067910852,0.060578244,0.054646508],
+    '42o': [0.301172779,0.192194122,0.136500258,0.105765472,0.087176888,0.07481934,0.065875828,0.058917719,0.053230221],
+    '32o': [0.29240095,0.183699852,0.129341637,0.09982238,0.082133957,0.070393825,0.061849594,0.055182624,0.049697954]
+}
+
+UNIQUE_EQUITY_TABLE = {
+    'AAo': [0.84933161,0.732048899,0.63609019,0.556456592,0.489655059,0.433154822,0.385045777,0.343928841,0.308682918],
+    'AKs': [0.662217824,0.49836231,0.405354241,0.34515568,0.301837554,0.268197189,0.240827756,0.217859914,0.198274079],
+    'AQs': [0.653189637,0.484191891,0.388210044,0.32655401,0.282788455,0.249469723,0.222840535,0.200960194,0.182658307],
+    'AJs': [0.643978479,0.470635585,0.372791729,0.310569389,0.267001709,0.234301182,0.208611393,0.187799987,0.170641465],
+    'ATs': [0.63488318,0.45783769,0.358912007,0.29677093,0.253844614,0.22199696,0.197274707,0.17746934,0.161297284],
+    'A9s': [0.615104341,0.431096677,0.330626739,0.269112429,0.227612086,0.197508218,0.174527713,0.156414951,0.141853099],
+    'A8s': [0.605031564,0.418928455,0.318643416,0.257894367,0.217260036,0.188043564,0.165923102,0.148649564,0.134853885],
+    'A7s': [0.593886468,0.406282356,0.306818472,0.247367347,0.208009485,0.17991033,0.158820987,0.142426059,0.129394336],
+    'A6s': [0.581813015,0.393037571,0.294990897,0.23731368,0.199610406,0.172939086,0.153023294,0.137601175,0.125358938],
+    'A5s': [0.580658287,0.394601911,0.298519706,0.241888066,0.204625501,0.17805168,0.158035357,0.142426851,0.129946079],
+    'A4s': [0.571392999,0.385452311,0.290991748,0.235941522,0.199975165,0.174432403,0.155237763,0.140261944,0.128306753],
+    'A3s': [0.563386492,0.377282971,0.284166605,0.230534004,0.195790554,0.171203182,0.152739255,0.138328251,0.12678969],
+    'A2s': [0.555081999,0.368629683,0.276717132,0.224415059,0.190753244,0.166992815,0.149161462,0.135203941,0.12402933],
+    'KAo': [0.644713545,0.472889868,0.376062287,0.313826001,0.269258649,0.234759003,0.206708406,0.183214006,0.16318403],
+    'KKo': [0.821190542,0.68632226,0.580094481,0.495367291,0.427145251,0.371729128,0.326414723,0.289103423,0.258244527],
+    'KQs': [0.62408774,0.460952865,0.372178994,0.315036143,0.273770439,0.241769359,0.21596639,0.194652633,0.176831571],
+    'KJs': [0.614789294,0.447557053,0.357075889,0.299509953,0.258564178,0.227325535,0.20253639,0.182411508,0.165800951],
+    'KTs': [0.605853525,0.435340581,0.343904947,0.286426595,0.246073578,0.215732789,0.191971667,0.172887066,0.157313858],
+    'K9s': [0.586422136,0.409185548,0.316204105,0.259264535,0.220235303,0.191484436,0.169343086,0.151808562,0.137648908],
+    'K8s': [0.56789751,0.386175377,0.293303848,0.237821931,0.200549102,0.173575324,0.153077825,0.137040765,0.124203469],
+    'K7s': [0.558469346,0.375766155,0.283531572,0.22892431,0.192548208,0.166417994,0.146714941,0.131374875,0.119162208],
+    'K6s': [0.54807547,0.364796693,0.273777053,0.220559977,0.185435159,0.160368812,0.141530997,0.126918532,0.115292554],
+    'K5s': [0.538321619,0.355064597,0.265393287,0.213562802,0.179671654,0.155578337,0.137523783,0.123488,0.112319802],
+    'K4s': [0.528917067,0.346415468,0.258489663,0.208229218,0.175587578,0.152467297,0.135161122,0.121741449,0.111044267],
+    'K3s': [0.520746257,0.338665037,0.252322259,0.203554706,0.172127419,0.149961957,0.13338837,0.120501525,0.110210762],
+    'K2s': [0.512391178,0.330889637,0.246235277,0.199038881,0.16886311,0.147632449,0.131751535,0.119389756,0.109496907],
+    'QAo': [0.635092014,0.457673987,0.357586072,0.293631538,0.248399304,0.214007779,0.186583719,0.16406332,0.145245502],
+    'QKo': [0.604341519,0.433583141,0.34151037,0.282644844,0.240264795,0.207500222,0.181061749,0.159295832,0.141105647],
+    'QQo': [0.796323165,0.646643354,0.532429852,0.444379359,0.375861202,0.322160241,0.279736848,0.245979211,0.218934686],
+    'QJs': [0.590691291,0.430395053,0.345545363,0.29088171,0.251368634,0.221026072,0.19695863,0.177498449,0.16153667],
+    'QTs': [0.581681508,0.418468422,0.332842879,0.278331337,0.239504545,0.210120353,0.187123908,0.168760838,0.153856591],
+    'Q9s': [0.562225636,0.392696241,0.305646966,0.251662597,0.214130567,0.186312399,0.16492027,0.148044931,0.134486673],
+    'Q8s': [0.544165232,0.370368429,0.283353762,0.230742967,0.194902307,0.168744363,0.148870611,0.1333447,0.120937944],
+    'Q7s': [0.52520164,0.348330487,0.262280594,0.211467522,0.177487231,0.153060521,0.134714733,0.120481086,0.109183234],
+    'Q6s': [0.516763675,0.339628287,0.254330845,0.204397963,0.171288614,0.147660261,0.129987756,0.116335247,0.105510627],
+    'Q5s': [0.507125342,0.330321439,0.246409845,0.197892584,0.165996016,0.143341168,0.126433129,0.113343479,0.102945046],
+    'Q4s': [0.497589353,0.321952707,0.239808007,0.192812386,0.162143284,0.140458953,0.124290178,0.11179402,0.101837627],
+    'Q3s': [0.489407004,0.314357089,0.233769743,0.188254502,0.15881168,0.138076446,0.12261467,0.110642076,0.101081795],
+    'Q2s': [0.481047641,0.30677764,0.227898377,0.183952112,0.155748984,0.135921109,0.121148687,0.109666845,0.100463511],
+    'JAo': [0.625372686,0.443135782,0.340896566,0.276189449,0.231017729,0.197178102,0.170623412,0.149148099,0.131481518],
+    'JKo': [0.594408269,0.419215383,0.325193607,0.265716966,0.223517027,0.191403861,0.165989769,0.145367238,0.128424013],
+    'JQo': [0.56905233,0.401687927,0.313955214,0.25777239,0.217287657,0.186268472,0.161706465,0.141902531,0.125739026],
+    'JJo': [0.771566329,0.608719205,0.488663522,0.399303802,0.332225854,0.281377268,0.242514802,0.212533399,0.189156082],
+    'JTs': [0.561545188,0.406898271,0.326345604,0.27408498,0.236369066,0.207742769,0.185427089,0.167697244,0.15337269],
+    'J9s': [0.541107174,0.38099004,0.299382861,0.247814981,0.21148903,0.184490716,0.163774119,0.147531524,0.134513267],
+    'J8s': [0.523125072,0.359185792,0.277699175,0.227417835,0.192708261,0.167299346,0.148054287,0.133071185,0.121131845],
+    'J7s': [0.504545433,0.337618096,0.256918986,0.208306914,0.175356152,0.151558967,0.133676683,0.119854657,0.108847663],
+    'J6s': [0.485737405,0.316831548,0.237545538,0.190899555,0.15982034,0.137652565,0.121133488,0.10838803,0.098271518],
+    'J5s': [0.478186221,0.309611974,0.231139885,0.18538736,0.155160574,0.133730607,0.117764709,0.105447974,0.095651475],
+    'J4s': [0.46868197,0.301548997,0.224764013,0.180504538,0.151483862,0.130988597,0.115756482,0.103997868,0.094604604],
+    'J3s': [0.460393597,0.294146802,0.218954202,0.176169476,0.14836795,0.12877164,0.114211851,0.10293467,0.093918657],
+    'J2s': [0.452025373,0.286717271,0.213227089,0.172013063,0.145424482,0.12674832,0.112842874,0.102043109,0.093366709],
+    'TAo': [0.615637267,0.429465168,0.325908287,0.261144162,0.216521386,0.183507927,0.157896604,0.137451716,0.120796565],
+    'TKo': [0.584948514,0.40610897,0.31088959,0.25137845,0.209737376,0.178466894,0.154053931,0.134504079,0.118613069],
+    'TQo': [0.559468173,0.388972383,0.300237166,0.244079142,0.20416202,0.174046257,0.150568435,0.131917624,0.116872125],
+    'TJo': [0.538280755,0.377268019,0.294278613,0.240670624,0.202091208,0.172893743,0.150238063,0.132345274,0.118006858],
+    'TTo': [0.746639807,0.572433294,0.448586779,0.359651897,0.295182195,0.247937132,0.212924551,0.186632505,0.166608373],
+    'T9s': [0.523784303,0.37372004,0.296685615,0.246890957,0.211461185,0.185123313,0.165007954,0.149274901,0.136695089],
+    'T8s': [0.505025812,0.351942023,0.275243826,0.226828921,0.193047039,0.168370637,0.149720756,0.135251554,0.123704647],
+    'T7s': [0.486476148,0.330823543,0.254904337,0.208056954,0.175983687,0.152838304,0.135487214,0.122068871,0.1113897],
+    'T6s': [0.468000789,0.310364428,0.23566365,0.190616327,0.160258963,0.138590413,0.122420908,0.109938967,0.099993234],
+    'T5s': [0.449398677,0.290750131,0.217725053,0.17473803,0.146282337,0.126116208,0.111126505,0.099523624,0.090254855],
+    'T4s': [0.442026931,0.28470794,0.212722357,0.17069799,0.14305329,0.123552987,0.109082921,0.097897937,0.088950647],
+    'T3s': [0.433797153,0.277508395,0.207073881,0.166499974,0.140040198,0.121429898,0.107609436,0.096894205,0.088291756],
+    'T2s': [0.425374835,0.270232505,0.201527789,0.162526066,0.137270244,0.119535676,0.106341842,0.096077554,0.087778627],
+    '9Ao': [0.594487092,0.400666912,0.295288475,0.231018825,0.187847165,0.156601578,0.132853026,0.114230003,0.099318465],
+    '9Ko': [0.564089482,0.377917165,0.280942115,0.221851069,0.181516353,0.151877099,0.129166957,0.111274677,0.096929337],
+    '9Qo': [0.538652036,0.36119198,0.270823617,0.215057855,0.176441723,0.147936683,0.12613527,0.109071472,0.09548934],
+    '9Jo': [0.516406165,0.34937472,0.265060706,0.212044297,0.174846132,0.147320231,0.126358231,0.110065241,0.097175921],
+    '9To': [0.498155219,0.342193758,0.262991734,0.212006713,0.175878429,0.149179515,0.128958017,0.113314914,0.100988647],
+    '99o': [0.71665056,0.532657795,0.408142716,0.322575823,0.262972076,0.220814753,0.190544383,0.168410729,0.151921848],
+    '98s': [0.488559881,0.345321875,0.27171124,0.22418202,0.190923792,0.16674661,0.148613631,0.134592627,0.123435875],
+    '97s': [0.469938822,0.325478399,0.253174083,0.207656825,0.176445297,0.154052478,0.137410152,0.124572373,0.114343492],
+    '96s': [0.451493119,0.305500223,0.234496782,0.190800752,0.161351637,0.140466023,0.125000274,0.113097317,0.103596716],
+    '95s': [0.433143275,0.28598276,0.216520911,0.174758148,0.147053944,0.127526462,0.113085208,0.101932921,0.09299735],
+    '94s': [0.414046261,0.26737541,0.200009093,0.160411079,0.134505284,0.116391891,0.103035066,0.092711017,0.08441667],
+    '93s': [0.408071568,0.262150475,0.19566563,0.156988531,0.131866782,0.114356251,0.101449013,0.091458805,0.083422277],
+    '92s': [0.399702664,0.254980946,0.190195852,0.153070419,0.129134076,0.112487247,0.100148337,0.090574825,0.082837462],
+    '8Ao': [0.58370153,0.387574194,0.282293017,0.218808192,0.17651199,0.146196528,0.123374132,0.105642525,0.091589997],
+    '8Ko': [0.544292702,0.353204872,0.256157696,0.198533858,0.160031776,0.132283762,0.111329409,0.095055667,0.082161495],
+    '8Qo': [0.519293016,0.337105439,0.246669627,0.192283465,0.155408169,0.128656072,0.10849668,0.092886399,0.080591033],
+    '8Jo': [0.497142891,0.325853449,0.241525412,0.189772267,0.15424972,0.128434587,0.109046564,0.094149376,0.08244968],
+    '8To': [0.478209277,0.318837043,0.239823083,0.190188795,0.155772841,0.130802221,0.11214167,0.097851363,0.086670073],
+    '89o': [0.460661044,0.312094786,0.236516026,0.187951941,0.154186875,0.129859178,0.111844561,0.098173294,0.087508822],
+    '88o': [0.687185223,0.496046663,0.372652456,0.29140528,0.236885875,0.199596733,0.173515542,0.15483269,0.141076158],
+    '87s': [0.456850271,0.322843838,0.25314472,0.208455172,0.177811502,0.155918766,0.139652564,0.12711132,0.117070452],
+    '86s': [0.438161019,0.30385295,0.2358407,0.193296247,0.164651518,0.144437353,0.129492337,0.117949654,0.108669611],
+    '85s': [0.41993028,0.284763444,0.21832395,0.177738264,0.150856016,0.131989419,0.118050865,0.10723364,0.09850069],
+    '84s': [0.401033858,0.266127712,0.201557284,0.162973089,0.137733478,0.120134789,0.107134469,0.097031918,0.0888487],
+    '83s': [0.382858237,0.2481033,0.1857573,0.149358964,0.125860931,0.10957168,0.097536835,0.088149426,0.080518241],
+    '82s': [0.376797601,0.242959063,0.181573825,0.146153195,0.123453225,0.107736323,0.096111868,0.08702171,0.07960532],
+    '7Ao': [0.571658507,0.373788491,0.269385161,0.207244013,0.166287251,0.13721569,0.115518848,0.098766017,0.08554805],
+    '7Ko': [0.534175394,0.34193235,0.245519284,0.18877765,0.151193353,0.124366446,0.104277363,0.088787224,0.076593951],
+    '7Qo': [0.499064769,0.313455654,0.223899,0.17135625,0.136465393,0.111566498,0.093057162,0.078894489,0.067826772],
+    '7Jo': [0.477270534,0.302636786,0.219049584,0.169016016,0.135331825,0.111260482,0.093386525,0.079761703,0.069122333],
+    '7To': [0.458260152,0.296074862,0.217738419,0.169732373,0.137095142,0.113765617,0.096529967,0.083434664,0.073236927],
+    '79o': [0.440699247,0.290700686,0.216449136,0.169941683,0.138308501,0.115893066,0.099508073,0.087134072,0.077522657],
+    '78o': [0.426916959,0.288335073,0.216913532,0.171356947,0.140415379,0.118605472,0.102698172,0.090721324,0.081382185],
+    '77o': [0.657264883,0.461114387,0.340562861,0.264478469,0.215274125,0.182603063,0.160256908,0.144470502,0.132891112],
+    '76s': [0.428277227,0.30378379,0.237462548,0.195535611,0.167414584,0.147624542,0.132977128,0.121615548,0.112406564],
+    '75s': [0.409801746,0.285482621,0.221154185,0.181574284,0.155475525,0.137208782,0.123677637,0.113115211,0.10451071],
+    '74s': [0.391113895,0.267238634,0.204841056,0.167218393,0.14274405,0.125730225,0.113115723,0.103260505,0.095196334],
+    '73s': [0.373045844,0.24907964,0.188648696,0.153066673,0.13019537,0.114339231,0.102580881,0.093348142,0.085767376],
+    '72s': [0.354395707,0.231157944,0.1731383,0.139800723,0.118658795,0.104052911,0.093184102,0.084581495,0.077474521],
+    '6Ao': [0.558681997,0.359502948,0.256519275,0.196244063,0.157066865,0.129523271,0.109091456,0.093425366,0.081121096],
+    '6Ko': [0.522964136,0.330069934,0.234879825,0.179577858,0.143321512,0.11761631,0.098516545,0.083851191,0.072334162],
+    '6Qo': [0.489960122,0.304018237,0.215225838,0.163592228,0.12960061,0.105561881,0.087816403,0.074317353,0.063807551],
+    '6Jo': [0.457163518,0.28036601,0.198150515,0.150138904,0.118436182,0.096109373,0.079721957,0.067323234,0.057689439],
+    '6To': [0.438462657,0.274028433,0.196892409,0.150717947,0.119928202,0.098207875,0.08229463,0.070276841,0.060934769],
+    '69o': [0.421029753,0.269313574,0.196289554,0.151669426,0.121916581,0.101131089,0.086068785,0.074744984,0.065978416],
+    '68o': [0.406957244,0.267961396,0.198210861,0.154873885,0.126056013,0.106064096,0.091602254,0.08074266,0.072266944],
+    '67o': [0.396572172,0.268211917,0.200339511,0.157736944,0.129520671,0.110016647,0.095951719,0.085341132,0.077019799],
+    '66o': [0.626976703,0.428132112,0.311892435,0.241641386,0.197728911,0.16932095,0.150163017,0.136648627,0.126663479],
+    '65s': [0.403502271,0.287238805,0.223954194,0.184913716,0.159298148,0.141393904,0.128065489,0.117601931,0.10899834],
+    '64s': [0.384806142,0.269878515,0.208860987,0.172117838,0.148336185,0.131807307,0.119493119,0.109778713,0.101744244],
+    '63s': [0.366841075,0.251942264,0.192983053,0.15825959,0.136063838,0.120690818,0.109233908,0.10015034,0.092599894],
+    '62s': [0.348380541,0.233893897,0.17711837,0.144463693,0.12382265,0.10954803,0.098866082,0.090345435,0.083231957],
+    '5Ao': [0.557448169,0.361120677,0.260213614,0.20105501,0.162342073,0.134905809,0.114414406,0.09857234,0.086036538],
+    '5Ko': [0.512576769,0.31963737,0.225822575,0.171992568,0.137009182,0.112367294,0.094113442,0.080106726,0.069118274],
+    '5Qo': [0.479568736,0.29389463,0.206491944,0.15636024,0.123701403,0.100744439,0.083844036,0.070984254,0.060963271],
+    '5Jo': [0.449015885,0.272467628,0.191063783,0.143994191,0.113224611,0.091691716,0.075920739,0.064022122,0.054783109],
+    '5To': [0.418586144,0.252874621,0.177462237,0.133489719,0.104695528,0.084630412,0.070024851,0.059030898,0.050487987],
+    '59o': [0.401401891,0.24832172,0.176827911,0.134265673,0.106361927,0.087070287,0.07313101,0.06267999,0.054589838],
+    '58o': [0.387406132,0.247387218,0.179243842,0.138001221,0.111052759,0.092532188,0.079206224,0.069195366,0.061385561],
+    '57o': [0.376715759,0.248496429,0.182702481,0.142519663,0.116465053,0.098637901,0.085819772,0.076144555,0.068524907],
+    '56o': [0.370186745,0.25065539,0.185950538,0.146442119,0.120937419,0.103522475,0.090965323,0.081433544,0.073859951],
+    '55o': [0.596427625,0.396494301,0.285363541,0.220998168,0.182033769,0.157307948,0.140743733,0.129014254,0.120206115],
+    '54s': [0.385344148,0.274962112,0.21414963,0.177602825,0.153928161,0.137406148,0.124987815,0.115106881,0.10685998],
+    '53s': [0.367607383,0.258005383,0.199590357,0.165293409,0.143398957,0.128149267,0.116668512,0.107478637,0.099756205],
+    '52s': [0.349329336,0.240124951,0.183891687,0.15167563,0.131332796,0.117202393,0.106515469,0.097919607,0.090664974],
+    '4Ao': [0.547341875,0.351083799,0.251866046,0.194424112,0.157160977,0.130897666,0.111332066,0.09622596,0.084286865],
+    '4Ko': [0.502234779,0.310037013,0.218089218,0.165913165,0.132313485,0.108793082,0.091398221,0.078084419,0.067661096],
+    '4Qo': [0.469213505,0.284677109,0.199113083,0.150576957,0.119252937,0.097374056,0.081316188,0.069133789,0.059642677],
+    '4Jo': [0.438673541,0.263612247,0.183986558,0.138507215,0.10904397,0.0885447,0.073603416,0.062332086,0.053588333],
+    '4To': [0.41054876,0.246255664,0.171886171,0.128910789,0.101007772,0.081685122,0.067682221,0.05715868,0.049007502],
+    '49o': [0.380838129,0.228159719,0.1588437,0.118558459,0.092631211,0.074907436,0.062214165,0.052729409,0.045389162],
+    '48o': [0.367086696,0.22724309,0.161042531,0.12190501,0.096762488,0.079656739,0.067416835,0.058244323,0.051100076],
+    '47o': [0.35661139,0.22872934,0.164875713,0.126860578,0.102601389,0.086190294,0.074444228,0.065589858,0.058615825],
+    '46o': [0.350029898,0.231852581,0.169544458,0.132451663,0.108935723,0.093069373,0.081674528,0.073016716,0.066118402],
+    '45o': [0.35074301,0.237479105,0.175356657,0.138485419,0.115118485,0.09926365,0.087776561,0.078960013,0.071859376],
+    '44o': [0.562626131,0.36348873,0.259784768,0.202937409,0.170004944,0.149613224,0.136036967,0.12630672,0.118836446],
+    '43s': [0.357229934,0.249946314,0.192663855,0.15947202,0.138406894,0.123742871,0.112650409,0.103707683,0.096160198],
+    '42s': [0.339180746,0.23297102,0.178258205,0.14740093,0.128086231,0.11466502,0.104454851,0.096164205,0.089113786],
+    '3Ao': [0.538564204,0.342043143,0.244267742,0.188388818,0.152481762,0.127272934,0.10853968,0.09407869,0.082637043],
+    '3Ko': [0.493342859,0.3014577,0.211206845,0.160641858,0.128406139,0.105958066,0.089387726,0.076709587,0.066761023],
+    '3Qo': [0.460219736,0.276308984,0.192407538,0.145523968,0.11553703,0.094717759,0.079467591,0.067895294,0.058856013],
+    '3Jo': [0.429666105,0.255408122,0.177431541,0.133572063,0.105453234,0.085994056,0.071842759,0.061147257,0.052831264],
+    '3To': [0.401615667,0.23828926,0.165575766,0.12416934,0.097569191,0.079252709,0.066002333,0.056035726,0.048281561],
+    '39o': [0.374236003,0.222282772,0.153853766,0.114581429,0.089539168,0.072516617,0.060362455,0.051300386,0.044275366],
+    '38o': [0.34750001,0.207736789,0.143825865,0.107017175,0.083803145,0.06816995,0.057027637,0.048693706,0.042194109],
+    '37o': [0.337148469,0.209031089,0.147299825,0.111450947,0.088926818,0.073820703,0.063036624,0.054926531,0.048533033],
+    '36o': [0.330669515,0.212399806,0.152225422,0.11732529,0.0955553,0.08098971,0.070564703,0.062659726,0.056351307],
+    '35o': [0.331675259,0.21911026,0.159512475,0.125057132,0.103630284,0.089225327,0.078815785,0.070800614,0.064319528],
+    '34o': [0.320683531,0.210612861,0.152161178,0.118873743,0.098327647,0.084559148,0.074572142,0.066856759,0.060592092],
+    '33o': [0.528401382,0.3321123,0.236914271,0.187823769,0.160544069,0.143984413,0.132888231,0.124735254,0.118257565],
+    '32s': [0.330934762,0.225061861,0.171649535,0.141961498,0.123489089,0.11063735,0.100809865,0.092770347,0.085900885],
+    '2Ao': [0.529457,0.332487485,0.236011462,0.181581248,0.146882752,0.122644891,0.104632894,0.09070468,0.079670277],
+    '2Ko': [0.484196089,0.292883125,0.204393964,0.155585363,0.124754258,0.103356168,0.087585214,0.075500703,0.065996096],
+    '2Qo': [0.451141763,0.267996595,0.185902647,0.140680723,0.112057739,0.092268759,0.077803601,0.066796393,0.058174799],
+    '2Jo': [0.42050763,0.247239531,0.171060921,0.128880215,0.102113861,0.08368265,0.070275947,0.060135884,0.052210835],
+    '2To': [0.392384515,0.230233753,0.159300248,0.119603383,0.094361069,0.077050762,0.064524254,0.055074627,0.047684535],
+    '29o': [0.36513905,0.214436759,0.147821221,0.110196413,0.086459917,0.070397839,0.058923993,0.050336723,0.043656017],
+    '28o': [0.340840585,0.201945571,0.139078693,0.103362703,0.081009221,0.066037677,0.055385789,0.047416158,0.041181551],
+    '27o': [0.317097993,0.189663313,0.130429511,0.096983565,0.076367765,0.062666122,0.052913611,0.045551185,0.039741353],
+    '26o': [0.31082834,0.192878149,0.135000647,0.102323878,0.082282548,0.068970568,0.059459541,0.052217931,0.046423191],
+    '25o': [0.311948254,0.199746653,0.142459478,0.110257251,0.090552092,0.077409713,0.067910852,0.060578244,0.054646508],
+    '24o': [0.301172779,0.192194122,0.136500258,0.105765472,0.087176888,0.07481934,0.065875828,0.058917719,0.053230221],
+    '23o': [0.29240095,0.183699852,0.129341637,0.09982238,0.082133957,0.070393825,0.061849594,0.055182624,0.049697954],
+    '22o': [0.493804224,0.30240269,0.216757158,0.17545235,0.153423789,0.140163722,0.131084607,0.12413666,0.1183773]
 }
\ No newline at end of file
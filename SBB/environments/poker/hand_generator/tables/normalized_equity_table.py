@@ -1,1328 +1,1328 @@
-NORMALIZED_HAND_EQUITY = {
-    frozenset(['2d', '2s']): 0.361630789011, 
-    frozenset(['2h', '2s']): 0.361630789011, 
-    frozenset(['2c', '2s']): 0.361630789011, 
-    frozenset(['3s', '2s']): 0.0691896043217, 
-    frozenset(['3d', '2s']): 0.0, 
-    frozenset(['3h', '2s']): 0.0, 
-    frozenset(['3c', '2s']): 0.0, 
-    frozenset(['4s', '2s']): 0.083995727583, 
-    frozenset(['4d', '2s']): 0.0157503072286, 
-    frozenset(['4h', '2s']): 0.0157503072286, 
-    frozenset(['4c', '2s']): 0.0157503072286, 
-    frozenset(['5s', '2s']): 0.102218085821, 
-    frozenset(['5d', '2s']): 0.0350982723774, 
-    frozenset(['5h', '2s']): 0.0350982723774, 
-    frozenset(['5c', '2s']): 0.0350982723774, 
-    frozenset(['6s', '2s']): 0.100514471586, 
-    frozenset(['6d', '2s']): 0.0330874044535, 
-    frozenset(['6h', '2s']): 0.0330874044535, 
-    frozenset(['6c', '2s']): 0.0330874044535, 
-    frozenset(['7s', '2s']): 0.111315036956, 
-    frozenset(['7d', '2s']): 0.0443449153975, 
-    frozenset(['7h', '2s']): 0.0443449153975, 
-    frozenset(['7c', '2s']): 0.0443449153975, 
-    frozenset(['8s', '2s']): 0.151538884571, 
-    frozenset(['8d', '2s']): 0.0869760608978, 
-    frozenset(['8h', '2s']): 0.0869760608978, 
-    frozenset(['8c', '2s']): 0.0869760608978, 
-    frozenset(['9s', '2s']): 0.192666200133, 
-    frozenset(['9d', '2s']): 0.130605307311, 
-    frozenset(['9h', '2s']): 0.130605307311, 
-    frozenset(['9c', '2s']): 0.130605307311, 
-    frozenset(['Ts', '2s']): 0.238762012133, 
-    frozenset(['Td', '2s']): 0.17952605626, 
-    frozenset(['Th', '2s']): 0.17952605626, 
-    frozenset(['Tc', '2s']): 0.17952605626, 
-    frozenset(['Js', '2s']): 0.286614536539, 
-    frozenset(['Jd', '2s']): 0.230022674636, 
-    frozenset(['Jh', '2s']): 0.230022674636, 
-    frozenset(['Jc', '2s']): 0.230022674636, 
-    frozenset(['Qs', '2s']): 0.338725634175, 
-    frozenset(['Qd', '2s']): 0.2850279656, 
-    frozenset(['Qh', '2s']): 0.2850279656, 
-    frozenset(['Qc', '2s']): 0.2850279656, 
-    frozenset(['Ks', '2s']): 0.395004699508, 
-    frozenset(['Kd', '2s']): 0.344378847808, 
-    frozenset(['Kh', '2s']): 0.344378847808, 
-    frozenset(['Kc', '2s']): 0.344378847808, 
-    frozenset(['As', '2s']): 0.471658444877, 
-    frozenset(['Ad', '2s']): 0.42564733283, 
-    frozenset(['Ah', '2s']): 0.42564733283, 
-    frozenset(['Ac', '2s']): 0.42564733283, 
-    frozenset(['2d', '2h']): 0.361630789011, 
-    frozenset(['2d', '2c']): 0.361630789011, 
-    frozenset(['2d', '3s']): 0.0, 
-    frozenset(['2d', '3d']): 0.0691896043217, 
-    frozenset(['2d', '3h']): 0.0, 
-    frozenset(['2d', '3c']): 0.0, 
-    frozenset(['2d', '4s']): 0.0157503072286, 
-    frozenset(['2d', '4d']): 0.083995727583, 
-    frozenset(['2d', '4h']): 0.0157503072286, 
-    frozenset(['2d', '4c']): 0.0157503072286, 
-    frozenset(['2d', '5s']): 0.0350982723774, 
-    frozenset(['2d', '5d']): 0.102218085821, 
-    frozenset(['2d', '5h']): 0.0350982723774, 
-    frozenset(['2d', '5c']): 0.0350982723774, 
-    frozenset(['2d', '6s']): 0.0330874044535, 
-    frozenset(['2d', '6d']): 0.100514471586, 
-    frozenset(['2d', '6h']): 0.0330874044535, 
-    frozenset(['2d', '6c']): 0.0330874044535, 
-    frozenset(['2d', '7s']): 0.0443449153975, 
-    frozenset(['2d', '7d']): 0.111315036956, 
-    frozenset(['2d', '7h']): 0.0443449153975, 
-    frozenset(['2d', '7c']): 0.0443449153975, 
-    frozenset(['2d', '8s']): 0.0869760608978, 
-    frozenset(['2d', '8d']): 0.151538884571, 
-    frozenset(['2d', '8h']): 0.0869760608978, 
-    frozenset(['2d', '8c']): 0.0869760608978, 
-    frozenset(['2d', '9s']): 0.130605307311, 
-    frozenset(['2d', '9d']): 0.192666200133, 
-    frozenset(['2d', '9h']): 0.130605307311, 
-    frozenset(['2d', '9c']): 0.130605307311, 
-    frozenset(['2d', 'Ts']): 0.17952605626, 
-    frozenset(['2d', 'Td']): 0.238762012133, 
-    frozenset(['2d', 'Th']): 0.17952605626, 
-    frozenset(['2d', 'Tc']): 0.17952605626, 
-    frozenset(['2d', 'Js']): 0.230022674636, 
-    frozenset(['2d', 'Jd']): 0.286614536539, 
-    frozenset(['2d', 'Jh']): 0.230022674636, 
-    frozenset(['2d', 'Jc']): 0.230022674636, 
-    frozenset(['2d', 'Qs']): 0.2850279656, 
-    frozenset(['2d', 'Qd']): 0.338725634175, 
-    frozenset(['2d', 'Qh']): 0.2850279656, 
-    frozenset(['2d', 'Qc']): 0.2850279656, 
-    frozenset(['2d', 'Ks']): 0.344378847808, 
-    frozenset(['2d', 'Kd']): 0.395004699508, 
-    frozenset(['2d', 'Kh']): 0.344378847808, 
-    frozenset(['2d', 'Kc']): 0.344378847808, 
-    frozenset(['2d', 'As']): 0.42564733283, 
-    frozenset(['2d', 'Ad']): 0.471658444877, 
-    frozenset(['2d', 'Ah']): 0.42564733283, 
-    frozenset(['2d', 'Ac']): 0.42564733283, 
-    frozenset(['2h', '2c']): 0.361630789011, 
-    frozenset(['3s', '2h']): 0.0, 
-    frozenset(['2h', '3d']): 0.0, 
-    frozenset(['3h', '2h']): 0.0691896043217, 
-    frozenset(['3c', '2h']): 0.0, 
-    frozenset(['2h', '4s']): 0.0157503072286, 
-    frozenset(['4d', '2h']): 0.0157503072286, 
-    frozenset(['2h', '4h']): 0.083995727583, 
-    frozenset(['2h', '4c']): 0.0157503072286, 
-    frozenset(['2h', '5s']): 0.0350982723774, 
-    frozenset(['5d', '2h']): 0.0350982723774, 
-    frozenset(['2h', '5h']): 0.102218085821, 
-    frozenset(['2h', '5c']): 0.0350982723774, 
-    frozenset(['6s', '2h']): 0.0330874044535, 
-    frozenset(['6d', '2h']): 0.0330874044535, 
-    frozenset(['6h', '2h']): 0.100514471586, 
-    frozenset(['6c', '2h']): 0.0330874044535, 
-    frozenset(['7s', '2h']): 0.0443449153975, 
-    frozenset(['7d', '2h']): 0.0443449153975, 
-    frozenset(['2h', '7h']): 0.111315036956, 
-    frozenset(['7c', '2h']): 0.0443449153975, 
-    frozenset(['8s', '2h']): 0.0869760608978, 
-    frozenset(['2h', '8d']): 0.0869760608978, 
-    frozenset(['8h', '2h']): 0.151538884571, 
-    frozenset(['8c', '2h']): 0.0869760608978, 
-    frozenset(['9s', '2h']): 0.130605307311, 
-    frozenset(['2h', '9d']): 0.130605307311, 
-    frozenset(['9h', '2h']): 0.192666200133, 
-    frozenset(['9c', '2h']): 0.130605307311, 
-    frozenset(['2h', 'Ts']): 0.17952605626, 
-    frozenset(['Td', '2h']): 0.17952605626, 
-    frozenset(['2h', 'Th']): 0.238762012133, 
-    frozenset(['2h', 'Tc']): 0.17952605626, 
-    frozenset(['2h', 'Js']): 0.230022674636, 
-    frozenset(['Jd', '2h']): 0.230022674636, 
-    frozenset(['Jh', '2h']): 0.286614536539, 
-    frozenset(['2h', 'Jc']): 0.230022674636, 
-    frozenset(['Qs', '2h']): 0.2850279656, 
-    frozenset(['2h', 'Qd']): 0.2850279656, 
-    frozenset(['Qh', '2h']): 0.338725634175, 
-    frozenset(['Qc', '2h']): 0.2850279656, 
-    frozenset(['Ks', '2h']): 0.344378847808, 
-    frozenset(['2h', 'Kd']): 0.344378847808, 
-    frozenset(['Kh', '2h']): 0.395004699508, 
-    frozenset(['Kc', '2h']): 0.344378847808, 
-    frozenset(['As', '2h']): 0.42564733283, 
-    frozenset(['2h', 'Ad']): 0.42564733283, 
-    frozenset(['Ah', '2h']): 0.471658444877, 
-    frozenset(['Ac', '2h']): 0.42564733283, 
-    frozenset(['3s', '2c']): 0.0, 
-    frozenset(['3d', '2c']): 0.0, 
-    frozenset(['3h', '2c']): 0.0, 
-    frozenset(['3c', '2c']): 0.0691896043217, 
-    frozenset(['4s', '2c']): 0.0157503072286, 
-    frozenset(['4d', '2c']): 0.0157503072286, 
-    frozenset(['4h', '2c']): 0.0157503072286, 
-    frozenset(['4c', '2c']): 0.083995727583, 
-    frozenset(['5s', '2c']): 0.0350982723774, 
-    frozenset(['5d', '2c']): 0.0350982723774, 
-    frozenset(['5h', '2c']): 0.0350982723774, 
-    frozenset(['5c', '2c']): 0.102218085821, 
-    frozenset(['6s', '2c']): 0.0330874044535, 
-    frozenset(['6d', '2c']): 0.0330874044535, 
-    frozenset(['6h', '2c']): 0.0330874044535, 
-    frozenset(['6c', '2c']): 0.100514471586, 
-    frozenset(['7s', '2c']): 0.0443449153975, 
-    frozenset(['7d', '2c']): 0.0443449153975, 
-    frozenset(['7h', '2c']): 0.0443449153975, 
-    frozenset(['7c', '2c']): 0.111315036956, 
-    frozenset(['8s', '2c']): 0.0869760608978, 
-    frozenset(['8d', '2c']): 0.0869760608978, 
-    frozenset(['8h', '2c']): 0.0869760608978, 
-    frozenset(['8c', '2c']): 0.151538884571, 
-    frozenset(['9s', '2c']): 0.130605307311, 
-    frozenset(['9d', '2c']): 0.130605307311, 
-    frozenset(['9h', '2c']): 0.130605307311, 
-    frozenset(['9c', '2c']): 0.192666200133, 
-    frozenset(['Ts', '2c']): 0.17952605626, 
-    frozenset(['Td', '2c']): 0.17952605626, 
-    frozenset(['Th', '2c']): 0.17952605626, 
-    frozenset(['Tc', '2c']): 0.238762012133, 
-    frozenset(['Js', '2c']): 0.230022674636, 
-    frozenset(['Jd', '2c']): 0.230022674636, 
-    frozenset(['Jh', '2c']): 0.230022674636, 
-    frozenset(['Jc', '2c']): 0.286614536539, 
-    frozenset(['Qs', '2c']): 0.2850279656, 
-    frozenset(['Qd', '2c']): 0.2850279656, 
-    frozenset(['Qh', '2c']): 0.2850279656, 
-    frozenset(['Qc', '2c']): 0.338725634175, 
-    frozenset(['Ks', '2c']): 0.344378847808, 
-    frozenset(['Kd', '2c']): 0.344378847808, 
-    frozenset(['Kh', '2c']): 0.344378847808, 
-    frozenset(['Kc', '2c']): 0.395004699508, 
-    frozenset(['As', '2c']): 0.42564733283, 
-    frozenset(['Ad', '2c']): 0.42564733283, 
-    frozenset(['Ah', '2c']): 0.42564733283, 
-    frozenset(['Ac', '2c']): 0.471658444877, 
-    frozenset(['3s', '3d']): 0.423751911953, 
-    frozenset(['3s', '3h']): 0.423751911953, 
-    frozenset(['3s', '3c']): 0.423751911953, 
-    frozenset(['3s', '4s']): 0.116404049294, 
-    frozenset(['3s', '4d']): 0.0507829484554, 
-    frozenset(['3s', '4h']): 0.0507829484554, 
-    frozenset(['3s', '4c']): 0.0507829484554, 
-    frozenset(['3s', '5s']): 0.135037336605, 
-    frozenset(['3s', '5d']): 0.0705192079028, 
-    frozenset(['3s', '5h']): 0.0705192079028, 
-    frozenset(['3s', '5c']): 0.0705192079028, 
-    frozenset(['3s', '6s']): 0.133661387937, 
-    frozenset(['3s', '6d']): 0.0687133385689, 
-    frozenset(['3s', '6h']): 0.0687133385689, 
-    frozenset(['3s', '6c']): 0.0687133385689, 
-    frozenset(['3s', '7s']): 0.144802396047, 
-    frozenset(['3s', '7d']): 0.0803466611086, 
-    frozenset(['3s', '7h']): 0.0803466611086, 
-    frozenset(['3s', '7c']): 0.0803466611086, 
-    frozenset(['3s', '8s']): 0.162421093858, 
-    frozenset(['3s', '8d']): 0.0989334291633, 
-    frozenset(['3s', '8h']): 0.0989334291633, 
-    frozenset(['3s', '8c']): 0.0989334291633, 
-    frozenset(['3s', '9s']): 0.207693033097, 
-    frozenset(['3s', '9d']): 0.146939392778, 
-    frozenset(['3s', '9h']): 0.146939392778, 
-    frozenset(['3s', '9c']): 0.146939392778, 
-    frozenset(['3s', 'Ts']): 0.253884752906, 
-    frozenset(['3s', 'Td']): 0.196101103502, 
-    frozenset(['3s', 'Th']): 0.196101103502, 
-    frozenset(['3s', 'Tc']): 0.196101103502, 
-    frozenset(['3s', 'Js']): 0.301640148524, 
-    frozenset(['3s', 'Jd']): 0.246467226279, 
-    frozenset(['3s', 'Jh']): 0.246467226279, 
-    frozenset(['3s', 'Jc']): 0.246467226279, 
-    frozenset(['3s', 'Qs']): 0.353735335742, 
-    frozenset(['3s', 'Qd']): 0.301327971421, 
-    frozenset(['3s', 'Qh']): 0.301327971421, 
-    frozenset(['3s', 'Qc']): 0.301327971421, 
-    frozenset(['3s', 'Ks']): 0.410006708914, 
-    frozenset(['3s', 'Kd']): 0.360802382473, 
-    frozenset(['3s', 'Kh']): 0.360802382473, 
-    frozenset(['3s', 'Kc']): 0.360802382473, 
-    frozenset(['3s', 'As']): 0.486569624305, 
-    frozenset(['3s', 'Ad']): 0.441999824538, 
-    frozenset(['3s', 'Ah']): 0.441999824538, 
-    frozenset(['3s', 'Ac']): 0.441999824538, 
-    frozenset(['3h', '3d']): 0.423751911953, 
-    frozenset(['3c', '3d']): 0.423751911953, 
-    frozenset(['4s', '3d']): 0.0507829484554, 
-    frozenset(['4d', '3d']): 0.116404049294, 
-    frozenset(['4h', '3d']): 0.0507829484554, 
-    frozenset(['4c', '3d']): 0.0507829484554, 
-    frozenset(['5s', '3d']): 0.0705192079028, 
-    frozenset(['5d', '3d']): 0.135037336605, 
-    frozenset(['5h', '3d']): 0.0705192079028, 
-    frozenset(['5c', '3d']): 0.0705192079028, 
-    frozenset(['6s', '3d']): 0.0687133385689, 
-    frozenset(['6d', '3d']): 0.133661387937, 
-    frozenset(['6h', '3d']): 0.0687133385689, 
-    frozenset(['6c', '3d']): 0.0687133385689, 
-    frozenset(['7s', '3d']): 0.0803466611086, 
-    frozenset(['7d', '3d']): 0.144802396047, 
-    frozenset(['7h', '3d']): 0.0803466611086, 
-    frozenset(['7c', '3d']): 0.0803466611086, 
-    frozenset(['8s', '3d']): 0.0989334291633, 
-    frozenset(['8d', '3d']): 0.162421093858, 
-    frozenset(['8h', '3d']): 0.0989334291633, 
-    frozenset(['8c', '3d']): 0.0989334291633, 
-    frozenset(['9s', '3d']): 0.146939392778, 
-    frozenset(['9d', '3d']): 0.207693033097, 
-    frozenset(['9h', '3d']): 0.146939392778, 
-    frozenset(['9c', '3d']): 0.146939392778, 
-    frozenset(['Ts', '3d']): 0.196101103502, 
-    frozenset(['Td', '3d']): 0.253884752906, 
-    frozenset(['Th', '3d']): 0.196101103502, 
-    frozenset(['Tc', '3d']): 0.196101103502, 
-    frozenset(['Js', '3d']): 0.246467226279, 
-    frozenset(['Jd', '3d']): 0.301640148524, 
-    frozenset(['Jh', '3d']): 0.246467226279, 
-    frozenset(['Jc', '3d']): 0.246467226279, 
-    frozenset(['Qs', '3d']): 0.301327971421, 
-    frozenset(['Qd', '3d']): 0.353735335742, 
-    frozenset(['Qh', '3d']): 0.301327971421, 
-    frozenset(['Qc', '3d']): 0.301327971421, 
-    frozenset(['Ks', '3d']): 0.360802382473, 
-    frozenset(['Kd', '3d']): 0.410006708914, 
-    frozenset(['Kh', '3d']): 0.360802382473, 
-    frozenset(['Kc', '3d']): 0.360802382473, 
-    frozenset(['As', '3d']): 0.441999824538, 
-    frozenset(['Ad', '3d']): 0.486569624305, 
-    frozenset(['Ah', '3d']): 0.441999824538, 
-    frozenset(['Ac', '3d']): 0.441999824538, 
-    frozenset(['3c', '3h']): 0.423751911953, 
-    frozenset(['3h', '4s']): 0.0507829484554, 
-    frozenset(['4d', '3h']): 0.0507829484554, 
-    frozenset(['3h', '4h']): 0.116404049294, 
-    frozenset(['3h', '4c']): 0.0507829484554, 
-    frozenset(['3h', '5s']): 0.0705192079028, 
-    frozenset(['5d', '3h']): 0.0705192079028, 
-    frozenset(['3h', '5h']): 0.135037336605, 
-    frozenset(['3h', '5c']): 0.0705192079028, 
-    frozenset(['6s', '3h']): 0.0687133385689, 
-    frozenset(['3h', '6d']): 0.0687133385689, 
-    frozenset(['6h', '3h']): 0.133661387937, 
-    frozenset(['6c', '3h']): 0.0687133385689, 
-    frozenset(['3h', '7s']): 0.0803466611086, 
-    frozenset(['3h', '7d']): 0.0803466611086, 
-    frozenset(['3h', '7h']): 0.144802396047, 
-    frozenset(['3h', '7c']): 0.0803466611086, 
-    frozenset(['8s', '3h']): 0.0989334291633, 
-    frozenset(['3h', '8d']): 0.0989334291633, 
-    frozenset(['8h', '3h']): 0.162421093858, 
-    frozenset(['8c', '3h']): 0.0989334291633, 
-    frozenset(['9s', '3h']): 0.146939392778, 
-    frozenset(['3h', '9d']): 0.146939392778, 
-    frozenset(['9h', '3h']): 0.207693033097, 
-    frozenset(['9c', '3h']): 0.146939392778, 
-    frozenset(['3h', 'Ts']): 0.196101103502, 
-    frozenset(['Td', '3h']): 0.196101103502, 
-    frozenset(['3h', 'Th']): 0.253884752906, 
-    frozenset(['3h', 'Tc']): 0.196101103502, 
-    frozenset(['3h', 'Js']): 0.246467226279, 
-    frozenset(['Jd', '3h']): 0.246467226279, 
-    frozenset(['3h', 'Jh']): 0.301640148524, 
-    frozenset(['3h', 'Jc']): 0.246467226279, 
-    frozenset(['Qs', '3h']): 0.301327971421, 
-    frozenset(['3h', 'Qd']): 0.301327971421, 
-    frozenset(['Qh', '3h']): 0.353735335742, 
-    frozenset(['Qc', '3h']): 0.301327971421, 
-    frozenset(['Ks', '3h']): 0.360802382473, 
-    frozenset(['3h', 'Kd']): 0.360802382473, 
-    frozenset(['Kh', '3h']): 0.410006708914, 
-    frozenset(['Kc', '3h']): 0.360802382473, 
-    frozenset(['As', '3h']): 0.441999824538, 
-    frozenset(['3h', 'Ad']): 0.441999824538, 
-    frozenset(['Ah', '3h']): 0.486569624305, 
-    frozenset(['Ac', '3h']): 0.441999824538, 
-    frozenset(['3c', '4s']): 0.0507829484554, 
-    frozenset(['3c', '4d']): 0.0507829484554, 
-    frozenset(['3c', '4h']): 0.0507829484554, 
-    frozenset(['3c', '4c']): 0.116404049294, 
-    frozenset(['3c', '5s']): 0.0705192079028, 
-    frozenset(['3c', '5d']): 0.0705192079028, 
-    frozenset(['3c', '5h']): 0.0705192079028, 
-    frozenset(['3c', '5c']): 0.135037336605, 
-    frozenset(['3c', '6s']): 0.0687133385689, 
-    frozenset(['3c', '6d']): 0.0687133385689, 
-    frozenset(['3c', '6h']): 0.0687133385689, 
-    frozenset(['3c', '6c']): 0.133661387937, 
-    frozenset(['3c', '7s']): 0.0803466611086, 
-    frozenset(['3c', '7d']): 0.0803466611086, 
-    frozenset(['3c', '7h']): 0.0803466611086, 
-    frozenset(['3c', '7c']): 0.144802396047, 
-    frozenset(['3c', '8s']): 0.0989334291633, 
-    frozenset(['3c', '8d']): 0.0989334291633, 
-    frozenset(['3c', '8h']): 0.0989334291633, 
-    frozenset(['3c', '8c']): 0.162421093858, 
-    frozenset(['3c', '9s']): 0.146939392778, 
-    frozenset(['3c', '9d']): 0.146939392778, 
-    frozenset(['3c', '9h']): 0.146939392778, 
-    frozenset(['3c', '9c']): 0.207693033097, 
-    frozenset(['3c', 'Ts']): 0.196101103502, 
-    frozenset(['3c', 'Td']): 0.196101103502, 
-    frozenset(['3c', 'Th']): 0.196101103502, 
-    frozenset(['3c', 'Tc']): 0.253884752906, 
-    frozenset(['3c', 'Js']): 0.246467226279, 
-    frozenset(['3c', 'Jd']): 0.246467226279, 
-    frozenset(['3c', 'Jh']): 0.246467226279, 
-    frozenset(['3c', 'Jc']): 0.301640148524, 
-    frozenset(['3c', 'Qs']): 0.301327971421, 
-    frozenset(['3c', 'Qd']): 0.301327971421, 
-    frozenset(['3c', 'Qh']): 0.301327971421, 
-    frozenset(['3c', 'Qc']): 0.353735335742, 
-    frozenset(['3c', 'Ks']): 0.360802382473, 
-    frozenset(['3c', 'Kd']): 0.360802382473, 
-    frozenset(['3c', 'Kh']): 0.360802382473, 
-    frozenset(['3c', 'Kc']): 0.410006708914, 
-    frozenset(['3c', 'As']): 0.441999824538, 
-    frozenset(['3c', 'Ad']): 0.441999824538, 
-    frozenset(['3c', 'Ah']): 0.441999824538, 
-    frozenset(['3c', 'Ac']): 0.486569624305, 
-    frozenset(['4d', '4s']): 0.485204353806, 
-    frozenset(['4s', '4h']): 0.485204353806, 
-    frozenset(['4s', '4c']): 0.485204353806, 
-    frozenset(['4s', '5s']): 0.166884685429, 
-    frozenset(['5d', '4s']): 0.104756416176, 
-    frozenset(['4s', '5h']): 0.104756416176, 
-    frozenset(['4s', '5c']): 0.104756416176, 
-    frozenset(['6s', '4s']): 0.16591866571, 
-    frozenset(['6d', '4s']): 0.103475983886, 
-    frozenset(['6h', '4s']): 0.103475983886, 
-    frozenset(['6c', '4s']): 0.103475983886, 
-    frozenset(['7s', '4s']): 0.177244587324, 
-    frozenset(['7d', '4s']): 0.115293419113, 
-    frozenset(['4s', '7h']): 0.115293419113, 
-    frozenset(['7c', '4s']): 0.115293419113, 
-    frozenset(['8s', '4s']): 0.195056433058, 
-    frozenset(['4s', '8d']): 0.134102414114, 
-    frozenset(['8h', '4s']): 0.134102414114, 
-    frozenset(['8c', '4s']): 0.134102414114, 
-    frozenset(['9s', '4s']): 0.218420926943, 
-    frozenset(['4s', '9d']): 0.1587938775, 
-    frozenset(['9h', '4s']): 0.1587938775, 
-    frozenset(['9c', '4s']): 0.1587938775, 
-    frozenset(['4s', 'Ts']): 0.268661777393, 
-    frozenset(['Td', '4s']): 0.212140969219, 
-    frozenset(['4s', 'Th']): 0.212140969219, 
-    frozenset(['4s', 'Tc']): 0.212140969219, 
-    frozenset(['4s', 'Js']): 0.316522383594, 
-    frozenset(['Jd', '4s']): 0.262640578991, 
-    frozenset(['Jh', '4s']): 0.262640578991, 
-    frozenset(['4s', 'Jc']): 0.262640578991, 
-    frozenset(['Qs', '4s']): 0.368427198819, 
-    frozenset(['4s', 'Qd']): 0.317476784273, 
-    frozenset(['Qh', '4s']): 0.317476784273, 
-    frozenset(['Qc', '4s']): 0.317476784273, 
-    frozenset(['Ks', '4s']): 0.424677853074, 
-    frozenset(['4s', 'Kd']): 0.376768319776, 
-    frozenset(['Kh', '4s']): 0.376768319776, 
-    frozenset(['Kc', '4s']): 0.376768319776, 
-    frozenset(['As', '4s']): 0.500945753283, 
-    frozenset(['4s', 'Ad']): 0.457760621403, 
-    frozenset(['Ah', '4s']): 0.457760621403, 
-    frozenset(['Ac', '4s']): 0.457760621403, 
-    frozenset(['4d', '4h']): 0.485204353806, 
-    frozenset(['4d', '4c']): 0.485204353806, 
-    frozenset(['4d', '5s']): 0.104756416176, 
-    frozenset(['5d', '4d']): 0.166884685429, 
-    frozenset(['4d', '5h']): 0.104756416176, 
-    frozenset(['4d', '5c']): 0.104756416176, 
-    frozenset(['4d', '6s']): 0.103475983886, 
-    frozenset(['4d', '6d']): 0.16591866571, 
-    frozenset(['6h', '4d']): 0.103475983886, 
-    frozenset(['4d', '6c']): 0.103475983886, 
-    frozenset(['4d', '7s']): 0.115293419113, 
-    frozenset(['4d', '7d']): 0.177244587324, 
-    frozenset(['4d', '7h']): 0.115293419113, 
-    frozenset(['4d', '7c']): 0.115293419113, 
-    frozenset(['8s', '4d']): 0.134102414114, 
-    frozenset(['4d', '8d']): 0.195056433058, 
-    frozenset(['4d', '8h']): 0.134102414114, 
-    frozenset(['8c', '4d']): 0.134102414114, 
-    frozenset(['4d', '9s']): 0.1587938775, 
-    frozenset(['4d', '9d']): 0.218420926943, 
-    frozenset(['9h', '4d']): 0.1587938775, 
-    frozenset(['4d', '9c']): 0.1587938775, 
-    frozenset(['4d', 'Ts']): 0.212140969219, 
-    frozenset(['4d', 'Td']): 0.268661777393, 
-    frozenset(['4d', 'Th']): 0.212140969219, 
-    frozenset(['4d', 'Tc']): 0.212140969219, 
-    frozenset(['4d', 'Js']): 0.262640578991, 
-    frozenset(['Jd', '4d']): 0.316522383594, 
-    frozenset(['4d', 'Jh']): 0.262640578991, 
-    frozenset(['4d', 'Jc']): 0.262640578991, 
-    frozenset(['4d', 'Qs']): 0.317476784273, 
-    frozenset(['4d', 'Qd']): 0.368427198819, 
-    frozenset(['Qh', '4d']): 0.317476784273, 
-    frozenset(['4d', 'Qc']): 0.317476784273, 
-    frozenset(['Ks', '4d']): 0.376768319776, 
-    frozenset(['4d', 'Kd']): 0.424677853074, 
-    frozenset(['4d', 'Kh']): 0.376768319776, 
-    frozenset(['Kc', '4d']): 0.376768319776, 
-    frozenset(['4d', 'As']): 0.457760621403, 
-    frozenset(['4d', 'Ad']): 0.500945753283, 
-    frozenset(['Ah', '4d']): 0.457760621403, 
-    frozenset(['4d', 'Ac']): 0.457760621403, 
-    frozenset(['4c', '4h']): 0.485204353806, 
-    frozenset(['5s', '4h']): 0.104756416176, 
-    frozenset(['5d', '4h']): 0.104756416176, 
-    frozenset(['5h', '4h']): 0.166884685429, 
-    frozenset(['5c', '4h']): 0.104756416176, 
-    frozenset(['6s', '4h']): 0.103475983886, 
-    frozenset(['6d', '4h']): 0.103475983886, 
-    frozenset(['6h', '4h']): 0.16591866571, 
-    frozenset(['6c', '4h']): 0.103475983886, 
-    frozenset(['7s', '4h']): 0.115293419113, 
-    frozenset(['7d', '4h']): 0.115293419113, 
-    frozenset(['4h', '7h']): 0.177244587324, 
-    frozenset(['7c', '4h']): 0.115293419113, 
-    frozenset(['8s', '4h']): 0.134102414114, 
-    frozenset(['8d', '4h']): 0.134102414114, 
-    frozenset(['8h', '4h']): 0.195056433058, 
-    frozenset(['8c', '4h']): 0.134102414114, 
-    frozenset(['9s', '4h']): 0.1587938775, 
-    frozenset(['9d', '4h']): 0.1587938775, 
-    frozenset(['9h', '4h']): 0.218420926943, 
-    frozenset(['9c', '4h']): 0.1587938775, 
-    frozenset(['Ts', '4h']): 0.212140969219, 
-    frozenset(['Td', '4h']): 0.212140969219, 
-    frozenset(['Th', '4h']): 0.268661777393, 
-    frozenset(['Tc', '4h']): 0.212140969219, 
-    frozenset(['4h', 'Js']): 0.262640578991, 
-    frozenset(['Jd', '4h']): 0.262640578991, 
-    frozenset(['Jh', '4h']): 0.316522383594, 
-    frozenset(['4h', 'Jc']): 0.262640578991, 
-    frozenset(['Qs', '4h']): 0.317476784273, 
-    frozenset(['Qd', '4h']): 0.317476784273, 
-    frozenset(['Qh', '4h']): 0.368427198819, 
-    frozenset(['Qc', '4h']): 0.317476784273, 
-    frozenset(['Ks', '4h']): 0.376768319776, 
-    frozenset(['4h', 'Kd']): 0.376768319776, 
-    frozenset(['Kh', '4h']): 0.424677853074, 
-    frozenset(['Kc', '4h']): 0.376768319776, 
-    frozenset(['As', '4h']): 0.457760621403, 
-    frozenset(['Ad', '4h']): 0.457760621403, 
-    frozenset(['Ah', '4h']): 0.500945753283, 
-    frozenset(['Ac', '4h']): 0.457760621403, 
-    frozenset(['4c', '5s']): 0.104756416176, 
-    frozenset(['5d', '4c']): 0.104756416176, 
-    frozenset(['4c', '5h']): 0.104756416176, 
-    frozenset(['4c', '5c']): 0.166884685429, 
-    frozenset(['6s', '4c']): 0.103475983886, 
-    frozenset(['6d', '4c']): 0.103475983886, 
-    frozenset(['6h', '4c']): 0.103475983886, 
-    frozenset(['6c', '4c']): 0.16591866571, 
-    frozenset(['7s', '4c']): 0.115293419113, 
-    frozenset(['7d', '4c']): 0.115293419113, 
-    frozenset(['4c', '7h']): 0.115293419113, 
-    frozenset(['7c', '4c']): 0.177244587324, 
-    frozenset(['8s', '4c']): 0.134102414114, 
-    frozenset(['4c', '8d']): 0.134102414114, 
-    frozenset(['8h', '4c']): 0.134102414114, 
-    frozenset(['8c', '4c']): 0.195056433058, 
-    frozenset(['9s', '4c']): 0.1587938775, 
-    frozenset(['4c', '9d']): 0.1587938775, 
-    frozenset(['9h', '4c']): 0.1587938775, 
-    frozenset(['9c', '4c']): 0.218420926943, 
-    frozenset(['4c', 'Ts']): 0.212140969219, 
-    frozenset(['Td', '4c']): 0.212140969219, 
-    frozenset(['4c', 'Th']): 0.212140969219, 
-    frozenset(['4c', 'Tc']): 0.268661777393, 
-    frozenset(['4c', 'Js']): 0.262640578991, 
-    frozenset(['Jd', '4c']): 0.262640578991, 
-    frozenset(['Jh', '4c']): 0.262640578991, 
-    frozenset(['4c', 'Jc']): 0.316522383594, 
-    frozenset(['Qs', '4c']): 0.317476784273, 
-    frozenset(['4c', 'Qd']): 0.317476784273, 
-    frozenset(['Qh', '4c']): 0.317476784273, 
-    frozenset(['Qc', '4c']): 0.368427198819, 
-    frozenset(['Ks', '4c']): 0.376768319776, 
-    frozenset(['4c', 'Kd']): 0.376768319776, 
-    frozenset(['Kh', '4c']): 0.376768319776, 
-    frozenset(['Kc', '4c']): 0.424677853074, 
-    frozenset(['As', '4c']): 0.457760621403, 
-    frozenset(['4c', 'Ad']): 0.457760621403, 
-    frozenset(['Ah', '4c']): 0.457760621403, 
-    frozenset(['Ac', '4c']): 0.500945753283, 
-    frozenset(['5d', '5s']): 0.545896817747, 
-    frozenset(['5h', '5s']): 0.545896817747, 
-    frozenset(['5c', '5s']): 0.545896817747, 
-    frozenset(['6s', '5s']): 0.199488605996, 
-    frozenset(['6d', '5s']): 0.139668724649, 
-    frozenset(['6h', '5s']): 0.139668724649, 
-    frozenset(['6c', '5s']): 0.139668724649, 
-    frozenset(['7s', '5s']): 0.210799664001, 
-    frozenset(['7d', '5s']): 0.151391932705, 
-    frozenset(['5s', '7h']): 0.151391932705, 
-    frozenset(['7c', '5s']): 0.151391932705, 
-    frozenset(['8s', '5s']): 0.228986010574, 
-    frozenset(['8d', '5s']): 0.170587092476, 
-    frozenset(['8h', '5s']): 0.170587092476, 
-    frozenset(['8c', '5s']): 0.170587092476, 
-    frozenset(['9s', '5s']): 0.252710678561, 
-    frozenset(['9d', '5s']): 0.195717256795, 
-    frozenset(['9h', '5s']): 0.195717256795, 
-    frozenset(['9c', '5s']): 0.195717256795, 
-    frozenset(['Ts', '5s']): 0.281898157663, 
-    frozenset(['Td', '5s']): 0.226572539569, 
-    frozenset(['Th', '5s']): 0.226572539569, 
-    frozenset(['Tc', '5s']): 0.226572539569, 
-    frozenset(['5s', 'Js']): 0.333587795292, 
-    frozenset(['Jd', '5s']): 0.28121083332, 
-    frozenset(['Jh', '5s']): 0.28121083332, 
-    frozenset(['5s', 'Jc']): 0.28121083332, 
-    frozenset(['Qs', '5s']): 0.385549597862, 
-    frozenset(['Qd', '5s']): 0.336070177928, 
-    frozenset(['Qh', '5s']): 0.336070177928, 
-    frozenset(['Qc', '5s']): 0.336070177928, 
-    frozenset(['Ks', '5s']): 0.441564249668, 
-    frozenset(['5s', 'Kd']): 0.395337938479, 
-    frozenset(['Kh', '5s']): 0.395337938479, 
-    frozenset(['Kc', '5s']): 0.395337938479, 
-    frozenset(['As', '5s']): 0.517582093613, 
-    frozenset(['Ad', '5s']): 0.475907034818, 
-    frozenset(['Ah', '5s']): 0.475907034818, 
-    frozenset(['Ac', '5s']): 0.475907034818, 
-    frozenset(['5d', '5h']): 0.545896817747, 
-    frozenset(['5d', '5c']): 0.545896817747, 
-    frozenset(['5d', '6s']): 0.139668724649, 
-    frozenset(['5d', '6d']): 0.199488605996, 
-    frozenset(['6h', '5d']): 0.139668724649, 
-    frozenset(['5d', '6c']): 0.139668724649, 
-    frozenset(['5d', '7s']): 0.151391932705, 
-    frozenset(['5d', '7d']): 0.210799664001, 
-    frozenset(['5d', '7h']): 0.151391932705, 
-    frozenset(['5d', '7c']): 0.151391932705, 
-    frozenset(['5d', '8s']): 0.170587092476, 
-    frozenset(['5d', '8d']): 0.228986010574, 
-    frozenset(['5d', '8h']): 0.170587092476, 
-    frozenset(['5d', '8c']): 0.170587092476, 
-    frozenset(['5d', '9s']): 0.195717256795, 
-    frozenset(['5d', '9d']): 0.252710678561, 
-    frozenset(['5d', '9h']): 0.195717256795, 
-    frozenset(['5d', '9c']): 0.195717256795, 
-    frozenset(['5d', 'Ts']): 0.226572539569, 
-    frozenset(['5d', 'Td']): 0.281898157663, 
-    frozenset(['5d', 'Th']): 0.226572539569, 
-    frozenset(['5d', 'Tc']): 0.226572539569, 
-    frozenset(['5d', 'Js']): 0.28121083332, 
-    frozenset(['Jd', '5d']): 0.333587795292, 
-    frozenset(['5d', 'Jh']): 0.28121083332, 
-    frozenset(['5d', 'Jc']): 0.28121083332, 
-    frozenset(['5d', 'Qs']): 0.336070177928, 
-    frozenset(['5d', 'Qd']): 0.385549597862, 
-    frozenset(['5d', 'Qh']): 0.336070177928, 
-    frozenset(['5d', 'Qc']): 0.336070177928, 
-    frozenset(['Ks', '5d']): 0.395337938479, 
-    frozenset(['5d', 'Kd']): 0.441564249668, 
-    frozenset(['5d', 'Kh']): 0.395337938479, 
-    frozenset(['Kc', '5d']): 0.395337938479, 
-    frozenset(['5d', 'As']): 0.475907034818, 
-    frozenset(['5d', 'Ad']): 0.517582093613, 
-    frozenset(['5d', 'Ah']): 0.475907034818, 
-    frozenset(['5d', 'Ac']): 0.475907034818, 
-    frozenset(['5h', '5c']): 0.545896817747, 
-    frozenset(['6s', '5h']): 0.139668724649, 
-    frozenset(['6d', '5h']): 0.139668724649, 
-    frozenset(['6h', '5h']): 0.199488605996, 
-    frozenset(['6c', '5h']): 0.139668724649, 
-    frozenset(['7s', '5h']): 0.151391932705, 
-    frozenset(['7d', '5h']): 0.151391932705, 
-    frozenset(['5h', '7h']): 0.210799664001, 
-    frozenset(['7c', '5h']): 0.151391932705, 
-    frozenset(['8s', '5h']): 0.170587092476, 
-    frozenset(['5h', '8d']): 0.170587092476, 
-    frozenset(['8h', '5h']): 0.228986010574, 
-    frozenset(['8c', '5h']): 0.170587092476, 
-    frozenset(['9s', '5h']): 0.195717256795, 
-    frozenset(['5h', '9d']): 0.195717256795, 
-    frozenset(['9h', '5h']): 0.252710678561, 
-    frozenset(['9c', '5h']): 0.195717256795, 
-    frozenset(['5h', 'Ts']): 0.226572539569, 
-    frozenset(['Td', '5h']): 0.226572539569, 
-    frozenset(['5h', 'Th']): 0.281898157663, 
-    frozenset(['5h', 'Tc']): 0.226572539569, 
-    frozenset(['5h', 'Js']): 0.28121083332, 
-    frozenset(['Jd', '5h']): 0.28121083332, 
-    frozenset(['Jh', '5h']): 0.333587795292, 
-    frozenset(['5h', 'Jc']): 0.28121083332, 
-    frozenset(['Qs', '5h']): 0.336070177928, 
-    frozenset(['5h', 'Qd']): 0.336070177928, 
-    frozenset(['Qh', '5h']): 0.385549597862, 
-    frozenset(['Qc', '5h']): 0.336070177928, 
-    frozenset(['Ks', '5h']): 0.395337938479, 
-    frozenset(['5h', 'Kd']): 0.395337938479, 
-    frozenset(['Kh', '5h']): 0.441564249668, 
-    frozenset(['Kc', '5h']): 0.395337938479, 
-    frozenset(['As', '5h']): 0.475907034818, 
-    frozenset(['5h', 'Ad']): 0.475907034818, 
-    frozenset(['Ah', '5h']): 0.517582093613, 
-    frozenset(['Ac', '5h']): 0.475907034818, 
-    frozenset(['6s', '5c']): 0.139668724649, 
-    frozenset(['6d', '5c']): 0.139668724649, 
-    frozenset(['6h', '5c']): 0.139668724649, 
-    frozenset(['6c', '5c']): 0.199488605996, 
-    frozenset(['7s', '5c']): 0.151391932705, 
-    frozenset(['7d', '5c']): 0.151391932705, 
-    frozenset(['5c', '7h']): 0.151391932705, 
-    frozenset(['7c', '5c']): 0.210799664001, 
-    frozenset(['8s', '5c']): 0.170587092476, 
-    frozenset(['8d', '5c']): 0.170587092476, 
-    frozenset(['8h', '5c']): 0.170587092476, 
-    frozenset(['8c', '5c']): 0.228986010574, 
-    frozenset(['9s', '5c']): 0.195717256795, 
-    frozenset(['9d', '5c']): 0.195717256795, 
-    frozenset(['9h', '5c']): 0.195717256795, 
-    frozenset(['9c', '5c']): 0.252710678561, 
-    frozenset(['Ts', '5c']): 0.226572539569, 
-    frozenset(['Td', '5c']): 0.226572539569, 
-    frozenset(['Th', '5c']): 0.226572539569, 
-    frozenset(['Tc', '5c']): 0.281898157663, 
-    frozenset(['5c', 'Js']): 0.28121083332, 
-    frozenset(['Jd', '5c']): 0.28121083332, 
-    frozenset(['Jh', '5c']): 0.28121083332, 
-    frozenset(['5c', 'Jc']): 0.333587795292, 
-    frozenset(['Qs', '5c']): 0.336070177928, 
-    frozenset(['Qd', '5c']): 0.336070177928, 
-    frozenset(['Qh', '5c']): 0.336070177928, 
-    frozenset(['Qc', '5c']): 0.385549597862, 
-    frozenset(['Ks', '5c']): 0.395337938479, 
-    frozenset(['5c', 'Kd']): 0.395337938479, 
-    frozenset(['Kh', '5c']): 0.395337938479, 
-    frozenset(['Kc', '5c']): 0.441564249668, 
-    frozenset(['As', '5c']): 0.475907034818, 
-    frozenset(['Ad', '5c']): 0.475907034818, 
-    frozenset(['Ah', '5c']): 0.475907034818, 
-    frozenset(['Ac', '5c']): 0.517582093613, 
-    frozenset(['6s', '6d']): 0.600749387724, 
-    frozenset(['6h', '6s']): 0.600749387724, 
-    frozenset(['6c', '6s']): 0.600749387724, 
-    frozenset(['6s', '7s']): 0.243973418522, 
-    frozenset(['6s', '7d']): 0.187045227497, 
-    frozenset(['6s', '7h']): 0.187045227497, 
-    frozenset(['6s', '7c']): 0.187045227497, 
-    frozenset(['8s', '6s']): 0.261720317211, 
-    frozenset(['6s', '8d']): 0.205692202329, 
-    frozenset(['8h', '6s']): 0.205692202329, 
-    frozenset(['8c', '6s']): 0.205692202329, 
-    frozenset(['9s', '6s']): 0.285658844855, 
-    frozenset(['6s', '9d']): 0.230960175545, 
-    frozenset(['9h', '6s']): 0.230960175545, 
-    frozenset(['9c', '6s']): 0.230960175545, 
-    frozenset(['6s', 'Ts']): 0.315299285193, 
-    frozenset(['Td', '6s']): 0.26226192503, 
-    frozenset(['6s', 'Th']): 0.26226192503, 
-    frozenset(['6s', 'Tc']): 0.26226192503, 
-    frozenset(['6s', 'Js']): 0.347146366479, 
-    frozenset(['Jd', '6s']): 0.295840361886, 
-    frozenset(['6s', 'Jh']): 0.295840361886, 
-    frozenset(['6s', 'Jc']): 0.295840361886, 
-    frozenset(['Qs', '6s']): 0.402855761254, 
-    frozenset(['6s', 'Qd']): 0.354728489899, 
-    frozenset(['Qh', '6s']): 0.354728489899, 
-    frozenset(['Qc', '6s']): 0.354728489899, 
-    frozenset(['Ks', '6s']): 0.459077832059, 
-    frozenset(['6s', 'Kd']): 0.413989034111, 
-    frozenset(['Kh', '6s']): 0.413989034111, 
-    frozenset(['Kc', '6s']): 0.413989034111, 
-    frozenset(['As', '6s']): 0.519655472012, 
-    frozenset(['6s', 'Ad']): 0.47812244167, 
-    frozenset(['Ah', '6s']): 0.47812244167, 
-    frozenset(['Ac', '6s']): 0.47812244167, 
-    frozenset(['6h', '6d']): 0.600749387724, 
-    frozenset(['6c', '6d']): 0.600749387724, 
-    frozenset(['7s', '6d']): 0.187045227497, 
-    frozenset(['7d', '6d']): 0.243973418522, 
-    frozenset(['6d', '7h']): 0.187045227497, 
-    frozenset(['7c', '6d']): 0.187045227497, 
-    frozenset(['8s', '6d']): 0.205692202329, 
-    frozenset(['6d', '8d']): 0.261720317211, 
-    frozenset(['8h', '6d']): 0.205692202329, 
-    frozenset(['8c', '6d']): 0.205692202329, 
-    frozenset(['9s', '6d']): 0.230960175545, 
-    frozenset(['6d', '9d']): 0.285658844855, 
-    frozenset(['9h', '6d']): 0.230960175545, 
-    frozenset(['9c', '6d']): 0.230960175545, 
-    frozenset(['6d', 'Ts']): 0.26226192503, 
-    frozenset(['Td', '6d']): 0.315299285193, 
-    frozenset(['6d', 'Th']): 0.26226192503, 
-    frozenset(['6d', 'Tc']): 0.26226192503, 
-    frozenset(['6d', 'Js']): 0.295840361886, 
-    frozenset(['Jd', '6d']): 0.347146366479, 
-    frozenset(['Jh', '6d']): 0.295840361886, 
-    frozenset(['6d', 'Jc']): 0.295840361886, 
-    frozenset(['Qs', '6d']): 0.354728489899, 
-    frozenset(['6d', 'Qd']): 0.402855761254, 
-    frozenset(['Qh', '6d']): 0.354728489899, 
-    frozenset(['Qc', '6d']): 0.354728489899, 
-    frozenset(['Ks', '6d']): 0.413989034111, 
-    frozenset(['6d', 'Kd']): 0.459077832059, 
-    frozenset(['Kh', '6d']): 0.413989034111, 
-    frozenset(['Kc', '6d']): 0.413989034111, 
-    frozenset(['As', '6d']): 0.47812244167, 
-    frozenset(['6d', 'Ad']): 0.519655472012, 
-    frozenset(['Ah', '6d']): 0.47812244167, 
-    frozenset(['Ac', '6d']): 0.47812244167, 
-    frozenset(['6h', '6c']): 0.600749387724, 
-    frozenset(['6h', '7s']): 0.187045227497, 
-    frozenset(['6h', '7d']): 0.187045227497, 
-    frozenset(['6h', '7h']): 0.243973418522, 
-    frozenset(['6h', '7c']): 0.187045227497, 
-    frozenset(['6h', '8s']): 0.205692202329, 
-    frozenset(['6h', '8d']): 0.205692202329, 
-    frozenset(['6h', '8h']): 0.261720317211, 
-    frozenset(['6h', '8c']): 0.205692202329, 
-    frozenset(['6h', '9s']): 0.230960175545, 
-    frozenset(['6h', '9d']): 0.230960175545, 
-    frozenset(['6h', '9h']): 0.285658844855, 
-    frozenset(['6h', '9c']): 0.230960175545, 
-    frozenset(['6h', 'Ts']): 0.26226192503, 
-    frozenset(['6h', 'Td']): 0.26226192503, 
-    frozenset(['6h', 'Th']): 0.315299285193, 
-    frozenset(['6h', 'Tc']): 0.26226192503, 
-    frozenset(['6h', 'Js']): 0.295840361886, 
-    frozenset(['6h', 'Jd']): 0.295840361886, 
-    frozenset(['6h', 'Jh']): 0.347146366479, 
-    frozenset(['6h', 'Jc']): 0.295840361886, 
-    frozenset(['6h', 'Qs']): 0.354728489899, 
-    frozenset(['6h', 'Qd']): 0.354728489899, 
-    frozenset(['6h', 'Qh']): 0.402855761254, 
-    frozenset(['6h', 'Qc']): 0.354728489899, 
-    frozenset(['6h', 'Ks']): 0.413989034111, 
-    frozenset(['6h', 'Kd']): 0.413989034111, 
-    frozenset(['6h', 'Kh']): 0.459077832059, 
-    frozenset(['6h', 'Kc']): 0.413989034111, 
-    frozenset(['6h', 'As']): 0.47812244167, 
-    frozenset(['6h', 'Ad']): 0.47812244167, 
-    frozenset(['6h', 'Ah']): 0.519655472012, 
-    frozenset(['6h', 'Ac']): 0.47812244167, 
-    frozenset(['6c', '7s']): 0.187045227497, 
-    frozenset(['6c', '7d']): 0.187045227497, 
-    frozenset(['6c', '7h']): 0.187045227497, 
-    frozenset(['6c', '7c']): 0.243973418522, 
-    frozenset(['8s', '6c']): 0.205692202329, 
-    frozenset(['6c', '8d']): 0.205692202329, 
-    frozenset(['8h', '6c']): 0.205692202329, 
-    frozenset(['8c', '6c']): 0.261720317211, 
-    frozenset(['9s', '6c']): 0.230960175545, 
-    frozenset(['6c', '9d']): 0.230960175545, 
-    frozenset(['9h', '6c']): 0.230960175545, 
-    frozenset(['9c', '6c']): 0.285658844855, 
-    frozenset(['6c', 'Ts']): 0.26226192503, 
-    frozenset(['Td', '6c']): 0.26226192503, 
-    frozenset(['6c', 'Th']): 0.26226192503, 
-    frozenset(['6c', 'Tc']): 0.315299285193, 
-    frozenset(['6c', 'Js']): 0.295840361886, 
-    frozenset(['Jd', '6c']): 0.295840361886, 
-    frozenset(['6c', 'Jh']): 0.295840361886, 
-    frozenset(['6c', 'Jc']): 0.347146366479, 
-    frozenset(['Qs', '6c']): 0.354728489899, 
-    frozenset(['6c', 'Qd']): 0.354728489899, 
-    frozenset(['Qh', '6c']): 0.354728489899, 
-    frozenset(['Qc', '6c']): 0.402855761254, 
-    frozenset(['Ks', '6c']): 0.413989034111, 
-    frozenset(['6c', 'Kd']): 0.413989034111, 
-    frozenset(['Kh', '6c']): 0.413989034111, 
-    frozenset(['Kc', '6c']): 0.459077832059, 
-    frozenset(['As', '6c']): 0.47812244167, 
-    frozenset(['6c', 'Ad']): 0.47812244167, 
-    frozenset(['Ah', '6c']): 0.47812244167, 
-    frozenset(['Ac', '6c']): 0.519655472012, 
-    frozenset(['7d', '7s']): 0.65513350082, 
-    frozenset(['7s', '7h']): 0.65513350082, 
-    frozenset(['7c', '7s']): 0.65513350082, 
-    frozenset(['8s', '7s']): 0.295277909462, 
-    frozenset(['7s', '8d']): 0.241530981613, 
-    frozenset(['8h', '7s']): 0.241530981613, 
-    frozenset(['8c', '7s']): 0.241530981613, 
-    frozenset(['9s', '7s']): 0.31877913132, 
-    frozenset(['7s', '9d']): 0.266277846869, 
-    frozenset(['9h', '7s']): 0.266277846869, 
-    frozenset(['9c', '7s']): 0.266277846869, 
-    frozenset(['7s', 'Ts']): 0.348472820656, 
-    frozenset(['Td', '7s']): 0.297809429274, 
-    frozenset(['7s', 'Th']): 0.297809429274, 
-    frozenset(['7s', 'Tc']): 0.297809429274, 
-    frozenset(['7s', 'Js']): 0.380917227649, 
-    frozenset(['Jd', '7s']): 0.331943628315, 
-    frozenset(['Jh', '7s']): 0.331943628315, 
-    frozenset(['7s', 'Jc']): 0.331943628315, 
-    frozenset(['Qs', '7s']): 0.418006597087, 
-    frozenset(['7s', 'Qd']): 0.371076390371, 
-    frozenset(['Qh', '7s']): 0.371076390371, 
-    frozenset(['Qc', '7s']): 0.371076390371, 
-    frozenset(['Ks', '7s']): 0.477740614963, 
-    frozenset(['7s', 'Kd']): 0.434119471893, 
-    frozenset(['Kh', '7s']): 0.434119471893, 
-    frozenset(['Kc', '7s']): 0.434119471893, 
-    frozenset(['As', '7s']): 0.541334028908, 
-    frozenset(['7s', 'Ad']): 0.501422487676, 
-    frozenset(['Ah', '7s']): 0.501422487676, 
-    frozenset(['Ac', '7s']): 0.501422487676, 
-    frozenset(['7d', '7h']): 0.65513350082, 
-    frozenset(['7d', '7c']): 0.65513350082, 
-    frozenset(['8s', '7d']): 0.241530981613, 
-    frozenset(['7d', '8d']): 0.295277909462, 
-    frozenset(['8h', '7d']): 0.241530981613, 
-    frozenset(['8c', '7d']): 0.241530981613, 
-    frozenset(['9s', '7d']): 0.266277846869, 
-    frozenset(['7d', '9d']): 0.31877913132, 
-    frozenset(['9h', '7d']): 0.266277846869, 
-    frozenset(['9c', '7d']): 0.266277846869, 
-    frozenset(['7d', 'Ts']): 0.297809429274, 
-    frozenset(['Td', '7d']): 0.348472820656, 
-    frozenset(['7d', 'Th']): 0.297809429274, 
-    frozenset(['7d', 'Tc']): 0.297809429274, 
-    frozenset(['7d', 'Js']): 0.331943628315, 
-    frozenset(['Jd', '7d']): 0.380917227649, 
-    frozenset(['7d', 'Jh']): 0.331943628315, 
-    frozenset(['7d', 'Jc']): 0.331943628315, 
-    frozenset(['Qs', '7d']): 0.371076390371, 
-    frozenset(['7d', 'Qd']): 0.418006597087, 
-    frozenset(['Qh', '7d']): 0.371076390371, 
-    frozenset(['Qc', '7d']): 0.371076390371, 
-    frozenset(['Ks', '7d']): 0.434119471893, 
-    frozenset(['7d', 'Kd']): 0.477740614963, 
-    frozenset(['Kh', '7d']): 0.434119471893, 
-    frozenset(['Kc', '7d']): 0.434119471893, 
-    frozenset(['As', '7d']): 0.501422487676, 
-    frozenset(['7d', 'Ad']): 0.541334028908, 
-    frozenset(['Ah', '7d']): 0.501422487676, 
-    frozenset(['Ac', '7d']): 0.501422487676, 
-    frozenset(['7c', '7h']): 0.65513350082, 
-    frozenset(['8s', '7h']): 0.241530981613, 
-    frozenset(['8d', '7h']): 0.241530981613, 
-    frozenset(['8h', '7h']): 0.295277909462, 
-    frozenset(['8c', '7h']): 0.241530981613, 
-    frozenset(['9s', '7h']): 0.266277846869, 
-    frozenset(['9d', '7h']): 0.266277846869, 
-    frozenset(['9h', '7h']): 0.31877913132, 
-    frozenset(['9c', '7h']): 0.266277846869, 
-    frozenset(['Ts', '7h']): 0.297809429274, 
-    frozenset(['Td', '7h']): 0.297809429274, 
-    frozenset(['Th', '7h']): 0.348472820656, 
-    frozenset(['Tc', '7h']): 0.297809429274, 
-    frozenset(['Js', '7h']): 0.331943628315, 
-    frozenset(['Jd', '7h']): 0.331943628315, 
-    frozenset(['Jh', '7h']): 0.380917227649, 
-    frozenset(['Jc', '7h']): 0.331943628315, 
-    frozenset(['Qs', '7h']): 0.371076390371, 
-    frozenset(['Qd', '7h']): 0.371076390371, 
-    frozenset(['Qh', '7h']): 0.418006597087, 
-    frozenset(['Qc', '7h']): 0.371076390371, 
-    frozenset(['Ks', '7h']): 0.434119471893, 
-    frozenset(['Kd', '7h']): 0.434119471893, 
-    frozenset(['Kh', '7h']): 0.477740614963, 
-    frozenset(['Kc', '7h']): 0.434119471893, 
-    frozenset(['As', '7h']): 0.501422487676, 
-    frozenset(['Ad', '7h']): 0.501422487676, 
-    frozenset(['Ah', '7h']): 0.541334028908, 
-    frozenset(['Ac', '7h']): 0.501422487676, 
-    frozenset(['8s', '7c']): 0.241530981613, 
-    frozenset(['7c', '8d']): 0.241530981613, 
-    frozenset(['8h', '7c']): 0.241530981613, 
-    frozenset(['8c', '7c']): 0.295277909462, 
-    frozenset(['9s', '7c']): 0.266277846869, 
-    frozenset(['7c', '9d']): 0.266277846869, 
-    frozenset(['9h', '7c']): 0.266277846869, 
-    frozenset(['9c', '7c']): 0.31877913132, 
-    frozenset(['7c', 'Ts']): 0.297809429274, 
-    frozenset(['Td', '7c']): 0.297809429274, 
-    frozenset(['7c', 'Th']): 0.297809429274, 
-    frozenset(['7c', 'Tc']): 0.348472820656, 
-    frozenset(['7c', 'Js']): 0.331943628315, 
-    frozenset(['Jd', '7c']): 0.331943628315, 
-    frozenset(['Jh', '7c']): 0.331943628315, 
-    frozenset(['7c', 'Jc']): 0.380917227649, 
-    frozenset(['Qs', '7c']): 0.371076390371, 
-    frozenset(['7c', 'Qd']): 0.371076390371, 
-    frozenset(['Qh', '7c']): 0.371076390371, 
-    frozenset(['Qc', '7c']): 0.418006597087, 
-    frozenset(['Ks', '7c']): 0.434119471893, 
-    frozenset(['7c', 'Kd']): 0.434119471893, 
-    frozenset(['Kh', '7c']): 0.434119471893, 
-    frozenset(['Kc', '7c']): 0.477740614963, 
-    frozenset(['As', '7c']): 0.501422487676, 
-    frozenset(['7c', 'Ad']): 0.501422487676, 
-    frozenset(['Ah', '7c']): 0.501422487676, 
-    frozenset(['Ac', '7c']): 0.541334028908, 
-    frozenset(['8s', '8d']): 0.708857136721, 
-    frozenset(['8s', '8h']): 0.708857136721, 
-    frozenset(['8s', '8c']): 0.708857136721, 
-    frozenset(['8s', '9s']): 0.352214279243, 
-    frozenset(['8s', '9d']): 0.302120364499, 
-    frozenset(['8s', '9h']): 0.302120364499, 
-    frozenset(['8s', '9c']): 0.302120364499, 
-    frozenset(['8s', 'Ts']): 0.381779774883, 
-    frozenset(['8s', 'Td']): 0.333629193623, 
-    frozenset(['8s', 'Th']): 0.333629193623, 
-    frozenset(['8s', 'Tc']): 0.333629193623, 
-    frozenset(['8s', 'Js']): 0.414278003657, 
-    frozenset(['Jd', '8s']): 0.367625551447, 
-    frozenset(['8s', 'Jh']): 0.367625551447, 
-    frozenset(['8s', 'Jc']): 0.367625551447, 
-    frozenset(['8s', 'Qs']): 0.452056782078, 
-    frozenset(['8s', 'Qd']): 0.407397333808, 
-    frozenset(['8s', 'Qh']): 0.407397333808, 
-    frozenset(['8s', 'Qc']): 0.407397333808, 
-    frozenset(['Ks', '8s']): 0.494669408217, 
-    frozenset(['8s', 'Kd']): 0.452285661558, 
-    frozenset(['8s', 'Kh']): 0.452285661558, 
-    frozenset(['Kc', '8s']): 0.452285661558, 
-    frozenset(['8s', 'As']): 0.561345669136, 
-    frozenset(['8s', 'Ad']): 0.523046405813, 
-    frozenset(['8s', 'Ah']): 0.523046405813, 
-    frozenset(['8s', 'Ac']): 0.523046405813, 
-    frozenset(['8h', '8d']): 0.708857136721, 
-    frozenset(['8c', '8d']): 0.708857136721, 
-    frozenset(['9s', '8d']): 0.302120364499, 
-    frozenset(['9d', '8d']): 0.352214279243, 
-    frozenset(['9h', '8d']): 0.302120364499, 
-    frozenset(['9c', '8d']): 0.302120364499, 
-    frozenset(['Ts', '8d']): 0.333629193623, 
-    frozenset(['Td', '8d']): 0.381779774883, 
-    frozenset(['Th', '8d']): 0.333629193623, 
-    frozenset(['Tc', '8d']): 0.333629193623, 
-    frozenset(['8d', 'Js']): 0.367625551447, 
-    frozenset(['Jd', '8d']): 0.414278003657, 
-    frozenset(['Jh', '8d']): 0.367625551447, 
-    frozenset(['8d', 'Jc']): 0.367625551447, 
-    frozenset(['Qs', '8d']): 0.407397333808, 
-    frozenset(['Qd', '8d']): 0.452056782078, 
-    frozenset(['Qh', '8d']): 0.407397333808, 
-    frozenset(['Qc', '8d']): 0.407397333808, 
-    frozenset(['Ks', '8d']): 0.452285661558, 
-    frozenset(['8d', 'Kd']): 0.494669408217, 
-    frozenset(['Kh', '8d']): 0.452285661558, 
-    frozenset(['Kc', '8d']): 0.452285661558, 
-    frozenset(['As', '8d']): 0.523046405813, 
-    frozenset(['Ad', '8d']): 0.561345669136, 
-    frozenset(['Ah', '8d']): 0.523046405813, 
-    frozenset(['Ac', '8d']): 0.523046405813, 
-    frozenset(['8c', '8h']): 0.708857136721, 
-    frozenset(['8h', '9s']): 0.302120364499, 
-    frozenset(['8h', '9d']): 0.302120364499, 
-    frozenset(['9h', '8h']): 0.352214279243, 
-    frozenset(['8h', '9c']): 0.302120364499, 
-    frozenset(['8h', 'Ts']): 0.333629193623, 
-    frozenset(['8h', 'Td']): 0.333629193623, 
-    frozenset(['8h', 'Th']): 0.381779774883, 
-    frozenset(['8h', 'Tc']): 0.333629193623, 
-    frozenset(['8h', 'Js']): 0.367625551447, 
-    frozenset(['Jd', '8h']): 0.367625551447, 
-    frozenset(['8h', 'Jh']): 0.414278003657, 
-    frozenset(['8h', 'Jc']): 0.367625551447, 
-    frozenset(['8h', 'Qs']): 0.407397333808, 
-    frozenset(['8h', 'Qd']): 0.407397333808, 
-    frozenset(['Qh', '8h']): 0.452056782078, 
-    frozenset(['8h', 'Qc']): 0.407397333808, 
-    frozenset(['Ks', '8h']): 0.452285661558, 
-    frozenset(['8h', 'Kd']): 0.452285661558, 
-    frozenset(['8h', 'Kh']): 0.494669408217, 
-    frozenset(['Kc', '8h']): 0.452285661558, 
-    frozenset(['8h', 'As']): 0.523046405813, 
-    frozenset(['8h', 'Ad']): 0.523046405813, 
-    frozenset(['Ah', '8h']): 0.561345669136, 
-    frozenset(['8h', 'Ac']): 0.523046405813, 
-    frozenset(['8c', '9s']): 0.302120364499, 
-    frozenset(['8c', '9d']): 0.302120364499, 
-    frozenset(['8c', '9h']): 0.302120364499, 
-    frozenset(['8c', '9c']): 0.352214279243, 
-    frozenset(['8c', 'Ts']): 0.333629193623, 
-    frozenset(['8c', 'Td']): 0.333629193623, 
-    frozenset(['8c', 'Th']): 0.333629193623, 
-    frozenset(['8c', 'Tc']): 0.381779774883, 
-    frozenset(['8c', 'Js']): 0.367625551447, 
-    frozenset(['Jd', '8c']): 0.367625551447, 
-    frozenset(['8c', 'Jh']): 0.367625551447, 
-    frozenset(['8c', 'Jc']): 0.414278003657, 
-    frozenset(['8c', 'Qs']): 0.407397333808, 
-    frozenset(['8c', 'Qd']): 0.407397333808, 
-    frozenset(['8c', 'Qh']): 0.407397333808, 
-    frozenset(['8c', 'Qc']): 0.452056782078, 
-    frozenset(['Ks', '8c']): 0.452285661558, 
-    frozenset(['8c', 'Kd']): 0.452285661558, 
-    frozenset(['8c', 'Kh']): 0.452285661558, 
-    frozenset(['Kc', '8c']): 0.494669408217, 
-    frozenset(['8c', 'As']): 0.523046405813, 
-    frozenset(['8c', 'Ad']): 0.523046405813, 
-    frozenset(['8c', 'Ah']): 0.523046405813, 
-    frozenset(['8c', 'Ac']): 0.561345669136, 
-    frozenset(['9s', '9d']): 0.76176378941, 
-    frozenset(['9h', '9s']): 0.76176378941, 
-    frozenset(['9s', '9c']): 0.76176378941, 
-    frozenset(['9s', 'Ts']): 0.415461689611, 
-    frozenset(['9s', 'Td']): 0.369443242719, 
-    frozenset(['9s', 'Th']): 0.369443242719, 
-    frozenset(['9s', 'Tc']): 0.369443242719, 
-    frozenset(['9s', 'Js']): 0.446565868721, 
-    frozenset(['Jd', '9s']): 0.402213832149, 
-    frozenset(['9s', 'Jh']): 0.402213832149, 
-    frozenset(['9s', 'Jc']): 0.402213832149, 
-    frozenset(['9s', 'Qs']): 0.484485242741, 
-    frozenset(['9s', 'Qd']): 0.442157531783, 
-    frozenset(['Qh', '9s']): 0.442157531783, 
-    frozenset(['9s', 'Qc']): 0.442157531783, 
-    frozenset(['Ks', '9s']): 0.527931405321, 
-    frozenset(['9s', 'Kd']): 0.48783188198, 
-    frozenset(['9s', 'Kh']): 0.48783188198, 
-    frozenset(['Kc', '9s']): 0.48783188198, 
-    frozenset(['9s', 'As']): 0.579431900912, 
-    frozenset(['9s', 'Ad']): 0.542412482732, 
-    frozenset(['Ah', '9s']): 0.542412482732, 
-    frozenset(['9s', 'Ac']): 0.542412482732, 
-    frozenset(['9h', '9d']): 0.76176378941, 
-    frozenset(['9c', '9d']): 0.76176378941, 
-    frozenset(['9d', 'Ts']): 0.369443242719, 
-    frozenset(['Td', '9d']): 0.415461689611, 
-    frozenset(['9d', 'Th']): 0.369443242719, 
-    frozenset(['9d', 'Tc']): 0.369443242719, 
-    frozenset(['9d', 'Js']): 0.402213832149, 
-    frozenset(['Jd', '9d']): 0.446565868721, 
-    frozenset(['Jh', '9d']): 0.402213832149, 
-    frozenset(['9d', 'Jc']): 0.402213832149, 
-    frozenset(['Qs', '9d']): 0.442157531783, 
-    frozenset(['9d', 'Qd']): 0.484485242741, 
-    frozenset(['Qh', '9d']): 0.442157531783, 
-    frozenset(['Qc', '9d']): 0.442157531783, 
-    frozenset(['Ks', '9d']): 0.48783188198, 
-    frozenset(['9d', 'Kd']): 0.527931405321, 
-    frozenset(['Kh', '9d']): 0.48783188198, 
-    frozenset(['Kc', '9d']): 0.48783188198, 
-    frozenset(['As', '9d']): 0.542412482732, 
-    frozenset(['9d', 'Ad']): 0.579431900912, 
-    frozenset(['Ah', '9d']): 0.542412482732, 
-    frozenset(['Ac', '9d']): 0.542412482732, 
-    frozenset(['9h', '9c']): 0.76176378941, 
-    frozenset(['9h', 'Ts']): 0.369443242719, 
-    frozenset(['9h', 'Td']): 0.369443242719, 
-    frozenset(['9h', 'Th']): 0.415461689611, 
-    frozenset(['9h', 'Tc']): 0.369443242719, 
-    frozenset(['9h', 'Js']): 0.402213832149, 
-    frozenset(['Jd', '9h']): 0.402213832149, 
-    frozenset(['9h', 'Jh']): 0.446565868721, 
-    frozenset(['9h', 'Jc']): 0.402213832149, 
-    frozenset(['9h', 'Qs']): 0.442157531783, 
-    frozenset(['9h', 'Qd']): 0.442157531783, 
-    frozenset(['9h', 'Qh']): 0.484485242741, 
-    frozenset(['9h', 'Qc']): 0.442157531783, 
-    frozenset(['Ks', '9h']): 0.48783188198, 
-    frozenset(['9h', 'Kd']): 0.48783188198, 
-    frozenset(['9h', 'Kh']): 0.527931405321, 
-    frozenset(['Kc', '9h']): 0.48783188198, 
-    frozenset(['9h', 'As']): 0.542412482732, 
-    frozenset(['9h', 'Ad']): 0.542412482732, 
-    frozenset(['9h', 'Ah']): 0.579431900912, 
-    frozenset(['9h', 'Ac']): 0.542412482732, 
-    frozenset(['9c', 'Ts']): 0.369443242719, 
-    frozenset(['9c', 'Td']): 0.369443242719, 
-    frozenset(['9c', 'Th']): 0.369443242719, 
-    frozenset(['9c', 'Tc']): 0.415461689611, 
-    frozenset(['9c', 'Js']): 0.402213832149, 
-    frozenset(['Jd', '9c']): 0.402213832149, 
-    frozenset(['9c', 'Jh']): 0.402213832149, 
-    frozenset(['9c', 'Jc']): 0.446565868721, 
-    frozenset(['9c', 'Qs']): 0.442157531783, 
-    frozenset(['9c', 'Qd']): 0.442157531783, 
-    frozenset(['Qh', '9c']): 0.442157531783, 
-    frozenset(['9c', 'Qc']): 0.484485242741, 
-    frozenset(['Ks', '9c']): 0.48783188198, 
-    frozenset(['9c', 'Kd']): 0.48783188198, 
-    frozenset(['9c', 'Kh']): 0.48783188198, 
-    frozenset(['Kc', '9c']): 0.527931405321, 
-    frozenset(['9c', 'As']): 0.542412482732, 
-    frozenset(['9c', 'Ad']): 0.542412482732, 
-    frozenset(['Ah', '9c']): 0.542412482732, 
-    frozenset(['9c', 'Ac']): 0.579431900912, 
-    frozenset(['Td', 'Ts']): 0.815611151665, 
-    frozenset(['Ts', 'Th']): 0.815611151665, 
-    frozenset(['Ts', 'Tc']): 0.815611151665, 
-    frozenset(['Ts', 'Js']): 0.483263460482, 
-    frozenset(['Jd', 'Ts']): 0.441490876081, 
-    frozenset(['Jh', 'Ts']): 0.441490876081, 
-    frozenset(['Ts', 'Jc']): 0.441490876081, 
-    frozenset(['Qs', 'Ts']): 0.519419343873, 
-    frozenset(['Ts', 'Qd']): 0.479534064438, 
-    frozenset(['Qh', 'Ts']): 0.479534064438, 
-    frozenset(['Qc', 'Ts']): 0.479534064438, 
-    frozenset(['Ks', 'Ts']): 0.562821545864, 
-    frozenset(['Ts', 'Kd']): 0.525285434995, 
-    frozenset(['Kh', 'Ts']): 0.525285434995, 
-    frozenset(['Kc', 'Ts']): 0.525285434995, 
-    frozenset(['As', 'Ts']): 0.61494590727, 
-    frozenset(['Ts', 'Ad']): 0.580388799209, 
-    frozenset(['Ah', 'Ts']): 0.580388799209, 
-    frozenset(['Ac', 'Ts']): 0.580388799209, 
-    frozenset(['Td', 'Th']): 0.815611151665, 
-    frozenset(['Td', 'Tc']): 0.815611151665, 
-    frozenset(['Td', 'Js']): 0.441490876081, 
-    frozenset(['Jd', 'Td']): 0.483263460482, 
-    frozenset(['Td', 'Jh']): 0.441490876081, 
-    frozenset(['Td', 'Jc']): 0.441490876081, 
-    frozenset(['Td', 'Qs']): 0.479534064438, 
-    frozenset(['Td', 'Qd']): 0.519419343873, 
-    frozenset(['Qh', 'Td']): 0.479534064438, 
-    frozenset(['Td', 'Qc']): 0.479534064438, 
-    frozenset(['Ks', 'Td']): 0.525285434995, 
-    frozenset(['Td', 'Kd']): 0.562821545864, 
-    frozenset(['Td', 'Kh']): 0.525285434995, 
-    frozenset(['Kc', 'Td']): 0.525285434995, 
-    frozenset(['Td', 'As']): 0.580388799209, 
-    frozenset(['Td', 'Ad']): 0.61494590727, 
-    frozenset(['Ah', 'Td']): 0.580388799209, 
-    frozenset(['Td', 'Ac']): 0.580388799209, 
-    frozenset(['Tc', 'Th']): 0.815611151665, 
-    frozenset(['Th', 'Js']): 0.441490876081, 
-    frozenset(['Jd', 'Th']): 0.441490876081, 
-    frozenset(['Jh', 'Th']): 0.483263460482, 
-    frozenset(['Th', 'Jc']): 0.441490876081, 
-    frozenset(['Qs', 'Th']): 0.479534064438, 
-    frozenset(['Qd', 'Th']): 0.479534064438, 
-    frozenset(['Qh', 'Th']): 0.519419343873, 
-    frozenset(['Qc', 'Th']): 0.479534064438, 
-    frozenset(['Ks', 'Th']): 0.525285434995, 
-    frozenset(['Th', 'Kd']): 0.525285434995, 
-    frozenset(['Kh', 'Th']): 0.562821545864, 
-    frozenset(['Kc', 'Th']): 0.525285434995, 
-    frozenset(['As', 'Th']): 0.580388799209, 
-    frozenset(['Ad', 'Th']): 0.580388799209, 
-    frozenset(['Ah', 'Th']): 0.61494590727, 
-    frozenset(['Ac', 'Th']): 0.580388799209, 
-    frozenset(['Tc', 'Js']): 0.441490876081, 
-    frozenset(['Jd', 'Tc']): 0.441490876081, 
-    frozenset(['Jh', 'Tc']): 0.441490876081, 
-    frozenset(['Tc', 'Jc']): 0.483263460482, 
-    frozenset(['Qs', 'Tc']): 0.479534064438, 
-    frozenset(['Tc', 'Qd']): 0.479534064438, 
-    frozenset(['Qh', 'Tc']): 0.479534064438, 
-    frozenset(['Qc', 'Tc']): 0.519419343873, 
-    frozenset(['Ks', 'Tc']): 0.525285434995, 
-    frozenset(['Tc', 'Kd']): 0.525285434995, 
-    frozenset(['Kh', 'Tc']): 0.525285434995, 
-    frozenset(['Kc', 'Tc']): 0.562821545864, 
-    frozenset(['As', 'Tc']): 0.580388799209, 
-    frozenset(['Tc', 'Ad']): 0.580388799209, 
-    frozenset(['Ah', 'Tc']): 0.580388799209, 
-    frozenset(['Ac', 'Tc']): 0.61494590727, 
-    frozenset(['Jd', 'Js']): 0.86036810938, 
-    frozenset(['Jh', 'Js']): 0.86036810938, 
-    frozenset(['Jc', 'Js']): 0.86036810938, 
-    frozenset(['Qs', 'Js']): 0.535596910754, 
-    frozenset(['Qd', 'Js']): 0.496742951807, 
-    frozenset(['Qh', 'Js']): 0.496742951807, 
-    frozenset(['Qc', 'Js']): 0.496742951807, 
-    frozenset(['Ks', 'Js']): 0.578866216487, 
-    frozenset(['Kd', 'Js']): 0.542270951648, 
-    frozenset(['Kh', 'Js']): 0.542270951648, 
-    frozenset(['Kc', 'Js']): 0.542270951648, 
-    frozenset(['As', 'Js']): 0.631277022888, 
-    frozenset(['Ad', 'Js']): 0.597869285918, 
-    frozenset(['Ah', 'Js']): 0.597869285918, 
-    frozenset(['Ac', 'Js']): 0.597869285918, 
-    frozenset(['Jd', 'Jh']): 0.86036810938, 
-    frozenset(['Jd', 'Jc']): 0.86036810938, 
-    frozenset(['Jd', 'Qs']): 0.496742951807, 
-    frozenset(['Jd', 'Qd']): 0.535596910754, 
-    frozenset(['Jd', 'Qh']): 0.496742951807, 
-    frozenset(['Jd', 'Qc']): 0.496742951807, 
-    frozenset(['Jd', 'Ks']): 0.542270951648, 
-    frozenset(['Jd', 'Kd']): 0.578866216487, 
-    frozenset(['Jd', 'Kh']): 0.542270951648, 
-    frozenset(['Jd', 'Kc']): 0.542270951648, 
-    frozenset(['Jd', 'As']): 0.597869285918, 
-    frozenset(['Jd', 'Ad']): 0.631277022888, 
-    frozenset(['Jd', 'Ah']): 0.597869285918, 
-    frozenset(['Jd', 'Ac']): 0.597869285918, 
-    frozenset(['Jh', 'Jc']): 0.86036810938, 
-    frozenset(['Qs', 'Jh']): 0.496742951807, 
-    frozenset(['Jh', 'Qd']): 0.496742951807, 
-    frozenset(['Qh', 'Jh']): 0.535596910754, 
-    frozenset(['Qc', 'Jh']): 0.496742951807, 
-    frozenset(['Ks', 'Jh']): 0.542270951648, 
-    frozenset(['Jh', 'Kd']): 0.542270951648, 
-    frozenset(['Kh', 'Jh']): 0.578866216487, 
-    frozenset(['Kc', 'Jh']): 0.542270951648, 
-    frozenset(['As', 'Jh']): 0.597869285918, 
-    frozenset(['Jh', 'Ad']): 0.597869285918, 
-    frozenset(['Ah', 'Jh']): 0.631277022888, 
-    frozenset(['Ac', 'Jh']): 0.597869285918, 
-    frozenset(['Qs', 'Jc']): 0.496742951807, 
-    frozenset(['Qd', 'Jc']): 0.496742951807, 
-    frozenset(['Qh', 'Jc']): 0.496742951807, 
-    frozenset(['Qc', 'Jc']): 0.535596910754, 
-    frozenset(['Ks', 'Jc']): 0.542270951648, 
-    frozenset(['Kd', 'Jc']): 0.542270951648, 
-    frozenset(['Kh', 'Jc']): 0.542270951648, 
-    frozenset(['Kc', 'Jc']): 0.578866216487, 
-    frozenset(['As', 'Jc']): 0.597869285918, 
-    frozenset(['Ad', 'Jc']): 0.597869285918, 
-    frozenset(['Ah', 'Jc']): 0.597869285918, 
-    frozenset(['Ac', 'Jc']): 0.631277022888, 
-    frozenset(['Qs', 'Qd']): 0.904820386437, 
-    frozenset(['Qh', 'Qs']): 0.904820386437, 
-    frozenset(['Qs', 'Qc']): 0.904820386437, 
-    frozenset(['Ks', 'Qs']): 0.595562093852, 
-    frozenset(['Qs', 'Kd']): 0.560106654929, 
-    frozenset(['Qs', 'Kh']): 0.560106654929, 
-    frozenset(['Kc', 'Qs']): 0.560106654929, 
-    frozenset(['Qs', 'As']): 0.64781616979, 
-    frozenset(['Qs', 'Ad']): 0.615320880341, 
-    frozenset(['Ah', 'Qs']): 0.615320880341, 
-    frozenset(['Qs', 'Ac']): 0.615320880341, 
-    frozenset(['Qh', 'Qd']): 0.904820386437, 
-    frozenset(['Qc', 'Qd']): 0.904820386437, 
-    frozenset(['Ks', 'Qd']): 0.560106654929, 
-    frozenset(['Qd', 'Kd']): 0.595562093852, 
-    frozenset(['Kh', 'Qd']): 0.560106654929, 
-    frozenset(['Kc', 'Qd']): 0.560106654929, 
-    frozenset(['As', 'Qd']): 0.615320880341, 
-    frozenset(['Qd', 'Ad']): 0.64781616979, 
-    frozenset(['Ah', 'Qd']): 0.615320880341, 
-    frozenset(['Ac', 'Qd']): 0.615320880341, 
-    frozenset(['Qh', 'Qc']): 0.904820386437, 
-    frozenset(['Ks', 'Qh']): 0.560106654929, 
-    frozenset(['Qh', 'Kd']): 0.560106654929, 
-    frozenset(['Qh', 'Kh']): 0.595562093852, 
-    frozenset(['Kc', 'Qh']): 0.560106654929, 
-    frozenset(['Qh', 'As']): 0.615320880341, 
-    frozenset(['Qh', 'Ad']): 0.615320880341, 
-    frozenset(['Qh', 'Ah']): 0.64781616979, 
-    frozenset(['Qh', 'Ac']): 0.615320880341, 
-    frozenset(['Ks', 'Qc']): 0.560106654929, 
-    frozenset(['Qc', 'Kd']): 0.560106654929, 
-    frozenset(['Qc', 'Kh']): 0.560106654929, 
-    frozenset(['Kc', 'Qc']): 0.595562093852, 
-    frozenset(['Qc', 'As']): 0.615320880341, 
-    frozenset(['Qc', 'Ad']): 0.615320880341, 
-    frozenset(['Ah', 'Qc']): 0.615320880341, 
-    frozenset(['Qc', 'Ac']): 0.64781616979, 
-    frozenset(['Ks', 'Kd']): 0.949471146013, 
-    frozenset(['Ks', 'Kh']): 0.949471146013, 
-    frozenset(['Ks', 'Kc']): 0.949471146013, 
-    frozenset(['Ks', 'As']): 0.664026782077, 
-    frozenset(['Ks', 'Ad']): 0.632596874807, 
-    frozenset(['Ks', 'Ah']): 0.632596874807, 
-    frozenset(['Ks', 'Ac']): 0.632596874807, 
-    frozenset(['Kh', 'Kd']): 0.949471146013, 
-    frozenset(['Kc', 'Kd']): 0.949471146013, 
-    frozenset(['As', 'Kd']): 0.632596874807, 
-    frozenset(['Ad', 'Kd']): 0.664026782077, 
-    frozenset(['Ah', 'Kd']): 0.632596874807, 
-    frozenset(['Ac', 'Kd']): 0.632596874807, 
-    frozenset(['Kc', 'Kh']): 0.949471146013, 
-    frozenset(['As', 'Kh']): 0.632596874807, 
-    frozenset(['Kh', 'Ad']): 0.632596874807, 
-    frozenset(['Ah', 'Kh']): 0.664026782077, 
-    frozenset(['Ac', 'Kh']): 0.632596874807, 
-    frozenset(['Kc', 'As']): 0.632596874807, 
-    frozenset(['Kc', 'Ad']): 0.632596874807, 
-    frozenset(['Kc', 'Ah']): 0.632596874807, 
-    frozenset(['Kc', 'Ac']): 0.664026782077, 
-    frozenset(['As', 'Ad']): 1.0, 
-    frozenset(['Ah', 'As']): 1.0, 
-    frozenset(['As', 'Ac']): 1.0, 
-    frozenset(['Ah', 'Ad']): 1.0, 
-    frozenset(['Ac', 'Ad']): 1.0, 
-    frozenset(['Ah', 'Ac']): 1.0,
+NORMALIZED_HAND_EQUITY = {
+    frozenset(['2d', '2s']): 0.361630789011, 
+    frozenset(['2h', '2s']): 0.361630789011, 
+    frozenset(['2c', '2s']): 0.361630789011, 
+    frozenset(['3s', '2s']): 0.0691896043217, 
+    frozenset(['3d', '2s']): 0.0, 
+    frozenset(['3h', '2s']): 0.0, 
+    frozenset(['3c', '2s']): 0.0, 
+    frozenset(['4s', '2s']): 0.083995727583, 
+    frozenset(['4d', '2s']): 0.0157503072286, 
+    frozenset(['4h', '2s']): 0.0157503072286, 
+    frozenset(['4c', '2s']): 0.0157503072286, 
+    frozenset(['5s', '2s']): 0.102218085821, 
+    frozenset(['5d', '2s']): 0.0350982723774, 
+    frozenset(['5h', '2s']): 0.0350982723774, 
+    frozenset(['5c', '2s']): 0.0350982723774, 
+    frozenset(['6s', '2s']): 0.100514471586, 
+    frozenset(['6d', '2s']): 0.0330874044535, 
+    frozenset(['6h', '2s']): 0.0330874044535, 
+    frozenset(['6c', '2s']): 0.0330874044535, 
+    frozenset(['7s', '2s']): 0.111315036956, 
+    frozenset(['7d', '2s']): 0.0443449153975, 
+    frozenset(['7h', '2s']): 0.0443449153975, 
+    frozenset(['7c', '2s']): 0.0443449153975, 
+    frozenset(['8s', '2s']): 0.151538884571, 
+    frozenset(['8d', '2s']): 0.0869760608978, 
+    frozenset(['8h', '2s']): 0.0869760608978, 
+    frozenset(['8c', '2s']): 0.0869760608978, 
+    frozenset(['9s', '2s']): 0.192666200133, 
+    frozenset(['9d', '2s']): 0.130605307311, 
+    frozenset(['9h', '2s']): 0.130605307311, 
+    frozenset(['9c', '2s']): 0.130605307311, 
+    frozenset(['Ts', '2s']): 0.238762012133, 
+    frozenset(['Td', '2s']): 0.17952605626, 
+    frozenset(['Th', '2s']): 0.17952605626, 
+    frozenset(['Tc', '2s']): 0.17952605626, 
+    frozenset(['Js', '2s']): 0.286614536539, 
+    frozenset(['Jd', '2s']): 0.230022674636, 
+    frozenset(['Jh', '2s']): 0.230022674636, 
+    frozenset(['Jc', '2s']): 0.230022674636, 
+    frozenset(['Qs', '2s']): 0.338725634175, 
+    frozenset(['Qd', '2s']): 0.2850279656, 
+    frozenset(['Qh', '2s']): 0.2850279656, 
+    frozenset(['Qc', '2s']): 0.2850279656, 
+    frozenset(['Ks', '2s']): 0.395004699508, 
+    frozenset(['Kd', '2s']): 0.344378847808, 
+    frozenset(['Kh', '2s']): 0.344378847808, 
+    frozenset(['Kc', '2s']): 0.344378847808, 
+    frozenset(['As', '2s']): 0.471658444877, 
+    frozenset(['Ad', '2s']): 0.42564733283, 
+    frozenset(['Ah', '2s']): 0.42564733283, 
+    frozenset(['Ac', '2s']): 0.42564733283, 
+    frozenset(['2d', '2h']): 0.361630789011, 
+    frozenset(['2d', '2c']): 0.361630789011, 
+    frozenset(['2d', '3s']): 0.0, 
+    frozenset(['2d', '3d']): 0.0691896043217, 
+    frozenset(['2d', '3h']): 0.0, 
+    frozenset(['2d', '3c']): 0.0, 
+    frozenset(['2d', '4s']): 0.0157503072286, 
+    frozenset(['2d', '4d']): 0.083995727583, 
+    frozenset(['2d', '4h']): 0.0157503072286, 
+    frozenset(['2d', '4c']): 0.0157503072286, 
+    frozenset(['2d', '5s']): 0.0350982723774, 
+    frozenset(['2d', '5d']): 0.102218085821, 
+    frozenset(['2d', '5h']): 0.0350982723774, 
+    frozenset(['2d', '5c']): 0.0350982723774, 
+    frozenset(['2d', '6s']): 0.0330874044535, 
+    frozenset(['2d', '6d']): 0.100514471586, 
+    frozenset(['2d', '6h']): 0.0330874044535, 
+    frozenset(['2d', '6c']): 0.0330874044535, 
+    frozenset(['2d', '7s']): 0.0443449153975, 
+    frozenset(['2d', '7d']): 0.111315036956, 
+    frozenset(['2d', '7h']): 0.0443449153975, 
+    frozenset(['2d', '7c']): 0.0443449153975, 
+    frozenset(['2d', '8s']): 0.0869760608978, 
+    frozenset(['2d', '8d']): 0.151538884571, 
+    frozenset(['2d', '8h']): 0.0869760608978, 
+    frozenset(['2d', '8c']): 0.0869760608978, 
+    frozenset(['2d', '9s']): 0.130605307311, 
+    frozenset(['2d', '9d']): 0.192666200133, 
+    frozenset(['2d', '9h']): 0.130605307311, 
+    frozenset(['2d', '9c']): 0.130605307311, 
+    frozenset(['2d', 'Ts']): 0.17952605626, 
+    frozenset(['2d', 'Td']): 0.238762012133, 
+    frozenset(['2d', 'Th']): 0.17952605626, 
+    frozenset(['2d', 'Tc']): 0.17952605626, 
+    frozenset(['2d', 'Js']): 0.230022674636, 
+    frozenset(['2d', 'Jd']): 0.286614536539, 
+    frozenset(['2d', 'Jh']): 0.230022674636, 
+    frozenset(['2d', 'Jc']): 0.230022674636, 
+    frozenset(['2d', 'Qs']): 0.2850279656, 
+    frozenset(['2d', 'Qd']): 0.338725634175, 
+    frozenset(['2d', 'Qh']): 0.2850279656, 
+    frozenset(['2d', 'Qc']): 0.2850279656, 
+    frozenset(['2d', 'Ks']): 0.344378847808, 
+    frozenset(['2d', 'Kd']): 0.395004699508, 
+    frozenset(['2d', 'Kh']): 0.344378847808, 
+    frozenset(['2d', 'Kc']): 0.344378847808, 
+    frozenset(['2d', 'As']): 0.42564733283, 
+    frozenset(['2d', 'Ad']): 0.471658444877, 
+    frozenset(['2d', 'Ah']): 0.42564733283, 
+    frozenset(['2d', 'Ac']): 0.42564733283, 
+    frozenset(['2h', '2c']): 0.361630789011, 
+    frozenset(['3s', '2h']): 0.0, 
+    frozenset(['2h', '3d']): 0.0, 
+    frozenset(['3h', '2h']): 0.0691896043217, 
+    frozenset(['3c', '2h']): 0.0, 
+    frozenset(['2h', '4s']): 0.0157503072286, 
+    frozenset(['4d', '2h']): 0.0157503072286, 
+    frozenset(['2h', '4h']): 0.083995727583, 
+    frozenset(['2h', '4c']): 0.0157503072286, 
+    frozenset(['2h', '5s']): 0.0350982723774, 
+    frozenset(['5d', '2h']): 0.0350982723774, 
+    frozenset(['2h', '5h']): 0.102218085821, 
+    frozenset(['2h', '5c']): 0.0350982723774, 
+    frozenset(['6s', '2h']): 0.0330874044535, 
+    frozenset(['6d', '2h']): 0.0330874044535, 
+    frozenset(['6h', '2h']): 0.100514471586, 
+    frozenset(['6c', '2h']): 0.0330874044535, 
+    frozenset(['7s', '2h']): 0.0443449153975, 
+    frozenset(['7d', '2h']): 0.0443449153975, 
+    frozenset(['2h', '7h']): 0.111315036956, 
+    frozenset(['7c', '2h']): 0.0443449153975, 
+    frozenset(['8s', '2h']): 0.0869760608978, 
+    frozenset(['2h', '8d']): 0.0869760608978, 
+    frozenset(['8h', '2h']): 0.151538884571, 
+    frozenset(['8c', '2h']): 0.0869760608978, 
+    frozenset(['9s', '2h']): 0.130605307311, 
+    frozenset(['2h', '9d']): 0.130605307311, 
+    frozenset(['9h', '2h']): 0.192666200133, 
+    frozenset(['9c', '2h']): 0.130605307311, 
+    frozenset(['2h', 'Ts']): 0.17952605626, 
+    frozenset(['Td', '2h']): 0.17952605626, 
+    frozenset(['2h', 'Th']): 0.238762012133, 
+    frozenset(['2h', 'Tc']): 0.17952605626, 
+    frozenset(['2h', 'Js']): 0.230022674636, 
+    frozenset(['Jd', '2h']): 0.230022674636, 
+    frozenset(['Jh', '2h']): 0.286614536539, 
+    frozenset(['2h', 'Jc']): 0.230022674636, 
+    frozenset(['Qs', '2h']): 0.2850279656, 
+    frozenset(['2h', 'Qd']): 0.2850279656, 
+    frozenset(['Qh', '2h']): 0.338725634175, 
+    frozenset(['Qc', '2h']): 0.2850279656, 
+    frozenset(['Ks', '2h']): 0.344378847808, 
+    frozenset(['2h', 'Kd']): 0.344378847808, 
+    frozenset(['Kh', '2h']): 0.395004699508, 
+    frozenset(['Kc', '2h']): 0.344378847808, 
+    frozenset(['As', '2h']): 0.42564733283, 
+    frozenset(['2h', 'Ad']): 0.42564733283, 
+    frozenset(['Ah', '2h']): 0.471658444877, 
+    frozenset(['Ac', '2h']): 0.42564733283, 
+    frozenset(['3s', '2c']): 0.0, 
+    frozenset(['3d', '2c']): 0.0, 
+    frozenset(['3h', '2c']): 0.0, 
+    frozenset(['3c', '2c']): 0.0691896043217, 
+    frozenset(['4s', '2c']): 0.0157503072286, 
+    frozenset(['4d', '2c']): 0.0157503072286, 
+    frozenset(['4h', '2c']): 0.0157503072286, 
+    frozenset(['4c', '2c']): 0.083995727583, 
+    frozenset(['5s', '2c']): 0.0350982723774, 
+    frozenset(['5d', '2c']): 0.0350982723774, 
+    frozenset(['5h', '2c']): 0.0350982723774, 
+    frozenset(['5c', '2c']): 0.102218085821, 
+    frozenset(['6s', '2c']): 0.0330874044535, 
+    frozenset(['6d', '2c']): 0.0330874044535, 
+    frozenset(['6h', '2c']): 0.0330874044535, 
+    frozenset(['6c', '2c']): 0.100514471586, 
+    frozenset(['7s', '2c']): 0.0443449153975, 
+    frozenset(['7d', '2c']): 0.0443449153975, 
+    frozenset(['7h', '2c']): 0.0443449153975, 
+    frozenset(['7c', '2c']): 0.111315036956, 
+    frozenset(['8s', '2c']): 0.0869760608978, 
+    frozenset(['8d', '2c']): 0.0869760608978, 
+    frozenset(['8h', '2c']): 0.0869760608978, 
+    frozenset(['8c', '2c']): 0.151538884571, 
+    frozenset(['9s', '2c']): 0.130605307311, 
+    frozenset(['9d', '2c']): 0.130605307311, 
+    frozenset(['9h', '2c']): 0.130605307311, 
+    frozenset(['9c', '2c']): 0.192666200133, 
+    frozenset(['Ts', '2c']): 0.17952605626, 
+    frozenset(['Td', '2c']): 0.17952605626, 
+    frozenset(['Th', '2c']): 0.17952605626, 
+    frozenset(['Tc', '2c']): 0.238762012133, 
+    frozenset(['Js', '2c']): 0.230022674636, 
+    frozenset(['Jd', '2c']): 0.230022674636, 
+    frozenset(['Jh', '2c']): 0.230022674636, 
+    frozenset(['Jc', '2c']): 0.286614536539, 
+    frozenset(['Qs', '2c']): 0.2850279656, 
+    frozenset(['Qd', '2c']): 0.2850279656, 
+    frozenset(['Qh', '2c']): 0.2850279656, 
+    frozenset(['Qc', '2c']): 0.338725634175, 
+    frozenset(['Ks', '2c']): 0.344378847808, 
+    frozenset(['Kd', '2c']): 0.344378847808, 
+    frozenset(['Kh', '2c']): 0.344378847808, 
+    frozenset(['Kc', '2c']): 0.395004699508, 
+    frozenset(['As', '2c']): 0.42564733283, 
+    frozenset(['Ad', '2c']): 0.42564733283, 
+    frozenset(['Ah', '2c']): 0.42564733283, 
+    frozenset(['Ac', '2c']): 0.471658444877, 
+    frozenset(['3s', '3d']): 0.423751911953, 
+    frozenset(['3s', '3h']): 0.423751911953, 
+    frozenset(['3s', '3c']): 0.423751911953, 
+    frozenset(['3s', '4s']): 0.116404049294, 
+    frozenset(['3s', '4d']): 0.0507829484554, 
+    frozenset(['3s', '4h']): 0.0507829484554, 
+    frozenset(['3s', '4c']): 0.0507829484554, 
+    frozenset(['3s', '5s']): 0.135037336605, 
+    frozenset(['3s', '5d']): 0.0705192079028, 
+    frozenset(['3s', '5h']): 0.0705192079028, 
+    frozenset(['3s', '5c']): 0.0705192079028, 
+    frozenset(['3s', '6s']): 0.133661387937, 
+    frozenset(['3s', '6d']): 0.0687133385689, 
+    frozenset(['3s', '6h']): 0.0687133385689, 
+    frozenset(['3s', '6c']): 0.0687133385689, 
+    frozenset(['3s', '7s']): 0.144802396047, 
+    frozenset(['3s', '7d']): 0.0803466611086, 
+    frozenset(['3s', '7h']): 0.0803466611086, 
+    frozenset(['3s', '7c']): 0.0803466611086, 
+    frozenset(['3s', '8s']): 0.162421093858, 
+    frozenset(['3s', '8d']): 0.0989334291633, 
+    frozenset(['3s', '8h']): 0.0989334291633, 
+    frozenset(['3s', '8c']): 0.0989334291633, 
+    frozenset(['3s', '9s']): 0.207693033097, 
+    frozenset(['3s', '9d']): 0.146939392778, 
+    frozenset(['3s', '9h']): 0.146939392778, 
+    frozenset(['3s', '9c']): 0.146939392778, 
+    frozenset(['3s', 'Ts']): 0.253884752906, 
+    frozenset(['3s', 'Td']): 0.196101103502, 
+    frozenset(['3s', 'Th']): 0.196101103502, 
+    frozenset(['3s', 'Tc']): 0.196101103502, 
+    frozenset(['3s', 'Js']): 0.301640148524, 
+    frozenset(['3s', 'Jd']): 0.246467226279, 
+    frozenset(['3s', 'Jh']): 0.246467226279, 
+    frozenset(['3s', 'Jc']): 0.246467226279, 
+    frozenset(['3s', 'Qs']): 0.353735335742, 
+    frozenset(['3s', 'Qd']): 0.301327971421, 
+    frozenset(['3s', 'Qh']): 0.301327971421, 
+    frozenset(['3s', 'Qc']): 0.301327971421, 
+    frozenset(['3s', 'Ks']): 0.410006708914, 
+    frozenset(['3s', 'Kd']): 0.360802382473, 
+    frozenset(['3s', 'Kh']): 0.360802382473, 
+    frozenset(['3s', 'Kc']): 0.360802382473, 
+    frozenset(['3s', 'As']): 0.486569624305, 
+    frozenset(['3s', 'Ad']): 0.441999824538, 
+    frozenset(['3s', 'Ah']): 0.441999824538, 
+    frozenset(['3s', 'Ac']): 0.441999824538, 
+    frozenset(['3h', '3d']): 0.423751911953, 
+    frozenset(['3c', '3d']): 0.423751911953, 
+    frozenset(['4s', '3d']): 0.0507829484554, 
+    frozenset(['4d', '3d']): 0.116404049294, 
+    frozenset(['4h', '3d']): 0.0507829484554, 
+    frozenset(['4c', '3d']): 0.0507829484554, 
+    frozenset(['5s', '3d']): 0.0705192079028, 
+    frozenset(['5d', '3d']): 0.135037336605, 
+    frozenset(['5h', '3d']): 0.0705192079028, 
+    frozenset(['5c', '3d']): 0.0705192079028, 
+    frozenset(['6s', '3d']): 0.0687133385689, 
+    frozenset(['6d', '3d']): 0.133661387937, 
+    frozenset(['6h', '3d']): 0.0687133385689, 
+    frozenset(['6c', '3d']): 0.0687133385689, 
+    frozenset(['7s', '3d']): 0.0803466611086, 
+    frozenset(['7d', '3d']): 0.144802396047, 
+    frozenset(['7h', '3d']): 0.0803466611086, 
+    frozenset(['7c', '3d']): 0.0803466611086, 
+    frozenset(['8s', '3d']): 0.0989334291633, 
+    frozenset(['8d', '3d']): 0.162421093858, 
+    frozenset(['8h', '3d']): 0.0989334291633, 
+    frozenset(['8c', '3d']): 0.0989334291633, 
+    frozenset(['9s', '3d']): 0.146939392778, 
+    frozenset(['9d', '3d']): 0.207693033097, 
+    frozenset(['9h', '3d']): 0.146939392778, 
+    frozenset(['9c', '3d']): 0.146939392778, 
+    frozenset(['Ts', '3d']): 0.196101103502, 
+    frozenset(['Td', '3d']): 0.253884752906, 
+    frozenset(['Th', '3d']): 0.196101103502, 
+    frozenset(['Tc', '3d']): 0.196101103502, 
+    frozenset(['Js', '3d']): 0.246467226279, 
+    frozenset(['Jd', '3d']): 0.301640148524, 
+    frozenset(['Jh', '3d']): 0.246467226279, 
+    frozenset(['Jc', '3d']): 0.246467226279, 
+    frozenset(['Qs', '3d']): 0.301327971421, 
+    frozenset(['Qd', '3d']): 0.353735335742, 
+    frozenset(['Qh', '3d']): 0.301327971421, 
+    frozenset(['Qc', '3d']): 0.301327971421, 
+    frozenset(['Ks', '3d']): 0.360802382473, 
+    frozenset(['Kd', '3d']): 0.410006708914, 
+    frozenset(['Kh', '3d']): 0.360802382473, 
+    frozenset(['Kc', '3d']): 0.360802382473, 
+    frozenset(['As', '3d']): 0.441999824538, 
+    frozenset(['Ad', '3d']): 0.486569624305, 
+    frozenset(['Ah', '3d']): 0.441999824538, 
+    frozenset(['Ac', '3d']): 0.441999824538, 
+    frozenset(['3c', '3h']): 0.423751911953, 
+    frozenset(['3h', '4s']): 0.0507829484554, 
+    frozenset(['4d', '3h']): 0.0507829484554, 
+    frozenset(['3h', '4h']): 0.116404049294, 
+    frozenset(['3h', '4c']): 0.0507829484554, 
+    frozenset(['3h', '5s']): 0.0705192079028, 
+    frozenset(['5d', '3h']): 0.0705192079028, 
+    frozenset(['3h', '5h']): 0.135037336605, 
+    frozenset(['3h', '5c']): 0.0705192079028, 
+    frozenset(['6s', '3h']): 0.0687133385689, 
+    frozenset(['3h', '6d']): 0.0687133385689, 
+    frozenset(['6h', '3h']): 0.133661387937, 
+    frozenset(['6c', '3h']): 0.0687133385689, 
+    frozenset(['3h', '7s']): 0.0803466611086, 
+    frozenset(['3h', '7d']): 0.0803466611086, 
+    frozenset(['3h', '7h']): 0.144802396047, 
+    frozenset(['3h', '7c']): 0.0803466611086, 
+    frozenset(['8s', '3h']): 0.0989334291633, 
+    frozenset(['3h', '8d']): 0.0989334291633, 
+    frozenset(['8h', '3h']): 0.162421093858, 
+    frozenset(['8c', '3h']): 0.0989334291633, 
+    frozenset(['9s', '3h']): 0.146939392778, 
+    frozenset(['3h', '9d']): 0.146939392778, 
+    frozenset(['9h', '3h']): 0.207693033097, 
+    frozenset(['9c', '3h']): 0.146939392778, 
+    frozenset(['3h', 'Ts']): 0.196101103502, 
+    frozenset(['Td', '3h']): 0.196101103502, 
+    frozenset(['3h', 'Th']): 0.253884752906, 
+    frozenset(['3h', 'Tc']): 0.196101103502, 
+    frozenset(['3h', 'Js']): 0.246467226279, 
+    frozenset(['Jd', '3h']): 0.246467226279, 
+    frozenset(['3h', 'Jh']): 0.301640148524, 
+    frozenset(['3h', 'Jc']): 0.246467226279, 
+    frozenset(['Qs', '3h']): 0.301327971421, 
+    frozenset(['3h', 'Qd']): 0.301327971421, 
+    frozenset(['Qh', '3h']): 0.353735335742, 
+    frozenset(['Qc', '3h']): 0.301327971421, 
+    frozenset(['Ks', '3h']): 0.360802382473, 
+    frozenset(['3h', 'Kd']): 0.360802382473, 
+    frozenset(['Kh', '3h']): 0.410006708914, 
+    frozenset(['Kc', '3h']): 0.360802382473, 
+    frozenset(['As', '3h']): 0.441999824538, 
+    frozenset(['3h', 'Ad']): 0.441999824538, 
+    frozenset(['Ah', '3h']): 0.486569624305, 
+    frozenset(['Ac', '3h']): 0.441999824538, 
+    frozenset(['3c', '4s']): 0.0507829484554, 
+    frozenset(['3c', '4d']): 0.0507829484554, 
+    frozenset(['3c', '4h']): 0.0507829484554, 
+    frozenset(['3c', '4c']): 0.116404049294, 
+    frozenset(['3c', '5s']): 0.0705192079028, 
+    frozenset(['3c', '5d']): 0.0705192079028, 
+    frozenset(['3c', '5h']): 0.0705192079028, 
+    frozenset(['3c', '5c']): 0.135037336605, 
+    frozenset(['3c', '6s']): 0.0687133385689, 
+    frozenset(['3c', '6d']): 0.0687133385689, 
+    frozenset(['3c', '6h']): 0.0687133385689, 
+    frozenset(['3c', '6c']): 0.133661387937, 
+    frozenset(['3c', '7s']): 0.0803466611086, 
+    frozenset(['3c', '7d']): 0.0803466611086, 
+    frozenset(['3c', '7h']): 0.0803466611086, 
+    frozenset(['3c', '7c']): 0.144802396047, 
+    frozenset(['3c', '8s']): 0.0989334291633, 
+    frozenset(['3c', '8d']): 0.0989334291633, 
+    frozenset(['3c', '8h']): 0.0989334291633, 
+    frozenset(['3c', '8c']): 0.162421093858, 
+    frozenset(['3c', '9s']): 0.146939392778, 
+    frozenset(['3c', '9d']): 0.146939392778, 
+    frozenset(['3c', '9h']): 0.146939392778, 
+    frozenset(['3c', '9c']): 0.207693033097, 
+    frozenset(['3c', 'Ts']): 0.196101103502, 
+    frozenset(['3c', 'Td']): 0.196101103502, 
+    frozenset(['3c', 'Th']): 0.196101103502, 
+    frozenset(['3c', 'Tc']): 0.253884752906, 
+    frozenset(['3c', 'Js']): 0.246467226279, 
+    frozenset(['3c', 'Jd']): 0.246467226279, 
+    frozenset(['3c', 'Jh']): 0.246467226279, 
+    frozenset(['3c', 'Jc']): 0.301640148524, 
+    frozenset(['3c', 'Qs']): 0.301327971421, 
+    frozenset(['3c', 'Qd']): 0.301327971421, 
+    frozenset(['3c', 'Qh']): 0.301327971421, 
+    frozenset(['3c', 'Qc']): 0.353735335742, 
+    frozenset(['3c', 'Ks']): 0.360802382473, 
+    frozenset(['3c', 'Kd']): 0.360802382473, 
+    frozenset(['3c', 'Kh']): 0.360802382473, 
+    frozenset(['3c', 'Kc']): 0.410006708914, 
+    frozenset(['3c', 'As']): 0.441999824538, 
+    frozenset(['3c', 'Ad']): 0.441999824538, 
+    frozenset(['3c', 'Ah']): 0.441999824538, 
+    frozenset(['3c', 'Ac']): 0.486569624305, 
+    frozenset(['4d', '4s']): 0.485204353806, 
+    frozenset(['4s', '4h']): 0.485204353806, 
+    frozenset(['4s', '4c']): 0.485204353806, 
+    frozenset(['4s', '5s']): 0.166884685429, 
+    frozenset(['5d', '4s']): 0.104756416176, 
+    frozenset(['4s', '5h']): 0.104756416176, 
+    frozenset(['4s', '5c']): 0.104756416176, 
+    frozenset(['6s', '4s']): 0.16591866571, 
+    frozenset(['6d', '4s']): 0.103475983886, 
+    frozenset(['6h', '4s']): 0.103475983886, 
+    frozenset(['6c', '4s']): 0.103475983886, 
+    frozenset(['7s', '4s']): 0.177244587324, 
+    frozenset(['7d', '4s']): 0.115293419113, 
+    frozenset(['4s', '7h']): 0.115293419113, 
+    frozenset(['7c', '4s']): 0.115293419113, 
+    frozenset(['8s', '4s']): 0.195056433058, 
+    frozenset(['4s', '8d']): 0.134102414114, 
+    frozenset(['8h', '4s']): 0.134102414114, 
+    frozenset(['8c', '4s']): 0.134102414114, 
+    frozenset(['9s', '4s']): 0.218420926943, 
+    frozenset(['4s', '9d']): 0.1587938775, 
+    frozenset(['9h', '4s']): 0.1587938775, 
+    frozenset(['9c', '4s']): 0.1587938775, 
+    frozenset(['4s', 'Ts']): 0.268661777393, 
+    frozenset(['Td', '4s']): 0.212140969219, 
+    frozenset(['4s', 'Th']): 0.212140969219, 
+    frozenset(['4s', 'Tc']): 0.212140969219, 
+    frozenset(['4s', 'Js']): 0.316522383594, 
+    frozenset(['Jd', '4s']): 0.262640578991, 
+    frozenset(['Jh', '4s']): 0.262640578991, 
+    frozenset(['4s', 'Jc']): 0.262640578991, 
+    frozenset(['Qs', '4s']): 0.368427198819, 
+    frozenset(['4s', 'Qd']): 0.317476784273, 
+    frozenset(['Qh', '4s']): 0.317476784273, 
+    frozenset(['Qc', '4s']): 0.317476784273, 
+    frozenset(['Ks', '4s']): 0.424677853074, 
+    frozenset(['4s', 'Kd']): 0.376768319776, 
+    frozenset(['Kh', '4s']): 0.376768319776, 
+    frozenset(['Kc', '4s']): 0.376768319776, 
+    frozenset(['As', '4s']): 0.500945753283, 
+    frozenset(['4s', 'Ad']): 0.457760621403, 
+    frozenset(['Ah', '4s']): 0.457760621403, 
+    frozenset(['Ac', '4s']): 0.457760621403, 
+    frozenset(['4d', '4h']): 0.485204353806, 
+    frozenset(['4d', '4c']): 0.485204353806, 
+    frozenset(['4d', '5s']): 0.104756416176, 
+    frozenset(['5d', '4d']): 0.166884685429, 
+    frozenset(['4d', '5h']): 0.104756416176, 
+    frozenset(['4d', '5c']): 0.104756416176, 
+    frozenset(['4d', '6s']): 0.103475983886, 
+    frozenset(['4d', '6d']): 0.16591866571, 
+    frozenset(['6h', '4d']): 0.103475983886, 
+    frozenset(['4d', '6c']): 0.103475983886, 
+    frozenset(['4d', '7s']): 0.115293419113, 
+    frozenset(['4d', '7d']): 0.177244587324, 
+    frozenset(['4d', '7h']): 0.115293419113, 
+    frozenset(['4d', '7c']): 0.115293419113, 
+    frozenset(['8s', '4d']): 0.134102414114, 
+    frozenset(['4d', '8d']): 0.195056433058, 
+    frozenset(['4d', '8h']): 0.134102414114, 
+    frozenset(['8c', '4d']): 0.134102414114, 
+    frozenset(['4d', '9s']): 0.1587938775, 
+    frozenset(['4d', '9d']): 0.218420926943, 
+    frozenset(['9h', '4d']): 0.1587938775, 
+    frozenset(['4d', '9c']): 0.1587938775, 
+    frozenset(['4d', 'Ts']): 0.212140969219, 
+    frozenset(['4d', 'Td']): 0.268661777393, 
+    frozenset(['4d', 'Th']): 0.212140969219, 
+    frozenset(['4d', 'Tc']): 0.212140969219, 
+    frozenset(['4d', 'Js']): 0.262640578991, 
+    frozenset(['Jd', '4d']): 0.316522383594, 
+    frozenset(['4d', 'Jh']): 0.262640578991, 
+    frozenset(['4d', 'Jc']): 0.262640578991, 
+    frozenset(['4d', 'Qs']): 0.317476784273, 
+    frozenset(['4d', 'Qd']): 0.368427198819, 
+    frozenset(['Qh', '4d']): 0.317476784273, 
+    frozenset(['4d', 'Qc']): 0.317476784273, 
+    frozenset(['Ks', '4d']): 0.376768319776, 
+    frozenset(['4d', 'Kd']): 0.424677853074, 
+    frozenset(['4d', 'Kh']): 0.376768319776, 
+    frozenset(['Kc', '4d']): 0.376768319776, 
+    frozenset(['4d', 'As']): 0.457760621403, 
+    frozenset(['4d', 'Ad']): 0.500945753283, 
+    frozenset(['Ah', '4d']): 0.457760621403, 
+    frozenset(['4d', 'Ac']): 0.457760621403, 
+    frozenset(['4c', '4h']): 0.485204353806, 
+    frozenset(['5s', '4h']): 0.104756416176, 
+    frozenset(['5d', '4h']): 0.104756416176, 
+    frozenset(['5h', '4h']): 0.166884685429, 
+    frozenset(['5c', '4h']): 0.104756416176, 
+    frozenset(['6s', '4h']): 0.103475983886, 
+    frozenset(['6d', '4h']): 0.103475983886, 
+    frozenset(['6h', '4h']): 0.16591866571, 
+    frozenset(['6c', '4h']): 0.103475983886, 
+    frozenset(['7s', '4h']): 0.115293419113, 
+    frozenset(['7d', '4h']): 0.115293419113, 
+    frozenset(['4h', '7h']): 0.177244587324, 
+    frozenset(['7c', '4h']): 0.115293419113, 
+    frozenset(['8s', '4h']): 0.134102414114, 
+    frozenset(['8d', '4h']): 0.134102414114, 
+    frozenset(['8h', '4h']): 0.195056433058, 
+    frozenset(['8c', '4h']): 0.134102414114, 
+    frozenset(['9s', '4h']): 0.1587938775, 
+    frozenset(['9d', '4h']): 0.1587938775, 
+    frozenset(['9h', '4h']): 0.218420926943, 
+    frozenset(['9c', '4h']): 0.1587938775, 
+    frozenset(['Ts', '4h']): 0.212140969219, 
+    frozenset(['Td', '4h']): 0.212140969219, 
+    frozenset(['Th', '4h']): 0.268661777393, 
+    frozenset(['Tc', '4h']): 0.212140969219, 
+    frozenset(['4h', 'Js']): 0.262640578991, 
+    frozenset(['Jd', '4h']): 0.262640578991, 
+    frozenset(['Jh', '4h']): 0.316522383594, 
+    frozenset(['4h', 'Jc']): 0.262640578991, 
+    frozenset(['Qs', '4h']): 0.317476784273, 
+    frozenset(['Qd', '4h']): 0.317476784273, 
+    frozenset(['Qh', '4h']): 0.368427198819, 
+    frozenset(['Qc', '4h']): 0.317476784273, 
+    frozenset(['Ks', '4h']): 0.376768319776, 
+    frozenset(['4h', 'Kd']): 0.376768319776, 
+    frozenset(['Kh', '4h']): 0.424677853074, 
+    frozenset(['Kc', '4h']): 0.376768319776, 
+    frozenset(['As', '4h']): 0.457760621403, 
+    frozenset(['Ad', '4h']): 0.457760621403, 
+    frozenset(['Ah', '4h']): 0.500945753283, 
+    frozenset(['Ac', '4h']): 0.457760621403, 
+    frozenset(['4c', '5s']): 0.104756416176, 
+    frozenset(['5d', '4c']): 0.104756416176, 
+    frozenset(['4c', '5h']): 0.104756416176, 
+    frozenset(['4c', '5c']): 0.166884685429, 
+    frozenset(['6s', '4c']): 0.103475983886, 
+    frozenset(['6d', '4c']): 0.103475983886, 
+    frozenset(['6h', '4c']): 0.103475983886, 
+    frozenset(['6c', '4c']): 0.16591866571, 
+    frozenset(['7s', '4c']): 0.115293419113, 
+    frozenset(['7d', '4c']): 0.115293419113, 
+    frozenset(['4c', '7h']): 0.115293419113, 
+    frozenset(['7c', '4c']): 0.177244587324, 
+    frozenset(['8s', '4c']): 0.134102414114, 
+    frozenset(['4c', '8d']): 0.134102414114, 
+    frozenset(['8h', '4c']): 0.134102414114, 
+    frozenset(['8c', '4c']): 0.195056433058, 
+    frozenset(['9s', '4c']): 0.1587938775, 
+    frozenset(['4c', '9d']): 0.1587938775, 
+    frozenset(['9h', '4c']): 0.1587938775, 
+    frozenset(['9c', '4c']): 0.218420926943, 
+    frozenset(['4c', 'Ts']): 0.212140969219, 
+    frozenset(['Td', '4c']): 0.212140969219, 
+    frozenset(['4c', 'Th']): 0.212140969219, 
+    frozenset(['4c', 'Tc']): 0.268661777393, 
+    frozenset(['4c', 'Js']): 0.262640578991, 
+    frozenset(['Jd', '4c']): 0.262640578991, 
+    frozenset(['Jh', '4c']): 0.262640578991, 
+    frozenset(['4c', 'Jc']): 0.316522383594, 
+    frozenset(['Qs', '4c']): 0.317476784273, 
+    frozenset(['4c', 'Qd']): 0.317476784273, 
+    frozenset(['Qh', '4c']): 0.317476784273, 
+    frozenset(['Qc', '4c']): 0.368427198819, 
+    frozenset(['Ks', '4c']): 0.376768319776, 
+    frozenset(['4c', 'Kd']): 0.376768319776, 
+    frozenset(['Kh', '4c']): 0.376768319776, 
+    frozenset(['Kc', '4c']): 0.424677853074, 
+    frozenset(['As', '4c']): 0.457760621403, 
+    frozenset(['4c', 'Ad']): 0.457760621403, 
+    frozenset(['Ah', '4c']): 0.457760621403, 
+    frozenset(['Ac', '4c']): 0.500945753283, 
+    frozenset(['5d', '5s']): 0.545896817747, 
+    frozenset(['5h', '5s']): 0.545896817747, 
+    frozenset(['5c', '5s']): 0.545896817747, 
+    frozenset(['6s', '5s']): 0.199488605996, 
+    frozenset(['6d', '5s']): 0.139668724649, 
+    frozenset(['6h', '5s']): 0.139668724649, 
+    frozenset(['6c', '5s']): 0.139668724649, 
+    frozenset(['7s', '5s']): 0.210799664001, 
+    frozenset(['7d', '5s']): 0.151391932705, 
+    frozenset(['5s', '7h']): 0.151391932705, 
+    frozenset(['7c', '5s']): 0.151391932705, 
+    frozenset(['8s', '5s']): 0.228986010574, 
+    frozenset(['8d', '5s']): 0.170587092476, 
+    frozenset(['8h', '5s']): 0.170587092476, 
+    frozenset(['8c', '5s']): 0.170587092476, 
+    frozenset(['9s', '5s']): 0.252710678561, 
+    frozenset(['9d', '5s']): 0.195717256795, 
+    frozenset(['9h', '5s']): 0.195717256795, 
+    frozenset(['9c', '5s']): 0.195717256795, 
+    frozenset(['Ts', '5s']): 0.281898157663, 
+    frozenset(['Td', '5s']): 0.226572539569, 
+    frozenset(['Th', '5s']): 0.226572539569, 
+    frozenset(['Tc', '5s']): 0.226572539569, 
+    frozenset(['5s', 'Js']): 0.333587795292, 
+    frozenset(['Jd', '5s']): 0.28121083332, 
+    frozenset(['Jh', '5s']): 0.28121083332, 
+    frozenset(['5s', 'Jc']): 0.28121083332, 
+    frozenset(['Qs', '5s']): 0.385549597862, 
+    frozenset(['Qd', '5s']): 0.336070177928, 
+    frozenset(['Qh', '5s']): 0.336070177928, 
+    frozenset(['Qc', '5s']): 0.336070177928, 
+    frozenset(['Ks', '5s']): 0.441564249668, 
+    frozenset(['5s', 'Kd']): 0.395337938479, 
+    frozenset(['Kh', '5s']): 0.395337938479, 
+    frozenset(['Kc', '5s']): 0.395337938479, 
+    frozenset(['As', '5s']): 0.517582093613, 
+    frozenset(['Ad', '5s']): 0.475907034818, 
+    frozenset(['Ah', '5s']): 0.475907034818, 
+    frozenset(['Ac', '5s']): 0.475907034818, 
+    frozenset(['5d', '5h']): 0.545896817747, 
+    frozenset(['5d', '5c']): 0.545896817747, 
+    frozenset(['5d', '6s']): 0.139668724649, 
+    frozenset(['5d', '6d']): 0.199488605996, 
+    frozenset(['6h', '5d']): 0.139668724649, 
+    frozenset(['5d', '6c']): 0.139668724649, 
+    frozenset(['5d', '7s']): 0.151391932705, 
+    frozenset(['5d', '7d']): 0.210799664001, 
+    frozenset(['5d', '7h']): 0.151391932705, 
+    frozenset(['5d', '7c']): 0.151391932705, 
+    frozenset(['5d', '8s']): 0.170587092476, 
+    frozenset(['5d', '8d']): 0.228986010574, 
+    frozenset(['5d', '8h']): 0.170587092476, 
+    frozenset(['5d', '8c']): 0.170587092476, 
+    frozenset(['5d', '9s']): 0.195717256795, 
+    frozenset(['5d', '9d']): 0.252710678561, 
+    frozenset(['5d', '9h']): 0.195717256795, 
+    frozenset(['5d', '9c']): 0.195717256795, 
+    frozenset(['5d', 'Ts']): 0.226572539569, 
+    frozenset(['5d', 'Td']): 0.281898157663, 
+    frozenset(['5d', 'Th']): 0.226572539569, 
+    frozenset(['5d', 'Tc']): 0.226572539569, 
+    frozenset(['5d', 'Js']): 0.28121083332, 
+    frozenset(['Jd', '5d']): 0.333587795292, 
+    frozenset(['5d', 'Jh']): 0.28121083332, 
+    frozenset(['5d', 'Jc']): 0.28121083332, 
+    frozenset(['5d', 'Qs']): 0.336070177928, 
+    frozenset(['5d', 'Qd']): 0.385549597862, 
+    frozenset(['5d', 'Qh']): 0.336070177928, 
+    frozenset(['5d', 'Qc']): 0.336070177928, 
+    frozenset(['Ks', '5d']): 0.395337938479, 
+    frozenset(['5d', 'Kd']): 0.441564249668, 
+    frozenset(['5d', 'Kh']): 0.395337938479, 
+    frozenset(['Kc', '5d']): 0.395337938479, 
+    frozenset(['5d', 'As']): 0.475907034818, 
+    frozenset(['5d', 'Ad']): 0.517582093613, 
+    frozenset(['5d', 'Ah']): 0.475907034818, 
+    frozenset(['5d', 'Ac']): 0.475907034818, 
+    frozenset(['5h', '5c']): 0.545896817747, 
+    frozenset(['6s', '5h']): 0.139668724649, 
+    frozenset(['6d', '5h']): 0.139668724649, 
+    frozenset(['6h', '5h']): 0.199488605996, 
+    frozenset(['6c', '5h']): 0.139668724649, 
+    frozenset(['7s', '5h']): 0.151391932705, 
+    frozenset(['7d', '5h']): 0.151391932705, 
+    frozenset(['5h', '7h']): 0.210799664001, 
+    frozenset(['7c', '5h']): 0.151391932705, 
+    frozenset(['8s', '5h']): 0.170587092476, 
+    frozenset(['5h', '8d']): 0.170587092476, 
+    frozenset(['8h', '5h']): 0.228986010574, 
+    frozenset(['8c', '5h']): 0.170587092476, 
+    frozenset(['9s', '5h']): 0.195717256795, 
+    frozenset(['5h', '9d']): 0.195717256795, 
+    frozenset(['9h', '5h']): 0.252710678561, 
+    frozenset(['9c', '5h']): 0.195717256795, 
+    frozenset(['5h', 'Ts']): 0.226572539569, 
+    frozenset(['Td', '5h']): 0.226572539569, 
+    frozenset(['5h', 'Th']): 0.281898157663, 
+    frozenset(['5h', 'Tc']): 0.226572539569, 
+    frozenset(['5h', 'Js']): 0.28121083332, 
+    frozenset(['Jd', '5h']): 0.28121083332, 
+    frozenset(['Jh', '5h']): 0.333587795292, 
+    frozenset(['5h', 'Jc']): 0.28121083332, 
+    frozenset(['Qs', '5h']): 0.336070177928, 
+    frozenset(['5h', 'Qd']): 0.336070177928, 
+    frozenset(['Qh', '5h']): 0.385549597862, 
+    frozenset(['Qc', '5h']): 0.336070177928, 
+    frozenset(['Ks', '5h']): 0.395337938479, 
+    frozenset(['5h', 'Kd']): 0.395337938479, 
+    frozenset(['Kh', '5h']): 0.441564249668, 
+    frozenset(['Kc', '5h']): 0.395337938479, 
+    frozenset(['As', '5h']): 0.475907034818, 
+    frozenset(['5h', 'Ad']): 0.475907034818, 
+    frozenset(['Ah', '5h']): 0.517582093613, 
+    frozenset(['Ac', '5h']): 0.475907034818, 
+    frozenset(['6s', '5c']): 0.139668724649, 
+    frozenset(['6d', '5c']): 0.139668724649, 
+    frozenset(['6h', '5c']): 0.139668724649, 
+    frozenset(['6c', '5c']): 0.199488605996, 
+    frozenset(['7s', '5c']): 0.151391932705, 
+    frozenset(['7d', '5c']): 0.151391932705, 
+    frozenset(['5c', '7h']): 0.151391932705, 
+    frozenset(['7c', '5c']): 0.210799664001, 
+    frozenset(['8s', '5c']): 0.170587092476, 
+    frozenset(['8d', '5c']): 0.170587092476, 
+    frozenset(['8h', '5c']): 0.170587092476, 
+    frozenset(['8c', '5c']): 0.228986010574, 
+    frozenset(['9s', '5c']): 0.195717256795, 
+    frozenset(['9d', '5c']): 0.195717256795, 
+    frozenset(['9h', '5c']): 0.195717256795, 
+    frozenset(['9c', '5c']): 0.252710678561, 
+    frozenset(['Ts', '5c']): 0.226572539569, 
+    frozenset(['Td', '5c']): 0.226572539569, 
+    frozenset(['Th', '5c']): 0.226572539569, 
+    frozenset(['Tc', '5c']): 0.281898157663, 
+    frozenset(['5c', 'Js']): 0.28121083332, 
+    frozenset(['Jd', '5c']): 0.28121083332, 
+    frozenset(['Jh', '5c']): 0.28121083332, 
+    frozenset(['5c', 'Jc']): 0.333587795292, 
+    frozenset(['Qs', '5c']): 0.336070177928, 
+    frozenset(['Qd', '5c']): 0.336070177928, 
+    frozenset(['Qh', '5c']): 0.336070177928, 
+    frozenset(['Qc', '5c']): 0.385549597862, 
+    frozenset(['Ks', '5c']): 0.395337938479, 
+    frozenset(['5c', 'Kd']): 0.395337938479, 
+    frozenset(['Kh', '5c']): 0.395337938479, 
+    frozenset(['Kc', '5c']): 0.441564249668, 
+    frozenset(['As', '5c']): 0.475907034818, 
+    frozenset(['Ad', '5c']): 0.475907034818, 
+    frozenset(['Ah', '5c']): 0.475907034818, 
+    frozenset(['Ac', '5c']): 0.517582093613, 
+    frozenset(['6s', '6d']): 0.600749387724, 
+    frozenset(['6h', '6s']): 0.600749387724, 
+    frozenset(['6c', '6s']): 0.600749387724, 
+    frozenset(['6s', '7s']): 0.243973418522, 
+    frozenset(['6s', '7d']): 0.187045227497, 
+    frozenset(['6s', '7h']): 0.187045227497, 
+    frozenset(['6s', '7c']): 0.187045227497, 
+    frozenset(['8s', '6s']): 0.261720317211, 
+    frozenset(['6s', '8d']): 0.205692202329, 
+    frozenset(['8h', '6s']): 0.205692202329, 
+    frozenset(['8c', '6s']): 0.205692202329, 
+    frozenset(['9s', '6s']): 0.285658844855, 
+    frozenset(['6s', '9d']): 0.230960175545, 
+    frozenset(['9h', '6s']): 0.230960175545, 
+    frozenset(['9c', '6s']): 0.230960175545, 
+    frozenset(['6s', 'Ts']): 0.315299285193, 
+    frozenset(['Td', '6s']): 0.26226192503, 
+    frozenset(['6s', 'Th']): 0.26226192503, 
+    frozenset(['6s', 'Tc']): 0.26226192503, 
+    frozenset(['6s', 'Js']): 0.347146366479, 
+    frozenset(['Jd', '6s']): 0.295840361886, 
+    frozenset(['6s', 'Jh']): 0.295840361886, 
+    frozenset(['6s', 'Jc']): 0.295840361886, 
+    frozenset(['Qs', '6s']): 0.402855761254, 
+    frozenset(['6s', 'Qd']): 0.354728489899, 
+    frozenset(['Qh', '6s']): 0.354728489899, 
+    frozenset(['Qc', '6s']): 0.354728489899, 
+    frozenset(['Ks', '6s']): 0.459077832059, 
+    frozenset(['6s', 'Kd']): 0.413989034111, 
+    frozenset(['Kh', '6s']): 0.413989034111, 
+    frozenset(['Kc', '6s']): 0.413989034111, 
+    frozenset(['As', '6s']): 0.519655472012, 
+    frozenset(['6s', 'Ad']): 0.47812244167, 
+    frozenset(['Ah', '6s']): 0.47812244167, 
+    frozenset(['Ac', '6s']): 0.47812244167, 
+    frozenset(['6h', '6d']): 0.600749387724, 
+    frozenset(['6c', '6d']): 0.600749387724, 
+    frozenset(['7s', '6d']): 0.187045227497, 
+    frozenset(['7d', '6d']): 0.243973418522, 
+    frozenset(['6d', '7h']): 0.187045227497, 
+    frozenset(['7c', '6d']): 0.187045227497, 
+    frozenset(['8s', '6d']): 0.205692202329, 
+    frozenset(['6d', '8d']): 0.261720317211, 
+    frozenset(['8h', '6d']): 0.205692202329, 
+    frozenset(['8c', '6d']): 0.205692202329, 
+    frozenset(['9s', '6d']): 0.230960175545, 
+    frozenset(['6d', '9d']): 0.285658844855, 
+    frozenset(['9h', '6d']): 0.230960175545, 
+    frozenset(['9c', '6d']): 0.230960175545, 
+    frozenset(['6d', 'Ts']): 0.26226192503, 
+    frozenset(['Td', '6d']): 0.315299285193, 
+    frozenset(['6d', 'Th']): 0.26226192503, 
+    frozenset(['6d', 'Tc']): 0.26226192503, 
+    frozenset(['6d', 'Js']): 0.295840361886, 
+    frozenset(['Jd', '6d']): 0.347146366479, 
+    frozenset(['Jh', '6d']): 0.295840361886, 
+    frozenset(['6d', 'Jc']): 0.295840361886, 
+    frozenset(['Qs', '6d']): 0.354728489899, 
+    frozenset(['6d', 'Qd']): 0.402855761254, 
+    frozenset(['Qh', '6d']): 0.354728489899, 
+    frozenset(['Qc', '6d']): 0.354728489899, 
+    frozenset(['Ks', '6d']): 0.413989034111, 
+    frozenset(['6d', 'Kd']): 0.459077832059, 
+    frozenset(['Kh', '6d']): 0.413989034111, 
+    frozenset(['Kc', '6d']): 0.413989034111, 
+    frozenset(['As', '6d']): 0.47812244167, 
+    frozenset(['6d', 'Ad']): 0.519655472012, 
+    frozenset(['Ah', '6d']): 0.47812244167, 
+    frozenset(['Ac', '6d']): 0.47812244167, 
+    frozenset(['6h', '6c']): 0.600749387724, 
+    frozenset(['6h', '7s']): 0.187045227497, 
+    frozenset(['6h', '7d']): 0.187045227497, 
+    frozenset(['6h', '7h']): 0.243973418522, 
+    frozenset(['6h', '7c']): 0.187045227497, 
+    frozenset(['6h', '8s']): 0.205692202329, 
+    frozenset(['6h', '8d']): 0.205692202329, 
+    frozenset(['6h', '8h']): 0.261720317211, 
+    frozenset(['6h', '8c']): 0.205692202329, 
+    frozenset(['6h', '9s']): 0.230960175545, 
+    frozenset(['6h', '9d']): 0.230960175545, 
+    frozenset(['6h', '9h']): 0.285658844855, 
+    frozenset(['6h', '9c']): 0.230960175545, 
+    frozenset(['6h', 'Ts']): 0.26226192503, 
+    frozenset(['6h', 'Td']): 0.26226192503, 
+    frozenset(['6h', 'Th']): 0.315299285193, 
+    frozenset(['6h', 'Tc']): 0.26226192503, 
+    frozenset(['6h', 'Js']): 0.295840361886, 
+    frozenset(['6h', 'Jd']): 0.295840361886, 
+    frozenset(['6h', 'Jh']): 0.347146366479, 
+    frozenset(['6h', 'Jc']): 0.295840361886, 
+    frozenset(['6h', 'Qs']): 0.354728489899, 
+    frozenset(['6h', 'Qd']): 0.354728489899, 
+    frozenset(['6h', 'Qh']): 0.402855761254, 
+    frozenset(['6h', 'Qc']): 0.354728489899, 
+    frozenset(['6h', 'Ks']): 0.413989034111, 
+    frozenset(['6h', 'Kd']): 0.413989034111, 
+    frozenset(['6h', 'Kh']): 0.459077832059, 
+    frozenset(['6h', 'Kc']): 0.413989034111, 
+    frozenset(['6h', 'As']): 0.47812244167, 
+    frozenset(['6h', 'Ad']): 0.47812244167, 
+    frozenset(['6h', 'Ah']): 0.519655472012, 
+    frozenset(['6h', 'Ac']): 0.47812244167, 
+    frozenset(['6c', '7s']): 0.187045227497, 
+    frozenset(['6c', '7d']): 0.187045227497, 
+    frozenset(['6c', '7h']): 0.187045227497, 
+    frozenset(['6c', '7c']): 0.243973418522, 
+    frozenset(['8s', '6c']): 0.205692202329, 
+    frozenset(['6c', '8d']): 0.205692202329, 
+    frozenset(['8h', '6c']): 0.205692202329, 
+    frozenset(['8c', '6c']): 0.261720317211, 
+    frozenset(['9s', '6c']): 0.230960175545, 
+    frozenset(['6c', '9d']): 0.230960175545, 
+    frozenset(['9h', '6c']): 0.230960175545, 
+    frozenset(['9c', '6c']): 0.285658844855, 
+    frozenset(['6c', 'Ts']): 0.26226192503, 
+    frozenset(['Td', '6c']): 0.26226192503, 
+    frozenset(['6c', 'Th']): 0.26226192503, 
+    frozenset(['6c', 'Tc']): 0.315299285193, 
+    frozenset(['6c', 'Js']): 0.295840361886, 
+    frozenset(['Jd', '6c']): 0.295840361886, 
+    frozenset(['6c', 'Jh']): 0.295840361886, 
+    frozenset(['6c', 'Jc']): 0.347146366479, 
+    frozenset(['Qs', '6c']): 0.354728489899, 
+    frozenset(['6c', 'Qd']): 0.354728489899, 
+    frozenset(['Qh', '6c']): 0.354728489899, 
+    frozenset(['Qc', '6c']): 0.402855761254, 
+    frozenset(['Ks', '6c']): 0.413989034111, 
+    frozenset(['6c', 'Kd']): 0.413989034111, 
+    frozenset(['Kh', '6c']): 0.413989034111, 
+    frozenset(['Kc', '6c']): 0.459077832059, 
+    frozenset(['As', '6c']): 0.47812244167, 
+    frozenset(['6c', 'Ad']): 0.47812244167, 
+    frozenset(['Ah', '6c']): 0.47812244167, 
+    frozenset(['Ac', '6c']): 0.519655472012, 
+    frozenset(['7d', '7s']): 0.65513350082, 
+    frozenset(['7s', '7h']): 0.65513350082, 
+    frozenset(['7c', '7s']): 0.65513350082, 
+    frozenset(['8s', '7s']): 0.295277909462, 
+    frozenset(['7s', '8d']): 0.241530981613, 
+    frozenset(['8h', '7s']): 0.241530981613, 
+    frozenset(['8c', '7s']): 0.241530981613, 
+    frozenset(['9s', '7s']): 0.31877913132, 
+    frozenset(['7s', '9d']): 0.266277846869, 
+    frozenset(['9h', '7s']): 0.266277846869, 
+    frozenset(['9c', '7s']): 0.266277846869, 
+    frozenset(['7s', 'Ts']): 0.348472820656, 
+    frozenset(['Td', '7s']): 0.297809429274, 
+    frozenset(['7s', 'Th']): 0.297809429274, 
+    frozenset(['7s', 'Tc']): 0.297809429274, 
+    frozenset(['7s', 'Js']): 0.380917227649, 
+    frozenset(['Jd', '7s']): 0.331943628315, 
+    frozenset(['Jh', '7s']): 0.331943628315, 
+    frozenset(['7s', 'Jc']): 0.331943628315, 
+    frozenset(['Qs', '7s']): 0.418006597087, 
+    frozenset(['7s', 'Qd']): 0.371076390371, 
+    frozenset(['Qh', '7s']): 0.371076390371, 
+    frozenset(['Qc', '7s']): 0.371076390371, 
+    frozenset(['Ks', '7s']): 0.477740614963, 
+    frozenset(['7s', 'Kd']): 0.434119471893, 
+    frozenset(['Kh', '7s']): 0.434119471893, 
+    frozenset(['Kc', '7s']): 0.434119471893, 
+    frozenset(['As', '7s']): 0.541334028908, 
+    frozenset(['7s', 'Ad']): 0.501422487676, 
+    frozenset(['Ah', '7s']): 0.501422487676, 
+    frozenset(['Ac', '7s']): 0.501422487676, 
+    frozenset(['7d', '7h']): 0.65513350082, 
+    frozenset(['7d', '7c']): 0.65513350082, 
+    frozenset(['8s', '7d']): 0.241530981613, 
+    frozenset(['7d', '8d']): 0.295277909462, 
+    frozenset(['8h', '7d']): 0.241530981613, 
+    frozenset(['8c', '7d']): 0.241530981613, 
+    frozenset(['9s', '7d']): 0.266277846869, 
+    frozenset(['7d', '9d']): 0.31877913132, 
+    frozenset(['9h', '7d']): 0.266277846869, 
+    frozenset(['9c', '7d']): 0.266277846869, 
+    frozenset(['7d', 'Ts']): 0.297809429274, 
+    frozenset(['Td', '7d']): 0.348472820656, 
+    frozenset(['7d', 'Th']): 0.297809429274, 
+    frozenset(['7d', 'Tc']): 0.297809429274, 
+    frozenset(['7d', 'Js']): 0.331943628315, 
+    frozenset(['Jd', '7d']): 0.380917227649, 
+    frozenset(['7d', 'Jh']): 0.331943628315, 
+    frozenset(['7d', 'Jc']): 0.331943628315, 
+    frozenset(['Qs', '7d']): 0.371076390371, 
+    frozenset(['7d', 'Qd']): 0.418006597087, 
+    frozenset(['Qh', '7d']): 0.371076390371, 
+    frozenset(['Qc', '7d']): 0.371076390371, 
+    frozenset(['Ks', '7d']): 0.434119471893, 
+    frozenset(['7d', 'Kd']): 0.477740614963, 
+    frozenset(['Kh', '7d']): 0.434119471893, 
+    frozenset(['Kc', '7d']): 0.434119471893, 
+    frozenset(['As', '7d']): 0.501422487676, 
+    frozenset(['7d', 'Ad']): 0.541334028908, 
+    frozenset(['Ah', '7d']): 0.501422487676, 
+    frozenset(['Ac', '7d']): 0.501422487676, 
+    frozenset(['7c', '7h']): 0.65513350082, 
+    frozenset(['8s', '7h']): 0.241530981613, 
+    frozenset(['8d', '7h']): 0.241530981613, 
+    frozenset(['8h', '7h']): 0.295277909462, 
+    frozenset(['8c', '7h']): 0.241530981613, 
+    frozenset(['9s', '7h']): 0.266277846869, 
+    frozenset(['9d', '7h']): 0.266277846869, 
+    frozenset(['9h', '7h']): 0.31877913132, 
+    frozenset(['9c', '7h']): 0.266277846869, 
+    frozenset(['Ts', '7h']): 0.297809429274, 
+    frozenset(['Td', '7h']): 0.297809429274, 
+    frozenset(['Th', '7h']): 0.348472820656, 
+    frozenset(['Tc', '7h']): 0.297809429274, 
+    frozenset(['Js', '7h']): 0.331943628315, 
+    frozenset(['Jd', '7h']): 0.331943628315, 
+    frozenset(['Jh', '7h']): 0.380917227649, 
+    frozenset(['Jc', '7h']): 0.331943628315, 
+    frozenset(['Qs', '7h']): 0.371076390371, 
+    frozenset(['Qd', '7h']): 0.371076390371, 
+    frozenset(['Qh', '7h']): 0.418006597087, 
+    frozenset(['Qc', '7h']): 0.371076390371, 
+    frozenset(['Ks', '7h']): 0.434119471893, 
+    frozenset(['Kd', '7h']): 0.434119471893, 
+    frozenset(['Kh', '7h']): 0.477740614963, 
+    frozenset(['Kc', '7h']): 0.434119471893, 
+    frozenset(['As', '7h']): 0.501422487676, 
+    frozenset(['Ad', '7h']): 0.501422487676, 
+    frozenset(['Ah', '7h']): 0.541334028908, 
+    frozenset(['Ac', '7h']): 0.501422487676, 
+    frozenset(['8s', '7c']): 0.241530981613, 
+    frozenset(['7c', '8d']): 0.241530981613, 
+    frozenset(['8h', '7c']): 0.241530981613, 
+    frozenset(['8c', '7c']): 0.295277909462, 
+    frozenset(['9s', '7c']): 0.266277846869, 
+    frozenset(['7c', '9d']): 0.266277846869, 
+    frozenset(['9h', '7c']): 0.266277846869, 
+    frozenset(['9c', '7c']): 0.31877913132, 
+    frozenset(['7c', 'Ts']): 0.297809429274, 
+    frozenset(['Td', '7c']): 0.297809429274, 
+    frozenset(['7c', 'Th']): 0.297809429274, 
+    frozenset(['7c', 'Tc']): 0.348472820656, 
+    frozenset(['7c', 'Js']): 0.331943628315, 
+    frozenset(['Jd', '7c']): 0.331943628315, 
+    frozenset(['Jh', '7c']): 0.331943628315, 
+    frozenset(['7c', 'Jc']): 0.380917227649, 
+    frozenset(['Qs', '7c']): 0.371076390371, 
+    frozenset(['7c', 'Qd']): 0.371076390371, 
+    frozenset(['Qh', '7c']): 0.371076390371, 
+    frozenset(['Qc', '7c']): 0.418006597087, 
+    frozenset(['Ks', '7c']): 0.434119471893, 
+    frozenset(['7c', 'Kd']): 0.434119471893, 
+    frozenset(['Kh', '7c']): 0.434119471893, 
+    frozenset(['Kc', '7c']): 0.477740614963, 
+    frozenset(['As', '7c']): 0.501422487676, 
+    frozenset(['7c', 'Ad']): 0.501422487676, 
+    frozenset(['Ah', '7c']): 0.501422487676, 
+    frozenset(['Ac', '7c']): 0.541334028908, 
+    frozenset(['8s', '8d']): 0.708857136721, 
+    frozenset(['8s', '8h']): 0.708857136721, 
+    frozenset(['8s', '8c']): 0.708857136721, 
+    frozenset(['8s', '9s']): 0.352214279243, 
+    frozenset(['8s', '9d']): 0.302120364499, 
+    frozenset(['8s', '9h']): 0.302120364499, 
+    frozenset(['8s', '9c']): 0.302120364499, 
+    frozenset(['8s', 'Ts']): 0.381779774883, 
+    frozenset(['8s', 'Td']): 0.333629193623, 
+    frozenset(['8s', 'Th']): 0.333629193623, 
+    frozenset(['8s', 'Tc']): 0.333629193623, 
+    frozenset(['8s', 'Js']): 0.414278003657, 
+    frozenset(['Jd', '8s']): 0.367625551447, 
+    frozenset(['8s', 'Jh']): 0.367625551447, 
+    frozenset(['8s', 'Jc']): 0.367625551447, 
+    frozenset(['8s', 'Qs']): 0.452056782078, 
+    frozenset(['8s', 'Qd']): 0.407397333808, 
+    frozenset(['8s', 'Qh']): 0.407397333808, 
+    frozenset(['8s', 'Qc']): 0.407397333808, 
+    frozenset(['Ks', '8s']): 0.494669408217, 
+    frozenset(['8s', 'Kd']): 0.452285661558, 
+    frozenset(['8s', 'Kh']): 0.452285661558, 
+    frozenset(['Kc', '8s']): 0.452285661558, 
+    frozenset(['8s', 'As']): 0.561345669136, 
+    frozenset(['8s', 'Ad']): 0.523046405813, 
+    frozenset(['8s', 'Ah']): 0.523046405813, 
+    frozenset(['8s', 'Ac']): 0.523046405813, 
+    frozenset(['8h', '8d']): 0.708857136721, 
+    frozenset(['8c', '8d']): 0.708857136721, 
+    frozenset(['9s', '8d']): 0.302120364499, 
+    frozenset(['9d', '8d']): 0.352214279243, 
+    frozenset(['9h', '8d']): 0.302120364499, 
+    frozenset(['9c', '8d']): 0.302120364499, 
+    frozenset(['Ts', '8d']): 0.333629193623, 
+    frozenset(['Td', '8d']): 0.381779774883, 
+    frozenset(['Th', '8d']): 0.333629193623, 
+    frozenset(['Tc', '8d']): 0.333629193623, 
+    frozenset(['8d', 'Js']): 0.367625551447, 
+    frozenset(['Jd', '8d']): 0.414278003657, 
+    frozenset(['Jh', '8d']): 0.367625551447, 
+    frozenset(['8d', 'Jc']): 0.367625551447, 
+    frozenset(['Qs', '8d']): 0.407397333808, 
+    frozenset(['Qd', '8d']): 0.452056782078, 
+    frozenset(['Qh', '8d']): 0.407397333808, 
+    frozenset(['Qc', '8d']): 0.407397333808, 
+    frozenset(['Ks', '8d']): 0.452285661558, 
+    frozenset(['8d', 'Kd']): 0.494669408217, 
+    frozenset(['Kh', '8d']): 0.452285661558, 
+    frozenset(['Kc', '8d']): 0.452285661558, 
+    frozenset(['As', '8d']): 0.523046405813, 
+    frozenset(['Ad', '8d']): 0.561345669136, 
+    frozenset(['Ah', '8d']): 0.523046405813, 
+    frozenset(['Ac', '8d']): 0.523046405813, 
+    frozenset(['8c', '8h']): 0.708857136721, 
+    frozenset(['8h', '9s']): 0.302120364499, 
+    frozenset(['8h', '9d']): 0.302120364499, 
+    frozenset(['9h', '8h']): 0.352214279243, 
+    frozenset(['8h', '9c']): 0.302120364499, 
+    frozenset(['8h', 'Ts']): 0.333629193623, 
+    frozenset(['8h', 'Td']): 0.333629193623, 
+    frozenset(['8h', 'Th']): 0.381779774883, 
+    frozenset(['8h', 'Tc']): 0.333629193623, 
+    frozenset(['8h', 'Js']): 0.367625551447, 
+    frozenset(['Jd', '8h']): 0.367625551447, 
+    frozenset(['8h', 'Jh']): 0.414278003657, 
+    frozenset(['8h', 'Jc']): 0.367625551447, 
+    frozenset(['8h', 'Qs']): 0.407397333808, 
+    frozenset(['8h', 'Qd']): 0.407397333808, 
+    frozenset(['Qh', '8h']): 0.452056782078, 
+    frozenset(['8h', 'Qc']): 0.407397333808, 
+    frozenset(['Ks', '8h']): 0.452285661558, 
+    frozenset(['8h', 'Kd']): 0.452285661558, 
+    frozenset(['8h', 'Kh']): 0.494669408217, 
+    frozenset(['Kc', '8h']): 0.452285661558, 
+    frozenset(['8h', 'As']): 0.523046405813, 
+    frozenset(['8h', 'Ad']): 0.523046405813, 
+    frozenset(['Ah', '8h']): 0.561345669136, 
+    frozenset(['8h', 'Ac']): 0.523046405813, 
+    frozenset(['8c', '9s']): 0.302120364499, 
+    frozenset(['8c', '9d']): 0.302120364499, 
+    frozenset(['8c', '9h']): 0.302120364499, 
+    frozenset(['8c', '9c']): 0.352214279243, 
+    frozenset(['8c', 'Ts']): 0.333629193623, 
+    frozenset(['8c', 'Td']): 0.333629193623, 
+    frozenset(['8c', 'Th']): 0.333629193623, 
+    frozenset(['8c', 'Tc']): 0.381779774883, 
+    frozenset(['8c', 'Js']): 0.367625551447, 
+    frozenset(['Jd', '8c']): 0.367625551447, 
+    frozenset(['8c', 'Jh']): 0.367625551447, 
+    frozenset(['8c', 'Jc']): 0.414278003657, 
+    frozenset(['8c', 'Qs']): 0.407397333808, 
+    frozenset(['8c', 'Qd']): 0.407397333808, 
+    frozenset(['8c', 'Qh']): 0.407397333808, 
+    frozenset(['8c', 'Qc']): 0.452056782078, 
+    frozenset(['Ks', '8c']): 0.452285661558, 
+    frozenset(['8c', 'Kd']): 0.452285661558, 
+    frozenset(['8c', 'Kh']): 0.452285661558, 
+    frozenset(['Kc', '8c']): 0.494669408217, 
+    frozenset(['8c', 'As']): 0.523046405813, 
+    frozenset(['8c', 'Ad']): 0.523046405813, 
+    frozenset(['8c', 'Ah']): 0.523046405813, 
+    frozenset(['8c', 'Ac']): 0.561345669136, 
+    frozenset(['9s', '9d']): 0.76176378941, 
+    frozenset(['9h', '9s']): 0.76176378941, 
+    frozenset(['9s', '9c']): 0.76176378941, 
+    frozenset(['9s', 'Ts']): 0.415461689611, 
+    frozenset(['9s', 'Td']): 0.369443242719, 
+    frozenset(['9s', 'Th']): 0.369443242719, 
+    frozenset(['9s', 'Tc']): 0.369443242719, 
+    frozenset(['9s', 'Js']): 0.446565868721, 
+    frozenset(['Jd', '9s']): 0.402213832149, 
+    frozenset(['9s', 'Jh']): 0.402213832149, 
+    frozenset(['9s', 'Jc']): 0.402213832149, 
+    frozenset(['9s', 'Qs']): 0.484485242741, 
+    frozenset(['9s', 'Qd']): 0.442157531783, 
+    frozenset(['Qh', '9s']): 0.442157531783, 
+    frozenset(['9s', 'Qc']): 0.442157531783, 
+    frozenset(['Ks', '9s']): 0.527931405321, 
+    frozenset(['9s', 'Kd']): 0.48783188198, 
+    frozenset(['9s', 'Kh']): 0.48783188198, 
+    frozenset(['Kc', '9s']): 0.48783188198, 
+    frozenset(['9s', 'As']): 0.579431900912, 
+    frozenset(['9s', 'Ad']): 0.542412482732, 
+    frozenset(['Ah', '9s']): 0.542412482732, 
+    frozenset(['9s', 'Ac']): 0.542412482732, 
+    frozenset(['9h', '9d']): 0.76176378941, 
+    frozenset(['9c', '9d']): 0.76176378941, 
+    frozenset(['9d', 'Ts']): 0.369443242719, 
+    frozenset(['Td', '9d']): 0.415461689611, 
+    frozenset(['9d', 'Th']): 0.369443242719, 
+    frozenset(['9d', 'Tc']): 0.369443242719, 
+    frozenset(['9d', 'Js']): 0.402213832149, 
+    frozenset(['Jd', '9d']): 0.446565868721, 
+    frozenset(['Jh', '9d']): 0.402213832149, 
+    frozenset(['9d', 'Jc']): 0.402213832149, 
+    frozenset(['Qs', '9d']): 0.442157531783, 
+    frozenset(['9d', 'Qd']): 0.484485242741, 
+    frozenset(['Qh', '9d']): 0.442157531783, 
+    frozenset(['Qc', '9d']): 0.442157531783, 
+    frozenset(['Ks', '9d']): 0.48783188198, 
+    frozenset(['9d', 'Kd']): 0.527931405321, 
+    frozenset(['Kh', '9d']): 0.48783188198, 
+    frozenset(['Kc', '9d']): 0.48783188198, 
+    frozenset(['As', '9d']): 0.542412482732, 
+    frozenset(['9d', 'Ad']): 0.579431900912, 
+    frozenset(['Ah', '9d']): 0.542412482732, 
+    frozenset(['Ac', '9d']): 0.542412482732, 
+    frozenset(['9h', '9c']): 0.76176378941, 
+    frozenset(['9h', 'Ts']): 0.369443242719, 
+    frozenset(['9h', 'Td']): 0.369443242719, 
+    frozenset(['9h', 'Th']): 0.415461689611, 
+    frozenset(['9h', 'Tc']): 0.369443242719, 
+    frozenset(['9h', 'Js']): 0.402213832149, 
+    frozenset(['Jd', '9h']): 0.402213832149, 
+    frozenset(['9h', 'Jh']): 0.446565868721, 
+    frozenset(['9h', 'Jc']): 0.402213832149, 
+    frozenset(['9h', 'Qs']): 0.442157531783, 
+    frozenset(['9h', 'Qd']): 0.442157531783, 
+    frozenset(['9h', 'Qh']): 0.484485242741, 
+    frozenset(['9h', 'Qc']): 0.442157531783, 
+    frozenset(['Ks', '9h']): 0.48783188198, 
+    frozenset(['9h', 'Kd']): 0.48783188198, 
+    frozenset(['9h', 'Kh']): 0.527931405321, 
+    frozenset(['Kc', '9h']): 0.48783188198, 
+    frozenset(['9h', 'As']): 0.542412482732, 
+    frozenset(['9h', 'Ad']): 0.542412482732, 
+    frozenset(['9h', 'Ah']): 0.579431900912, 
+    frozenset(['9h', 'Ac']): 0.542412482732, 
+    frozenset(['9c', 'Ts']): 0.369443242719, 
+    frozenset(['9c', 'Td']): 0.369443242719, 
+    frozenset(['9c', 'Th']): 0.369443242719, 
+    frozenset(['9c', 'Tc']): 0.415461689611, 
+    frozenset(['9c', 'Js']): 0.402213832149, 
+    frozenset(['Jd', '9c']): 0.402213832149, 
+    frozenset(['9c', 'Jh']): 0.402213832149, 
+    frozenset(['9c', 'Jc']): 0.446565868721, 
+    frozenset(['9c', 'Qs']): 0.442157531783, 
+    frozenset(['9c', 'Qd']): 0.442157531783, 
+    frozenset(['Qh', '9c']): 0.442157531783, 
+    frozenset(['9c', 'Qc']): 0.484485242741, 
+    frozenset(['Ks', '9c']): 0.48783188198, 
+    frozenset(['9c', 'Kd']): 0.48783188198, 
+    frozenset(['9c', 'Kh']): 0.48783188198, 
+    frozenset(['Kc', '9c']): 0.527931405321, 
+    frozenset(['9c', 'As']): 0.542412482732, 
+    frozenset(['9c', 'Ad']): 0.542412482732, 
+    frozenset(['Ah', '9c']): 0.542412482732, 
+    frozenset(['9c', 'Ac']): 0.579431900912, 
+    frozenset(['Td', 'Ts']): 0.815611151665, 
+    frozenset(['Ts', 'Th']): 0.815611151665, 
+    frozenset(['Ts', 'Tc']): 0.815611151665, 
+    frozenset(['Ts', 'Js']): 0.483263460482, 
+    frozenset(['Jd', 'Ts']): 0.441490876081, 
+    frozenset(['Jh', 'Ts']): 0.441490876081, 
+    frozenset(['Ts', 'Jc']): 0.441490876081, 
+    frozenset(['Qs', 'Ts']): 0.519419343873, 
+    frozenset(['Ts', 'Qd']): 0.479534064438, 
+    frozenset(['Qh', 'Ts']): 0.479534064438, 
+    frozenset(['Qc', 'Ts']): 0.479534064438, 
+    frozenset(['Ks', 'Ts']): 0.562821545864, 
+    frozenset(['Ts', 'Kd']): 0.525285434995, 
+    frozenset(['Kh', 'Ts']): 0.525285434995, 
+    frozenset(['Kc', 'Ts']): 0.525285434995, 
+    frozenset(['As', 'Ts']): 0.61494590727, 
+    frozenset(['Ts', 'Ad']): 0.580388799209, 
+    frozenset(['Ah', 'Ts']): 0.580388799209, 
+    frozenset(['Ac', 'Ts']): 0.580388799209, 
+    frozenset(['Td', 'Th']): 0.815611151665, 
+    frozenset(['Td', 'Tc']): 0.815611151665, 
+    frozenset(['Td', 'Js']): 0.441490876081, 
+    frozenset(['Jd', 'Td']): 0.483263460482, 
+    frozenset(['Td', 'Jh']): 0.441490876081, 
+    frozenset(['Td', 'Jc']): 0.441490876081, 
+    frozenset(['Td', 'Qs']): 0.479534064438, 
+    frozenset(['Td', 'Qd']): 0.519419343873, 
+    frozenset(['Qh', 'Td']): 0.479534064438, 
+    frozenset(['Td', 'Qc']): 0.479534064438, 
+    frozenset(['Ks', 'Td']): 0.525285434995, 
+    frozenset(['Td', 'Kd']): 0.562821545864, 
+    frozenset(['Td', 'Kh']): 0.525285434995, 
+    frozenset(['Kc', 'Td']): 0.525285434995, 
+    frozenset(['Td', 'As']): 0.580388799209, 
+    frozenset(['Td', 'Ad']): 0.61494590727, 
+    frozenset(['Ah', 'Td']): 0.580388799209, 
+    frozenset(['Td', 'Ac']): 0.580388799209, 
+    frozenset(['Tc', 'Th']): 0.815611151665, 
+    frozenset(['Th', 'Js']): 0.441490876081, 
+    frozenset(['Jd', 'Th']): 0.441490876081, 
+    frozenset(['Jh', 'Th']): 0.483263460482, 
+    frozenset(['Th', 'Jc']): 0.441490876081, 
+    frozenset(['Qs', 'Th']): 0.479534064438, 
+    frozenset(['Qd', 'Th']): 0.479534064438, 
+    frozenset(['Qh', 'Th']): 0.519419343873, 
+    frozenset(['Qc', 'Th']): 0.479534064438, 
+    frozenset(['Ks', 'Th']): 0.525285434995, 
+    frozenset(['Th', 'Kd']): 0.525285434995, 
+    frozenset(['Kh', 'Th']): 0.562821545864, 
+    frozenset(['Kc', 'Th']): 0.525285434995, 
+    frozenset(['As', 'Th']): 0.580388799209, 
+    frozenset(['Ad', 'Th']): 0.580388799209, 
+    frozenset(['Ah', 'Th']): 0.61494590727, 
+    frozenset(['Ac', 'Th']): 0.580388799209, 
+    frozenset(['Tc', 'Js']): 0.441490876081, 
+    frozenset(['Jd', 'Tc']): 0.441490876081, 
+    frozenset(['Jh', 'Tc']): 0.441490876081, 
+    frozenset(['Tc', 'Jc']): 0.483263460482, 
+    frozenset(['Qs', 'Tc']): 0.479534064438, 
+    frozenset(['Tc', 'Qd']): 0.479534064438, 
+    frozenset(['Qh', 'Tc']): 0.479534064438, 
+    frozenset(['Qc', 'Tc']): 0.519419343873, 
+    frozenset(['Ks', 'Tc']): 0.525285434995, 
+    frozenset(['Tc', 'Kd']): 0.525285434995, 
+    frozenset(['Kh', 'Tc']): 0.525285434995, 
+    frozenset(['Kc', 'Tc']): 0.562821545864, 
+    frozenset(['As', 'Tc']): 0.580388799209, 
+    frozenset(['Tc', 'Ad']): 0.580388799209, 
+    frozenset(['Ah', 'Tc']): 0.580388799209, 
+    frozenset(['Ac', 'Tc']): 0.61494590727, 
+    frozenset(['Jd', 'Js']): 0.86036810938, 
+    frozenset(['Jh', 'Js']): 0.86036810938, 
+    frozenset(['Jc', 'Js']): 0.86036810938, 
+    frozenset(['Qs', 'Js']): 0.535596910754, 
+    frozenset(['Qd', 'Js']): 0.496742951807, 
+    frozenset(['Qh', 'Js']): 0.496742951807, 
+    frozenset(['Qc', 'Js']): 0.496742951807, 
+    frozenset(['Ks', 'Js']): 0.578866216487, 
+    frozenset(['Kd', 'Js']): 0.542270951648, 
+    frozenset(['Kh', 'Js']): 0.542270951648, 
+    frozenset(['Kc', 'Js']): 0.542270951648, 
+    frozenset(['As', 'Js']): 0.631277022888, 
+    frozenset(['Ad', 'Js']): 0.597869285918, 
+    frozenset(['Ah', 'Js']): 0.597869285918, 
+    frozenset(['Ac', 'Js']): 0.597869285918, 
+    frozenset(['Jd', 'Jh']): 0.86036810938, 
+    frozenset(['Jd', 'Jc']): 0.86036810938, 
+    frozenset(['Jd', 'Qs']): 0.496742951807, 
+    frozenset(['Jd', 'Qd']): 0.535596910754, 
+    frozenset(['Jd', 'Qh']): 0.496742951807, 
+    frozenset(['Jd', 'Qc']): 0.496742951807, 
+    frozenset(['Jd', 'Ks']): 0.542270951648, 
+    frozenset(['Jd', 'Kd']): 0.578866216487, 
+    frozenset(['Jd', 'Kh']): 0.542270951648, 
+    frozenset(['Jd', 'Kc']): 0.542270951648, 
+    frozenset(['Jd', 'As']): 0.597869285918, 
+    frozenset(['Jd', 'Ad']): 0.631277022888, 
+    frozenset(['Jd', 'Ah']): 0.597869285918, 
+    frozenset(['Jd', 'Ac']): 0.597869285918, 
+    frozenset(['Jh', 'Jc']): 0.86036810938, 
+    frozenset(['Qs', 'Jh']): 0.496742951807, 
+    frozenset(['Jh', 'Qd']): 0.496742951807, 
+    frozenset(['Qh', 'Jh']): 0.535596910754, 
+    frozenset(['Qc', 'Jh']): 0.496742951807, 
+    frozenset(['Ks', 'Jh']): 0.542270951648, 
+    frozenset(['Jh', 'Kd']): 0.542270951648, 
+    frozenset(['Kh', 'Jh']): 0.578866216487, 
+    frozenset(['Kc', 'Jh']): 0.542270951648, 
+    frozenset(['As', 'Jh']): 0.597869285918, 
+    frozenset(['Jh', 'Ad']): 0.597869285918, 
+    frozenset(['Ah', 'Jh']): 0.631277022888, 
+    frozenset(['Ac', 'Jh']): 0.597869285918, 
+    frozenset(['Qs', 'Jc']): 0.496742951807, 
+    frozenset(['Qd', 'Jc']): 0.496742951807, 
+    frozenset(['Qh', 'Jc']): 0.496742951807, 
+    frozenset(['Qc', 'Jc']): 0.535596910754, 
+    frozenset(['Ks', 'Jc']): 0.542270951648, 
+    frozenset(['Kd', 'Jc']): 0.542270951648, 
+    frozenset(['Kh', 'Jc']): 0.542270951648, 
+    frozenset(['Kc', 'Jc']): 0.578866216487, 
+    frozenset(['As', 'Jc']): 0.597869285918, 
+    frozenset(['Ad', 'Jc']): 0.597869285918, 
+    frozenset(['Ah', 'Jc']): 0.597869285918, 
+    frozenset(['Ac', 'Jc']): 0.631277022888, 
+    frozenset(['Qs', 'Qd']): 0.904820386437, 
+    frozenset(['Qh', 'Qs']): 0.904820386437, 
+    frozenset(['Qs', 'Qc']): 0.904820386437, 
+    frozenset(['Ks', 'Qs']): 0.595562093852, 
+    frozenset(['Qs', 'Kd']): 0.560106654929, 
+    frozenset(['Qs', 'Kh']): 0.560106654929, 
+    frozenset(['Kc', 'Qs']): 0.560106654929, 
+    frozenset(['Qs', 'As']): 0.64781616979, 
+    frozenset(['Qs', 'Ad']): 0.615320880341, 
+    frozenset(['Ah', 'Qs']): 0.615320880341, 
+    frozenset(['Qs', 'Ac']): 0.615320880341, 
+    frozenset(['Qh', 'Qd']): 0.904820386437, 
+    frozenset(['Qc', 'Qd']): 0.904820386437, 
+    frozenset(['Ks', 'Qd']): 0.560106654929, 
+    frozenset(['Qd', 'Kd']): 0.595562093852, 
+    frozenset(['Kh', 'Qd']): 0.560106654929, 
+    frozenset(['Kc', 'Qd']): 0.560106654929, 
+    frozenset(['As', 'Qd']): 0.615320880341, 
+    frozenset(['Qd', 'Ad']): 0.64781616979, 
+    frozenset(['Ah', 'Qd']): 0.615320880341, 
+    frozenset(['Ac', 'Qd']): 0.615320880341, 
+    frozenset(['Qh', 'Qc']): 0.904820386437, 
+    frozenset(['Ks', 'Qh']): 0.560106654929, 
+    frozenset(['Qh', 'Kd']): 0.560106654929, 
+    frozenset(['Qh', 'Kh']): 0.595562093852, 
+    frozenset(['Kc', 'Qh']): 0.560106654929, 
+    frozenset(['Qh', 'As']): 0.615320880341, 
+    frozenset(['Qh', 'Ad']): 0.615320880341, 
+    frozenset(['Qh', 'Ah']): 0.64781616979, 
+    frozenset(['Qh', 'Ac']): 0.615320880341, 
+    frozenset(['Ks', 'Qc']): 0.560106654929, 
+    frozenset(['Qc', 'Kd']): 0.560106654929, 
+    frozenset(['Qc', 'Kh']): 0.560106654929, 
+    frozenset(['Kc', 'Qc']): 0.595562093852, 
+    frozenset(['Qc', 'As']): 0.615320880341, 
+    frozenset(['Qc', 'Ad']): 0.615320880341, 
+    frozenset(['Ah', 'Qc']): 0.615320880341, 
+    frozenset(['Qc', 'Ac']): 0.64781616979, 
+    frozenset(['Ks', 'Kd']): 0.949471146013, 
+    frozenset(['Ks', 'Kh']): 0.949471146013, 
+    frozenset(['Ks', 'Kc']): 0.949471146013, 
+    frozenset(['Ks', 'As']): 0.664026782077, 
+    frozenset(['Ks', 'Ad']): 0.632596874807, 
+    frozenset(['Ks', 'Ah']): 0.632596874807, 
+    frozenset(['Ks', 'Ac']): 0.632596874807, 
+    frozenset(['Kh', 'Kd']): 0.949471146013, 
+    frozenset(['Kc', 'Kd']): 0.949471146013, 
+    frozenset(['As', 'Kd']): 0.632596874807, 
+    frozenset(['Ad', 'Kd']): 0.664026782077, 
+    frozenset(['Ah', 'Kd']): 0.632596874807, 
+    frozenset(['Ac', 'Kd']): 0.632596874807, 
+    frozenset(['Kc', 'Kh']): 0.949471146013, 
+    frozenset(['As', 'Kh']): 0.632596874807, 
+    frozenset(['Kh', 'Ad']): 0.632596874807, 
+    frozenset(['Ah', 'Kh']): 0.664026782077, 
+    frozenset(['Ac', 'Kh']): 0.632596874807, 
+    frozenset(['Kc', 'As']): 0.632596874807, 
+    frozenset(['Kc', 'Ad']): 0.632596874807, 
+    frozenset(['Kc', 'Ah']): 0.632596874807, 
+    frozenset(['Kc', 'Ac']): 0.664026782077, 
+    frozenset(['As', 'Ad']): 1.0, 
+    frozenset(['Ah', 'As']): 1.0, 
+    frozenset(['As', 'Ac']): 1.0, 
+    frozenset(['Ah', 'Ad']): 1.0, 
+    frozenset(['Ac', 'Ad']): 1.0, 
+    frozenset(['Ah', 'Ac']): 1.0,
 }
\ No newline at end of file
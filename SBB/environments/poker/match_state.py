@@ -1,75 +1,96 @@
-import re
-import numpy
-from poker_config import PokerConfig
-from ...utils.helpers import round_value
-from ...config import Config
-
-class MatchState():
-
-    INPUTS = ['hand strength', 'effective potential', 'pot odds', 'betting position', 'round', 'chips']
-
-    MAX_BETS = 4
-
-    def __init__(self, point, player_key):
-        self.point = point
-        self.player_key = player_key
-        self.position = point.players[player_key]['position']
-        self.hand_strength = point.players[player_key]['hand_strength']
-        self.effective_potential = point.players[player_key]['effective_potential']
-        self.hole_cards = point.players[player_key]['hole_cards']
-        self.actions = []
-
-    def inputs_for_team(self, pot, bet, chips, round_id):
-        """
-        inputs[0] = hand strength
-        inputs[1] = effective potential
-        inputs[2] = pot odds
-        inputs[3] = betting position (0: first betting, 1: last betting)
-        inputs[4] = round
-        inputs[5] = chips
-        """
-        inputs = [0] * len(MatchState.INPUTS)
-        inputs[0] = self.hand_strength[round_id]
-        inputs[1] = self.effective_potential[round_id]
-        if (pot + bet) > 0:
-            inputs[2] = bet / float(pot + bet)
-        else:
-            inputs[2] = 0.0
-        inputs[3] = float(self._betting_position(round_id))
-        inputs[4] = round_id/3.0
-        inputs[5] = self._calculate_chips_input(chips)
-        normalized_inputs = [round_value(i*Config.RESTRICTIONS['multiply_normalization_by']) for i in inputs[2:]]
-        return inputs[:2]+normalized_inputs
-
-    def inputs_for_rule_based_opponents(self, bet, round_id):
-        inputs = [0] * 2
-        inputs[0] = self.hand_strength[round_id]
-        if round_id == 0 or round_id == 1:
-            bet = bet/float(PokerConfig.CONFIG['small_bet'])
-        else:
-            bet = bet/float(PokerConfig.CONFIG['big_bet'])
-        inputs[1] = round_value(bet*Config.RESTRICTIONS['multiply_normalization_by'])
-        return inputs
-
-    @staticmethod
-    def maximum_winning():
-        max_raises_overall = MatchState.MAX_BETS
-        max_small_bet_turn_winning = PokerConfig.CONFIG['small_bet']*max_raises_overall
-        max_big_bet_turn_winning = PokerConfig.CONFIG['big_bet']*max_raises_overall
-        return max_small_bet_turn_winning*2 + max_big_bet_turn_winning*2
-
-    def _betting_position(self, round_id):
-        if round_id == 0: # reverse blinds
-            if self.position == 0:
-                return 1
-            else:
-                return 0
-        else:
-            return self.position
-
-    def _calculate_chips_input(self, chips):
-        if len(chips) == 0:
-            chips = 0.5
-        else:
-            chips = numpy.mean(chips)
-        return chips
\ No newline at end of file
+import re
+from poker_config import PokerConfig
+from ...utils.helpers import round_value
+from ...config import Config
+
+class MatchState(object):
+    """
+    The cards and the actions of a player during a hand. The same object is reused for the hands 
+    played by a PokerMatch, and reset() sets it for a new hand.
+    """
+
+    INPUTS = ['hand strength', 'effective potential', 'pot odds', 'betting position', 'round', 'chips']
+
+    MAX_BETS = 4
+
+    __slots__ = ['point', 'player_key', 'position', 'hand_strength', 'effective_potential', 'hole_cards', 'actions',
+        'static_inputs']
+
+    def reset(self, point, player_key):
+        self.point = point
+        self.player_key = player_key
+        self.position = point.players[player_key]['position']
+        self.hand_strength = point.players[player_key]['hand_strength']
+        self.effective_potential = point.players[player_key]['effective_potential']
+        self.hole_cards = point.players[player_key]['hole_cards']
+        self.static_inputs = point.players[player_key]['static_inputs']
+        self.actions = []
+
+    def inputs_for_team(self, pot, bet, chips, round_id):
+        """
+        inputs[0] = hand strength
+        inputs[1] = effective potential
+        inputs[2] = pot odds
+        inputs[3] = betting position (0: first betting, 1: last betting)
+        inputs[4] = round
+        inputs[5] = chips
+        Only the pot odds and the chips are calculated for each decision, the other inputs are read from
+        the ones calculated by static_inputs_per_round() when the point was created.
+        """
+        hand_strength, effective_potential, betting_position, round_input = self.static_inputs[round_id]
+        if (pot + bet) > 0:
+            pot_odds = round_value(bet / float(pot + bet)*Config.RESTRICTIONS['multiply_normalization_by'])
+        else:
+            pot_odds = 0.0
+        return [hand_strength, effective_potential, pot_odds, betting_position, round_input,
+            self._calculate_chips_input(chips)]
+
+    @staticmethod
+    def static_inputs_per_round(player):
+        """
+        The inputs for the team that depend only on the point: hand strength, effective potential, and
+        the normalized betting position and round, for each round. player is an item of PokerPoint.players.
+        """
+        multiplier = Config.RESTRICTIONS['multiply_normalization_by']
+        inputs_per_round = []
+        for round_id in range(len(player['hand_strength'])):
+            betting_position = float(MatchState._betting_position(player['position'], round_id))
+            inputs_per_round.append((player['hand_strength'][round_id], player['effective_potential'][round_id],
+                round_value(betting_position*multiplier), round_value(round_id/3.0*multiplier)))
+        return inputs_per_round
+
+    def inputs_for_rule_based_opponents(self, bet, round_id):
+        inputs = [0] * 2
+        inputs[0] = self.hand_strength[round_id]
+        if round_id == 0 or round_id == 1:
+            bet = bet/float(PokerConfig.CONFIG['small_bet'])
+        else:
+            bet = bet/float(PokerConfig.CONFIG['big_bet'])
+        inputs[1] = round_value(bet*Config.RESTRICTIONS['multiply_normalization_by'])
+        return inputs
+
+    @staticmethod
+    def maximum_winning():
+        max_raises_overall = MatchState.MAX_BETS
+        max_small_bet_turn_winning = PokerConfig.CONFIG['small_bet']*max_raises_overall
+        max_big_bet_turn_winning = PokerConfig.CONFIG['big_bet']*max_raises_overall
+        return max_small_bet_turn_winning*2 + max_big_bet_turn_winning*2
+
+    @staticmethod
+    def _betting_position(position, round_id):
+        if round_id == 0: # reverse blinds
+            if position == 0:
+                return 1
+            else:
+                return 0
+        else:
+            return position
+
+    def _calculate_chips_input(self, chips):
+        """
+        The normalized mean of the chips, which is a RunningMean, so it doesn't calculate the mean over all
+        the previous hands.
+        """
+        if len(chips) == 0:
+            return round_value(0.5*Config.RESTRICTIONS['multiply_normalization_by'])
+        return chips.rounded_mean(Config.RESTRICTIONS['multiply_normalization_by'])
\ No newline at end of file
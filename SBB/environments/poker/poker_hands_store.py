@@ -0,0 +1,76 @@
+import os
+import sys
+import json
+import numpy
+
+PLAYER_DTYPE = [
+    ('hc', 'S2', 2), # hole cards
+    ('str', 'f8', 4), # hand strength per round
+    ('ep', 'f8', 4), # effective potential per round
+]
+
+HAND_DTYPE = numpy.dtype([
+    ('id', 'i8'), # seed
+    ('pos', 'i1'), # position of the team
+    ('p', PLAYER_DTYPE), # team
+    ('o', PLAYER_DTYPE), # opponent
+    ('bc', 'S2', 5), # board cards
+])
+
+class PokerHandsStore():
+    """
+    Stores the hands of each label as a fixed-width numpy array (.npy) next to the .json file
+    generated by poker_hand_generator.py. Each row is equivalent to a line of the .json, but the
+    hands are sampled by index from a memory-mapped file, without parsing text. The .npy is created
+    the first time it is used, and created again if the .json file changes.
+    """
+
+    PATH = "SBB/environments/poker/hand_generator/poker_hands/"
+
+    @staticmethod
+    def load(label):
+        json_file = PokerHandsStore.PATH+"hands_type_"+str(label)+".json"
+        store_file = PokerHandsStore.PATH+"hands_type_"+str(label)+".npy"
+        if not os.path.exists(store_file) or os.path.getmtime(store_file) < os.path.getmtime(json_file):
+            PokerHandsStore.convert(json_file, store_file)
+        return numpy.load(store_file, mmap_mode = 'r')
+
+    @staticmethod
+    def convert(json_file, store_file):
+        with open(json_file, 'r') as f:
+            hands = [json.loads(line) for line in f]
+        store = numpy.zeros(len(hands), dtype = HAND_DTYPE)
+        for index, hand in enumerate(hands):
+            store[index] = (hand['id'], hand['pos'], PokerHandsStore._player_to_tuple(hand['p']),
+                PokerHandsStore._player_to_tuple(hand['o']), hand['bc'])
+        temp_file = store_file+"."+str(os.getpid())+".tmp" # per process, since many runs may start at once
+        with open(temp_file, 'wb') as f:
+            numpy.save(f, store)
+        os.rename(temp_file, store_file) # so other runs never load a partially written store
+
+    @staticmethod
+    def _player_to_tuple(player):
+        return (player['hc'], player['str'], player['ep'])
+
+    @staticmethod
+    def hand_info(hand):
+        """
+        Get a row of the store in the same format as the .json lines, as expected by PokerPoint.
+        """
+        info = {}
+        info['id'] = int(hand['id'])
+        info['pos'] = int(hand['pos'])
+        info['p'] = PokerHandsStore._player_info(hand['p'])
+        info['o'] = PokerHandsStore._player_info(hand['o'])
+        info['bc'] = hand['bc'].tolist()
+        return info
+
+    @staticmethod
+    def _player_info(player):
+        return {'hc': player['hc'].tolist(), 'str': player['str'].tolist(), 'ep': player['ep'].tolist()}
+
+if __name__ == "__main__":
+    # converts the hands of all labels, ie.: python -m SBB.environments.poker.poker_hands_store 9
+    for label in range(int(sys.argv[1])):
+        print "converting label "+str(label)+"..."
+        PokerHandsStore.load(label)
@@ -1,369 +1,292 @@
-import os
-from match_state import MatchState
-from poker_config import PokerConfig
-from opponent_model import OpponentModel
-from ...core.diversity_maintenance import DiversityMaintenance
-from ...utils.helpers import round_value
-from ...config import Config
-
-class PokerMatch():
-
-    def __init__(self, team, opponent, point, mode, match_id):
-        self.team = team
-        self.opponent = opponent
-        self.point = point
-        self.mode = mode
-        if mode == Config.RESTRICTIONS['mode']['training']:
-            self.is_training = True
-        else:
-            self.is_training = False
-        self.match_id = match_id
-        self.opponent_indeces = {
-            0: 1,
-            1: 0,
-        }
-        self.players_info = {
-            0: {
-                'player': None,
-                'match_state': None,
-                'key': None,
-                'chips': 0.0,
-                'folded': False,
-            },
-            1: { # dealer/button
-                'player': None,
-                'match_state': None,
-                'key': None,
-                'chips': 0.0,
-                'folded': False,
-            }
-        }
-        self.pot = 0.0
-        self._setup_debug_files()
-
-    def _setup_debug_files(self):
-        if Config.USER['debug']['output_path'] is None:
-            Config.USER['debug']['output_path'] = 'SBB/environments/poker/logs/'
-
-        self.debug_file = None
-        if Config.USER['debug']['enabled']:
-            path = Config.USER['debug']['output_path']+'matches_output/'
-            if not os.path.exists(path):
-                os.makedirs(path)
-            filename = self.mode+"_"+str(self.match_id)+"_"+str(self.team.__repr__())
-            self.debug_file = open(path+filename+'.log','w')
-
-    def run(self):
-        ### Setup helpers
-        if not self.is_training:
-            self.team.extra_metrics_['played_last_hand'] = True
-
-        self.team.encodings_['encoding_custom_info_per_match'].append(str(self.point.seed_))
-        self.team.encodings_['encoding_custom_info_per_match'].append(str(self.point.players['team']['position']))
-
-        self.opponent.initialize(self.point.seed_)
-            
-        ### Setup match
-        if self.point.players['team']['position'] == 0:
-            self.players_info[0]['player'] = self.team
-            self.players_info[0]['match_state'] = MatchState(self.point, player_key = 'team')
-            self.players_info[0]['id'] = self.team.__repr__()
-            self.players_info[0]['key'] = 'team'
-            self.players_info[1]['player'] = self.opponent
-            self.players_info[1]['match_state'] = MatchState(self.point, player_key = 'opponent')
-            self.players_info[1]['id'] = self.opponent.opponent_id
-            self.players_info[1]['key'] = 'opponent'
-            sbb_position = 0
-            opponent_position = 1
-        else:
-            self.players_info[1]['player'] = self.team
-            self.players_info[1]['match_state'] = MatchState(self.point, player_key = 'team')
-            self.players_info[1]['id'] = self.team.__repr__()
-            self.players_info[1]['key'] = 'team'
-            self.players_info[0]['player'] = self.opponent
-            self.players_info[0]['match_state'] = MatchState(self.point, player_key = 'opponent')
-            self.players_info[0]['id'] = self.opponent.opponent_id
-            self.players_info[0]['key'] = 'opponent'
-            sbb_position = 1
-            opponent_position = 0
-
-        if Config.USER['debug']['enabled']:
-            self.debug_file.write("PokerSBB Game: Hold'em Limit\n")
-            self.debug_file.write("Table '"+str(self.match_id)+"' 2-max Seat #2 is the button\n")
-            m = "Seat 1: "+self.players_info[0]['id']+" ("+str(MatchState.maximum_winning())+" chips)"
-            if sbb_position == 0:
-                m += " [SBB]"
-            self.debug_file.write(m+"\n")
-            m = "Seat 2: "+self.players_info[1]['id']+" ("+str(MatchState.maximum_winning())+" chips)"
-            if sbb_position == 1:
-                m += " [SBB]"
-            self.debug_file.write(m+"\n")
-
-        ### Apply blinds (forced bets made before the cards are dealt)
-        # since it is a heads-up, the dealer posts the small blind, and the non-dealer places the big blind
-        # The small blind is usually equal to half of the big blind. 
-        # The big blind is equal to the minimum bet.
-        big_blind = PokerConfig.CONFIG['small_bet']
-        small_blind = big_blind/2.0
-        self.players_info[0]['chips'] -= big_blind
-        self.pot += big_blind
-        self.players_info[1]['chips'] -= small_blind  # dealer/button
-        self.pot += small_blind
-        if Config.USER['debug']['enabled']:
-            self.debug_file.write(self.players_info[1]['id']+": posts small blind "+str(small_blind)+"\n")
-            self.debug_file.write(self.players_info[0]['id']+": posts big blind "+str(big_blind)+"\n")
-
-        ### Starting match
-
-        self.rounds = [[], [], [], []]
-
-        if Config.USER['debug']['enabled']:
-            self.debug_file.write("*** HOLE CARDS ***\n")
-        self.round_id = 0 # preflop
-        result = self._run_poker_round(starter_player_index = 1, initial_bet = small_blind, default_bet = PokerConfig.CONFIG['small_bet'])
-        if result == "next_round":
-            if Config.USER['debug']['enabled']:
-                self.debug_file.write("*** FLOP *** "+str(self.point.board_cards_[:3])+"\n")
-            self.round_id = 1 # flop
-            result = self._run_poker_round(starter_player_index = 0, initial_bet = 0.0, default_bet = PokerConfig.CONFIG['small_bet'])
-        if result == "next_round":
-            if Config.USER['debug']['enabled']:
-                self.debug_file.write("*** TURN *** "+str(self.point.board_cards_[:4])+"\n")
-            self.round_id = 2 # turn
-            result = self._run_poker_round(starter_player_index = 0, initial_bet = 0.0, default_bet = PokerConfig.CONFIG['big_bet'])
-        river_bet = 0.0
-        river_default_bet = PokerConfig.CONFIG['big_bet']
-        river_starter_player_index = 0
-
-        if result == "next_round":
-            if Config.USER['debug']['enabled']:
-                self.debug_file.write("*** RIVER *** "+str(self.point.board_cards_)+"\n")
-            self.round_id = 3 # river
-            result = self._run_poker_round(starter_player_index = river_starter_player_index, initial_bet = river_bet, default_bet = river_default_bet)
-        
-        showdown_happened = False
-        if result == "next_round": # showdown
-            showdown_happened = True
-            if Config.USER['debug']['enabled']:
-                self.debug_file.write("*** SHOW DOWN ***\n")
-                self.debug_file.write(self.players_info[0]['id']+": shows "+str(self.players_info[0]['match_state'].hole_cards)+" (HS: "+str(self.players_info[0]['match_state'].hand_strength[3])+")\n")
-                self.debug_file.write(self.players_info[1]['id']+": shows "+str(self.players_info[1]['match_state'].hole_cards)+" (HS: "+str(self.players_info[1]['match_state'].hand_strength[3])+")\n")
-            player0_hs = self.players_info[0]['match_state'].hand_strength[3]
-            player1_hs = self.players_info[1]['match_state'].hand_strength[3]
-            if player0_hs > player1_hs:
-                self.players_info[0]['chips'] += self.pot
-                if Config.USER['debug']['enabled']:
-                    self.debug_file.write(self.players_info[0]['id']+" collected "+str(self.pot)+" from main pot\n")
-                showdown_winner = 0
-            elif player0_hs < player1_hs:
-                self.players_info[1]['chips'] += self.pot
-                if Config.USER['debug']['enabled']:
-                    self.debug_file.write(self.players_info[1]['id']+" collected "+str(self.pot)+" from main pot\n")
-                showdown_winner = 1
-            else:
-                self.players_info[0]['chips'] += self.pot/2.0
-                self.players_info[1]['chips'] += self.pot/2.0
-                if Config.USER['debug']['enabled']:
-                    self.debug_file.write("Draw! The players shared "+str(self.pot)+" from main pot\n")
-                showdown_winner = -1
-        if result == "player_folded":
-            if Config.USER['debug']['enabled']:
-                if self.players_info[0]['folded']:
-                    last_player = self.players_info[1]['id']
-                else:
-                    last_player = self.players_info[0]['id']
-                self.debug_file.write(last_player+" collected "+str(self.pot)+" from pot\n")
-                self.debug_file.write(last_player+": doesn't show hand\n")
-
-        if Config.USER['debug']['enabled']:
-            self.debug_file.write("*** SUMMARY ***\n")
-            self.debug_file.write("Total pot "+str(self.pot)+" | Rake 0\n")
-            self.debug_file.write("Board "+str(self.point.board_cards_)+"\n")
-            if self.players_info[0]['folded']:
-                status0 = "folded"
-                status1 = "collected "+str(self.pot)
-            elif self.players_info[1]['folded']:
-                status0 = "collected "+str(self.pot)
-                status1 = "folded"
-            elif showdown_winner == 0:
-                status0 = "showed and won "+str(self.pot)
-                status1 = "showed and lost"
-            elif showdown_winner == 1:
-                status0 = "showed and lost"
-                status1 = "showed and won "+str(self.pot)
-            elif showdown_winner == -1:
-                status0 = "showed and won "+str(self.pot/2.0)
-                status1 = "showed and won "+str(self.pot/2.0)
-            else:
-                raise ValueError("Unrecognized game final status.")
-
-            self.debug_file.write("Seat 1: "+self.players_info[0]['id']+" "+status0+"\n")
-            self.debug_file.write("Seat 2: "+self.players_info[1]['id']+" "+status1+"\n")
-
-            self.debug_file.write("\n\n### Point Information: "+str(self.point)+"\n")
-
-        player_actions = self.players_info[sbb_position]['match_state'].actions
-        opponent_actions = self.players_info[opponent_position]['match_state'].actions
-        self._get_opponent_model_for_team().update_overall_agressiveness(self.round_id, player_actions, opponent_actions, self.point.label_, showdown_happened)
-        if self.opponent.opponent_id == 'hall_of_fame':
-            self._get_opponent_model_for_hall_of_fame().update_overall_agressiveness(self.round_id, opponent_actions, player_actions, self.point.label_, showdown_happened)
-
-        if self.team.opponent_id == 'bayesian_opponent' or self.team.opponent_id == 'sbb_bayesian_opponent':
-            self.team.update_opponent_actions(opponent_actions)
-        if self.opponent.opponent_id == 'bayesian_opponent' or self.opponent.opponent_id == 'sbb_bayesian_opponent':
-            self.opponent.update_opponent_actions(player_actions)
-
-        if self.is_training:
-            original_player_actions =  [PokerConfig.CONFIG['inverted_action_mapping'][a] for a in player_actions]
-            if Config.USER['reinforcement_parameters']['environment_parameters']['weights_per_action']:
-                bin_label = DiversityMaintenance.define_bin_for_actions(original_player_actions)
-                self.team.encodings_['encoding_for_pattern_of_actions_per_match'].append(bin_label)
-
-        sbb_chips = self.players_info[sbb_position]['chips']
-        opponent_chips = self.players_info[opponent_position]['chips']
-
-        normalized_value = self._normalize_winning(float(sbb_chips))
-
-        if Config.USER['debug']['enabled']:
-            self.debug_file.write("\n\n### Result Information: ")
-            self.debug_file.write("\nmatch: "+str(self.match_id))
-            self.debug_file.write("\nsbb_chips: "+str(sbb_chips))
-            self.debug_file.write("\nopponent_chips: "+str(opponent_chips))
-            self.debug_file.write("\nnormalized_value: "+str(normalized_value))
-
-        self.point.teams_results_.append(normalized_value)
-
-        self._get_chips_for_team().append(normalized_value)
-        if self.opponent.opponent_id == "hall_of_fame":
-            self._get_chips_for_hall_of_fame().append(self._normalize_winning(float(opponent_chips)))
-
-        if Config.USER['debug']['enabled']:
-            self.debug_file.close()
-
-        return normalized_value
-
-    def _run_poker_round(self, starter_player_index, initial_bet, default_bet):
-        last_action = None
-        current_index = starter_player_index
-        bet = initial_bet
-        last_action_was_a_bet = False
-        while True:
-            opponent_actions = self.players_info[self.opponent_indeces[current_index]]['match_state'].actions
-            action = self._execute_player(self.players_info[current_index]['player'], 
-                self.players_info[current_index]['match_state'], bet, opponent_actions, current_index)
-            self.rounds[self.round_id].append(action)
-
-            if action == 'f':
-                if self.players_info[current_index]['key'] == 'team' and not self.is_training and self.round_id == 0:
-                    self.players_info[current_index]['player'].extra_metrics_['played_last_hand'] = False
-                if Config.USER['debug']['enabled']:
-                    self.debug_file.write(self.players_info[current_index]['id']+": folds (pot: "+str(self.pot)+")\n")
-                self.players_info[self.opponent_indeces[current_index]]['chips'] += self.pot
-                self.players_info[current_index]['folded'] = True
-                return "player_folded"
-            elif action == 'c':
-                self.players_info[current_index]['chips'] -= bet
-                self.pot += bet
-                if Config.USER['debug']['enabled']:
-                    self.debug_file.write(self.players_info[current_index]['id']+": calls "+str(bet)+" (pot: "+str(self.pot)+")\n")
-                bet = 0.0
-                if last_action_was_a_bet:
-                    return "next_round"
-                else:
-                    last_action_was_a_bet = True
-            elif action == 'r':
-                self.players_info[current_index]['chips'] -= bet
-                self.pot += bet
-                bet = default_bet
-                self.players_info[current_index]['chips'] -= bet
-                self.pot += bet
-                if Config.USER['debug']['enabled']:
-                    self.debug_file.write(self.players_info[current_index]['id']+": raises "+str(default_bet)+" (pot: "+str(self.pot)+")\n")
-                last_action_was_a_bet = False
-            else:
-                raise ValueError("Invalid action.")
-
-            current_index = self.opponent_indeces[current_index]
-
-    def _valid_actions(self):
-        valid = [0, 1]
-
-        max_raises_overall = MatchState.MAX_BETS
-
-        # check if can raise
-        if self.round_id == 0:
-            max_raises = max_raises_overall-1
-        else:
-            max_raises = max_raises_overall
-        raises = 0
-        for action in self.rounds[self.round_id]:
-            if action == 'r':
-                raises += 1
-        if raises < max_raises: 
-            valid.append(2)
-        return valid
-
-    def _execute_player(self, player, match_state, bet, opponent_actions, current_index):
-        if match_state.player_key == 'team' and not player.opponent_id == 'bayesian_opponent' and not player.opponent_id == 'bayesian_tester':
-            inputs = match_state.inputs_for_team(self.pot, bet, self._get_chips_for_team(), self.round_id)
-            inputs += self._get_opponent_model_for_team().inputs(match_state.actions, opponent_actions)
-        else:
-            if player.opponent_id == 'hall_of_fame':
-                inputs = match_state.inputs_for_team(self.pot, bet, self._get_chips_for_hall_of_fame(), self.round_id)
-                inputs += self._get_opponent_model_for_hall_of_fame().inputs(match_state.actions, opponent_actions)
-            else:
-                inputs = match_state.inputs_for_rule_based_opponents(bet, self.round_id)
-
-        if Config.USER['debug']['enabled']:
-            if match_state.player_key == 'team' or self.opponent.opponent_id == 'hall_of_fame':
-                self.debug_file.write("    >> registers: "+str([(p.program_id_, [round_value(r, 2) for r in p.general_registers_]) for p in player.programs])+"\n")
-            self.debug_file.write("    >> inputs: "+str(inputs)+"\n")
-        action = player.execute(self.point.point_id_, inputs, self._valid_actions(), self.is_training)
-        if Config.USER['debug']['enabled']:
-            if match_state.player_key == 'team' or self.opponent.opponent_id == 'hall_of_fame':
-                self.debug_file.write("    << program: "+str(player.last_selected_program_)+"\n")
-
-        if action is None:
-            action = 1
-
-        if match_state.player_key == 'team' and self.is_training:
-            player.encodings_['encoding_for_actions_per_match'].append(str(action))
-        
-        action = PokerConfig.CONFIG['action_mapping'][action]
-
-        if match_state.player_key == 'team' and self.is_training:
-            player.encodings_['encoding_custom_info_per_match'].append(str(DiversityMaintenance.define_bin_for_value(match_state.hand_strength[self.round_id], is_normalized = True)))
-            player.encodings_['encoding_custom_info_per_match'].append(str(DiversityMaintenance.define_bin_for_value(match_state.effective_potential[self.round_id], is_normalized = True)))
-            player.encodings_['encoding_custom_info_per_match'].append(str(action))
-
-        match_state.actions.append(action)
-        return action
-
-    def _get_opponent_model_for_team(self):
-        opponent_id = self.opponent.opponent_id
-        if opponent_id not in self.team.opponent_model:
-            self.team.opponent_model[opponent_id] = OpponentModel()
-        return self.team.opponent_model[opponent_id]
-
-    def _get_chips_for_team(self):
-        opponent_id = self.opponent.opponent_id
-        if opponent_id not in self.team.chips:
-            self.team.chips[opponent_id] = []
-        return self.team.chips[opponent_id]
-
-    def _get_opponent_model_for_hall_of_fame(self):
-        opponent_id = self.team.team_id_
-        if opponent_id not in self.opponent.opponent_model:
-            self.opponent.opponent_model[opponent_id] = OpponentModel()
-        return self.opponent.opponent_model[opponent_id]
-
-    def _get_chips_for_hall_of_fame(self):
-        opponent_id = self.team.team_id_
-        if opponent_id not in self.opponent.chips:
-            self.opponent.chips[opponent_id] = []
-        return self.opponent.chips[opponent_id]
-
-    def _normalize_winning(self, value):
-        max_winning = MatchState.maximum_winning()
-        max_losing = -max_winning
-        return (value - max_losing)/float(max_winning - max_losing)
\ No newline at end of file
+from match_state import MatchState
+from poker_config import PokerConfig
+from opponent_model import OpponentModel
+from running_mean import RunningMean
+from poker_match_debug_log import PokerMatchDebugLog
+from ...core.diversity_maintenance import DiversityMaintenance
+from ...config import Config
+
+class PokerPlayerInfo(object):
+    """
+    The state of a player during a hand.
+    """
+
+    __slots__ = ['player', 'match_state', 'key', 'id', 'chips', 'folded']
+
+    def reset(self, player, match_state, key, player_id):
+        self.player = player
+        self.match_state = match_state
+        self.key = key
+        self.id = player_id
+        self.chips = 0.0
+        self.folded = False
+
+class PokerMatch():
+    """
+    Plays hands between a team and an opponent. The same match is reused for all the hands played
+    in the environment, and run() resets its state for each hand. The hand is only written to a log
+    file when debug is enabled, by a PokerMatchDebugLog.
+    """
+
+    VALID_ACTIONS_WITHOUT_RAISE = (0, 1) # tuples, since they are shared by all the decisions
+    VALID_ACTIONS = (0, 1, 2)
+
+    def __init__(self):
+        self.players_info = [PokerPlayerInfo(), PokerPlayerInfo()] # 1: dealer/button
+        self.match_state_for_team_ = MatchState()
+        self.match_state_for_opponent_ = MatchState()
+        self.debug_log_ = None
+
+    def _reset(self, team, opponent, point, mode, match_id):
+        self.team = team
+        self.opponent = opponent
+        self.point = point
+        self.mode = mode
+        if mode == Config.RESTRICTIONS['mode']['training']:
+            self.is_training = True
+        else:
+            self.is_training = False
+        self.match_id = match_id
+        self.pot = 0.0
+        self.round_id = 0
+        self.raises_in_round_ = 0
+        self.match_state_for_team_.reset(point, 'team')
+        self.match_state_for_opponent_.reset(point, 'opponent')
+        if Config.USER['debug']['enabled']:
+            self.debug_log_ = PokerMatchDebugLog(self)
+        else:
+            self.debug_log_ = None
+
+    def run(self, team, opponent, point, mode, match_id):
+        self._reset(team, opponent, point, mode, match_id)
+        debug_log = self.debug_log_
+
+        ### Setup helpers
+        if not self.is_training:
+            self.team.extra_metrics_['played_last_hand'] = True
+
+        self.team.encodings_['encoding_custom_info_per_match'].append(str(self.point.seed_))
+        self.team.encodings_['encoding_custom_info_per_match'].append(str(self.point.players['team']['position']))
+
+        self.opponent.initialize(self.point.seed_)
+
+        ### Setup match
+        if self.point.players['team']['position'] == 0:
+            sbb_position = 0
+            opponent_position = 1
+        else:
+            sbb_position = 1
+            opponent_position = 0
+        self.players_info[sbb_position].reset(self.team, self.match_state_for_team_, 'team', self.team.__repr__())
+        self.players_info[opponent_position].reset(self.opponent, self.match_state_for_opponent_, 'opponent',
+            self.opponent.opponent_id)
+
+        if debug_log:
+            debug_log.start(sbb_position)
+
+        ### Apply blinds (forced bets made before the cards are dealt)
+        # since it is a heads-up, the dealer posts the small blind, and the non-dealer places the big blind
+        # The small blind is usually equal to half of the big blind.
+        # The big blind is equal to the minimum bet.
+        big_blind = PokerConfig.CONFIG['small_bet']
+        small_blind = big_blind/2.0
+        self.players_info[0].chips -= big_blind
+        self.pot += big_blind
+        self.players_info[1].chips -= small_blind  # dealer/button
+        self.pot += small_blind
+        if debug_log:
+            debug_log.blinds(small_blind, big_blind)
+
+        ### Starting match
+
+        if debug_log:
+            debug_log.write("*** HOLE CARDS ***")
+        result = self._run_poker_round(0, starter_player_index = 1, initial_bet = small_blind, default_bet = PokerConfig.CONFIG['small_bet']) # preflop
+        if result == "next_round":
+            if debug_log:
+                debug_log.write("*** FLOP *** "+str(self.point.board_cards_[:3]))
+            result = self._run_poker_round(1, starter_player_index = 0, initial_bet = 0.0, default_bet = PokerConfig.CONFIG['small_bet'])
+        if result == "next_round":
+            if debug_log:
+                debug_log.write("*** TURN *** "+str(self.point.board_cards_[:4]))
+            result = self._run_poker_round(2, starter_player_index = 0, initial_bet = 0.0, default_bet = PokerConfig.CONFIG['big_bet'])
+        if result == "next_round":
+            if debug_log:
+                debug_log.write("*** RIVER *** "+str(self.point.board_cards_))
+            result = self._run_poker_round(3, starter_player_index = 0, initial_bet = 0.0, default_bet = PokerConfig.CONFIG['big_bet'])
+
+        showdown_happened = False
+        showdown_winner = None
+        if result == "next_round": # showdown
+            showdown_happened = True
+            player0_hs = self.players_info[0].match_state.hand_strength[3]
+            player1_hs = self.players_info[1].match_state.hand_strength[3]
+            if player0_hs > player1_hs:
+                self.players_info[0].chips += self.pot
+                showdown_winner = 0
+            elif player0_hs < player1_hs:
+                self.players_info[1].chips += self.pot
+                showdown_winner = 1
+            else:
+                self.players_info[0].chips += self.pot/2.0
+                self.players_info[1].chips += self.pot/2.0
+                showdown_winner = -1
+            if debug_log:
+                debug_log.showdown(showdown_winner)
+        if result == "player_folded":
+            if debug_log:
+                debug_log.folded()
+
+        if debug_log:
+            debug_log.summary(showdown_winner)
+
+        player_actions = self.players_info[sbb_position].match_state.actions
+        opponent_actions = self.players_info[opponent_position].match_state.actions
+        self._get_opponent_model_for_team().update_overall_agressiveness(self.round_id, player_actions, opponent_actions, self.point.label_, showdown_happened)
+        if self.opponent.opponent_id == 'hall_of_fame':
+            self._get_opponent_model_for_hall_of_fame().update_overall_agressiveness(self.round_id, opponent_actions, player_actions, self.point.label_, showdown_happened)
+
+        if self.team.opponent_id == 'bayesian_opponent' or self.team.opponent_id == 'sbb_bayesian_opponent':
+            self.team.update_opponent_actions(opponent_actions)
+        if self.opponent.opponent_id == 'bayesian_opponent' or self.opponent.opponent_id == 'sbb_bayesian_opponent':
+            self.opponent.update_opponent_actions(player_actions)
+
+        if self.is_training:
+            original_player_actions =  [PokerConfig.CONFIG['inverted_action_mapping'][a] for a in player_actions]
+            if Config.USER['reinforcement_parameters']['environment_parameters']['weights_per_action']:
+                bin_label = DiversityMaintenance.define_bin_for_actions(original_player_actions)
+                self.team.encodings_['encoding_for_pattern_of_actions_per_match'].append(bin_label)
+
+        sbb_chips = self.players_info[sbb_position].chips
+        opponent_chips = self.players_info[opponent_position].chips
+
+        normalized_value = self._normalize_winning(float(sbb_chips))
+
+        self.point.teams_results_.append(normalized_value)
+
+        self._get_chips_for_team().append(normalized_value)
+        if self.opponent.opponent_id == "hall_of_fame":
+            self._get_chips_for_hall_of_fame().append(self._normalize_winning(float(opponent_chips)))
+
+        if debug_log:
+            debug_log.result(sbb_chips, opponent_chips, normalized_value)
+            self.debug_log_ = None
+
+        return normalized_value
+
+    def _run_poker_round(self, round_id, starter_player_index, initial_bet, default_bet):
+        self.round_id = round_id
+        self.raises_in_round_ = 0
+        current_index = starter_player_index
+        bet = initial_bet
+        last_action_was_a_bet = False
+        while True:
+            player_info = self.players_info[current_index]
+            opponent_info = self.players_info[1-current_index]
+            action = self._execute_player(player_info.player, player_info.match_state, bet,
+                opponent_info.match_state.actions)
+
+            if action == 'f':
+                if player_info.key == 'team' and not self.is_training and round_id == 0:
+                    player_info.player.extra_metrics_['played_last_hand'] = False
+                if self.debug_log_:
+                    self.debug_log_.action(player_info, "folds")
+                opponent_info.chips += self.pot
+                player_info.folded = True
+                return "player_folded"
+            elif action == 'c':
+                player_info.chips -= bet
+                self.pot += bet
+                if self.debug_log_:
+                    self.debug_log_.action(player_info, "calls "+str(bet))
+                bet = 0.0
+                if last_action_was_a_bet:
+                    return "next_round"
+                else:
+                    last_action_was_a_bet = True
+            elif action == 'r':
+                self.raises_in_round_ += 1
+                player_info.chips -= bet
+                self.pot += bet
+                bet = default_bet
+                player_info.chips -= bet
+                self.pot += bet
+                if self.debug_log_:
+                    self.debug_log_.action(player_info, "raises "+str(default_bet))
+                last_action_was_a_bet = False
+            else:
+                raise ValueError("Invalid action.")
+
+            current_index = 1-current_index
+
+    def _valid_actions(self):
+        # check if can raise
+        if self.round_id == 0:
+            max_raises = MatchState.MAX_BETS-1
+        else:
+            max_raises = MatchState.MAX_BETS
+        if self.raises_in_round_ < max_raises:
+            return PokerMatch.VALID_ACTIONS
+        return PokerMatch.VALID_ACTIONS_WITHOUT_RAISE
+
+    def _execute_player(self, player, match_state, bet, opponent_actions):
+        if match_state.player_key == 'team' and not player.opponent_id == 'bayesian_opponent' and not player.opponent_id == 'bayesian_tester':
+            inputs = match_state.inputs_for_team(self.pot, bet, self._get_chips_for_team(), self.round_id)
+            inputs += self._get_opponent_model_for_team().inputs(match_state.actions, opponent_actions)
+        else:
+            if player.opponent_id == 'hall_of_fame':
+                inputs = match_state.inputs_for_team(self.pot, bet, self._get_chips_for_hall_of_fame(), self.round_id)
+                inputs += self._get_opponent_model_for_hall_of_fame().inputs(match_state.actions, opponent_actions)
+            else:
+                inputs = match_state.inputs_for_rule_based_opponents(bet, self.round_id)
+
+        if self.debug_log_:
+            self.debug_log_.inputs(player, match_state, inputs)
+        action = player.execute(self.point.point_id_, inputs, self._valid_actions(), self.is_training)
+        if self.debug_log_:
+            self.debug_log_.selected_program(player, match_state)
+
+        if action is None:
+            action = 1
+
+        if match_state.player_key == 'team' and self.is_training:
+            player.encodings_['encoding_for_actions_per_match'].append(str(action))
+
+        action = PokerConfig.CONFIG['action_mapping'][action]
+
+        if match_state.player_key == 'team' and self.is_training:
+            player.encodings_['encoding_custom_info_per_match'].append(str(DiversityMaintenance.define_bin_for_value(match_state.hand_strength[self.round_id], is_normalized = True)))
+            player.encodings_['encoding_custom_info_per_match'].append(str(DiversityMaintenance.define_bin_for_value(match_state.effective_potential[self.round_id], is_normalized = True)))
+            player.encodings_['encoding_custom_info_per_match'].append(str(action))
+
+        match_state.actions.append(action)
+        return action
+
+    def _get_opponent_model_for_team(self):
+        opponent_id = self.opponent.opponent_id
+        if opponent_id not in self.team.opponent_model:
+            self.team.opponent_model[opponent_id] = OpponentModel()
+        return self.team.opponent_model[opponent_id]
+
+    def _get_chips_for_team(self):
+        opponent_id = self.opponent.opponent_id
+        if opponent_id not in self.team.chips:
+            self.team.chips[opponent_id] = RunningMean()
+        return self.team.chips[opponent_id]
+
+    def _get_opponent_model_for_hall_of_fame(self):
+        opponent_id = self.team.team_id_
+        if opponent_id not in self.opponent.opponent_model:
+            self.opponent.opponent_model[opponent_id] = OpponentModel()
+        return self.opponent.opponent_model[opponent_id]
+
+    def _get_chips_for_hall_of_fame(self):
+        opponent_id = self.team.team_id_
+        if opponent_id not in self.opponent.chips:
+            self.opponent.chips[opponent_id] = RunningMean()
+        return self.opponent.chips[opponent_id]
+
+    def _normalize_winning(self, value):
+        max_winning = MatchState.maximum_winning()
+        max_losing = -max_winning
+        return (value - max_losing)/float(max_winning - max_losing)
@@ -0,0 +1,107 @@
+import os
+from match_state import MatchState
+from ...utils.helpers import round_value
+from ...config import Config
+
+class PokerMatchDebugLog():
+    """
+    Writes the hand played by a PokerMatch in a log file, using a format similar to the hand histories
+    of the poker sites. It is only created when debug is enabled, so the match doesn't build the
+    messages otherwise.
+    """
+
+    def __init__(self, match):
+        self.match = match
+        if Config.USER['debug']['output_path'] is None:
+            Config.USER['debug']['output_path'] = 'SBB/environments/poker/logs/'
+        path = Config.USER['debug']['output_path']+'matches_output/'
+        if not os.path.exists(path):
+            os.makedirs(path)
+        filename = match.mode+"_"+str(match.match_id)+"_"+str(match.team.__repr__())
+        self.file = open(path+filename+'.log','w')
+
+    def write(self, message):
+        self.file.write(message+"\n")
+
+    def start(self, sbb_position):
+        players_info = self.match.players_info
+        self.write("PokerSBB Game: Hold'em Limit")
+        self.write("Table '"+str(self.match.match_id)+"' 2-max Seat #2 is the button")
+        for index in [0, 1]:
+            m = "Seat "+str(index+1)+": "+players_info[index].id+" ("+str(MatchState.maximum_winning())+" chips)"
+            if sbb_position == index:
+                m += " [SBB]"
+            self.write(m)
+
+    def blinds(self, small_blind, big_blind):
+        self.write(self.match.players_info[1].id+": posts small blind "+str(small_blind))
+        self.write(self.match.players_info[0].id+": posts big blind "+str(big_blind))
+
+    def action(self, player_info, message):
+        self.write(player_info.id+": "+message+" (pot: "+str(self.match.pot)+")")
+
+    def inputs(self, player, match_state, inputs):
+        if match_state.player_key == 'team' or self.match.opponent.opponent_id == 'hall_of_fame':
+            self.write("    >> registers: "+str([(p.program_id_, [round_value(r, 2) for r in p.general_registers_])
+                for p in player.programs]))
+        self.write("    >> inputs: "+str(inputs))
+
+    def selected_program(self, player, match_state):
+        if match_state.player_key == 'team' or self.match.opponent.opponent_id == 'hall_of_fame':
+            self.write("    << program: "+str(player.last_selected_program_))
+
+    def showdown(self, showdown_winner):
+        players_info = self.match.players_info
+        pot = self.match.pot
+        self.write("*** SHOW DOWN ***")
+        for player_info in players_info:
+            self.write(player_info.id+": shows "+str(player_info.match_state.hole_cards)+" (HS: "
+                +str(player_info.match_state.hand_strength[3])+")")
+        if showdown_winner == -1:
+            self.write("Draw! The players shared "+str(pot)+" from main pot")
+        else:
+            self.write(players_info[showdown_winner].id+" collected "+str(pot)+" from main pot")
+
+    def folded(self):
+        players_info = self.match.players_info
+        if players_info[0].folded:
+            last_player = players_info[1].id
+        else:
+            last_player = players_info[0].id
+        self.write(last_player+" collected "+str(self.match.pot)+" from pot")
+        self.write(last_player+": doesn't show hand")
+
+    def summary(self, showdown_winner):
+        players_info = self.match.players_info
+        pot = self.match.pot
+        self.write("*** SUMMARY ***")
+        self.write("Total pot "+str(pot)+" | Rake 0")
+        self.write("Board "+str(self.match.point.board_cards_))
+        if players_info[0].folded:
+            status0 = "folded"
+            status1 = "collected "+str(pot)
+        elif players_info[1].folded:
+            status0 = "collected "+str(pot)
+            status1 = "folded"
+        elif showdown_winner == 0:
+            status0 = "showed and won "+str(pot)
+            status1 = "showed and lost"
+        elif showdown_winner == 1:
+            status0 = "showed and lost"
+            status1 = "showed and won "+str(pot)
+        elif showdown_winner == -1:
+            status0 = "showed and won "+str(pot/2.0)
+            status1 = "showed and won "+str(pot/2.0)
+        else:
+            raise ValueError("Unrecognized game final status.")
+        self.write("Seat 1: "+players_info[0].id+" "+status0)
+        self.write("Seat 2: "+players_info[1].id+" "+status1)
+        self.write("\n\n### Point Information: "+str(self.match.point))
+
+    def result(self, sbb_chips, opponent_chips, normalized_value):
+        self.file.write("\n\n### Result Information: ")
+        self.file.write("\nmatch: "+str(self.match.match_id))
+        self.file.write("\nsbb_chips: "+str(sbb_chips))
+        self.file.write("\nopponent_chips: "+str(opponent_chips))
+        self.file.write("\nnormalized_value: "+str(normalized_value))
+        self.file.close()
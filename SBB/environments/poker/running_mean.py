@@ -0,0 +1,67 @@
+import numpy
+from ...utils.helpers import round_value
+
+class RunningMean(object):
+    """
+    The running sum and count of a history of non-negative values, so their mean costs O(1) instead of
+    calling numpy.mean over the whole history. It also keeps the mean of the first short_term_size
+    values, which doesn't change after them.
+
+    The running sum adds the values in order, while numpy adds them pairwise, so the means may differ
+    in the last bits. rounded_mean() gets the same value as round_value(numpy.mean(values)*multiplier):
+    if a difference within the error bound of both sums could change the rounded value, the mean is
+    calculated again with numpy, so the values are also kept, but only for this fallback. If all values
+    are multiples of 1/1024 (ie. 0.0 and 1.0), the sums are exact in any order, so the running mean is
+    always equal to numpy.mean. The rounded mean is kept until the next value is added, since it is used
+    by all the decisions of a hand.
+    """
+
+    EPSILON = numpy.finfo(float).eps
+
+    def __init__(self, short_term_size = 0):
+        self.sum_ = 0.0
+        self.count_ = 0
+        self.exact_ = True
+        self.values_ = []
+        self.short_term_size_ = short_term_size
+        self.short_term_mean_ = None
+        self.rounded_mean_ = None # (multiplier, value)
+
+    def __len__(self):
+        return self.count_
+
+    def __copy__(self):
+        copied = RunningMean.__new__(RunningMean)
+        copied.__dict__.update(self.__dict__)
+        copied.values_ = list(self.values_) # so appending to the copy doesn't change this one
+        return copied
+
+    def append(self, value):
+        self.values_.append(value)
+        self.sum_ += value
+        self.count_ += 1
+        self.rounded_mean_ = None
+        if self.exact_ and not float(value*1024.0).is_integer():
+            self.exact_ = False
+        if self.count_ <= self.short_term_size_:
+            self.short_term_mean_ = numpy.mean(self.values_)
+
+    def short_term_mean(self):
+        """
+        The mean of the first short_term_size values, or None if there are no values.
+        """
+        return self.short_term_mean_
+
+    def rounded_mean(self, multiplier):
+        if self.rounded_mean_ is None or self.rounded_mean_[0] != multiplier:
+            self.rounded_mean_ = (multiplier, self._rounded_mean(multiplier))
+        return self.rounded_mean_[1]
+
+    def _rounded_mean(self, multiplier):
+        mean = self.sum_/self.count_
+        value = round_value(mean*multiplier)
+        if not self.exact_:
+            error = 4*(self.count_+20)*RunningMean.EPSILON*self.sum_/self.count_
+            if round_value((mean-error)*multiplier) != value or round_value((mean+error)*multiplier) != value:
+                return round_value(numpy.mean(self.values_)*multiplier)
+        return value
@@ -4,7 +4,10 @@ import copy
 import numpy
 from collections import defaultdict
 from default_environment import DefaultEnvironment, DefaultPoint, reset_points_ids
+from parallel_evaluation import evaluate_teams
 from ..core.team import Team
+from ..core.results_matrix import ResultsMatrix
+from ..core.distances_cache import DistancesCache
 from ..core.diversity_maintenance import DiversityMaintenance
 from ..core.pareto_dominance_for_teams import ParetoDominanceForTeams
 from ..utils.helpers import round_value, flatten, accumulative_performances, rank_teams_by_accumulative_score
@@ -123,6 +126,9 @@ class ReinforcementEnvironment(DefaultEnvironment):
         reset_points_ids()
         self._initialize_opponent_population()
         self.point_population_ = []
+        self.results_matrix_ = ResultsMatrix()
+        self.distances_cache_ = DistancesCache()
+        self.hall_of_fame_distances_cache_ = DistancesCache()
         self.team_to_add_to_hall_of_fame_ = None
         self.validation_point_population_ = self._initialize_random_population_of_points(Config.USER['reinforcement_parameters']['validation_population'], ignore_cache = True)
         if Config.USER['reinforcement_parameters']['hall_of_fame']['opponents'] > 0:
@@ -199,7 +205,7 @@ class ReinforcementEnvironment(DefaultEnvironment):
                 if len(hall_of_fame) > Config.USER['reinforcement_parameters']['hall_of_fame']['size']:
                     if Config.USER['reinforcement_parameters']['hall_of_fame']['diversity']:
                         novelty = Config.USER['reinforcement_parameters']['hall_of_fame']['diversity']
-                        DiversityMaintenance.calculate_diversities_based_on_distances(hall_of_fame, k = Config.USER['reinforcement_parameters']['hall_of_fame']['size'], distances = [novelty])
+                        DiversityMaintenance.calculate_diversities_based_on_distances(hall_of_fame, k = Config.USER['reinforcement_parameters']['hall_of_fame']['size'], distances = [novelty], distances_cache = self.hall_of_fame_distances_cache_)
                         keep_teams, remove_teams, pareto_front = ParetoDominanceForTeams.run(hall_of_fame, novelty, Config.USER['reinforcement_parameters']['hall_of_fame']['size'])
                         removed_point = [p for p in hall_of_fame if p == remove_teams[0]]
                         worst_point = removed_point[0]
@@ -227,6 +233,7 @@ class ReinforcementEnvironment(DefaultEnvironment):
             for point in points_to_remove:
                 if point.point_id_ in team.results_per_points_:
                     team.results_per_points_.pop(point.point_id_)
+        self.results_matrix_.remove_points([point.point_id_ for point in points_to_remove])
 
     def evaluate_point_population(self, teams_population):
         """
@@ -251,7 +258,7 @@ class ReinforcementEnvironment(DefaultEnvironment):
         for subset, points_to_add in zip(current_subsets_per_class, points_to_add_per_label):
             subset.sort(key=lambda x: x.age_, reverse=True)
             remove_solutions = subset[:samples_per_class_to_remove]
-            keep_solutions = list(set(subset) - set(remove_solutions))
+            keep_solutions = subset[samples_per_class_to_remove:]
             kept_subsets_per_class.append(keep_solutions)
             removed_subsets_per_class.append(remove_solutions)
 
@@ -281,7 +288,7 @@ class ReinforcementEnvironment(DefaultEnvironment):
             team.encodings_['encoding_for_pattern_of_actions_per_match'] = []
             team.encodings_['encoding_for_actions_per_match'] = []
             team.encodings_['encoding_custom_info_per_match'] = []
-            self.evaluate_team(team, Config.RESTRICTIONS['mode']['training'])
+        evaluate_teams(self, teams_population, Config.RESTRICTIONS['mode']['training'])
         if Config.USER['reinforcement_parameters']['hall_of_fame']['enabled']:
             sorted_teams = sorted(teams_population, key=lambda team: team.fitness_, reverse = True) # better ones first
             team_ids = [p.team_id_ for p in self.opponent_population_['hall_of_fame']]
@@ -321,6 +328,7 @@ class ReinforcementEnvironment(DefaultEnvironment):
                 extra_metrics_opponents[key] = round_value(numpy.mean(extra_metrics_opponents[key]))
             team.extra_metrics_['training_opponents'] = extra_metrics_opponents
             team.fitness_ = numpy.mean(results)
+            self.results_matrix_.set_results(team, [point.point_id_ for point, _ in zip(point_population, opponent_population)], results)
         else:
             if mode == Config.RESTRICTIONS['mode']['validation']:
                 point_population = self.validation_point_population_
@@ -361,6 +369,29 @@ class ReinforcementEnvironment(DefaultEnvironment):
             team.extra_metrics_['points'] = extra_metrics_points
             team.score_testset_ = numpy.mean(results)
 
+    def can_evaluate_teams_in_parallel(self, mode):
+        """
+        The hall of fame teams keep their registers between matches, so when they are opponents 
+        the result of a team depends on the teams that played before it.
+        """
+        if (mode == Config.RESTRICTIONS['mode']['training'] 
+                and Config.USER['reinforcement_parameters']['hall_of_fame']['opponents'] > 0):
+            return False
+        return super(ReinforcementEnvironment, self).can_evaluate_teams_in_parallel(mode)
+
+    def evaluate_team_in_worker(self, team, mode):
+        results = super(ReinforcementEnvironment, self).evaluate_team_in_worker(team, mode)
+        results['encodings'] = team.encodings_ # the matches also add info to the encodings outside of training
+        if mode == Config.RESTRICTIONS['mode']['training']:
+            results['training_opponents'] = team.extra_metrics_['training_opponents']
+        return results
+
+    def apply_parallel_evaluation_results(self, team, mode, results):
+        super(ReinforcementEnvironment, self).apply_parallel_evaluation_results(team, mode, results)
+        team.encodings_ = results['encodings']
+        if mode == Config.RESTRICTIONS['mode']['training']:
+            team.extra_metrics_['training_opponents'] = results['training_opponents']
+
     def _initialize_extra_metrics_for_points(self):
         return {}
 
@@ -369,16 +400,17 @@ class ReinforcementEnvironment(DefaultEnvironment):
 
     def validate(self, current_generation, teams_population):
         print "\nvalidating all..."
-        for team in teams_population:
-            if team.generation != current_generation: # dont evaluate teams that have just being created (to improve performance and to get training metrics)
-                team.results_per_points_for_validation_ = {}
-                self.evaluate_team(team, Config.RESTRICTIONS['mode']['validation'])
-                team.extra_metrics_['validation_score'] = round_value(team.score_testset_)
-                team.extra_metrics_['validation_opponents'] = team.extra_metrics_['opponents']
-                team.extra_metrics_['validation_points'] = team.extra_metrics_['points']
-                team.extra_metrics_.pop('champion_score', None)
-                team.extra_metrics_.pop('champion_opponents', None)
-                team.extra_metrics_.pop('champion_points', None)
+        older_teams = [team for team in teams_population if team.generation != current_generation] # dont evaluate teams that have just being created (to improve performance and to get training metrics)
+        for team in older_teams:
+            team.results_per_points_for_validation_ = {}
+        evaluate_teams(self, older_teams, Config.RESTRICTIONS['mode']['validation'])
+        for team in older_teams:
+            team.extra_metrics_['validation_score'] = round_value(team.score_testset_)
+            team.extra_metrics_['validation_opponents'] = team.extra_metrics_['opponents']
+            team.extra_metrics_['validation_points'] = team.extra_metrics_['points']
+            team.extra_metrics_.pop('champion_score', None)
+            team.extra_metrics_.pop('champion_opponents', None)
+            team.extra_metrics_.pop('champion_points', None)
         score = [p.score_testset_ for p in teams_population]
         best_team = teams_population[score.index(max(score))]
         print "\nvalidating champion..."
@@ -444,19 +476,19 @@ class ReinforcementEnvironment(DefaultEnvironment):
                 msg += ("\n\nscore per opponent (except hall of fame) (champion): "
                     ""+str(team.extra_metrics_['champion_score']))
                 total_opponents = Config.USER['reinforcement_parameters']['environment_parameters']['validation_opponents_labels']+['hall_of_fame']
-                for key in team.extra_metrics_['opponents']:
+                for key in sorted(team.extra_metrics_['opponents']):
                     if key in total_opponents:
                         msg += "\n"+key+": "+str(team.extra_metrics_['champion_opponents'][key])
 
             if 'validation_score' in team.extra_metrics_:
                 msg += "\n\nscore per opponent (validation): "+str(team.extra_metrics_['validation_score'])
-                for key in team.extra_metrics_['validation_opponents']:
+                for key in sorted(team.extra_metrics_['validation_opponents']):
                     msg += "\n"+key+": "+str(team.extra_metrics_['validation_opponents'][key])
                     
             if 'training_opponents' in team.extra_metrics_:
                 msg += "\n\nscore per opponent (training): "+str(round_value(team.fitness_))
                 total_opponents = Config.USER['reinforcement_parameters']['environment_parameters']['training_opponents_labels']+['hall_of_fame']
-                for key in team.extra_metrics_['training_opponents']:
+                for key in sorted(team.extra_metrics_['training_opponents']):
                     if key in total_opponents:
                         msg += "\n"+key+": "+str(team.extra_metrics_['training_opponents'][key])
         return msg
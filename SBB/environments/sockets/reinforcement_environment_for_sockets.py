@@ -121,6 +121,9 @@ class ReinforcementEnvironmentForSockets(ReinforcementEnvironment):
                 raise ValueError("Unexpected value for 'message_type'")
         return result
 
+    def can_evaluate_teams_in_parallel(self, mode):
+        return False # all matches are played through the same connection
+
     def _request(self, mode, match_id, message_type, args = {}, response = None):
         if Config.USER['debug']['enabled']:
             print "\nrequest type: "+message_type+", mode: "+str(mode)+", match_id: "+str(match_id)+"\n"
@@ -71,6 +71,8 @@ TEST_CONFIG = {
         'diversity': {
             'metrics': [],
             'k': 10,
+            'ncd_compressor': 'bz2',
+            'ncd_compression_level': 9,
         },
         "novelty": {
             "enabled": False,
@@ -78,6 +80,7 @@ TEST_CONFIG = {
         },
         'use_weighted_probability_selection': False, 
         'use_agressive_mutations': True,
+        'processes': 1,
         'second_layer': {
             'enabled': False,
             'path': 'actions_reference/baseline3_without_bayes/run[run_id]/second_layer_files/top10_overall/actions.json',
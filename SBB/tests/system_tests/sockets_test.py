@@ -77,6 +77,8 @@ TEST_CONFIG = {
         'diversity': {
             'metrics': [],
             'k': 8,
+            'ncd_compressor': 'bz2',
+            'ncd_compression_level': 9,
         },
         'novelty': {
             'enabled': False,
@@ -84,6 +86,7 @@ TEST_CONFIG = {
         },
         'use_weighted_probability_selection': False, 
         'use_agressive_mutations': False,
+        'processes': 1,
         'second_layer': {
             'enabled': False,
             'path': 'actions_reference/ttt-test/run[run_id]/second_layer_files/hall_of_fame/actions.json',
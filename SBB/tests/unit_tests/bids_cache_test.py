@@ -0,0 +1,88 @@
+import unittest
+import random
+import numpy
+from ...core.bids_cache import BidsCache
+from ...core.program import Program
+from ...core.instruction import Instruction
+from ...config import Config
+
+TEST_CONFIG = {
+    'task': 'classification',
+    'advanced_training_parameters': {
+        'processes': 1,
+        'use_operations': ['+', '-', '*', '/', 'ln', 'exp', 'cos', 'sin', 'if_lesser_than',
+            'if_equal_or_higher_than', 'if_lesser_than_for_signal', 'if_equal_or_higher_than_for_signal'],
+    },
+}
+
+class DummyTeam:
+    def __init__(self, programs, memory_actions_per_points):
+        self.programs = programs
+        self.memory_actions_per_points_ = memory_actions_per_points
+
+class BidsCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.user_config_ = Config.USER
+        self.total_registers_ = Config.RESTRICTIONS['genotype_options']['total_registers']
+        self.total_inputs_ = Config.RESTRICTIONS['total_inputs']
+        self.use_memmory_for_actions_ = Config.RESTRICTIONS['use_memmory_for_actions']
+        Config.USER = TEST_CONFIG
+        Config.RESTRICTIONS['genotype_options']['total_registers'] = 3
+        Config.RESTRICTIONS['total_inputs'] = 4
+        random.seed(1)
+
+    def tearDown(self):
+        Config.USER = self.user_config_
+        Config.RESTRICTIONS['genotype_options']['total_registers'] = self.total_registers_
+        Config.RESTRICTIONS['total_inputs'] = self.total_inputs_
+        Config.RESTRICTIONS['use_memmory_for_actions'] = self.use_memmory_for_actions_
+
+    def test_cached_bids_are_the_same_as_executed_bids(self):
+        """ Ensures the cache returns the bids of the programs, and only executes them on misses """
+        inputs_matrix = numpy.array([[random.uniform(-10.0, 10.0) for _ in range(4)] for _ in range(10)], order = 'F')
+        point_ids = range(10)
+        programs = [Program(0, [Instruction() for _ in range(random.randint(1, 30))], 0, program_id = 1) 
+            for _ in range(20)]
+        cache = BidsCache()
+        for program in programs:
+            expected = [program.execute(inputs) for inputs in inputs_matrix]
+            self.assertEqual(expected, list(cache.bids_for_arrays(program, point_ids[:5], inputs_matrix[:5]))
+                + [cache.bid(program, point_id, inputs_matrix[point_id]) for point_id in point_ids[5:]])
+            self.assertEqual(expected, list(cache.bids_for_arrays(program, point_ids, inputs_matrix)))
+        self.assertEqual({'hits': 200, 'misses': 200, 'hit_rate': 0.5}, cache.metrics())
+
+    def test_removed_points_and_programs_are_evicted(self):
+        cache = BidsCache()
+        program = Program(0, [Instruction(mode = 'read-input', target = 0, op = '+', source = 0)], 0, program_id = 1)
+        cache.bid(program, 0, [1.0, 2.0, 3.0, 4.0])
+        cache.bid(program, 1, [2.0, 2.0, 3.0, 4.0])
+        cache.remove_points([0])
+        self.assertEqual({1: 2.0}, cache.bids_per_program_[program])
+        cache.remove_programs([program])
+        self.assertEqual({}, cache.bids_per_program_)
+
+    def test_bids_calculated_for_the_teams_are_the_same_as_calculated_by_each_team(self):
+        """ Ensures the bids calculated once per unique program are the bids the teams would get, with the same misses """
+        inputs_matrix = numpy.array([[random.uniform(-10.0, 10.0) for _ in range(4)] for _ in range(10)], order = 'F')
+        point_ids = range(10)
+        programs = [Program(0, [Instruction() for _ in range(random.randint(1, 30))], 0, program_id = i) 
+            for i in range(20)]
+        teams = [DummyTeam(random.sample(programs, 5), dict([(p, 0) for p in random.sample(point_ids, 8)])) 
+            for _ in range(10)]
+        teams.append(DummyTeam(random.sample(programs, 5), dict([(p, 0) for p in point_ids])))
+        Config.RESTRICTIONS['use_memmory_for_actions'] = True
+        expected_cache = BidsCache()
+        cache = BidsCache()
+        cache.calculate_bids_for_teams(teams, point_ids, inputs_matrix)
+        for team in teams:
+            rows = [i for i in point_ids if i not in team.memory_actions_per_points_]
+            for program in team.programs:
+                expected = expected_cache.bids_for_arrays(program, rows, inputs_matrix[rows])
+                self.assertEqual(list(expected), list(cache.bids_for_arrays(program, rows, inputs_matrix[rows])))
+        expected_metrics = expected_cache.metrics()
+        self.assertEqual(expected_metrics['misses'], cache.metrics()['misses'])
+        self.assertEqual(expected_metrics['hits']+expected_metrics['misses'], cache.metrics()['hits'])
+        self.assertEqual(expected_cache.bids_per_program_, cache.bids_per_program_)
+
+if __name__ == '__main__':
+    unittest.main()
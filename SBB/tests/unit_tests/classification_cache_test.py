@@ -0,0 +1,79 @@
+import unittest
+import os
+import time
+import tempfile
+import shutil
+import numpy
+from ...environments.classification_environment import ClassificationEnvironment
+from ...config import Config
+
+class ClassificationCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.user_config_ = Config.USER
+        self.multiply_normalization_by_ = Config.RESTRICTIONS['multiply_normalization_by']
+        self.temp_folder_ = tempfile.mkdtemp()
+        Config.USER = {'classification_parameters': {'working_path': self.temp_folder_+"/", 'dataset': 'data'}}
+        self.dataset_path_ = os.path.join(self.temp_folder_, "data")
+        with open(self.dataset_path_+".train", 'w') as f:
+            f.write("0.1 2.0 a\n0.3 4.0 b\n0.5 8.0 a\n")
+        with open(self.dataset_path_+".test", 'w') as f:
+            f.write("0.2 3.0 b\n0.4 6.0 a\n")
+
+    def tearDown(self):
+        Config.USER = self.user_config_
+        Config.RESTRICTIONS['multiply_normalization_by'] = self.multiply_normalization_by_
+        shutil.rmtree(self.temp_folder_)
+
+    def _initialize_datasets(self):
+        """ Returns the train and test sets, and if they were read from the dataset instead of from the cache """
+        environment = ClassificationEnvironment.__new__(ClassificationEnvironment)
+        read_files = []
+        read_file = environment._read_space_separated_file
+        environment._read_space_separated_file = lambda path: read_files.append(path) or read_file(path)
+        train, test = environment._initialize_datasets()
+        return numpy.array(train), numpy.array(test), len(read_files) > 0
+
+    def test_cache_is_used_only_while_it_is_updated(self):
+        """ Ensures a stale cache or a changed normalization rebuilds the cache, and the cache has the same sets """
+        train, test, rebuilt = self._initialize_datasets()
+        self.assertTrue(rebuilt)
+        cached_train, cached_test, rebuilt = self._initialize_datasets()
+        self.assertFalse(rebuilt)
+        self.assertEqual(train.tolist(), cached_train.tolist())
+        self.assertEqual(test.tolist(), cached_test.tolist())
+        self.assertEqual([], [f for f in os.listdir(self.temp_folder_) if f.endswith(".tmp")])
+
+        older_time = time.time()-10 # the dataset was changed after the cache was saved
+        for extension in [".train.npy", ".test.npy", ".cache.json"]:
+            os.utime(self.dataset_path_+extension, (older_time, older_time))
+        _, _, rebuilt = self._initialize_datasets()
+        self.assertTrue(rebuilt)
+        _, _, rebuilt = self._initialize_datasets()
+        self.assertFalse(rebuilt)
+
+        Config.RESTRICTIONS['multiply_normalization_by'] *= 2
+        scaled_train, _, rebuilt = self._initialize_datasets()
+        self.assertTrue(rebuilt)
+        self.assertEqual((train[:,:-1]*2).tolist(), scaled_train[:,:-1].tolist())
+
+    def test_sets_are_used_when_the_cache_cant_be_saved(self):
+        """ Ensures a failure to write the cache only skips it, without leaving temporary files """
+        expected_train, expected_test, _ = self._initialize_datasets()
+        for extension in [".train.npy", ".test.npy", ".cache.json"]:
+            os.remove(self.dataset_path_+extension)
+        save = numpy.save
+        def failed_save(f, array):
+            f.write("partial")
+            raise IOError("No space left on device")
+        numpy.save = failed_save
+        try:
+            train, test, rebuilt = self._initialize_datasets()
+        finally:
+            numpy.save = save
+        self.assertTrue(rebuilt)
+        self.assertEqual(expected_train.tolist(), train.tolist())
+        self.assertEqual(expected_test.tolist(), test.tolist())
+        self.assertEqual(["data.test", "data.train"], sorted(os.listdir(self.temp_folder_)))
+
+if __name__ == '__main__':
+    unittest.main()
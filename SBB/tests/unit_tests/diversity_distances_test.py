@@ -0,0 +1,104 @@
+import unittest
+import random
+import numpy
+from ...core.diversity_maintenance import DiversityMaintenance
+from ...core.distances_cache import DistancesCache
+from ...utils.helpers import round_value
+from ...config import Config
+
+class DummyTeam:
+    def __init__(self, total_points, programs):
+        self.diversity_ = {}
+        self.active_programs_ = random.sample(programs, random.randint(1, 5))
+        self.encodings_ = {
+            'encoding_for_pattern_of_actions_per_match': [random.randint(0, 2) for _ in range(total_points)],
+            'encoding_for_actions_per_match': [str(random.randint(0, 2)) for _ in range(total_points*5)],
+            'encoding_custom_info_per_match': [str(random.randint(0, 9)) for _ in range(total_points*5)],
+        }
+
+class DiversityDistancesTests(unittest.TestCase):
+    def setUp(self):
+        self.user_config_ = Config.USER
+        self.total_bins_ = Config.RESTRICTIONS['diversity']['total_bins']
+        self.max_euclidean_ = Config.RESTRICTIONS['diversity'].pop('max_euclidean', None)
+        self.max_entropy_ = Config.RESTRICTIONS['diversity'].pop('max_entropy', None)
+        self.total_raw_actions_ = Config.RESTRICTIONS.get('total_raw_actions')
+        Config.USER = {
+            'training_parameters': {'populations': {'points': 20}},
+            'advanced_training_parameters': {'processes': 1, 'diversity': {'ncd_compressor': 'bz2', 'ncd_compression_level': 9}},
+        }
+        Config.RESTRICTIONS['diversity']['total_bins'] = 3
+        random.seed(1)
+
+    def tearDown(self):
+        Config.USER = self.user_config_
+        Config.RESTRICTIONS['diversity']['total_bins'] = self.total_bins_
+        Config.RESTRICTIONS['diversity'].pop('max_euclidean', None)
+        if self.max_euclidean_ is not None:
+            Config.RESTRICTIONS['diversity']['max_euclidean'] = self.max_euclidean_
+        Config.RESTRICTIONS['diversity'].pop('max_entropy', None)
+        if self.max_entropy_ is not None:
+            Config.RESTRICTIONS['diversity']['max_entropy'] = self.max_entropy_
+        Config.RESTRICTIONS['total_raw_actions'] = self.total_raw_actions_
+
+    def _diversities_pair_by_pair(self, population, k, distance):
+        diversities = []
+        for team in population:
+            results = []
+            for other_team in population:
+                if team != other_team:
+                    results.append(getattr(DiversityMaintenance, "_"+distance)(team, other_team))
+            diversities.append(round_value(numpy.mean(sorted(results)[:k])))
+        return diversities
+
+    def test_distances_matrices_get_the_same_diversities_as_the_distances_per_pair(self):
+        """ Ensures the vectorized distances get the same diversities, even if a team is twice in the population """
+        programs = range(12)
+        population = [DummyTeam(20, programs) for _ in range(25)]
+        population.append(population[3])
+        distances = ['hamming', 'euclidean', 'genotype']
+        for k in [1, 3, 24, 30]:
+            expected = dict([(distance, self._diversities_pair_by_pair(population, k, distance)) for distance in distances])
+            DiversityMaintenance.calculate_diversities_based_on_distances(population, k, distances)
+            for distance in distances:
+                self.assertEqual(expected[distance], [team.diversity_[distance] for team in population])
+
+    def test_cached_distances_get_the_same_diversities_as_the_distances_per_pair(self):
+        """ Ensures the cache only reuses the distances of the teams that didn't change between the calls """
+        Config.RESTRICTIONS['total_raw_actions'] = 3
+        programs = range(12)
+        population = [DummyTeam(20, programs) for _ in range(20)]
+        distances = ['hamming', 'euclidean', 'genotype', 'entropy']
+        distances_cache = DistancesCache()
+        for _ in range(4):
+            expected = dict([(distance, self._diversities_pair_by_pair(population, 3, distance)) for distance in distances])
+            DiversityMaintenance.calculate_diversities_based_on_distances(population, 3, distances, distances_cache)
+            for distance in distances:
+                self.assertEqual(expected[distance], [team.diversity_[distance] for team in population])
+            changed_team = random.choice(population)
+            changed_team.encodings_ = DummyTeam(20, programs).encodings_
+            changed_team.active_programs_ = random.sample(programs, 3)
+            population = random.sample(population, 15) + [DummyTeam(20, programs) for _ in range(5)]
+        self.assertTrue(distances_cache.hits_ > 0)
+
+    def test_ncd_matrices_get_the_same_diversities_as_the_distances_per_pair(self):
+        """ Ensures the NCD compresses each encoding alone only once, for any compressor and number of processes """
+        population = [DummyTeam(20, range(12)) for _ in range(10)]
+        population.append(population[3])
+        distances = ['ncd', 'ncd_custom']
+        try:
+            for compressor_name, processes in [('bz2', 1), ('zlib', 1), ('bz2', 3)]:
+                Config.USER['advanced_training_parameters']['diversity']['ncd_compressor'] = compressor_name
+                Config.USER['advanced_training_parameters']['processes'] = processes
+                DiversityMaintenance.reset_ncd_compression()
+                expected = dict([(distance, self._diversities_pair_by_pair(population, 3, distance)) for distance in distances])
+                DiversityMaintenance.reset_ncd_compression()
+                DiversityMaintenance.calculate_diversities_based_on_distances(population, 3, distances)
+                for distance in distances:
+                    self.assertEqual(expected[distance], [team.diversity_[distance] for team in population])
+                self.assertEqual(2*len(population), DiversityMaintenance.ncd_compression_.single_compressions_)
+        finally:
+            DiversityMaintenance.ncd_compression_ = None
+
+if __name__ == '__main__':
+    unittest.main()
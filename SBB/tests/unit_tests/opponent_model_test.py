@@ -0,0 +1,79 @@
+import unittest
+import random
+import copy
+import numpy
+from ...environments.poker.opponent_model import OpponentModel
+from ...environments.poker.running_mean import RunningMean
+from ...utils.helpers import round_value
+from ...config import Config
+
+class OpponentModelTests(unittest.TestCase):
+    def setUp(self):
+        random.seed(1)
+
+    def _normalized(self, value):
+        return round_value(value*Config.RESTRICTIONS['multiply_normalization_by'])
+
+    def _expected_inputs(self, model, opponent_actions):
+        """ The inputs calculated with numpy.mean over the histories """
+        inputs = [0.5] * len(OpponentModel.INPUTS)
+        if len(opponent_actions) > 0:
+            inputs[0] = OpponentModel.calculate_points([opponent_actions[-1]])
+            inputs[1] = numpy.mean([OpponentModel.SINGLE_HAND_AGRESSIVENESS_MAPPING[a] for a in opponent_actions])
+        else:
+            inputs[1] = 0.0
+        if len(model.opponent_agressiveness) > 0:
+            inputs[2] = numpy.mean(model.opponent_agressiveness.values_)
+            inputs[6] = numpy.mean(model.opponent_agressiveness.values_[:10])
+        if len(model.opponent_tight_loose) > 0:
+            inputs[3] = numpy.mean(model.opponent_tight_loose.values_)
+        if len(model.opponent_passive_aggressive) > 0:
+            inputs[4] = numpy.mean(model.opponent_passive_aggressive.values_)
+        if len(model.opponent_bluffing) > 0:
+            inputs[5] = numpy.mean(model.opponent_bluffing.values_)
+        else:
+            inputs[5] = 0.0
+        if len(model.self_agressiveness) > 0:
+            inputs[7] = numpy.mean(model.self_agressiveness[:10])
+        return [self._normalized(i) for i in inputs]
+
+    def test_inputs_are_equal_to_the_means_of_the_histories(self):
+        """ Ensures the running means get the same inputs as numpy.mean over the whole histories """
+        model = OpponentModel()
+        for _ in range(600):
+            self_actions = [random.choice(['c', 'r', 'f']) for _ in range(random.randint(0, 6))]
+            opponent_actions = [random.choice(['c', 'r', 'c']) for _ in range(random.randint(0, 6))]
+            for index in range(len(opponent_actions)+1):
+                self.assertEqual(self._expected_inputs(model, opponent_actions[:index]),
+                    model.inputs(self_actions, opponent_actions[:index]))
+            opponent_actions += random.choice([[], ['f']]) # a fold ends the hand
+            model.update_overall_agressiveness(random.randint(0, 3), self_actions, opponent_actions,
+                random.randint(0, 8), random.choice([True, False]))
+
+    def test_rounded_means_are_equal_to_numpy_means(self):
+        """ Ensures the rounded means are equal for values whose means are often exactly between two rounded values """
+        for values in [[0.5, 1.0, 0.0, 0.75], [1/3.0, 2/3.0, 0.5], [0.1, 0.2, 0.3, 0.4, 0.5]]:
+            running_mean = RunningMean()
+            for _ in range(300):
+                running_mean.append(random.choice(values))
+                self.assertEqual(self._normalized(numpy.mean(running_mean.values_)),
+                    running_mean.rounded_mean(Config.RESTRICTIONS['multiply_normalization_by']))
+
+    def test_copies_keep_their_own_means(self):
+        """ Ensures the copies of a running mean have the same means, and are independent from the original """
+        multiplier = Config.RESTRICTIONS['multiply_normalization_by']
+        running_mean = RunningMean(short_term_size = 2)
+        for value in [0.25, 0.5, 0.75]:
+            running_mean.append(value)
+        for copied in [copy.copy(running_mean), copy.deepcopy(running_mean)]:
+            self.assertEqual(3, len(copied))
+            self.assertEqual(self._normalized(0.5), copied.rounded_mean(multiplier))
+            self.assertEqual(0.375, copied.short_term_mean())
+            copied.append(1.0)
+            self.assertEqual(self._normalized(0.625), copied.rounded_mean(multiplier))
+        self.assertEqual(3, len(running_mean))
+        self.assertEqual([0.25, 0.5, 0.75], running_mean.values_)
+        self.assertEqual(self._normalized(0.5), running_mean.rounded_mean(multiplier))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+import random
+from ...core.pareto_dominance_for_teams import ParetoDominanceForTeams
+from ...config import Config
+
+class DummyTeam:
+    def __init__(self, fitness, diversity):
+        self.fitness_ = fitness
+        self.diversity_ = {'genotype': diversity}
+
+class ParetoDominanceTests(unittest.TestCase):
+    def setUp(self):
+        random.seed(1)
+
+    @staticmethod
+    def _pareto_front_pair_by_pair(teams_population, novelty):
+        for team in teams_population:
+            team.dom_by_ = 0
+            team.dom_of_ = 0
+        front = []
+        dominateds = []
+        for teamA in teams_population:
+            for teamB in teams_population:
+                if ParetoDominanceForTeams._is_dominated(teamA, teamB, novelty):
+                    teamA.dom_by_ += 1
+                    teamB.dom_of_ += 1
+                    if teamA not in dominateds:
+                        dominateds.append(teamA)
+            if teamA.dom_by_ == 0:
+                front.append(teamA)
+        for team in teams_population:
+            team.submission_score_ = team.dom_by_/float(len(teams_population))
+            team.dominance_score_ = team.dom_of_/float(len(teams_population))
+        return front, dominateds
+
+    def _run_pair_by_pair(self, teams_population, novelty, teams_to_keep):
+        pareto_front = ParetoDominanceForTeams.__dict__['_pareto_front']
+        ParetoDominanceForTeams._pareto_front = staticmethod(ParetoDominanceTests._pareto_front_pair_by_pair)
+        try:
+            result = ParetoDominanceForTeams.run(teams_population, novelty, teams_to_keep)
+        finally:
+            ParetoDominanceForTeams._pareto_front = pareto_front
+        return result, [(team.dom_by_, team.dom_of_) for team in teams_population]
+
+    def _random_value(self, values):
+        """ Values with ties and with differences close to the threshold for nearly equal values """
+        threshold = Config.RESTRICTIONS['is_nearly_equal_threshold']
+        option = random.randint(0, 3)
+        if option == 0:
+            return random.choice(values)
+        if option == 1:
+            return random.choice(values)+random.choice([-1, 1])*threshold*random.choice([0.5, 1.0, 1.5])
+        if option == 2:
+            return round(random.random(), 2)
+        return random.random()
+
+    def test_pareto_front_is_equal_to_comparing_all_pairs(self):
+        """ Ensures the dominance counts and the kept teams are the same as comparing each pair of teams """
+        for total_teams in [1, 2, 10, 90]:
+            fitness_values = [0.0, 0.5, 1.0]
+            diversity_values = [0.0, 0.25, 0.5]
+            population = []
+            for _ in range(total_teams):
+                fitness = self._random_value(fitness_values)
+                diversity = self._random_value(diversity_values)
+                fitness_values.append(fitness)
+                diversity_values.append(diversity)
+                population.append(DummyTeam(fitness, diversity))
+            for teams_to_keep in [1, max(1, total_teams/2), total_teams]:
+                expected, expected_counts = self._run_pair_by_pair(population, 'genotype', teams_to_keep)
+                result = ParetoDominanceForTeams.run(population, 'genotype', teams_to_keep)
+                self.assertEqual(expected_counts, [(team.dom_by_, team.dom_of_) for team in population])
+                self.assertEqual(expected, result)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+import os
+import json
+import tempfile
+import shutil
+from ...environments.poker.hand_generator import poker_hand_generator
+
+FAIL_FROM_SEED = None
+
+def _fake_generate_shard(args):
+    """ Writes a shard with one line per seed, and logs the shard, so the tests know which ones were generated """
+    shard_from, shard_to, shards_path = args
+    if shard_from == FAIL_FROM_SEED:
+        raise ValueError("interrupted")
+    with open(os.path.join(shards_path, "..", "generated.log"), 'a') as f:
+        f.write(str(shard_from)+" "+str(shard_to)+"\n")
+    lines = [str(seed % 9)+" "+json.dumps({'id': seed})+"\n" for seed in range(shard_from, shard_to)]
+    with open(poker_hand_generator._shard_file(shards_path, shard_from, shard_to), 'w') as f:
+        f.write("".join(lines))
+    return shard_from, shard_to, len(lines)
+
+class PokerHandGeneratorTests(unittest.TestCase):
+    def setUp(self):
+        global FAIL_FROM_SEED
+        FAIL_FROM_SEED = None
+        self.temp_folder_ = tempfile.mkdtemp()
+        self.generate_shard_ = poker_hand_generator._generate_shard
+        poker_hand_generator._generate_shard = _fake_generate_shard
+
+    def tearDown(self):
+        poker_hand_generator._generate_shard = self.generate_shard_
+        shutil.rmtree(self.temp_folder_)
+
+    def _generate(self, from_seed, to_seed, seeds_per_shard, fail_from_seed = None):
+        global FAIL_FROM_SEED
+        FAIL_FROM_SEED = fail_from_seed
+        poker_hand_generator.generate_poker_hands(from_seed, to_seed, 2, seeds_per_shard, self.temp_folder_)
+
+    def _generated_shards(self):
+        with open(os.path.join(self.temp_folder_, "generated.log"), 'r') as f:
+            shards = [tuple(int(x) for x in line.split()) for line in f]
+        os.remove(os.path.join(self.temp_folder_, "generated.log"))
+        return sorted(shards)
+
+    def _merged_seeds(self):
+        seeds = []
+        for label in range(9):
+            with open(os.path.join(self.temp_folder_, "hands_type_"+str(label)+".json"), 'r') as f:
+                seeds += [json.loads(line)['id'] for line in f]
+        return sorted(seeds)
+
+    def test_all_shards_are_merged(self):
+        self._generate(10, 33, 5)
+        self.assertEqual([(10, 15), (15, 20), (20, 25), (25, 30), (30, 33)], self._generated_shards())
+        self.assertEqual(range(10, 33), self._merged_seeds())
+        self.assertFalse(os.path.exists(os.path.join(self.temp_folder_, "shards")))
+
+    def test_resume_only_generates_the_unfinished_shards(self):
+        self.assertRaises(ValueError, self._generate, 10, 33, 5, fail_from_seed = 20)
+        self.assertEqual([(10, 15), (15, 20)], self._generated_shards()[:2])
+        self._generate(10, 33, 5)
+        self.assertEqual([(20, 25), (25, 30), (30, 33)], self._generated_shards())
+        self.assertEqual(range(10, 33), self._merged_seeds())
+
+    def test_resume_with_other_parameters_restarts(self):
+        """ Ensures the shards of a checkpoint with other from_seed or seeds_per_shard are not reused """
+        for from_seed, seeds_per_shard, expected_shards in [(10, 3, [(10, 13), (13, 16), (16, 19), (19, 22),
+                (22, 25), (25, 28), (28, 31), (31, 33)]), (12, 5, [(12, 17), (17, 22), (22, 27), (27, 32), (32, 33)])]:
+            self.assertRaises(ValueError, self._generate, 10, 33, 5, fail_from_seed = 20)
+            self._generated_shards()
+            self._generate(from_seed, 33, seeds_per_shard)
+            self.assertEqual(expected_shards, self._generated_shards())
+            self.assertEqual(range(from_seed, 33), self._merged_seeds())
+
+if __name__ == '__main__':
+    unittest.main()
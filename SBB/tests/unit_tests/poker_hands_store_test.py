@@ -0,0 +1,33 @@
+import unittest
+import os
+import json
+import tempfile
+import shutil
+import numpy
+from ...environments.poker.poker_hands_store import PokerHandsStore
+
+class PokerHandsStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_folder_ = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_folder_)
+
+    def test_stored_hands_are_equal_to_the_json_hands(self):
+        """ Ensures each row of the store has the same info as the respective line of the .json file """
+        json_file = PokerHandsStore.PATH+"hands_type_0.json"
+        with open(json_file, 'r') as f:
+            lines = [f.readline() for _ in range(20)]
+        sample_file = os.path.join(self.temp_folder_, "hands.json")
+        store_file = os.path.join(self.temp_folder_, "hands.npy")
+        with open(sample_file, 'w') as f:
+            f.write("".join(lines))
+        PokerHandsStore.convert(sample_file, store_file)
+        self.assertEqual(["hands.json", "hands.npy"], sorted(os.listdir(self.temp_folder_)))
+        hands = numpy.load(store_file, mmap_mode = 'r')
+        self.assertEqual(len(lines), len(hands))
+        for line, hand in zip(lines, hands):
+            self.assertEqual(json.loads(line), PokerHandsStore.hand_info(hand))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,160 @@
+import unittest
+import json
+import hashlib
+from ...environments.default_environment import reset_points_ids
+from ...environments.poker.poker_match import PokerMatch
+from ...environments.poker.poker_point import PokerPoint
+from ...environments.poker.poker_hands_store import PokerHandsStore
+from ...environments.poker.poker_opponents import (PokerRandomOpponent, PokerLooseAgressiveOpponent,
+    PokerLoosePassiveOpponent, PokerTightAgressiveOpponent, PokerTightPassiveOpponent)
+from ...core.program import Program
+from ...core.team import Team
+from ...core.instruction import Instruction
+from ...config import Config
+
+TEST_CONFIG = {
+    'task': 'reinforcement',
+    'reinforcement_parameters': {
+        'environment_parameters': {
+            'weights_per_action': [0.0, 0.5, 1.0],
+        },
+    },
+    'advanced_training_parameters': {
+        'use_operations': ['+', '-', '*', '/', 'if_lesser_than', 'if_equal_or_higher_than'],
+        'second_layer': {
+            'enabled': False,
+        },
+    },
+    'debug': {
+        'enabled': False,
+    },
+}
+
+# the inputs added by the program of each action (fold, call, raise), so the teams use all the inputs of the match
+INPUTS_PER_ACTION_PER_TEAM = [
+    [[3], [4], [0]],
+    [[2, 2], [5], [1]],
+    [[2, 2], [5, 5], [1, 1]],
+    [[2, 7], [1, 11], [0, 12]],
+]
+
+# the results, the actions and the md5 of the encodings of each team in _play_matches(), recorded with the
+# matches from before they were optimized
+BASELINE = [
+    {
+        'results': [0.479167, 0.4375, 0.4375, 0.479167, 0.510417, 0.479167, 0.479167, 0.5625, 0.479167, 0.416667,
+            0.416667, 0.479167, 0.510417, 0.479167, 0.479167, 0.416667, 0.479167, 0.416667, 0.416667, 0.479167,
+            0.510417, 0.479167, 0.479167, 0.416667, 0.479167, 0.416667, 0.520833, 0.510417, 0.510417, 0.510417,
+            0.479167, 0.416667, 0.479167, 0.416667, 0.520833, 0.510417, 0.510417, 0.510417, 0.479167, 0.416667,
+            0.479167, 0.4375, 0.4375, 0.479167, 0.510417, 0.479167, 0.479167, 0.5625, 0.479167, 0.416667, 0.416667,
+            0.479167, 0.510417, 0.479167, 0.479167, 0.416667, 0.479167, 0.416667, 0.416667, 0.479167, 0.510417,
+            0.479167, 0.479167, 0.416667, 0.479167, 0.416667, 0.520833, 0.510417, 0.510417, 0.510417, 0.479167,
+            0.416667, 0.479167, 0.416667, 0.520833, 0.510417, 0.510417, 0.510417, 0.479167, 0.416667],
+        'actions': ("022022000022022022000022002202220000220022020220022020220"),
+        'encodings': '21a435592633754f26c5d3fee5d7b24d',
+    },
+    {
+        'results': [0.666667, 0.604167, 0.604167, 0.541667, 0.510417, 0.583333, 0.583333, 0.541667, 0.0, 0.416667,
+            0.833333, 0.0, 0.510417, 0.583333, 0.479167, 0.489583, 0.0, 0.416667, 0.833333, 0.0, 0.510417, 0.583333,
+            0.479167, 0.489583, 0.0, 0.416667, 0.520833, 0.510417, 0.510417, 0.510417, 0.479167, 0.489583, 0.0,
+            0.416667, 0.520833, 0.510417, 0.510417, 0.510417, 0.479167, 0.489583, 0.770833, 0.645833, 0.604167,
+            0.541667, 0.510417, 0.583333, 0.583333, 0.541667, 0.0, 1.0, 0.833333, 0.0, 0.510417, 0.25, 0.479167,
+            0.489583, 0.0, 1.0, 0.833333, 0.0, 0.510417, 0.25, 0.479167, 0.489583, 0.0, 0.583333, 0.520833, 0.510417,
+            0.510417, 0.510417, 0.479167, 0.489583, 0.0, 0.583333, 0.520833, 0.510417, 0.510417, 0.510417, 0.479167,
+            0.489583],
+        'actions': ("221221122122122221111111112122122122122022122122221221222212212212221200212212212212202221"
+            "222212222122221222212222122122212002122122122122020022212212222122221220200"),
+        'encodings': '2b44776a55c05e6f5526a497eeb2dba4',
+    },
+    {
+        'results': [0.666667, 0.604167, 0.604167, 0.541667, 0.510417, 0.583333, 0.583333, 0.541667, 0.0, 0.416667,
+            0.833333, 0.0, 0.510417, 0.583333, 0.0, 1.0, 0.0, 0.416667, 0.833333, 0.0, 0.510417, 0.583333, 0.333333,
+            1.0, 0.0, 0.416667, 0.520833, 0.510417, 0.510417, 0.510417, 0.416667, 1.0, 0.0, 0.416667, 0.520833,
+            0.510417, 0.510417, 0.510417, 0.416667, 1.0, 0.770833, 0.645833, 0.604167, 0.541667, 0.510417, 0.583333,
+            0.583333, 0.541667, 0.0, 1.0, 0.833333, 0.0, 0.510417, 0.25, 0.0, 1.0, 0.0, 1.0, 0.833333, 0.0, 0.510417,
+            0.25, 0.333333, 1.0, 0.0, 0.583333, 0.520833, 0.510417, 0.510417, 0.510417, 0.416667, 1.0, 0.0, 0.583333,
+            0.520833, 0.510417, 0.510417, 0.510417, 0.416667, 0.916667],
+        'actions': ("221221122122122221111111112122122122122022122122221221222212212212221221111111111111111221"
+            "221221221212212212212202221222212222122221222212222122122212211111111221221221221212212212"
+            "21220221111111122122122221222122122221222212202211111111222212222122221"),
+        'encodings': 'ec79a5d96d8225eb4d28a15429b70db5',
+    },
+    {
+        'results': [0.354167, 0.645833, 0.604167, 0.541667, 0.510417, 0.583333, 0.625, 0.5625, 0.4375, 1.0,
+            0.833333, 0.4375, 0.510417, 0.583333, 0.4375, 0.416667, 0.4375, 1.0, 0.833333, 0.0, 0.510417, 0.583333,
+            0.479167, 0.416667, 0.4375, 0.583333, 0.520833, 0.510417, 0.510417, 0.510417, 0.479167, 0.458333, 0.0,
+            0.583333, 0.520833, 0.510417, 0.510417, 0.510417, 0.479167, 0.458333, 0.354167, 0.645833, 0.604167,
+            0.541667, 0.510417, 0.583333, 0.625, 0.5625, 0.4375, 1.0, 0.833333, 0.4375, 0.510417, 0.583333, 0.4375,
+            0.416667, 0.4375, 1.0, 0.833333, 0.0, 0.510417, 0.583333, 0.4375, 0.416667, 0.4375, 0.583333, 0.520833,
+            0.510417, 0.510417, 0.510417, 0.479167, 0.416667, 0.0, 0.583333, 0.520833, 0.510417, 0.510417, 0.510417,
+            0.479167, 0.458333],
+        'actions': ("221220221222212222122212222202212212212212212212222122022212202202022122221222212222122212"
+            "22212222122221222212222122122212022020221220202221221222212222122122020"),
+        'encodings': '5cff42ab11936366b40c3b210d96185b',
+    },
+]
+
+class PokerMatchTests(unittest.TestCase):
+    def setUp(self):
+        self.user_config_ = Config.USER
+        self.total_registers_ = Config.RESTRICTIONS['genotype_options']['total_registers']
+        self.total_inputs_ = Config.RESTRICTIONS['total_inputs']
+        self.total_actions_ = Config.RESTRICTIONS['total_actions']
+        self.use_memmory_for_actions_ = Config.RESTRICTIONS['use_memmory_for_actions']
+        Config.USER = TEST_CONFIG
+        Config.RESTRICTIONS['genotype_options']['total_registers'] = Config.RESTRICTIONS['genotype_options']['output_registers']+4
+        Config.RESTRICTIONS['total_inputs'] = 14
+        Config.RESTRICTIONS['total_actions'] = 3
+        Config.RESTRICTIONS['use_memmory_for_actions'] = False
+        reset_points_ids()
+
+    def tearDown(self):
+        Config.USER = self.user_config_
+        Config.RESTRICTIONS['genotype_options']['total_registers'] = self.total_registers_
+        Config.RESTRICTIONS['total_inputs'] = self.total_inputs_
+        Config.RESTRICTIONS['total_actions'] = self.total_actions_
+        Config.RESTRICTIONS['use_memmory_for_actions'] = self.use_memmory_for_actions_
+
+    def _points(self):
+        points = []
+        for label in range(4):
+            with open(PokerHandsStore.PATH+"hands_type_"+str(label)+".json", 'r') as f:
+                points += [PokerPoint(label, json.loads(f.readline())) for _ in range(2)]
+        return points
+
+    def _play_matches(self):
+        """ Plays the points against each opponent, with a few teams, for training and for validation """
+        teams = []
+        for team_id, inputs_per_action in enumerate(INPUTS_PER_ACTION_PER_TEAM):
+            programs = []
+            for action, inputs in enumerate(inputs_per_action):
+                instructions = [Instruction(mode = 'read-register', target = 0, op = '-', source = 0)] # r0 = 0
+                instructions += [Instruction(mode = 'read-input', target = 0, op = '+', source = i) for i in inputs]
+                programs.append(Program(0, instructions, action, program_id = team_id*3+action))
+            teams.append(Team(0, programs, None, team_id = team_id))
+        opponents = [PokerRandomOpponent(), PokerLooseAgressiveOpponent(), PokerLoosePassiveOpponent(),
+            PokerTightAgressiveOpponent(), PokerTightPassiveOpponent()]
+        points = self._points()
+        match = PokerMatch()
+        results = []
+        for team in teams:
+            team.opponent_model = {}
+            team.chips = {}
+            team.encodings_ = {'encoding_for_pattern_of_actions_per_match': [], 'encoding_for_actions_per_match': [],
+                'encoding_custom_info_per_match': []}
+            team_results = []
+            for mode in [Config.RESTRICTIONS['mode']['training'], Config.RESTRICTIONS['mode']['validation']]:
+                for opponent in opponents:
+                    for match_id, point in enumerate(points):
+                        team_results.append(match.run(team, opponent, point, mode, match_id))
+            encodings = json.dumps(team.encodings_, sort_keys = True)
+            results.append({'results': [round(r, 6) for r in team_results], 'actions': "".join(team.encodings_['encoding_for_actions_per_match']),
+                'encodings': hashlib.md5(encodings).hexdigest()})
+        return results
+
+    def test_matches_have_the_same_results_and_encodings_as_the_baseline(self):
+        """ Ensures the optimizations of the matches keep the results of the teams for a fixed set of points """
+        self.assertEqual(BASELINE, self._play_matches())
+
+if __name__ == '__main__':
+    unittest.main()
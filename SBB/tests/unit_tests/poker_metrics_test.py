@@ -0,0 +1,33 @@
+import unittest
+import json
+from ...environments.poker.hand_generator.poker_metrics import PokerMetrics
+from ...environments.poker.poker_hands_store import PokerHandsStore
+from ...utils.helpers import round_value
+from ...config import Config
+
+class PokerMetricsTests(unittest.TestCase):
+    def _hands(self):
+        hands = []
+        for label in [0, 4, 8]:
+            with open(PokerHandsStore.PATH+"hands_type_"+str(label)+".json", 'r') as f:
+                hands.append(json.loads(f.readline()))
+        return hands
+
+    def _normalized(self, value):
+        return round_value(value*Config.RESTRICTIONS['multiply_normalization_by'], 3)
+
+    def test_metrics_are_equal_to_the_pokereval_metrics_in_the_hands_files(self):
+        """ Ensures the numpy evaluator gets the same hand strength and potential that were generated with pokereval """
+        for hand in self._hands():
+            for player in ['p', 'o']:
+                hole_cards = [str(card) for card in hand[player]['hc']]
+                for round_id, total_board_cards in [(1, 3), (2, 4), (3, 5)]:
+                    board_cards = [str(card) for card in hand['bc'][:total_board_cards]]
+                    hand_strength = PokerMetrics.calculate_hand_strength(hole_cards, board_cards)
+                    self.assertEqual(hand[player]['str'][round_id], self._normalized(hand_strength))
+                    if round_id == 1 or round_id == 2:
+                        hand_potential = PokerMetrics.calculate_hand_potential_without_heuristics(hole_cards, board_cards, round_id)
+                        self.assertEqual(hand[player]['ep'][round_id], self._normalized(hand_potential))
+
+if __name__ == '__main__':
+    unittest.main()
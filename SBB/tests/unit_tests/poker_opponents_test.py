@@ -0,0 +1,42 @@
+import unittest
+import numpy
+from ...environments.poker.poker_opponents import (PokerLooseAgressiveOpponent, PokerLoosePassiveOpponent,
+    PokerTightAgressiveOpponent, PokerTightPassiveOpponent, PokerLAAntiPlayerOpponent, PokerLPAntiPlayerOpponent,
+    PokerTAAntiPlayerOpponent, PokerTPAntiPlayerOpponent)
+
+class PokerOpponentsTests(unittest.TestCase):
+    def _rule(self, opponent, inputs, valid_actions):
+        """ The rule of the rule based opponents, deciding with if/else for each decision """
+        if inputs[0] >= opponent.alfa_:
+            if inputs[0] >= opponent.beta_:
+                action = 2
+            else:
+                action = 1
+        else:
+            if inputs[1] > 0.0:
+                action = 0
+            else:
+                action = 1
+        if action not in valid_actions:
+            action = 1
+        return action
+
+    def test_decision_tables_are_equal_to_the_rule(self):
+        """ Ensures the decision tables and the batch of decisions get the same actions as the rule """
+        opponents = [PokerLooseAgressiveOpponent(), PokerLoosePassiveOpponent(), PokerTightAgressiveOpponent(),
+            PokerTightPassiveOpponent()]
+        for balanced in [True, False]:
+            opponents += [PokerLAAntiPlayerOpponent(balanced), PokerLPAntiPlayerOpponent(balanced),
+                PokerTAAntiPlayerOpponent(balanced), PokerTPAntiPlayerOpponent(balanced)]
+        decisions = [([strength, bet], valid_actions) for strength in numpy.arange(0.0, 10.01, 0.25)
+            for bet in [0.0, 5.0, 10.0] for valid_actions in [[0, 1], [0, 1, 2]]]
+        for opponent in opponents:
+            expected = [self._rule(opponent, inputs, valid_actions) for inputs, valid_actions in decisions]
+            self.assertEqual(expected, [opponent.execute(0, inputs, valid_actions, True)
+                for inputs, valid_actions in decisions])
+            actions = opponent.execute_for_arrays([inputs[0] for inputs, _ in decisions],
+                [inputs[1] for inputs, _ in decisions], [2 in valid_actions for _, valid_actions in decisions])
+            self.assertEqual(expected, actions.tolist())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+import unittest
+import random
+import numpy
+from ...core.program import Program
+from ...core.instruction import Instruction
+from ...core.operations import Operation
+from ...config import Config
+
+TEST_CONFIG = {
+    'task': 'reinforcement',
+    'advanced_training_parameters': {
+        'use_operations': ['+', '-', '*', '/', 'ln', 'exp', 'cos', 'sin', 'if_lesser_than',
+            'if_equal_or_higher_than', 'if_lesser_than_for_signal', 'if_equal_or_higher_than_for_signal'],
+    },
+}
+
+class ProgramExecutionTests(unittest.TestCase):
+    def setUp(self):
+        self.user_config_ = Config.USER
+        self.total_registers_ = Config.RESTRICTIONS['genotype_options']['total_registers']
+        self.total_inputs_ = Config.RESTRICTIONS['total_inputs']
+        self.use_compiled_programs_ = Config.RESTRICTIONS['use_compiled_programs']
+        Config.USER = TEST_CONFIG
+        Config.RESTRICTIONS['genotype_options']['total_registers'] = 3
+        Config.RESTRICTIONS['total_inputs'] = 4
+        random.seed(1)
+
+    def tearDown(self):
+        Config.USER = self.user_config_
+        Config.RESTRICTIONS['genotype_options']['total_registers'] = self.total_registers_
+        Config.RESTRICTIONS['total_inputs'] = self.total_inputs_
+        Config.RESTRICTIONS['use_compiled_programs'] = self.use_compiled_programs_
+
+    def _execute(self, program, inputs_list, use_compiled_programs):
+        Config.RESTRICTIONS['use_compiled_programs'] = use_compiled_programs
+        program.reset_registers()
+        return [program.execute(inputs) for inputs in inputs_list]
+
+    def test_compiled_programs_have_the_same_bids_as_interpreted_programs(self):
+        """ Ensures the compiled programs are equivalent to the interpreter, including the registers memory """
+        inputs_list = [[random.uniform(-10.0, 10.0) for _ in range(4)] for _ in range(10)]
+        inputs_list += [[0.0, 0.0, 0.0, 0.0], [800.0, -800.0, 0.0, 1.0]]
+        for _ in range(300):
+            program = Program(0, [Instruction() for _ in range(random.randint(1, 30))], 0, program_id = 1)
+            interpreted = self._execute(program, inputs_list, False)
+            compiled = self._execute(program, inputs_list, True)
+            self.assertEqual([repr(x) for x in interpreted], [repr(x) for x in compiled])
+
+    def test_compiled_programs_skip_instructions_after_false_ifs(self):
+        """ Ensures the compiled programs skip the instructions the same way the interpreter does """
+        instructions = []
+        instructions.append(Instruction(mode = 'read-input', target = 0, op = '+', source = 0))
+        instructions.append(Instruction(mode = 'read-input', target = 2, op = 'if_lesser_than', source = 1))
+        instructions.append(Instruction(mode = 'read-input', target = 0, op = 'if_lesser_than', source = 3))
+        instructions.append(Instruction(mode = 'read-input', target = 0, op = '*', source = 1))
+        instructions.append(Instruction(mode = 'read-input', target = 0, op = '+', source = 2))
+        program = Program(0, instructions, 0, program_id = 1)
+        self.assertEqual([9.0], self._execute(program, [[4.0, 3.0, 5.0, 0.0]], True))
+        self.assertEqual([9.0], self._execute(program, [[4.0, 3.0, 5.0, 0.0]], False))
+
+    def test_programs_executed_for_arrays_have_the_same_bids_as_interpreted_programs(self):
+        """ Ensures the execution over a matrix of inputs is equivalent to the interpreter for each row """
+        Config.USER = dict(TEST_CONFIG)
+        Config.USER['task'] = 'classification'
+        inputs_list = [[random.uniform(-10.0, 10.0) for _ in range(4)] for _ in range(10)]
+        inputs_list += [[0.0, 0.0, 0.0, 0.0], [800.0, -800.0, 0.0, 1.0]]
+        inputs_matrix = numpy.array(inputs_list, order = 'F')
+        for _ in range(300):
+            program = Program(0, [Instruction() for _ in range(random.randint(1, 30))], 0, program_id = 1)
+            interpreted = self._execute(program, inputs_matrix, False)
+            self.assertEqual(interpreted, list(program.execute_for_arrays(inputs_matrix)))
+
+    def test_compilation_is_invalidated_by_mutation(self):
+        """ Ensures a mutated program doesn't reuse the compiled version of the previous instructions """
+        Config.USER = dict(TEST_CONFIG)
+        Config.USER['training_parameters'] = {
+            'mutation': {
+                'program': {
+                    'remove_instruction': 0.0,
+                    'add_instruction': 1.0,
+                    'change_instruction': 0.0,
+                    'swap_instructions': 0.0,
+                    'change_action': 0.0,
+                },
+            },
+            'program_size': {
+                'min': 1,
+                'max': 20,
+            },
+        }
+        Config.RESTRICTIONS['use_compiled_programs'] = True
+        program = Program(0, [Instruction(mode = 'read-input', target = 0, op = '+', source = 0)], 0, program_id = 1)
+        program.execute([1.0, 2.0, 3.0, 4.0])
+        program.mutate()
+        self.assertIsNone(program.compiled_program_)
+        self.assertEqual(self._execute(program, [[1.0, 2.0, 3.0, 4.0]], False),
+            self._execute(program, [[1.0, 2.0, 3.0, 4.0]], True))
+
+    def test_packed_instructions_keep_the_instructions(self):
+        """ Ensures the packed instructions are saved and printed as the instructions they were created from """
+        instructions = [Instruction() for _ in range(30)]
+        program = Program(0, instructions, 0, program_id = 1)
+        self.assertEqual([i.dict() for i in instructions], [Instruction.unpack(row).dict() for row in program.instructions])
+        self.assertEqual([str(i) for i in instructions], [str(Instruction.unpack(row)) for row in program.instructions])
+        clone = Program(0, program.instructions.copy(), 0, program_id = 2)
+        Instruction.mutate_row(clone.instructions[0])
+        self.assertEqual([i.dict() for i in instructions], [Instruction.unpack(row).dict() for row in program.instructions])
+
+    def test_registered_operations_are_executed_by_opcode(self):
+        """ Ensures a new operation can be registered and used by the programs without other changes """
+        opcode = Operation.register('max', lambda target, source: max(target, source), 
+            lambda target, source: numpy.maximum(target, source))
+        try:
+            Config.USER = dict(TEST_CONFIG)
+            Config.USER['task'] = 'classification'
+            instructions = [Instruction(mode = 'read-input', target = 0, op = 'max', source = 1)]
+            self.assertEqual(opcode, instructions[0].opcode)
+            program = Program(0, instructions, 0, program_id = 1)
+            inputs_list = [[1.0, 2.0, 3.0, 4.0], [1.0, -2.0, 3.0, 4.0]]
+            self.assertEqual([2.0, 0.0], self._execute(program, inputs_list, False))
+            self.assertEqual([2.0, 0.0], self._execute(program, inputs_list, True))
+            self.assertEqual([2.0, 0.0], list(program.execute_for_arrays(numpy.array(inputs_list))))
+        finally:
+            del Operation.OPCODES['max']
+            for values in [Operation.OPERATORS, Operation.FUNCTIONS, Operation.ARRAY_FUNCTIONS, Operation.CONDITIONS]:
+                values.pop()
+            Config.RESTRICTIONS['genotype_options']['complex_operations'].remove('max')
+
+if __name__ == '__main__':
+    unittest.main()
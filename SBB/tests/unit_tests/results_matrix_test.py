@@ -0,0 +1,49 @@
+import unittest
+import random
+from ...core.results_matrix import ResultsMatrix
+from ...core.diversity_maintenance import DiversityMaintenance
+
+class DummyTeam:
+    def __init__(self):
+        self.results_per_points_ = {}
+
+class ResultsMatrixTests(unittest.TestCase):
+    def setUp(self):
+        random.seed(1)
+
+    def test_reused_rows_and_columns_dont_keep_old_results(self):
+        """ Ensures the rows of removed points and the columns of removed teams are reused without their results """
+        results_matrix = ResultsMatrix()
+        team1, team2, team3 = DummyTeam(), DummyTeam(), DummyTeam()
+        results_matrix.set_results(team1, [1, 2], [1.0, 0.0])
+        results_matrix.set_results(team2, [1, 2], [0.5, 1.0])
+        results_matrix.remove_points([1])
+        results_matrix.remove_teams([team1])
+        results_matrix.set_results(team3, [2, 3], [0.0, 1.0])
+        self.assertEqual([[1.0, 0.0]], results_matrix.results([team2, team3], [2]).tolist())
+        self.assertRaises(KeyError, results_matrix.results, [team2, team3], [2, 3])
+        self.assertRaises(KeyError, results_matrix.results, [team1], [2])
+
+    def test_fitness_sharing_is_equal_to_adding_the_results_one_by_one(self):
+        """ Ensures fitness sharing with the matrix gets the same values as the loops over the teams and points """
+        teams = [DummyTeam() for _ in range(30)]
+        point_ids = range(50)
+        results_matrix = ResultsMatrix()
+        for team in teams:
+            for point_id in point_ids:
+                team.results_per_points_[point_id] = random.choice([0.0, 0.5, 1.0, random.random()])
+            results_matrix.set_results(team, point_ids, [team.results_per_points_[i] for i in point_ids])
+        diversities = DiversityMaintenance._shared_fitness(results_matrix.results(teams, point_ids))
+
+        denominators = [1.0] * len(point_ids)
+        for index, point_id in enumerate(point_ids):
+            for team in teams:
+                denominators[index] += team.results_per_points_[point_id]
+        for team, diversity in zip(teams, diversities):
+            score = 0.0
+            for index, point_id in enumerate(point_ids):
+                score += team.results_per_points_[point_id] / denominators[index]
+            self.assertEqual(score/float(len(point_ids)), diversity)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+import random
+from ...core.program import Program
+from ...core.team import Team
+from ...core.instruction import Instruction
+from ...config import Config
+
+TEST_CONFIG = {
+    'task': 'reinforcement',
+    'advanced_training_parameters': {
+        'use_operations': ['+', '-', '*', '/'],
+        'second_layer': {
+            'enabled': False,
+        },
+    },
+    'training_parameters': {
+        'mutation': {
+            'program': {
+                'remove_instruction': 0.0,
+                'add_instruction': 0.0,
+                'change_instruction': 0.0,
+                'swap_instructions': 0.0,
+                'change_action': 1.0,
+            },
+        },
+        'program_size': {
+            'min': 1,
+            'max': 20,
+        },
+    },
+}
+
+class TeamActionsTests(unittest.TestCase):
+    def setUp(self):
+        self.user_config_ = Config.USER
+        self.total_registers_ = Config.RESTRICTIONS['genotype_options']['total_registers']
+        self.total_inputs_ = Config.RESTRICTIONS['total_inputs']
+        self.total_actions_ = Config.RESTRICTIONS['total_actions']
+        Config.USER = TEST_CONFIG
+        Config.RESTRICTIONS['genotype_options']['total_registers'] = 3
+        Config.RESTRICTIONS['total_inputs'] = 4
+        Config.RESTRICTIONS['total_actions'] = 3
+        random.seed(1)
+
+    def tearDown(self):
+        Config.USER = self.user_config_
+        Config.RESTRICTIONS['genotype_options']['total_registers'] = self.total_registers_
+        Config.RESTRICTIONS['total_inputs'] = self.total_inputs_
+        Config.RESTRICTIONS['total_actions'] = self.total_actions_
+
+    def test_teams_only_select_programs_with_valid_actions(self):
+        """ Ensures the actions masks of the team follow the programs that are added, removed and mutated """
+        program1 = Program(0, [Instruction(mode = 'read-input', target = 0, op = '+', source = 0)], 0, program_id = 1)
+        program2 = Program(0, [Instruction(mode = 'read-input', target = 0, op = '+', source = 1)], 1, program_id = 2)
+        team = Team(0, [program1, program2], None, team_id = 1)
+        inputs = [1.0, 2.0, 3.0, 4.0]
+        self.assertEqual(1, team.execute(1, inputs, [0, 1], False, force_reset = True))
+        self.assertEqual(0, team.execute(1, inputs, [0, 2], False, force_reset = True))
+        self.assertIsNone(team.execute(1, inputs, [2], False, force_reset = True))
+        team.remove_program(program1)
+        self.assertIsNone(team.execute(1, inputs, [0, 2], False, force_reset = True))
+        while program2.action != 2:
+            program2.mutate()
+        self.assertEqual(2, team.execute(1, inputs, [0, 2], False, force_reset = True))
+
+if __name__ == '__main__':
+    unittest.main()